@@ -30,6 +30,13 @@ public function __invoke(): Response
             $lines[] = 'svp_services_active '.$services;
         }
 
+        if (Schema::hasTable('svp_inbound_queue')) {
+            $pending = (int) DB::table('svp_inbound_queue')->where('status', 'pending')->count();
+            $lines[] = '# HELP svp_inbound_queue_pending Webhook updates waiting in svp_inbound_queue.';
+            $lines[] = '# TYPE svp_inbound_queue_pending gauge';
+            $lines[] = 'svp_inbound_queue_pending '.$pending;
+        }
+
         foreach ([
             'webhook_received_total' => 'counter',
             'mutate_op_total' => 'counter',
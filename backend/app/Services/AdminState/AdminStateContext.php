@@ -27,6 +27,7 @@ public function __construct(
         public array $moderatableUserIds = [],
         /** @var array<int, int> */
         public array $allowedPanelIds = [],
+        public bool $manifestFields = false,
     ) {}
 
     public static function fromRequest(Request $request, DashboardUser $actor): self
@@ -57,6 +58,7 @@ public static function fromRequest(Request $request, DashboardUser $actor): self
             isAdmin: $actor->role === 'admin',
             actorSvpUserId: (int) ($actor->svp_user_id ?? 0),
             request: $request,
+            manifestFields: (string) $request->query('fields') === 'manifest',
         );
         $ctx->pagination = $pagination;
 
@@ -0,0 +1,51 @@
+<?php
+
+namespace App\Services\AdminState;
+
+use Illuminate\Support\Str;
+
+/**
+ * Per-tab admin/state fields the dashboard reads — generated by
+ * frontend/scripts/admin-state-fields.py into database/data/admin_state_fields.php.
+ *
+ * A tab without an entry (or with `null`) keeps the full payload.
+ */
+class FieldManifest
+{
+    /** @var array<string, list<string>|null>|null */
+    protected static ?array $tabs = null;
+
+    /** @return array<string, list<string>|null> */
+    public static function all(): array
+    {
+        if (self::$tabs !== null) {
+            return self::$tabs;
+        }
+
+        $path = database_path('data/admin_state_fields.php');
+        $tabs = is_file($path) ? require $path : [];
+        self::$tabs = is_array($tabs) ? $tabs : [];
+
+        return self::$tabs;
+    }
+
+    /** @return list<string>|null Field names and `prefix*suffix` patterns; null = everything. */
+    public function fieldsFor(string $tab): ?array
+    {
+        $fields = self::all()[$tab] ?? null;
+
+        return is_array($fields) ? $fields : null;
+    }
+
+    /** @param  list<string>  $fields */
+    public static function matches(array $fields, string $key): bool
+    {
+        foreach ($fields as $field) {
+            if ($field === $key || (str_contains($field, '*') && Str::is($field, $key))) {
+                return true;
+            }
+        }
+
+        return false;
+    }
+}
@@ -17,6 +17,26 @@ public function loadIfNeeded(AdminStateContext $ctx, AdminStateResult $result):
         }
     }
 
+    /**
+     * Top-level payload keys this loader merges; a loader returning [] is never skipped by a field manifest.
+     *
+     * @return list<string>
+     */
+    public function provides(): array
+    {
+        return [];
+    }
+
+    /**
+     * Keys of earlier loaders' output this loader reads from the result.
+     *
+     * @return list<string>
+     */
+    public function reads(): array
+    {
+        return [];
+    }
+
     abstract protected function shouldLoad(AdminStateContext $ctx): bool;
 
     abstract protected function load(AdminStateContext $ctx, AdminStateResult $result): void;
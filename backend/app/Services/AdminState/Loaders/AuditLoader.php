@@ -10,6 +10,11 @@ class AuditLoader extends AbstractLoader
 {
     public function __construct(protected AuditQueryService $audit) {}
 
+    public function provides(): array
+    {
+        return ['auditRows', 'auditPagination'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->activeTab === 'audit';
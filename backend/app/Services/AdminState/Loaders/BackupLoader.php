@@ -19,6 +19,11 @@ public function __construct(
         protected SettingsStore $settings,
     ) {}
 
+    public function provides(): array
+    {
+        return ['backupRows', 'backupPanels', 'backupStatus', 'backupMeta'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->activeTab === 'backup' && svp_modules()->isEnabled('backup');
@@ -11,6 +11,11 @@ class BotUiLoader extends AbstractLoader
 {
     public function __construct(protected UiLayoutStudioService $layoutStudio) {}
 
+    public function provides(): array
+    {
+        return ['uiLayout', 'uiRegistry'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->activeTab === 'bot_ui';
@@ -11,6 +11,11 @@ class BotsLoader extends AbstractLoader
 {
     public function __construct(protected TelegramMirrorBotService $mirrors) {}
 
+    public function provides(): array
+    {
+        return ['botsList', 'telegramMirrorsList'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsBots();
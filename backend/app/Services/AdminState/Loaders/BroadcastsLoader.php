@@ -9,6 +9,11 @@
 
 class BroadcastsLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['broadcasts', 'broadcastQueueAggregates'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsBroadcasts();
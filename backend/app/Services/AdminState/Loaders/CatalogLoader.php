@@ -12,6 +12,11 @@
 
 class CatalogLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['panels', 'plans', 'planCategories', 'cards', 'l2tpServers'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsCatalog();
@@ -9,6 +9,11 @@
 
 class DiscountsLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['discountCodes', 'discountUsageSummary'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsDiscounts();
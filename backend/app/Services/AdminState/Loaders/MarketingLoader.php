@@ -16,6 +16,20 @@ public function __construct(
         protected MarketingLifecycleAnalyticsService $analytics,
     ) {}
 
+    public function provides(): array
+    {
+        return [
+            'marketingOffers',
+            'marketingRules',
+            'marketingRuleStats',
+            'marketingLifecycleStats',
+            'marketingLifecycleFunnel',
+            'marketingFunnel',
+            'marketingSkipBreakdown',
+            'marketingSegmentTrend',
+        ];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsMarketing();
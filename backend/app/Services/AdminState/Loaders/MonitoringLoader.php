@@ -15,6 +15,16 @@ public function __construct(
         protected MonitorHostSnapshotService $hostSnapshots,
     ) {}
 
+    public function provides(): array
+    {
+        return ['monitorHosts', 'overview'];
+    }
+
+    public function reads(): array
+    {
+        return ['overview', 'panels'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsMonitoring();
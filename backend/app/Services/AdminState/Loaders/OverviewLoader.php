@@ -10,6 +10,11 @@
 
 class OverviewLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['overview', 'stats', 'resellerOverviewMetrics'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsOverview();
@@ -10,6 +10,11 @@ class PanelFinancialReportsLoader extends AbstractLoader
 {
     public function __construct(protected PanelFinancialReportsService $reports) {}
 
+    public function provides(): array
+    {
+        return ['panelFinancialReports'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsPanelFinancialReports() && $ctx->isAdmin;
@@ -14,6 +14,11 @@
  */
 class PanelTemplatesLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['panelTemplates', 'panelTemplatesMeta'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         if (! function_exists('svp_modules') || ! svp_modules()->isEnabled('pasarguard')) {
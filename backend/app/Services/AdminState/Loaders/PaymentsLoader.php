@@ -12,6 +12,19 @@ class PaymentsLoader extends AbstractLoader
 {
     public function __construct(protected PaymentTransactionService $payments) {}
 
+    public function provides(): array
+    {
+        return [
+            'paymentsView',
+            'receipts',
+            'receiptAggregates',
+            'payments',
+            'paymentAggregates',
+            'orders',
+            'orderAggregates',
+        ];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsPayments();
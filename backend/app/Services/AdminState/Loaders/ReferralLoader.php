@@ -9,6 +9,11 @@
 
 class ReferralLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['referralEvents', 'referralStats'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsReferral();
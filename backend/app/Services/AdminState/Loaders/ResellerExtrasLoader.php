@@ -15,6 +15,21 @@ public function __construct(
         protected ResellerScopeService $scope,
     ) {}
 
+    public function provides(): array
+    {
+        return [
+            'resellerPanelPricesMap',
+            'resellerBotMap',
+            'resellerPlanFloors',
+            'wholesaleCatalogByPanel',
+            'wholesaleLinesCatalog',
+            'wholesaleLines',
+            'resellerWholesaleLineIdsMap',
+            'resellerCustomerCharges',
+            'resellerCustomerChargesPagination',
+        ];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsResellerExtras();
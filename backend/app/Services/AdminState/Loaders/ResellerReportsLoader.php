@@ -10,6 +10,11 @@ class ResellerReportsLoader extends AbstractLoader
 {
     public function __construct(protected ResellerReportsBuilder $builder) {}
 
+    public function provides(): array
+    {
+        return ['resellerReports', 'resellerReportsRows', 'resellerReportsStats', 'resellerReportsDaily'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsResellerReports();
@@ -11,6 +11,11 @@
 
 class ResellersLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['resellers', 'resellerPermissionsMap'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsResellersList();
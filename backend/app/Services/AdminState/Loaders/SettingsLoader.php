@@ -19,6 +19,11 @@ public function __construct(
         protected SensitiveSettings $sensitive,
     ) {}
 
+    public function provides(): array
+    {
+        return ['settings', 'resellersDefaults', 'textDefaults', 'paymentMethods'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return true;
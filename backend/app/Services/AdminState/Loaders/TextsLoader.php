@@ -9,6 +9,11 @@
 
 class TextsLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['texts', 'textDefaults'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsTexts();
@@ -16,6 +16,24 @@ public function __construct(
         protected PortalPagesBuilder $portalPages,
     ) {}
 
+    public function provides(): array
+    {
+        return [
+            'navTabs',
+            'portalPages',
+            'wpPages',
+            'uiLayout',
+            'uiRegistry',
+            'resellerAllowedTabs',
+            'actorPermissions',
+        ];
+    }
+
+    public function reads(): array
+    {
+        return ['uiLayout', 'uiRegistry'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return true;
@@ -8,6 +8,11 @@
 
 class UnitEconomicsLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['unitEconomics', 'panelEconomicsMap'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsUnitEconomics() && $ctx->isAdmin;
@@ -10,6 +10,11 @@
 
 class UsersLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['usersList', 'pendingUsers'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         return $ctx->needsUsersList() || $ctx->needsPendingUsers();
@@ -10,6 +10,11 @@
 
 class XrayCoreLoader extends AbstractLoader
 {
+    public function provides(): array
+    {
+        return ['xrayNodes', 'xrayInbounds', 'xrayHosts', 'tunnelEndpoints'];
+    }
+
     protected function shouldLoad(AdminStateContext $ctx): bool
     {
         if (! svp_modules()->isEnabled('xray_core')) {
@@ -6,6 +6,8 @@
 use App\Services\AdminState\AdminActorResolver;
 use App\Services\AdminState\AdminStateContext;
 use App\Services\AdminState\AdminStateResult;
+use App\Services\AdminState\FieldManifest;
+use App\Services\AdminState\Loaders\AbstractLoader;
 use App\Services\AdminState\Loaders\AuditLoader;
 use App\Services\AdminState\Loaders\BackupLoader;
 use App\Services\AdminState\Loaders\BotUiLoader;
@@ -62,6 +64,7 @@ public function __construct(
         protected PanelTemplatesLoader $panelTemplatesLoader,
         protected BackupLoader $backupLoader,
         protected AuditLoader $auditLoader,
+        protected FieldManifest $fieldManifest,
     ) {}
 
     /** @return array<string, mixed> */
@@ -75,12 +78,15 @@ public function build(?Authenticatable $actor, Request $request): array
         $this->actorResolver->applyScope($ctx);
 
         $result = new AdminStateResult;
+        $fields = $ctx->manifestFields ? $this->fieldManifest->fieldsFor($ctx->activeTab) : null;
 
-        foreach ($this->loaders() as $loader) {
+        foreach ($this->loaders($fields) as $loader) {
             $loader->loadIfNeeded($ctx, $result);
         }
 
-        $payload = $result->data;
+        $payload = $fields === null
+            ? $result->data
+            : array_filter($result->data, fn ($key) => FieldManifest::matches($fields, (string) $key), ARRAY_FILTER_USE_KEY);
         $payload['pagination'] = $this->paginationBuilder->build($ctx, $result);
         $payload['resellerContextId'] = $ctx->resellerContextId;
 
@@ -91,8 +97,39 @@ public function build(?Authenticatable $actor, Request $request): array
         return $payload;
     }
 
-    /** @return array<int, object> */
-    protected function loaders(): array
+    /**
+     * With a field manifest, loaders whose keys the tab never reads are dropped;
+     * a kept loader's reads() keep the earlier loaders it depends on.
+     *
+     * @param  list<string>|null  $fields
+     * @return array<int, AbstractLoader>
+     */
+    protected function loaders(?array $fields = null): array
+    {
+        $loaders = $this->allLoaders();
+        if ($fields === null) {
+            return $loaders;
+        }
+
+        $kept = [];
+        foreach (array_reverse($loaders, true) as $i => $loader) {
+            $provides = $loader->provides();
+            $wanted = $provides === [];
+            foreach ($provides as $key) {
+                $wanted = $wanted || FieldManifest::matches($fields, $key);
+            }
+            if ($wanted) {
+                $kept[$i] = $loader;
+                $fields = array_merge($fields, $loader->reads());
+            }
+        }
+        ksort($kept);
+
+        return array_values($kept);
+    }
+
+    /** @return array<int, AbstractLoader> */
+    protected function allLoaders(): array
     {
         return [
             $this->settingsLoader,
@@ -0,0 +1,384 @@
+<?php
+
+/** Auto-generated by frontend/scripts/admin-state-fields.py — do not edit. null = full payload. */
+
+return [
+    'audit' => [
+        'auditPagination',
+        'auditRows',
+    ],
+    'backup' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'settings',
+    ],
+    'bot_ui' => [
+        'textDefaults',
+        'uiLayout',
+        'uiRegistry',
+    ],
+    'bots' => [
+        '*Pagination',
+        'botsList',
+        'pagination',
+        'settings',
+        'telegramMirrorsList',
+    ],
+    'broadcast' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'broadcastJobs',
+        'broadcastQueueAggregates',
+        'broadcasts',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+    ],
+    'cards' => [
+        'cards',
+        'cardsPagination',
+        'pagination',
+        'paymentMethods',
+        'settings',
+    ],
+    'configs' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panelRows',
+        'panels',
+        'planRows',
+        'plans',
+        'xui_panels',
+    ],
+    'dashboard' => [
+        '*Pagination',
+        'actorBalance',
+        'actorRole',
+        'bot',
+        'broadcasts',
+        'cards',
+        'cards_total',
+        'counts',
+        'economics',
+        'host',
+        'isReseller',
+        'onlineDailySeries',
+        'overview',
+        'pagination',
+        'panelHealth',
+        'panels',
+        'panels_total',
+        'pendingUsers',
+        'plans',
+        'plans_total',
+        'receipts',
+        'receipts_total',
+        'resellerOverviewMetrics',
+        'resellers',
+        'services_total',
+        'stat_date',
+        'stats',
+        'user',
+        'users',
+        'usersList',
+        'users_pending',
+        'users_today',
+        'users_total',
+    ],
+    'discounts' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'discountCodes',
+        'discountUsageSummary',
+        'discounts',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'plans',
+        'users',
+        'usersList',
+    ],
+    'l2tp_servers' => [
+        'l2tpServers',
+        'pagination',
+    ],
+    'marketing_lifecycle' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'marketingFunnel',
+        'marketingLifecycleFunnel',
+        'marketingLifecycleStats',
+        'marketingOffers',
+        'marketingOffersList',
+        'marketingRuleStats',
+        'marketingRules',
+        'marketingSegmentTrend',
+        'marketingSkipBreakdown',
+        'marketingWindowDays',
+        'pagination',
+    ],
+    'monitoring' => [
+        '*Pagination',
+        'livePanelSnapshots',
+        'monitorHosts',
+        'overview',
+        'pagination',
+        'panels',
+    ],
+    'overview' => [
+        '*Pagination',
+        'actorBalance',
+        'actorRole',
+        'bot',
+        'broadcasts',
+        'cards',
+        'cards_total',
+        'counts',
+        'economics',
+        'host',
+        'isReseller',
+        'onlineDailySeries',
+        'overview',
+        'pagination',
+        'panelHealth',
+        'panels',
+        'panels_total',
+        'pendingUsers',
+        'plans',
+        'plans_total',
+        'receipts',
+        'receipts_total',
+        'resellerOverviewMetrics',
+        'resellers',
+        'services_total',
+        'stat_date',
+        'stats',
+        'user',
+        'users',
+        'usersList',
+        'users_pending',
+        'users_today',
+        'users_total',
+    ],
+    'panel_financial_reports' => [
+        'panelFinancialReports',
+    ],
+    'payments' => [
+        '*Pagination',
+        'orderAggregates',
+        'orders',
+        'ordersPagination',
+        'pagination',
+        'paymentAggregates',
+        'payments',
+        'paymentsPagination',
+        'receiptAggregates',
+        'receipts',
+        'settings',
+    ],
+    'plan_cats' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panels',
+        'planCategories',
+        'plan_categories',
+        'settings',
+    ],
+    'plans' => [
+        'actorRole',
+        'actorSvpUserId',
+        'actor_svp_user_id',
+        'isReseller',
+        'l2tpServers',
+        'pagination',
+        'panels',
+        'planCategories',
+        'plan_categories',
+        'plans',
+        'plansPagination',
+        'resellerChoices',
+        'resellerPanelAccessDiagnostics',
+        'resellerPlanFloors',
+        'resellers',
+        'settings',
+        'wholesaleLines',
+        'wholesaleLinesCatalog',
+    ],
+    'referral' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'referralEvents',
+        'referralStats',
+        'settings',
+    ],
+    'referral_reports' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'referralEvents',
+        'referralStats',
+        'settings',
+    ],
+    'reseller_bots' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'botsList',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+    ],
+    'reseller_charge' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'resellerCustomerCharges',
+        'resellerCustomerChargesPagination',
+        'user',
+    ],
+    'reseller_reports' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'resellerReports',
+        'resellerReportsDaily',
+        'resellerReportsRows',
+        'resellerReportsStats',
+    ],
+    'reseller_settings' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'actorSvpUserId',
+        'botsList',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panels',
+        'settings',
+    ],
+    'reseller_xui_panels' => [
+        'pagination',
+        'panelRows',
+        'panels',
+        'panelsPagination',
+        'resellerPanelPricesMap',
+    ],
+    'resellers' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'actorSvpUserId',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panels',
+        'resellerBotMap',
+        'resellerPanelPricesMap',
+        'resellerPermissionsMap',
+        'resellerWholesaleLineIdsMap',
+        'resellers',
+        'wholesaleCatalogByPanel',
+        'wholesaleLinesCatalog',
+    ],
+    'site_settings' => [
+        'features',
+        'panels',
+        'plans',
+        'portalPages',
+        'resellerPermissionsMap',
+        'resellers',
+        'settings',
+        'wpPages',
+    ],
+    'texts' => [
+        'textDefaults',
+        'texts',
+    ],
+    'unit_economics' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panelEconomicsMap',
+        'panels',
+        'unitEconomics',
+    ],
+    'users' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'pendingUsers',
+        'planCategories',
+        'plan_categories',
+        'plans',
+        'settings',
+        'userDetail',
+        'users',
+        'usersList',
+    ],
+    'users_bulk' => [
+        '*Pagination',
+        'actorPermissions',
+        'actorRole',
+        'enabledPlatforms',
+        'isReseller',
+        'pagination',
+        'panels',
+    ],
+    'vpn_server' => [
+        'endpoints',
+        'tunnelEnabled',
+        'tunnelEndpoints',
+        'tunnels',
+        'xrayCore',
+        'xrayCoreEnabled',
+        'xrayHosts',
+        'xrayInbounds',
+        'xrayNodes',
+    ],
+    'xui_panels' => [
+        'pagination',
+        'panelEconomicsMap',
+        'panelRows',
+        'panels',
+        'panelsPagination',
+        'rows',
+        'unitEconomics',
+    ],
+];
@@ -1,10 +1,21 @@
 #!/usr/bin/env bash
 # v28: §7.1 session paths + canonical /admin/* after normalizeAdminApiPath.
+# The route index checks that every canonical path has a backend route. Its normalizeAdminApiPath cases run
+# against a regex reading of the definition in src/lib/api.ts and api-base.ts (the first startsWith and replace
+# literals), not the function itself. When node can load it, the real function runs on the same cases too.
 set -euo pipefail
 REPO="$(cd "$(dirname "$0")/../../.." && pwd)"
-cd "$REPO/frontend"
 
-node --input-type=module -e "
+python3 "$REPO/backend/scripts/ci/route_index.py" --check api-paths
+
+# Importing api-base.ts needs type stripping (node >= 22.6; flagged before 23.6).
+if ! command -v node >/dev/null 2>&1 || ! node --experimental-strip-types -e "" >/dev/null 2>&1; then
+  echo "node with type stripping not found: normalizeAdminApiPath checked from its source text only" >&2
+  exit 0
+fi
+
+cd "$REPO/frontend"
+node --experimental-strip-types --no-warnings --input-type=module -e "
 import { normalizeAdminApiPath } from './src/lib/api-base.ts';
 
 const cases = [
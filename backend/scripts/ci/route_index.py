@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""One-pass route index for the CI path checks — replaces the grep scripts in ``scripts/ci``.
+
+Builds, in one run:
+
+- the backend route table from ``routes/*.php`` (as wired in
+  ``bootstrap/app.php``) and module ``routes.php`` files, with each
+  ``[Controller::class, 'method']`` handler checked against the controller's
+  public methods (``Api/V1`` and module controllers)
+- every API path ``frontend/src`` calls: ``${apiBase()}/…`` templates (and
+  variables holding an API base), ``getAdminJson`` / ``postAdminJson`` /
+  ``postAdminFormData`` / ``normalizeAdminApiPath`` arguments and
+  ``"/api/v1/…"`` literals
+- the admin nav tab sets from ``config/admin-nav.ts`` and ``admin-tab-markers.ts``
+
+and answers every check from that index:
+
+``routes``     each frontend API path (and method, when the helper fixes it)
+               matches a backend route; each handler method exists
+``api-paths``  normalizeAdminApiPath §7.1 cases, canonical paths routed.
+               The cases run against the first startsWith/replace literals of
+               its definition, not the function itself; check-frontend-api-paths.sh
+               also runs the real function under node when node is available
+``fetch``      raw /api/v1/admin/ paths, X-WP-Nonce, wp-json / admin-ajax
+               (was ci-check-frontend-fetch.sh)
+``nav``        ADMIN_TAB_KEYS / ADMIN_ONLY_TAB_KEYS / FEATURE_TAB_MAP rules
+               (was ci-check-admin-nav-parity.sh)
+
+Diagnostics are ``file:line: check: message``; any error exits 1.
+
+Usage:
+  python3 scripts/ci/route_index.py                       # all checks
+  python3 scripts/ci/route_index.py --check nav --check fetch
+  python3 scripts/ci/route_index.py --routes              # print the route table
+  python3 scripts/ci/route_index.py --json > route-index.json
+  python3 scripts/ci/route_index.py --check fetch --evidence ../docs/evidence/frontend-fetch-audit-v27.md
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+REPO = Path(__file__).resolve().parents[3]
+BACKEND = REPO / "backend"
+FRONTEND_SRC = REPO / "frontend" / "src"
+ARCHIVE = "frontend/src/_vite_legacy_archive/"
+API_ROOT = "api/v1"
+CHECKS = ("routes", "api-paths", "fetch", "nav")
+
+# --- backend ---------------------------------------------------------------
+
+BOOT_ROUTES_RE = re.compile(r"\b(web|api):\s*__DIR__\s*\.\s*'/\.\./(routes/[\w.-]+)'")
+BOOT_REQUIRE_RE = re.compile(r"require\s+__DIR__\s*\.\s*'/\.\./(routes/[\w.-]+)'")
+API_PREFIX_RE = re.compile(r"apiPrefix:\s*'([^']*)'")
+LOAD_ROUTES_RE = re.compile(r"loadRoutesFrom\(\s*__DIR__\s*\.\s*'/([\w./-]+)'\s*\)")
+USE_RE = re.compile(r"^use\s+([\w\\]+)(?:\s+as\s+(\w+))?;", re.M)
+NAMESPACE_RE = re.compile(r"^namespace\s+([\w\\]+);", re.M)
+EXTENDS_RE = re.compile(r"\bclass\s+\w+\s+extends\s+([\w\\]+)")
+PUBLIC_METHOD_RE = re.compile(r"\bpublic\s+(?:static\s+)?function\s+(\w+)\s*\(")
+ROUTE_RE = re.compile(
+    r"Route::(get|post|put|patch|delete|options|any|match|redirect)\(\s*"
+    r"(?:\[([^\]]*)\]\s*,\s*)?(['\"])(.*?)\3\s*,?\s*(.*)"
+)
+HANDLER_RE = re.compile(r"^\[\s*([\w\\]+)::class\s*,\s*['\"](\w+)['\"]\s*\]|^([\w\\]+)::class")
+PREFIX_RE = re.compile(r"(?:Route::|->)prefix\(\s*(['\"])(.*?)\1\s*\)")
+FOREACH_RE = re.compile(r"foreach\s*\(\s*\[([^\]]*)\]\s+as\s+\$(\w+)\s*\)")
+STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+VAR_RE = re.compile(r"\{?\$(\w+)\}?")
+
+
+class Route(NamedTuple):
+    methods: tuple[str, ...]  # upper case; "ANY" for Route::any
+    path: str  # without leading slash, e.g. "api/v1/admin/state"
+    controller: str | None  # fully qualified class
+    action: str | None  # method name; "__invoke" for invokable controllers
+    file: str
+    line: int
+
+
+class Diagnostic(NamedTuple):
+    file: str
+    line: int
+    check: str
+    message: str
+    warning: bool = False
+
+    def __str__(self) -> str:
+        where = f"{self.file}:{self.line}" if self.line else self.file
+        return f"{where}: {'warning: ' if self.warning else ''}{self.check}: {self.message}"
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(REPO).as_posix()
+
+
+def route_files(backend: Path = BACKEND) -> list[tuple[Path, str]]:
+    """(route file, URI prefix) in the order Laravel registers them."""
+    boot = (backend / "bootstrap" / "app.php").read_text(encoding="utf-8")
+    api_prefix = (m.group(1) if (m := API_PREFIX_RE.search(boot)) else "api").strip("/")
+    files = [(backend / rel, api_prefix if kind == "api" else "") for kind, rel in BOOT_ROUTES_RE.findall(boot)]
+    files += [(backend / rel, "") for rel in BOOT_REQUIRE_RE.findall(boot)]
+    for provider in sorted((backend / "app" / "Modules").glob("*/*ServiceProvider.php")):
+        for rel in LOAD_ROUTES_RE.findall(provider.read_text(encoding="utf-8")):
+            files.append((provider.parent / rel, ""))
+    return [(path, prefix) for path, prefix in files if path.is_file()]
+
+
+def _join(*parts: str) -> str:
+    return "/".join(p.strip("/") for p in parts if p.strip("/"))
+
+
+def _expand(literal: str, env: dict[str, list[str]]) -> list[str]:
+    """``"{$adminPrefix}/state"`` → one path per value of each loop variable."""
+    names = [n for n in VAR_RE.findall(literal) if n in env]
+    out = [literal]
+    for name in dict.fromkeys(names):
+        out = [re.sub(r"\{\$" + name + r"\}|\$" + name + r"\b", value, path) for path in out for value in env[name]]
+    return out
+
+
+def parse_routes(text: str, prefix: str, file: str, uses: dict[str, str] | None = None) -> list[Route]:
+    """Route table of one routes file: prefix groups, loops over prefix lists, handlers."""
+    uses = _uses(text) if uses is None else uses
+    frames: list[tuple[int, str, dict[str, list[str]]]] = []  # (depth before "{", prefix, loop vars)
+    depth = 0
+    pending: str | None = None
+    routes: list[Route] = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        code = line.split("//", 1)[0] if not line.lstrip().startswith("#") else ""
+        env: dict[str, list[str]] = {}
+        for _d, _p, loop in frames:
+            env.update(loop)
+        current = _join(prefix, *(p for _d, p, _v in frames))
+
+        if m := PREFIX_RE.search(code):
+            pending = m.group(2)
+        if m := ROUTE_RE.search(code):
+            verb, match_methods, _q, literal, rest = m.groups()
+            if verb == "match":
+                methods = tuple(sorted(s.upper() for s in re.findall(r"'(\w+)'", match_methods or "")))
+            elif verb == "redirect":
+                methods, rest = ("GET",), ""
+            else:
+                methods = ("ANY",) if verb == "any" else (verb.upper(),)
+            controller = action = None
+            if h := HANDLER_RE.match(rest.strip()):
+                name = h.group(1) or h.group(3)
+                controller = _qualify(name, uses)
+                action = h.group(2) or "__invoke"
+            for path in _expand(literal, env):
+                routes.append(Route(methods, _join(current, path), controller, action, file, lineno))
+
+        bare = STRING_RE.sub("''", code)
+        opens, closes = bare.count("{"), bare.count("}")
+        if "group(function" in bare and opens:
+            frames.append((depth + closes, pending or "", {}))
+            pending = None
+        elif m := FOREACH_RE.search(code):
+            frames.append((depth + closes, "", {m.group(2): re.findall(r"'([^']*)'", m.group(1))}))
+        elif ";" in bare:
+            pending = None
+        depth += opens - closes
+        while frames and depth <= frames[-1][0]:
+            frames.pop()
+    return routes
+
+
+def _uses(text: str) -> dict[str, str]:
+    uses = {}
+    for fqcn, alias in USE_RE.findall(text):
+        uses[alias or fqcn.rsplit("\\", 1)[-1]] = fqcn
+    return uses
+
+
+def _qualify(name: str, uses: dict[str, str], namespace: str = "") -> str:
+    name = name.lstrip("\\")
+    head, _, tail = name.partition("\\")
+    if head in uses:
+        return uses[head] + ("\\" + tail if tail else "")
+    return f"{namespace}\\{name}" if namespace and "\\" not in name else name
+
+
+class Controllers:
+    """Public methods per controller class (own and inherited), read once per file."""
+
+    def __init__(self, backend: Path = BACKEND):
+        self.backend = backend
+        self._methods: dict[str, set[str] | None] = {}
+
+    def path(self, fqcn: str) -> Path | None:
+        if not fqcn.startswith("App\\"):
+            return None
+        return self.backend / "app" / (fqcn[4:].replace("\\", "/") + ".php")
+
+    def methods(self, fqcn: str) -> set[str] | None:
+        """None when the class file is not in the tree (vendor or missing)."""
+        if fqcn in self._methods:
+            return self._methods[fqcn]
+        self._methods[fqcn] = None  # guards against inheritance cycles
+        path = self.path(fqcn)
+        if path is None or not path.is_file():
+            return None
+        text = path.read_text(encoding="utf-8")
+        found = set(PUBLIC_METHOD_RE.findall(text))
+        if m := EXTENDS_RE.search(text):
+            ns = m2.group(1) if (m2 := NAMESPACE_RE.search(text)) else ""
+            parent = self.methods(_qualify(m.group(1), _uses(text), ns))
+            found |= parent or set()
+        self._methods[fqcn] = found
+        return found
+
+
+def build_routes(backend: Path = BACKEND) -> list[Route]:
+    routes: list[Route] = []
+    for path, prefix in route_files(backend):
+        routes += parse_routes(path.read_text(encoding="utf-8"), prefix, _rel(path))
+    return routes
+
+
+# --- frontend --------------------------------------------------------------
+
+API_BASE_CALL = r"\w*[aA]pi\w*Base\([^)]*\)"
+API_VAR_RE = re.compile(r"(?:const|let)\s+(\w+)\s*=\s*(?:useMemo\(\s*\(\)\s*=>\s*)?(?:[^;\n]*\|\|\s*)?" + API_BASE_CALL)
+TEMPLATE_BASE_RE = re.compile(r"\$\{\s*(" + API_BASE_CALL + r"|\w+)\s*\}")
+NORMALIZE_HOLE_RE = re.compile(r"\$\{\s*normalizeAdminApiPath\(\s*([\"'`])([^\"'`]*)\1\s*\)\s*\}")
+HELPER_RE = re.compile(r"\b(getAdminJson|postAdminJson|postAdminFormData|normalizeAdminApiPath)\(\s*([\"'`])([^\"'`$]*)\2")
+LITERAL_RE = re.compile(r"[\"'`]/api/v1(/[^\"'`?\s$]*)")
+HELPER_METHODS = {"getAdminJson": "GET", "postAdminJson": "POST", "postAdminFormData": "POST"}
+HOLE_RE = re.compile(r"\$\{[^}]*\}")
+FETCH_RAW_RE = re.compile(r"[\"'`]/api/v1/admin/")
+FETCH_MARKERS_RE = re.compile(r"normalizeAdminApiPath|apiBase\(|postAdminMutate|dash-admin-mutate|dash-admin-upload")
+FETCH_EXEMPT_RE = re.compile(r"/api/v1/(bootstrap|auth/|me/)")
+FORBIDDEN = (
+    (re.compile(r"X-WP-Nonce"), "X-WP-Nonce must not appear in frontend/src (Appendix B)"),
+    (re.compile(r"wp-json|admin-ajax"), "wp-json and admin-ajax must not appear in frontend/src (Appendix B)"),
+)
+
+
+class ApiCall(NamedTuple):
+    path: str  # relative to /api/v1, e.g. "/admin/state"; "{}" for interpolated segments
+    method: str | None  # None when the call site does not fix it
+    via: str
+    file: str
+    line: int
+
+
+class NormalizeRule(NamedTuple):
+    """``normalizeAdminApiPath`` as written: paths starting with ``match`` get ``old`` → ``new``."""
+    match: str
+    old: str
+    new: str
+    file: str
+    line: int
+
+    def apply(self, path: str) -> str:
+        p = path if path.startswith("/") else "/" + path
+        return p.replace(self.old, self.new, 1) if p.startswith(self.match) else p
+
+
+NORMALIZE_DEF_RE = re.compile(r"export function normalizeAdminApiPath\([^)]*\)[^{]*\{(.*?)\n\}", re.S)
+STARTS_WITH_RE = re.compile(r"\.startsWith\(\s*\"(/[^\"]+)\"\s*\)")
+REPLACE_RE = re.compile(r"\.replace\(\s*\"([^\"]+)\"\s*,\s*\"([^\"]+)\"\s*\)")
+
+
+def _clean(path: str) -> str:
+    path = HOLE_RE.sub("{}", path.split("?", 1)[0])
+    return path.rstrip("/") or "/"
+
+
+def _admin_helper_path(path: str) -> str:
+    """``cleanPath`` of getAdminJson / postAdminJson: bare names live under /admin/."""
+    return path if path.startswith("/") else "/admin/" + re.sub(r"^admin/", "", path)
+
+
+class FrontendFile(NamedTuple):
+    rel: str
+    text: str
+    calls: list[ApiCall]
+    normalize: NormalizeRule | None
+
+    def line(self, offset: int) -> int:
+        return self.text.count("\n", 0, offset) + 1
+
+
+def scan_frontend_text(text: str, rel: str, normalize: NormalizeRule | None = None) -> FrontendFile:
+    """API calls in one file. ``normalize`` rewrites ``normalizeAdminApiPath("…")`` arguments."""
+    rule = _normalize_rule(text, rel) or normalize
+    norm = rule.apply if rule else (lambda p: p)
+    calls: dict[tuple[int, str], ApiCall] = {}
+
+    def add(path: str, method: str | None, via: str, offset: int) -> None:
+        path, line = _clean(path), text.count("\n", 0, offset) + 1
+        calls.setdefault((line, path), ApiCall(path, method, via, rel, line))
+
+    if "Base(" in text:
+        api_vars = set(API_VAR_RE.findall(text))
+        for m in TEMPLATE_BASE_RE.finditer(text):
+            base = m.group(1)
+            if not (base.endswith(")") or base in api_vars):
+                continue
+            rest = re.split(r"[`\n]", text[m.end():m.end() + 400], maxsplit=1)[0]
+            if n := NORMALIZE_HOLE_RE.match(rest):
+                add(norm(n.group(2)) + rest[n.end():], None, "normalizeAdminApiPath", m.start())
+            elif rest.startswith("/"):
+                add(rest, None, "apiBase", m.start())
+    for m in HELPER_RE.finditer(text) if "Admin" in text else ():
+        helper, _q, path = m.groups()
+        if helper != "normalizeAdminApiPath":
+            add(_admin_helper_path(path), HELPER_METHODS[helper], helper, m.start())
+        elif text[max(0, m.start() - 2):m.start()] != "${":  # else counted with its ${apiBase()} template
+            add(norm(path), None, helper, m.start())
+    for m in LITERAL_RE.finditer(text) if "/api/v1/" in text else ():
+        add(m.group(1), None, "literal", m.start())
+    return FrontendFile(rel, text, sorted(calls.values(), key=lambda c: c.line), rule)
+
+
+def _normalize_rule(text: str, rel: str) -> NormalizeRule | None:
+    if not (m := NORMALIZE_DEF_RE.search(text)):
+        return None
+    body = m.group(1)
+    starts, repl = STARTS_WITH_RE.search(body), REPLACE_RE.search(body)
+    if not (starts and repl):
+        return None
+    return NormalizeRule(starts.group(1), repl.group(1), repl.group(2), rel, text.count("\n", 0, m.start()) + 1)
+
+
+def scan_frontend(src: Path = FRONTEND_SRC) -> list[FrontendFile]:
+    paths = sorted(p for p in src.rglob("*") if p.suffix in (".ts", ".tsx") and p.is_file())
+    texts = {p: p.read_text(encoding="utf-8") for p in paths}
+    # normalizeAdminApiPath is imported from lib/api; its own file defines the rule.
+    shared = next((r for p, t in texts.items() if (r := _normalize_rule(t, _rel(p))) and p.name == "api.ts"), None)
+    return [scan_frontend_text(text, _rel(path), shared) for path, text in texts.items()]
+
+
+# --- nav -------------------------------------------------------------------
+
+LIST_RE = re.compile(r"^(?:export\s+)?const\s+(\w+)\b[^=]*=\s*(?:new Set(?:<[^>]*>)?\(\s*)?\[", re.M)
+MAP_RE = re.compile(r"^(?:export\s+)?const\s+(\w+)\s*:\s*Record<[^=]*=\s*\{", re.M)
+ITEM_RE = re.compile(r"\"([\w-]+)\"")
+ENTRY_RE = re.compile(r"^\s*\"?(\w+)\"?\s*:\s*\"([\w-]+)\"")
+
+
+def parse_tab_sets(text: str) -> dict[str, dict[str, int]]:
+    """``const NAME = [..]`` / ``new Set([..])`` string lists and ``Record<…> = {k: "v"}`` maps → {name: {item: line}}.
+
+    Map entries are stored as ``"key=value"``.
+    """
+    out: dict[str, dict[str, int]] = {}
+    for m in LIST_RE.finditer(text):
+        end = text.find("]", m.end())
+        first = text.count("\n", 0, m.end()) + 1
+        items: dict[str, int] = {}
+        for n, line in enumerate(text[m.end():end].split("\n")):
+            for item in ITEM_RE.findall(line):
+                items.setdefault(item, first + n)
+        out[m.group(1)] = items
+    for m in MAP_RE.finditer(text):
+        end = text.find("}", m.end())
+        first = text.count("\n", 0, m.end()) + 1
+        out[m.group(1)] = {
+            f"{e.group(1)}={e.group(2)}": first + n
+            for n, line in enumerate(text[m.end():end].split("\n"))
+            if (e := ENTRY_RE.match(line))
+        }
+    return out
+
+
+NAV = "frontend/src/config/admin-nav.ts"
+MARKERS = "frontend/src/config/admin-tab-markers.ts"
+REQUIRED_TABS = ("reseller_charge", "reseller_settings", "reseller_xui_panels")
+NOT_ADMIN_ONLY = {
+    "reseller_xui_panels": "reseller_xui_panels must not be ADMIN_ONLY (spec E.4)",
+    "bot_ui": "bot_ui must not be ADMIN_ONLY (reseller read-only §D.4)",
+}
+MUST_ADMIN_ONLY = ("bots", "xui_panels")  # spec §10.2
+REQUIRED_FEATURES = {"broadcast": "marketing"}  # v21 gate
+
+
+def check_nav(nav_text: str, markers_text: str) -> list[Diagnostic]:
+    sets = parse_tab_sets(nav_text)
+    markers = parse_tab_sets(markers_text)
+    if "FEATURE_TAB_MAP" not in sets:
+        return [Diagnostic(NAV, 0, "nav", "FEATURE_TAB_MAP missing")]
+    tabs = sets.get("ADMIN_TAB_KEYS", {})
+    admin_only = sets.get("ADMIN_ONLY_TAB_KEYS", {})
+    features = dict(item.split("=", 1) for item in sets["FEATURE_TAB_MAP"])
+    feature_lines = {item.split("=", 1)[0]: line for item, line in sets["FEATURE_TAB_MAP"].items()}
+    forbidden = markers.get("RESELLER_FORBIDDEN_TABS", {})
+    out: list[Diagnostic] = []
+    for key in REQUIRED_TABS:
+        if key not in tabs:
+            out.append(Diagnostic(NAV, 0, "nav", f"Missing routable tab key: {key}"))
+    for key, message in NOT_ADMIN_ONLY.items():
+        if key in admin_only:
+            out.append(Diagnostic(NAV, admin_only[key], "nav", message))
+    if "bot_ui" in forbidden:
+        out.append(Diagnostic(MARKERS, forbidden["bot_ui"], "nav", "bot_ui must not be RESELLER_FORBIDDEN"))
+    for key in MUST_ADMIN_ONLY:
+        if key not in admin_only:
+            out.append(Diagnostic(NAV, 0, "nav", f"{key} must be ADMIN_ONLY per spec §10.2"))
+    for key, feature in REQUIRED_FEATURES.items():
+        if features.get(key) != feature:
+            out.append(Diagnostic(NAV, feature_lines.get(key, 0), "nav", f"{key} must map to {feature} feature (v21 gate)"))
+    for key, line in forbidden.items():
+        if key not in admin_only:
+            out.append(Diagnostic(MARKERS, line, "nav", f"RESELLER_FORBIDDEN_TABS entry {key} is not in ADMIN_ONLY_TAB_KEYS"))
+    for key, line in feature_lines.items():
+        if tabs and key not in tabs:
+            out.append(Diagnostic(NAV, line, "nav", f"FEATURE_TAB_MAP key {key} is not an ADMIN_TAB_KEYS tab", warning=True))
+    return out
+
+
+# --- index and checks ------------------------------------------------------
+
+SEGMENT_PARAM_RE = re.compile(r"^\{\w+\??\}$")
+API_PATH_CASES = (
+    ("/dashboard/admin/state", "/admin/state"),
+    ("/dashboard/admin/mutate", "/admin/mutate"),
+    ("/dashboard/admin/backup/status", "/admin/backup/status"),
+    ("/dashboard/persona", "/dashboard/persona"),
+    ("/dashboard/ui-preferences", "/dashboard/ui-preferences"),
+    ("/dashboard/impersonate/start", "/dashboard/impersonate/start"),
+    ("/dashboard/impersonate/stop", "/dashboard/impersonate/stop"),
+    ("/admin/state", "/admin/state"),
+    ("/admin/mutate", "/admin/mutate"),
+)
+
+
+class RouteTable:
+    def __init__(self, routes: list[Route]):
+        self.routes = routes
+        self._by_len: dict[int, list[tuple[list[str], Route]]] = {}
+        self._optional: list[tuple[list[str], Route]] = []
+        for route in routes:
+            segments = route.path.split("/") if route.path else []
+            if segments and segments[-1].endswith("?}"):
+                self._optional.append((segments, route))
+            self._by_len.setdefault(len(segments), []).append((segments, route))
+
+    def match(self, path: str) -> list[Route]:
+        """Routes for a path with a leading slash; ``{}`` segments match anything."""
+        segments = [s for s in path.split("/") if s]
+        found = []
+        candidates = self._by_len.get(len(segments), []) + [
+            (segs, r) for segs, r in self._optional if len(segs) == len(segments) + 1
+        ]
+        for route_segments, route in candidates:
+            if all(a == b or b == "{}" or SEGMENT_PARAM_RE.match(a)
+                   for a, b in zip(route_segments, segments)):
+                found.append(route)
+        return found
+
+
+def _allows(route: Route, method: str | None) -> bool:
+    if method is None or "ANY" in route.methods:
+        return True
+    return method in route.methods or (method == "HEAD" and "GET" in route.methods)
+
+
+class Index(NamedTuple):
+    routes: RouteTable
+    frontend: list[FrontendFile]
+    controllers: Controllers
+
+
+def build(backend: Path = BACKEND, src: Path = FRONTEND_SRC) -> Index:
+    return Index(RouteTable(build_routes(backend)), scan_frontend(src), Controllers(backend))
+
+
+def check_routes(index: Index) -> list[Diagnostic]:
+    out: list[Diagnostic] = []
+    seen: set[tuple[str, int, str | None]] = set()
+    for route in index.routes.routes:
+        if route.controller is None or (route.file, route.line, route.action) in seen:
+            continue  # loop-expanded routes share one handler line
+        seen.add((route.file, route.line, route.action))
+        methods = index.controllers.methods(route.controller)
+        if methods is not None and route.action not in methods:
+            out.append(Diagnostic(route.file, route.line, "routes",
+                                  f"{route.controller.rsplit(chr(92), 1)[-1]} has no public {route.action}()"))
+    for f in index.frontend:
+        if f.rel.startswith(ARCHIVE):
+            continue  # not imported by the Next app
+        for call in f.calls:
+            found = index.routes.match("/" + API_ROOT + call.path)
+            if not found:
+                out.append(Diagnostic(f.rel, call.line, "routes", f"no backend route for /{API_ROOT}{call.path} ({call.via})"))
+            elif not any(_allows(r, call.method) for r in found):
+                allowed = ", ".join(sorted({m for r in found for m in r.methods}))
+                out.append(Diagnostic(f.rel, call.line, "routes",
+                                      f"{call.via} sends {call.method} to /{API_ROOT}{call.path}; route allows {allowed}"))
+    return out
+
+
+def check_api_paths(index: Index) -> list[Diagnostic]:
+    rules = [f.normalize for f in index.frontend if f.normalize and f.normalize.file == f.rel]
+    out: list[Diagnostic] = []
+    if not rules:
+        return [Diagnostic("frontend/src/lib/api.ts", 0, "api-paths", "normalizeAdminApiPath definition not found")]
+    for rule in rules:
+        for given, expected in API_PATH_CASES:
+            got = rule.apply(given)
+            if got != expected:
+                out.append(Diagnostic(rule.file, rule.line, "api-paths",
+                                      f"normalizeAdminApiPath({given!r}) => {got!r} expected {expected!r}"))
+    for _given, expected in API_PATH_CASES:
+        if not index.routes.match(f"/{API_ROOT}{expected}"):
+            out.append(Diagnostic("backend/routes/api.php", 0, "api-paths", f"§7.1 path /{API_ROOT}{expected} has no route"))
+    return out
+
+
+def check_fetch(index: Index) -> list[Diagnostic]:
+    out: list[Diagnostic] = []
+    for f in index.frontend:
+        text = f.text
+        if FETCH_RAW_RE.search(text) and not FETCH_MARKERS_RE.search(text) and not FETCH_EXEMPT_RE.search(text):
+            out += [Diagnostic(f.rel, f.line(m.start()), "fetch", "raw admin API path without normalizeAdminApiPath/apiBase helpers")
+                    for m in FETCH_RAW_RE.finditer(text)]
+        for pattern, message in FORBIDDEN:
+            out += [Diagnostic(f.rel, f.line(m.start()), "fetch", message) for m in pattern.finditer(text)]
+    if not any(f.rel == NAV and "FEATURE_TAB_MAP" in f.text for f in index.frontend):
+        out.append(Diagnostic(NAV, 0, "fetch", "FEATURE_TAB_MAP missing in admin-nav.ts"))
+    return sorted(out)
+
+
+def run_checks(index: Index, checks: Iterable[str]) -> list[Diagnostic]:
+    texts = {f.rel: f.text for f in index.frontend if f.rel in (NAV, MARKERS)}
+    runners = {
+        "routes": lambda: check_routes(index),
+        "api-paths": lambda: check_api_paths(index),
+        "fetch": lambda: check_fetch(index),
+        "nav": lambda: check_nav(texts.get(NAV, ""), texts.get(MARKERS, "")),
+    }
+    return [d for check in checks for d in runners[check]()]
+
+
+def evidence(diagnostics: list[Diagnostic], index: Index) -> str:
+    fetch = [d for d in diagnostics if d.check == "fetch" and not d.warning]
+    calls = sum(len(f.calls) for f in index.frontend)
+    return "\n".join((
+        "# Frontend fetch audit v27",
+        "",
+        f"Date: {datetime.now(timezone.utc):%Y-%m-%d}",
+        f"Warnings: {len(fetch)} (threshold: 0)",
+        "",
+        "All admin fetch paths use normalizeAdminApiPath helpers.",
+        "§7.1 session paths keep /dashboard/ prefix (persona, ui-preferences, impersonate).",
+        "X-WP-Nonce: absent from frontend/src",
+        "wp-json / admin-ajax: absent from frontend/src",
+        f"Route index: {len(index.routes.routes)} backend routes, {calls} frontend API calls checked.",
+        "",
+    ))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="append", choices=CHECKS, help="run only these checks (repeatable)")
+    parser.add_argument("--routes", action="store_true", help="print the route table")
+    parser.add_argument("--json", action="store_true", help="route table, frontend calls and diagnostics as JSON")
+    parser.add_argument("--evidence", type=Path, help="write the fetch audit evidence markdown here on success")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = build()
+    diagnostics = run_checks(index, args.check or CHECKS)
+    elapsed = (time.perf_counter() - started) * 1000
+    errors = [d for d in diagnostics if not d.warning]
+
+    if args.json:
+        print(json.dumps({
+            "routes": [r._asdict() for r in index.routes.routes],
+            "calls": [c._asdict() for f in index.frontend for c in f.calls],
+            "diagnostics": [d._asdict() for d in diagnostics],
+        }, indent=2, ensure_ascii=False))
+        return 1 if errors else 0
+    if args.routes:
+        for r in index.routes.routes:
+            handler = f"{r.controller.rsplit(chr(92), 1)[-1]}@{r.action}" if r.controller else "-"
+            print(f"{'|'.join(r.methods):<12} /{r.path:<60} {handler:<48} {r.file}:{r.line}")
+    for d in diagnostics:
+        print(d, file=sys.stderr)
+    calls = sum(len(f.calls) for f in index.frontend)
+    print(f"route-index: {len(index.routes.routes)} routes, {calls} API calls in {len(index.frontend)} files; "
+          f"{', '.join(args.check or CHECKS)}: {len(errors)} error(s), {len(diagnostics) - len(errors)} warning(s) "
+          f"({elapsed:.0f}ms)")
+    if args.evidence and not errors:
+        args.evidence.write_text(evidence(diagnostics, index), encoding="utf-8")
+        print(f"route-index: evidence → {args.evidence}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
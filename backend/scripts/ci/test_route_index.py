@@ -0,0 +1,202 @@
+"""Route index parsing and checks on inline fixtures, plus one run over the real tree.
+
+Run: python3 -m pytest backend/scripts/ci   (or python3 -m unittest from this directory)
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from route_index import (  # noqa: E402
+    CHECKS, Controllers, Index, NormalizeRule, RouteTable, build, check_fetch, check_nav, parse_routes, run_checks,
+    scan_frontend_text,
+)
+
+ROUTES = """<?php
+
+use App\\Http\\Controllers\\Api\\V1\\AdminStateController;
+use App\\Modules\\XuiPanel\\Http\\PanelController;
+use Illuminate\\Support\\Facades\\Route;
+
+Route::prefix('v1')->group(function () {
+    Route::get('bootstrap', BootstrapController::class)->middleware('web');
+    Route::middleware(['install.wizard.open'])->prefix('setup')->group(function () {
+        Route::get('status', [SetupController::class, 'status']);
+    });
+    foreach (['admin', 'dashboard/admin'] as $adminPrefix) {
+        Route::middleware(['web'])->group(function () use ($adminPrefix) {
+            Route::get("{$adminPrefix}/state", [AdminStateController::class, 'show']);
+            Route::match(['get', 'post'], "{$adminPrefix}/panel/scan", [PanelController::class, "scan"]);
+        });
+    }
+    Route::post('after-loop', [AdminStateController::class, 'show']);
+});
+Route::prefix('v1/internal')
+    ->middleware('bot.service.auth')
+    ->group(function () {
+        Route::get('health', [AdminStateController::class, 'health']);
+    });
+"""
+
+
+class ParseRoutesTest(unittest.TestCase):
+    def setUp(self):
+        self.routes = parse_routes(ROUTES, "api", "routes/api.php")
+
+    def test_prefix_stack_and_loop_expansion(self):
+        paths = [r.path for r in self.routes]
+        self.assertEqual(paths, [
+            "api/v1/bootstrap",
+            "api/v1/setup/status",
+            "api/v1/admin/state",
+            "api/v1/dashboard/admin/state",
+            "api/v1/admin/panel/scan",
+            "api/v1/dashboard/admin/panel/scan",
+            "api/v1/after-loop",
+            "api/v1/internal/health",
+        ])
+
+    def test_handlers_and_methods(self):
+        by_path = {r.path: r for r in self.routes}
+        self.assertEqual(by_path["api/v1/bootstrap"].action, "__invoke")
+        scan = by_path["api/v1/admin/panel/scan"]
+        self.assertEqual(scan.methods, ("GET", "POST"))
+        self.assertEqual((scan.controller, scan.action), ("App\\Modules\\XuiPanel\\Http\\PanelController", "scan"))
+        self.assertEqual(by_path["api/v1/admin/state"].controller, "App\\Http\\Controllers\\Api\\V1\\AdminStateController")
+        self.assertEqual(by_path["api/v1/admin/state"].line, 14)
+
+
+class ControllersTest(unittest.TestCase):
+    def test_public_methods_include_parent(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "app" / "Http" / "Controllers"
+            base.mkdir(parents=True)
+            (base / "Base.php").write_text(
+                "<?php\nnamespace App\\Http\\Controllers;\nclass Base {\n  public function shared() {}\n}\n")
+            (base / "Child.php").write_text(
+                "<?php\nnamespace App\\Http\\Controllers;\nclass Child extends Base {\n"
+                "  public function show() {}\n  private function hidden() {}\n}\n")
+            controllers = Controllers(Path(tmp))
+            self.assertEqual(controllers.methods("App\\Http\\Controllers\\Child"), {"show", "shared"})
+            self.assertIsNone(controllers.methods("App\\Http\\Controllers\\Missing"))
+            self.assertIsNone(controllers.methods("Vendor\\Thing"))
+
+
+RULE = NormalizeRule("/dashboard/admin/", "/dashboard/admin/", "/admin/", "frontend/src/lib/api.ts", 2)
+
+CLIENT = """import { apiBase, normalizeAdminApiPath } from "@/lib/api"
+const restBase = apiBase()
+export async function load(id: number) {
+  await fetch(`${apiBase()}/setup/status`)
+  await fetch(`${restBase}/users/${id}/configs?full=1`)
+  await fetch(`${apiBase()}${normalizeAdminApiPath("/dashboard/admin/user-search")}?q=x`)
+  await getAdminJson("/dashboard/admin/audit")
+  await postAdminJson("backup/run", {})
+  const url = "/api/v1/me/state"
+  const page = `${base}/users/${id}`
+}
+"""
+
+
+class ScanFrontendTest(unittest.TestCase):
+    def test_collects_api_calls_with_lines(self):
+        f = scan_frontend_text(CLIENT, "frontend/src/x.tsx", RULE)
+        self.assertEqual([(c.line, c.path, c.method, c.via) for c in f.calls], [
+            (4, "/setup/status", None, "apiBase"),
+            (5, "/users/{}/configs", None, "apiBase"),
+            (6, "/admin/user-search", None, "normalizeAdminApiPath"),
+            (7, "/dashboard/admin/audit", "GET", "getAdminJson"),
+            (8, "/admin/backup/run", "POST", "postAdminJson"),
+            (9, "/me/state", None, "literal"),
+        ])
+
+    def test_reads_normalize_rule_from_its_definition(self):
+        text = ('export function normalizeAdminApiPath(path: string): string {\n'
+                '  const p = path.startsWith("/") ? path : `/${path}`\n'
+                '  if (p.startsWith("/dashboard/admin/")) return p.replace("/dashboard/admin/", "/admin/")\n'
+                '  return p\n}\n')
+        rule = scan_frontend_text(text, "frontend/src/lib/api.ts").normalize
+        self.assertEqual(rule.apply("/dashboard/admin/state"), "/admin/state")
+        self.assertEqual(rule.apply("dashboard/persona"), "/dashboard/persona")
+
+
+class FetchTest(unittest.TestCase):
+    def test_forbidden_patterns_without_wp_prefix(self):
+        files = [scan_frontend_text('const url = "/admin-ajax.php"\n', "frontend/src/lib/legacy.ts"),
+                 scan_frontend_text('headers["X-WP-Nonce"] = n\n', "frontend/src/lib/nonce.ts"),
+                 scan_frontend_text('export const FEATURE_TAB_MAP = {}\n', "frontend/src/config/admin-nav.ts")]
+        diagnostics = check_fetch(Index(RouteTable([]), files, None))
+        self.assertEqual([(d.file, d.line) for d in diagnostics],
+                         [("frontend/src/lib/legacy.ts", 1), ("frontend/src/lib/nonce.ts", 1)])
+
+
+class RouteTableTest(unittest.TestCase):
+    def test_segment_match(self):
+        routes = parse_routes(
+            "Route::get('api/v1/users/{id}/configs', [A::class, 'x']);\n"
+            "Route::get('/dashboard/{path?}', D::class);\n", "", "routes/web.php")
+        table = RouteTable(routes)
+        self.assertEqual(len(table.match("/api/v1/users/{}/configs")), 1)
+        self.assertEqual(len(table.match("/api/v1/users/7/configs")), 1)
+        self.assertEqual(table.match("/api/v1/users/7"), [])
+        self.assertEqual(len(table.match("/dashboard")), 1)
+        self.assertEqual(len(table.match("/dashboard/users")), 1)
+
+
+NAV = """export const ADMIN_ONLY_TAB_KEYS = new Set<string>([
+  "bots",
+  "xui_panels",
+  "secrets",
+])
+
+export const ADMIN_TAB_KEYS: string[] = [
+  "overview", "bots", "xui_panels", "broadcast",
+  "reseller_charge", "reseller_settings", "reseller_xui_panels", "bot_ui",
+]
+
+const FEATURE_TAB_MAP: Record<string, string> = {
+  broadcast: "marketing",
+  proxy: "proxy",
+}
+"""
+MARKERS = """export const RESELLER_FORBIDDEN_TABS = new Set([
+  "bots",
+  "secrets",
+])
+"""
+
+
+class NavTest(unittest.TestCase):
+    def test_clean_nav_has_only_the_unknown_key_warning(self):
+        diagnostics = check_nav(NAV, MARKERS)
+        self.assertEqual([(d.line, d.warning) for d in diagnostics], [(14, True)])
+        self.assertIn("proxy", diagnostics[0].message)
+
+    def test_rules(self):
+        nav = NAV.replace('"secrets",', '"secrets",\n  "bot_ui",').replace('"xui_panels",\n', "")
+        nav = nav.replace('broadcast: "marketing"', 'broadcast: "messaging"')
+        markers = MARKERS.replace('"secrets",', '"secrets",\n  "bot_ui",\n  "users",')
+        messages = [str(d) for d in check_nav(nav, markers) if not d.warning]
+        self.assertEqual(messages, [
+            "frontend/src/config/admin-nav.ts:4: nav: bot_ui must not be ADMIN_ONLY (reseller read-only §D.4)",
+            "frontend/src/config/admin-tab-markers.ts:4: nav: bot_ui must not be RESELLER_FORBIDDEN",
+            "frontend/src/config/admin-nav.ts: nav: xui_panels must be ADMIN_ONLY per spec §10.2",
+            "frontend/src/config/admin-nav.ts:13: nav: broadcast must map to marketing feature (v21 gate)",
+            "frontend/src/config/admin-tab-markers.ts:5: nav: "
+            "RESELLER_FORBIDDEN_TABS entry users is not in ADMIN_ONLY_TAB_KEYS",
+        ])
+        self.assertEqual(str(check_nav("", MARKERS)[0]), "frontend/src/config/admin-nav.ts: nav: FEATURE_TAB_MAP missing")
+
+
+class TreeTest(unittest.TestCase):
+    def test_repository_passes_all_checks(self):
+        index = build()
+        self.assertGreater(len(index.routes.routes), 50)
+        errors = [str(d) for d in run_checks(index, CHECKS) if not d.warning]
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
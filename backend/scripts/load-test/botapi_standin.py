@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Local Telegram/Bale Bot API stand-in with the flood limits a broadcast runs into.
+
+It serves ``POST /bot{token}/{method}``, the URL shape TelegramApiClient and
+BaleApiClient post to. The method is ``sendMessage``, ``sendPhoto``,
+``sendMediaGroup`` or ``getMe``, with a JSON or form body.
+
+Each token gets its own limits (BotLimits):
+
+- A token bucket of ``rate`` messages per second with room for ``burst``.
+- At most one message per chat every ``per_chat_interval`` seconds.
+- A flood wait. Over the limit, the reply is Telegram's 429: ``{"ok": false,
+  "error_code": 429, "description": "Too Many Requests: retry after N",
+  "parameters": {"retry_after": N}}``. With ``flood_wait`` set, every call on
+  that token keeps getting 429 until the ``retry_after`` window has passed,
+  the same way the real API penalises a bot that ignores it.
+
+A fixed share of chats answer 403 "bot was blocked by the user" and another
+share 400 "chat not found". Which chats do is derived from the chat id, so
+retries see the same answer. A random ``server_error_share`` of calls gets 502.
+
+Usage:
+  python3 scripts/load-test/botapi_standin.py --port=8081 --rate=30 --burst=30 --latency-ms=50 --blocked-share=0.03
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import parse_qsl
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin_server import Reply, Request, StandinServer  # noqa: E402
+
+SEND_METHODS = ("sendMessage", "sendPhoto", "sendMediaGroup")
+
+
+class BotLimits(NamedTuple):
+    rate: float = 30.0  # messages per second per token
+    burst: int = 30
+    per_chat_interval: float = 1.0
+    retry_after: int = 0  # fixed value; 0 = time until the bucket has a token, rounded up
+    flood_wait: bool = True
+    blocked_share: float = 0.0
+    bad_request_share: float = 0.0
+    server_error_share: float = 0.0
+
+
+class BotState:
+    __slots__ = ("tokens", "refilled", "penalty_until", "last_by_chat", "sent", "limited")
+
+    def __init__(self, burst: int, now: float):
+        self.tokens = float(burst)
+        self.refilled = now
+        self.penalty_until = 0.0
+        self.last_by_chat: dict[int, float] = {}
+        self.sent = 0
+        self.limited = 0
+
+
+def chat_share(chat_id: int, salt: bytes) -> float:
+    return (zlib.crc32(salt + str(chat_id).encode()) % 10000) / 10000
+
+
+def too_many(retry_after: int) -> Reply:
+    return Reply(429, {"ok": False, "error_code": 429, "description": f"Too Many Requests: retry after {retry_after}",
+                       "parameters": {"retry_after": retry_after}})
+
+
+class BotApiServer(StandinServer):
+    def __init__(self, limits: BotLimits = BotLimits(), latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 seed: int | None = None):
+        super().__init__(latency_ms, jitter_ms, rate_limit_per_min=0)
+        self.limits = limits
+        self.rng = random.Random(seed)
+        self.bots: dict[str, BotState] = {}
+        self.calls = 0
+        self.blocked = 0
+        self.bad_requests = 0
+        self.server_errors = 0
+        self.message_id = 0
+        self.route("POST", "/bot{token}/{method}", self._bot_method)
+
+    def totals(self) -> dict[str, int]:
+        return {"calls": self.calls, "sent": sum(b.sent for b in self.bots.values()),
+                "limited": sum(b.limited for b in self.bots.values()), "blocked": self.blocked,
+                "bad_requests": self.bad_requests, "server_errors": self.server_errors}
+
+    def _admit(self, bot: BotState, chat_id: int) -> int:
+        """0 when the message may go out, else the retry_after to answer with."""
+        now = self.clock()
+        lim = self.limits
+        if now < bot.penalty_until:
+            return max(1, math.ceil(bot.penalty_until - now))
+        bot.tokens = min(float(lim.burst), bot.tokens + (now - bot.refilled) * lim.rate)
+        bot.refilled = now
+        last = bot.last_by_chat.get(chat_id)
+        if last is not None and now - last < lim.per_chat_interval:
+            return max(1, math.ceil(lim.per_chat_interval - (now - last)))
+        if bot.tokens < 1:
+            wait = lim.retry_after or max(1, math.ceil((1 - bot.tokens) / lim.rate))
+            if lim.flood_wait:
+                bot.penalty_until = now + wait
+            return wait
+        bot.tokens -= 1
+        bot.last_by_chat[chat_id] = now
+        return 0
+
+    async def _bot_method(self, req: Request) -> Reply:
+        self.calls += 1
+        method = req.params["method"]
+        if method == "getMe":
+            return Reply(200, {"ok": True, "result": {"id": zlib.crc32(req.params["token"].encode()), "is_bot": True,
+                                                      "username": "svp_bench_bot"}})
+        if method not in SEND_METHODS:
+            return Reply(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+        if req.headers.get("content-type", "").startswith("application/json"):
+            params = req.json()
+        else:
+            params = dict(parse_qsl(req.body.decode()))
+        try:
+            chat_id = int(params.get("chat_id") or 0)
+        except (TypeError, ValueError):
+            chat_id = 0
+        if not chat_id:
+            return Reply(400, {"ok": False, "error_code": 400, "description": "Bad Request: chat_id is empty"})
+        if method == "sendMessage" and not str(params.get("text") or "").strip():
+            return Reply(400, {"ok": False, "error_code": 400, "description": "Bad Request: message text is empty"})
+        lim = self.limits
+        if lim.server_error_share and self.rng.random() < lim.server_error_share:
+            self.server_errors += 1
+            return Reply(502, {"ok": False, "error_code": 502, "description": "Bad Gateway"})
+        bot = self.bots.get(req.params["token"])
+        if bot is None:
+            bot = self.bots[req.params["token"]] = BotState(lim.burst, self.clock())
+        wait = self._admit(bot, chat_id)
+        if wait:
+            bot.limited += 1
+            return too_many(wait)
+        if chat_share(chat_id, b"blocked") < lim.blocked_share:
+            self.blocked += 1
+            return Reply(403, {"ok": False, "error_code": 403, "description": "Forbidden: bot was blocked by the user"})
+        if chat_share(chat_id, b"bad") < lim.bad_request_share:
+            self.bad_requests += 1
+            return Reply(400, {"ok": False, "error_code": 400, "description": "Bad Request: chat not found"})
+        bot.sent += 1
+        self.message_id += 1
+        return Reply(200, {"ok": True, "result": {"message_id": self.message_id, "date": int(self.clock()),
+                                                  "chat": {"id": chat_id, "type": "private"}}})
+
+
+def add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rate", type=float, default=30.0, help="messages per second per bot token")
+    parser.add_argument("--burst", type=int, default=30)
+    parser.add_argument("--per-chat-interval", type=float, default=1.0, help="seconds between messages to one chat")
+    parser.add_argument("--retry-after", type=int, default=0, help="fixed retry_after (0 = until the bucket refills)")
+    parser.add_argument("--no-flood-wait", action="store_true", help="do not keep answering 429 during retry_after")
+    parser.add_argument("--blocked-share", type=float, default=0.0, help="share of chats that blocked the bot (403)")
+    parser.add_argument("--bad-request-share", type=float, default=0.0, help="share of chats answering 400")
+    parser.add_argument("--server-error-share", type=float, default=0.0, help="share of calls answering 502")
+
+
+def limits_from_args(args: argparse.Namespace) -> BotLimits:
+    return BotLimits(args.rate, args.burst, args.per_chat_interval, args.retry_after, not args.no_flood_wait,
+                     args.blocked_share, args.bad_request_share, args.server_error_share)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = await BotApiServer(limits_from_args(args), args.latency_ms, args.jitter_ms, args.seed).start(
+        args.host, args.port)
+    print(f"bot api stand-in listening on {server.base} (POST /bot<token>/sendMessage)", flush=True)
+    await asyncio.Event().wait()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Telegram/Bale Bot API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    add_limit_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
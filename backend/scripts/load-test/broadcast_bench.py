@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""Broadcast fan-out benchmark: enqueue and drain ``svp_broadcast_queue`` at 10k–1M targets.
+
+BroadcastLoadEnqueueTest stops at 1000 users and never sends anything. This
+driver replays BroadcastQueueService::createAndEnqueue and
+BroadcastWorkerService::runBatch statement for statement. It runs them against
+a SQLite stand-in of ``svp_users``, ``svp_broadcasts`` and
+``svp_broadcast_queue``, with the columns and indexes of
+database/schema/svp_schema.sql. Messages go to the Bot API stand-in
+(botapi_standin.py), or to any base URL that speaks the Bot API.
+
+For each target size it measures:
+
+- Enqueue. The time to resolve recipients (every approved non-reseller user
+  loaded at once), to build one ``payload_json`` row per chat, and to insert
+  in chunks of 200. It also reports how many rows and payload bytes are held
+  in memory before the first insert, and how much the queue table grows.
+- Drain. runBatch runs back to back on ``--workers`` workers. The cron job has
+  no ``withoutOverlapping``, so runs can overlap. The drain stops after
+  ``--drain-seconds`` or ``--drain-limit`` finished rows. Reported: delivered
+  rows per second, 429s and other failure kinds, and retry amplification
+  (send attempts per finished row). Per row it splits DB, send and sleep time,
+  and shows the share spent in maybeMarkBroadcastDone's COUNT, which scans
+  the unfinished rows once per row. It also reports the backlog over time and
+  the ``tries`` histogram.
+- Projection. The time to drain that size's whole queue at three rates:
+  - the scheduler cadence, one ``broadcast_batch_size`` batch per minute;
+  - the worker rate measured at that backlog;
+  - the Bot API ceiling of ``--rate`` per token, with Telegram and Bale
+    draining in parallel.
+
+The absolute DB times are SQLite's. Trends like per-row cost growing with the
+backlog, and engine-independent numbers like payload bytes, carry over to
+MySQL. Each send opens a new connection (``Connection: close``), as Laravel's
+Http client does. Sleeps are real: ``--usleep-us`` is broadcast_usleep_us,
+default 280 ms.
+
+Usage:
+  python3 scripts/load-test/broadcast_bench.py --targets=10k,100k,1M --drain-seconds=20
+  python3 scripts/load-test/broadcast_bench.py --targets=100k --workers=8 --usleep-us=0 --latency-ms=50
+  python3 scripts/load-test/botapi_standin.py --port=8081 --latency-ms=50 &
+  python3 scripts/load-test/broadcast_bench.py --api=http://127.0.0.1:8081 --log ../docs/evidence/broadcast-bench-v28.log
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from botapi_standin import BotApiServer, add_limit_arguments, limits_from_args  # noqa: E402
+from load_engine import ConnectionPool, Histogram  # noqa: E402
+
+CHUNK = 200  # array_chunk in createAndEnqueue
+CRON_INTERVAL_S = 60  # BroadcastWorkerJob runs everyMinute()
+DEFAULT_TEXT = ("<b>اطلاعیه</b>\nسرویس‌های شما تا پایان ماه با ۲۰٪ تخفیف تمدید می‌شوند. "
+                "برای تمدید از منوی «سرویس‌های من» استفاده کنید.")
+
+SCHEMA = """
+CREATE TABLE svp_users (
+    id INTEGER PRIMARY KEY, tg_user_id INTEGER UNIQUE, bale_user_id INTEGER UNIQUE,
+    first_name TEXT DEFAULT '', last_name TEXT DEFAULT '', username TEXT DEFAULT '', phone TEXT DEFAULT '',
+    role TEXT NOT NULL DEFAULT 'user', balance NUMERIC NOT NULL DEFAULT 0, status TEXT NOT NULL DEFAULT 'pending',
+    bot_locale TEXT NOT NULL DEFAULT '', created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX svp_users_status ON svp_users (status);
+CREATE INDEX svp_users_role ON svp_users (role);
+CREATE TABLE svp_broadcasts (
+    id INTEGER PRIMARY KEY, owner_svp_user_id INTEGER NOT NULL DEFAULT 0, type TEXT NOT NULL, content TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'draft', sent_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0, total_targets INTEGER NOT NULL DEFAULT 0,
+    blocked_count INTEGER NOT NULL DEFAULT 0, meta_json TEXT, created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE svp_broadcast_queue (
+    id INTEGER PRIMARY KEY, broadcast_id INTEGER NOT NULL, user_id INTEGER NOT NULL, bot TEXT NOT NULL,
+    chat_id INTEGER NOT NULL, payload_json TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending',
+    tries INTEGER NOT NULL DEFAULT 0, last_error TEXT, failure_kind TEXT,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX svp_broadcast_queue_broadcast_id ON svp_broadcast_queue (broadcast_id);
+CREATE INDEX svp_broadcast_queue_status ON svp_broadcast_queue (status);
+"""
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def php_json(value: object) -> str:
+    """json_encode($value, JSON_UNESCAPED_UNICODE): compact, slashes escaped."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).replace("/", "\\/")
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    db = sqlite3.connect(path, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    if not db.execute("SELECT 1 FROM sqlite_master WHERE name = 'svp_broadcast_queue'").fetchone():
+        db.executescript(SCHEMA)
+    return db
+
+
+def db_bytes(db: sqlite3.Connection) -> int:
+    return db.execute("PRAGMA page_count").fetchone()[0] * db.execute("PRAGMA page_size").fetchone()[0]
+
+
+def seed_users(db: sqlite3.Connection, count: int, bale_share: float) -> None:
+    """``count`` approved users, all on Telegram; a ``bale_share`` of them also on Bale."""
+    step = round(1 / bale_share) if bale_share > 0 else 0
+    rows = ((i, 700_000_000 + i, 1_100_000_000 + i if step and i % step == 0 else None, f"u{i}", now())
+            for i in range(1, count + 1))
+    db.execute("BEGIN")
+    db.executemany("INSERT INTO svp_users (id, tg_user_id, bale_user_id, username, role, status, created_at) "
+                   "VALUES (?, ?, ?, ?, 'user', 'approved', ?)", rows)
+    db.execute("COMMIT")
+
+
+# --- BroadcastQueueService -------------------------------------------------
+
+class Enqueue(NamedTuple):
+    broadcast_id: int
+    queued: int
+    total_targets: int
+    resolve_s: float
+    build_s: float
+    insert_s: float
+    payload_bytes: int
+    grown_bytes: int
+
+
+def create_and_enqueue(db: sqlite3.Connection, text: str, targets: str = "both", chunk: int = CHUNK) -> Enqueue:
+    include_tg = targets in ("both", "telegram")
+    include_bale = targets in ("both", "bale")
+    before = db_bytes(db)
+    content = php_json({"text": text, "parse_mode": "HTML", "photo": "", "media_urls": [], "targets": targets})
+    meta = php_json({"targets": targets, "parse_mode": "HTML", "has_photo": False, "media_count": 0})
+    bid = db.execute("INSERT INTO svp_broadcasts (owner_svp_user_id, type, content, status, meta_json, total_targets, "
+                     "blocked_count, created_at) VALUES (0, 'text', ?, 'sending', ?, 0, 0, ?)",
+                     (content, meta, now())).lastrowid
+
+    t = time.perf_counter()
+    users = db.execute("SELECT * FROM svp_users WHERE status = 'approved' AND role != 'reseller'").fetchall()
+    resolve_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    base = {"text": text, "parse_mode": "HTML", "media_urls": []}
+    rows = []
+    for user in users:
+        for bot, chat_id, included in (("tg", user["tg_user_id"], include_tg),
+                                       ("bale", user["bale_user_id"], include_bale)):
+            if included and (chat_id or 0) > 0:
+                rows.append((bid, user["id"], bot, chat_id, php_json({**base, "chat_id": chat_id}), "pending", 0,
+                             now()))
+    build_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for i in range(0, len(rows), chunk):
+        # One multi-row INSERT per chunk in MySQL: one transaction each.
+        db.execute("BEGIN")
+        db.executemany("INSERT INTO svp_broadcast_queue (broadcast_id, user_id, bot, chat_id, payload_json, status, "
+                       "tries, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows[i:i + chunk])
+        db.execute("COMMIT")
+    distinct = len({r[1] for r in rows})
+    db.execute("UPDATE svp_broadcasts SET total_targets = ?, status = ? WHERE id = ?",
+               (distinct, "sending" if rows else "done", bid))
+    insert_s = time.perf_counter() - t
+    return Enqueue(bid, len(rows), distinct, resolve_s, build_s, insert_s, sum(len(r[4].encode()) for r in rows),
+                   db_bytes(db) - before)
+
+
+def pop_batch(db: sqlite3.Connection, limit: int, token: str) -> list[sqlite3.Row]:
+    # MySQL: UPDATE ... WHERE status = 'pending' ORDER BY id LIMIT n
+    db.execute("UPDATE svp_broadcast_queue SET status = ? WHERE id IN "
+               "(SELECT id FROM svp_broadcast_queue WHERE status = 'pending' ORDER BY id LIMIT ?)", (token, max(1, limit)))
+    rows = db.execute("SELECT * FROM svp_broadcast_queue WHERE status = ? ORDER BY id", (token,)).fetchall()
+    if rows:
+        db.execute("UPDATE svp_broadcast_queue SET status = 'sending', updated_at = ? WHERE status = ?", (now(), token))
+    return rows
+
+
+def reclaim_stuck(db: sqlite3.Connection, older_than_s: int) -> int:
+    cutoff = (datetime.now(timezone.utc) - timedelta(seconds=max(60, older_than_s))).strftime("%Y-%m-%d %H:%M:%S")
+    return db.execute("UPDATE svp_broadcast_queue SET status = 'pending', updated_at = ? "
+                      "WHERE status = 'sending' AND updated_at < ?", (now(), cutoff)).rowcount
+
+
+def maybe_mark_done(db: sqlite3.Connection, bid: int) -> None:
+    row = db.execute("SELECT * FROM svp_broadcasts WHERE id = ?", (bid,)).fetchone()
+    if row is not None and row["status"] == "cancelled":
+        return
+    pending = db.execute("SELECT COUNT(*) FROM svp_broadcast_queue WHERE broadcast_id = ? "
+                         "AND status IN ('pending', 'sending')", (bid,)).fetchone()[0]
+    if pending == 0:
+        db.execute("UPDATE svp_broadcasts SET status = 'done' WHERE id = ?", (bid,))
+
+
+# --- BroadcastWorkerService ------------------------------------------------
+
+class Settings(NamedTuple):
+    batch: int = 20  # broadcast_batch_size, clamped to 5..80
+    usleep_us: int = 280000  # broadcast_usleep_us
+    maxtry: int = 8  # broadcast_max_retries
+    reclaim_s: int = 600  # broadcast_sending_timeout_sec
+
+
+DEFAULTS = Settings()
+
+
+class Api(NamedTuple):
+    base: str
+    token: str
+
+
+def classify(r: dict) -> str:
+    """BroadcastWorkerService::classifyError."""
+    code = int(r.get("error_code") or 0)
+    desc = str(r.get("description") or "").lower()
+    if code == 429:
+        return "rate_limit"
+    if code in (502, 503, 504):
+        return "network"
+    if code == 400:
+        return "bad_request"
+    if code == 403:
+        return "blocked" if any(s in desc for s in ("blocked", "deactivated", "forbidden", "kicked")) else "bad_request"
+    if "timeout" in desc or "timed out" in desc:
+        return "network"
+    return "unknown"
+
+
+class Drain:
+    """Counters shared by the workers of one drain."""
+
+    def __init__(self, queued: int):
+        self.queued = queued
+        self.batches = 0
+        self.rows = 0
+        self.attempts = 0
+        self.delivered = 0
+        self.failed = 0
+        self.retried = 0
+        self.kinds: Counter[str] = Counter()
+        self.exceptions: Counter[str] = Counter()
+        self.db_s = 0.0
+        self.done_check_s = 0.0
+        self.send_s = 0.0
+        self.slept = 0.0
+        self.send_hist = Histogram()
+        self.samples: list[tuple[float, int, int]] = []
+
+    @property
+    def finished(self) -> int:
+        return self.delivered + self.failed
+
+
+class Worker:
+    """One BroadcastWorkerJob run loop with its own Http client."""
+
+    def __init__(self, db: sqlite3.Connection, apis: dict[str, Api], settings: Settings, drain: Drain,
+                 timeout: float = 30.0):
+        self.db = db
+        self.apis = apis
+        self.pools = {bot: ConnectionPool(api.base, size=1, timeout=timeout) for bot, api in apis.items()}
+        self.settings = settings
+        self.drain = drain
+        self.popped = 0
+
+    def _db(self, fn, *args):
+        t = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.drain.db_s += time.perf_counter() - t
+
+    def _exec(self, sql: str, args: tuple = ()) -> sqlite3.Cursor:
+        return self._db(self.db.execute, sql, args)
+
+    def _mark_done(self, bid: int) -> None:
+        t = time.perf_counter()
+        self._db(maybe_mark_done, self.db, bid)
+        self.drain.done_check_s += time.perf_counter() - t
+
+    async def _sleep(self, us: int) -> None:
+        self.drain.slept += us / 1e6
+        await asyncio.sleep(us / 1e6)
+
+    async def close(self) -> None:
+        for pool in self.pools.values():
+            await pool.close()
+
+    async def send(self, bot: str, method: str, params: dict) -> dict:
+        api = self.apis.get(bot)
+        if api is None:
+            return {"ok": False, "description": "no_token", "error_code": 400}
+        self.drain.attempts += 1
+        t = time.perf_counter()
+        try:
+            resp = await self.pools[bot].request("POST", f"/bot{api.token}/{method}", {
+                "Content-Type": "application/json", "Accept": "application/json", "Connection": "close"},
+                json.dumps(params, ensure_ascii=False).encode())
+            r = json.loads(resp.body)
+        except (OSError, asyncio.TimeoutError, ValueError) as exc:
+            self.drain.exceptions[type(exc).__name__] += 1
+            r = None
+        finally:
+            ms = (time.perf_counter() - t) * 1000
+            self.drain.send_s += ms / 1000
+            self.drain.send_hist.record(ms)
+        return r if isinstance(r, dict) else {"ok": False, "description": "no_response"}
+
+    async def run_batch(self) -> int:
+        s = self.settings
+        self._db(reclaim_stuck, self.db, max(120, s.reclaim_s))
+        self.popped += 1
+        rows = self._db(pop_batch, self.db, max(5, min(80, s.batch)), f"c_{id(self):x}{self.popped:x}")
+        if not rows:
+            return 0
+        self.drain.batches += 1
+        owners: dict[int, int] = {}
+        for row in rows:
+            self.drain.rows += 1
+            qid, bid = row["id"], row["broadcast_id"]
+            try:
+                payload = json.loads(row["payload_json"])
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                self._fail(row, "bad_request", "invalid_payload_json")
+                continue
+            fresh = self._exec("SELECT status FROM svp_broadcast_queue WHERE id = ?", (qid,)).fetchone()
+            if fresh is None or fresh[0] != "sending":
+                self._mark_done(bid)
+                continue
+            if bid not in owners:
+                bcast = self._exec("SELECT * FROM svp_broadcasts WHERE id = ?", (bid,)).fetchone()
+                owners[bid] = bcast["owner_svp_user_id"] if bcast else 0
+            params = {"chat_id": int(payload.get("chat_id") or 0), "text": str(payload.get("text") or "")}
+            if row["bot"] == "tg" and payload.get("parse_mode"):
+                params["parse_mode"] = payload["parse_mode"]  # normalizeForPlatform drops it for Bale
+            r = await self.send(row["bot"], "sendMessage", params)
+            if r.get("ok"):
+                self.drain.delivered += 1
+                self._exec("UPDATE svp_broadcast_queue SET status = 'sent', tries = ?, last_error = NULL, "
+                           "failure_kind = NULL, updated_at = ? WHERE id = ?", (row["tries"] + 1, now(), qid))
+                self._exec("UPDATE svp_broadcasts SET sent_count = sent_count + 1 WHERE id = ?", (bid,))
+            else:
+                await self.handle_failure(row, r)
+            self._mark_done(bid)
+            if s.usleep_us > 0:
+                await self._sleep(s.usleep_us)
+        return len(rows)
+
+    async def handle_failure(self, row: sqlite3.Row, r: dict) -> None:
+        kind = classify(r)
+        self.drain.kinds[kind] += 1
+        err = f"{r.get('error_code', '')}: {str(r.get('description') or '')[:500]}".strip()
+        tries = row["tries"] + 1
+        if kind == "rate_limit" or (kind not in ("blocked", "bad_request") and tries < self.settings.maxtry):
+            # 429 goes back to pending with no retry cap; retry_after is not read.
+            self.drain.retried += 1
+            self._exec("UPDATE svp_broadcast_queue SET status = 'pending', tries = ?, failure_kind = ?, last_error = ?, "
+                       "updated_at = ? WHERE id = ?", (tries, kind, err, now(), row["id"]))
+            if kind == "rate_limit" and self.settings.usleep_us > 0:
+                await self._sleep(min(2000000, self.settings.usleep_us * 2))
+            return
+        self.drain.failed += 1
+        self._exec("UPDATE svp_broadcast_queue SET status = 'failed', tries = ?, failure_kind = ?, last_error = ?, "
+                   "updated_at = ? WHERE id = ?", (tries, kind, err, now(), row["id"]))
+        column = "blocked_count" if kind == "blocked" else "failed_count"
+        self._exec(f"UPDATE svp_broadcasts SET {column} = {column} + 1 WHERE id = ?", (row["broadcast_id"],))
+
+    def _fail(self, row: sqlite3.Row, kind: str, err: str) -> None:
+        self.drain.failed += 1
+        self.drain.kinds[kind] += 1
+        self._exec("UPDATE svp_broadcast_queue SET status = 'failed', tries = ?, failure_kind = ?, last_error = ?, "
+                   "updated_at = ? WHERE id = ?", (row["tries"] + 1, kind, err, now(), row["id"]))
+        self._exec("UPDATE svp_broadcasts SET failed_count = failed_count + 1 WHERE id = ?", (row["broadcast_id"],))
+        self._mark_done(row["broadcast_id"])
+
+
+async def drain_queue(db: sqlite3.Connection, apis: dict[str, Api], settings: Settings, workers: int, queued: int,
+                      seconds: float, limit: int = 0, sample_every: float = 5.0, timeout: float = 30.0) -> tuple[Drain, float]:
+    """Run ``workers`` back-to-back runBatch loops until the time or row limit, or the queue is empty."""
+    drain = Drain(queued)
+    started = time.perf_counter()
+    deadline = started + seconds
+    done = asyncio.Event()
+
+    def over() -> bool:
+        return time.perf_counter() >= deadline or (limit and drain.finished >= limit) or done.is_set()
+
+    async def loop(worker: Worker) -> None:
+        try:
+            while not over():
+                if await worker.run_batch() == 0:
+                    if drain.finished >= queued:
+                        done.set()
+                    else:
+                        await asyncio.sleep(0.05)  # other workers still hold rows that may come back
+        finally:
+            await worker.close()
+
+    async def sampler() -> None:
+        while not over():
+            drain.samples.append((time.perf_counter() - started, drain.delivered, queued - drain.finished))
+            await asyncio.sleep(sample_every)
+
+    pool = [Worker(db, apis, settings, drain, timeout) for _ in range(max(1, workers))]
+    sample = asyncio.create_task(sampler())
+    await asyncio.gather(*(loop(w) for w in pool))
+    wall = time.perf_counter() - started
+    sample.cancel()
+    drain.samples.append((wall, drain.delivered, queued - drain.finished))
+    return drain, wall
+
+
+# --- report ----------------------------------------------------------------
+
+def human(seconds: float | None) -> str:
+    if seconds is None:
+        return "never"
+    seconds = int(round(seconds))
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            whole, rest = divmod(seconds, size)
+            sub = {"d": ("h", 3600), "h": ("m", 60), "m": ("s", 1)}[unit]
+            return f"{whole}{unit}{rest // sub[1]}{sub[0]}" if rest // sub[1] else f"{whole}{unit}"
+    return f"{seconds}s"
+
+
+def projection(queued: int, tg_rows: int, settings: Settings, worker_rate: float, api_rate: float) -> dict:
+    """Seconds to drain ``queued`` rows at the cron cadence, the measured rate and the Bot API ceiling."""
+    cron_rate = max(5, min(80, settings.batch)) / CRON_INTERVAL_S
+    busiest = max(tg_rows, queued - tg_rows)  # the two tokens drain in parallel
+    return {
+        "cron_s": round(queued / cron_rate, 1),
+        "worker_s": round(queued / worker_rate, 1) if worker_rate else None,
+        "api_s": round(busiest / api_rate, 1) if api_rate else None,
+    }
+
+
+def run_report(size: int, enq: Enqueue, drain: Drain, wall: float, tries: dict[int, int], settings: Settings,
+               workers: int, api_rate: float, tg_rows: int) -> dict:
+    rows = max(drain.rows, 1)
+    worker_rate = drain.finished / wall if wall else 0.0
+    return {
+        "targets": size,
+        "queued": enq.queued,
+        "enqueue": {
+            "total_s": round(enq.resolve_s + enq.build_s + enq.insert_s, 3),
+            "resolve_s": round(enq.resolve_s, 3),
+            "build_s": round(enq.build_s, 3),
+            "insert_s": round(enq.insert_s, 3),
+            "rows_per_s": round(enq.queued / enq.insert_s) if enq.insert_s else 0,
+            "rows_in_memory": enq.queued,
+            "payload_bytes": enq.payload_bytes,
+            "avg_payload_bytes": round(enq.payload_bytes / enq.queued, 1) if enq.queued else 0,
+            "table_growth_bytes": enq.grown_bytes,
+            "bytes_per_row": round(enq.grown_bytes / enq.queued, 1) if enq.queued else 0,
+        },
+        "drain": {
+            "workers": workers,
+            "wall_s": round(wall, 3),
+            "batches": drain.batches,
+            "rows": drain.rows,
+            "attempts": drain.attempts,
+            "delivered": drain.delivered,
+            "failed": drain.failed,
+            "retried": drain.retried,
+            "backlog": enq.queued - drain.finished,
+            "delivered_per_s": round(drain.delivered / wall, 2) if wall else 0.0,
+            "finished_per_s": round(worker_rate, 2),
+            "amplification": round(drain.attempts / drain.finished, 3) if drain.finished else 0.0,
+            "kinds": dict(drain.kinds),
+            "exceptions": dict(drain.exceptions),
+            "db_ms_per_row": round(drain.db_s * 1000 / rows, 3),
+            "done_check_ms_per_row": round(drain.done_check_s * 1000 / rows, 3),
+            "send_ms_per_row": round(drain.send_s * 1000 / rows, 3),
+            "sleep_ms_per_row": round(drain.slept * 1000 / rows, 3),
+            "send_p50_ms": round(drain.send_hist.percentile(50), 1),
+            "send_p99_ms": round(drain.send_hist.percentile(99), 1),
+            "samples": [(round(t, 1), d, b) for t, d, b in drain.samples],
+        },
+        "tries": tries,
+        "projection": projection(enq.queued, tg_rows, settings, worker_rate, api_rate),
+    }
+
+
+async def bench_size(size: int, args: argparse.Namespace, apis: dict[str, Api], settings: Settings,
+                     workdir: Path) -> dict:
+    path = workdir / f"broadcast-{size}.sqlite"
+    path.unlink(missing_ok=True)
+    db = connect(path)
+    try:
+        seed_users(db, size, args.bale_share)
+        enq = create_and_enqueue(db, args.text, args.platforms, args.chunk)
+        tg_rows = db.execute("SELECT COUNT(*) FROM svp_broadcast_queue WHERE bot = 'tg'").fetchone()[0]
+        drain, wall = await drain_queue(db, apis, settings, args.workers, enq.queued, args.drain_seconds,
+                                        args.drain_limit, args.sample_every, args.timeout)
+        tries = {t: n for t, n in db.execute("SELECT tries, COUNT(*) FROM svp_broadcast_queue "
+                                             "WHERE status IN ('sent', 'failed') GROUP BY tries ORDER BY tries")}
+        return run_report(size, enq, drain, wall, tries, settings, args.workers, args.rate, tg_rows)
+    finally:
+        db.close()
+
+
+async def bench(args: argparse.Namespace) -> tuple[list[dict], dict | None]:
+    settings = Settings(args.batch, args.usleep_us, args.maxtry)
+    server = None
+    base = args.api
+    if not base:
+        server = await BotApiServer(limits_from_args(args), args.latency_ms, args.jitter_ms, args.seed).start()
+        base = server.base
+    apis = {"tg": Api(base, args.tg_token), "bale": Api(args.bale_api or base, args.bale_token)}
+    tmp = None
+    workdir = args.keep_db
+    if workdir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="broadcast-bench-")
+        workdir = Path(tmp.name)
+    workdir.mkdir(parents=True, exist_ok=True)
+    reports = []
+    try:
+        for size in sorted(set(args.targets)):
+            reports.append(await bench_size(size, args, apis, settings, workdir))
+    finally:
+        if server is not None:
+            await server.stop()
+        if tmp is not None:
+            tmp.cleanup()
+    return reports, server.totals() if server is not None else None
+
+
+def failures(reports: list[dict], max_amplification: float) -> list[str]:
+    lines = []
+    for r in reports:
+        d = r["drain"]
+        if d["exceptions"]:
+            lines.append(f"FAIL: targets={r['targets']} send exceptions {d['exceptions']}")
+        if d["rows"] and not d["delivered"]:
+            lines.append(f"FAIL: targets={r['targets']} nothing delivered in {d['wall_s']}s")
+        if max_amplification and d["amplification"] > max_amplification:
+            lines.append(f"FAIL: targets={r['targets']} amplification {d['amplification']} > {max_amplification}")
+    return lines
+
+
+def log_lines(reports: list[dict], args: argparse.Namespace, started: str, fails: list[str]) -> list[str]:
+    where = args.api or f"stand-in rate={args.rate:g}/s burst={args.burst} latency={args.latency_ms:g}ms"
+    lines = [f"broadcast-bench start {started} host={socket.gethostname()} platforms={args.platforms} "
+             f"batch={args.batch} usleep_us={args.usleep_us} workers={args.workers} api={where}"]
+    for r in reports:
+        e, d, n = r["enqueue"], r["drain"], r["targets"]
+        lines.append(f"enqueue targets={n} queued={r['queued']} s={e['total_s']} resolve_s={e['resolve_s']} "
+                     f"build_s={e['build_s']} insert_s={e['insert_s']} rows_per_s={e['rows_per_s']} "
+                     f"rows_in_memory={e['rows_in_memory']} payload_bytes={e['payload_bytes']}")
+        lines.append(f"queue-growth targets={n} bytes={e['table_growth_bytes']} bytes_per_row={e['bytes_per_row']} "
+                     f"avg_payload_bytes={e['avg_payload_bytes']}")
+        kinds = " ".join(f"{k}={v}" for k, v in sorted(d["kinds"].items())) or "none"
+        lines.append(f"drain targets={n} s={d['wall_s']} delivered={d['delivered']} failed={d['failed']} "
+                     f"attempts={d['attempts']} retried={d['retried']} amplification={d['amplification']} "
+                     f"delivered_per_s={d['delivered_per_s']} backlog={d['backlog']} errors={kinds}")
+        lines.append(f"per-row targets={n} db_ms={d['db_ms_per_row']} done_check_ms={d['done_check_ms_per_row']} "
+                     f"send_ms={d['send_ms_per_row']} sleep_ms={d['sleep_ms_per_row']} "
+                     f"send_p50_ms={d['send_p50_ms']} send_p99_ms={d['send_p99_ms']}")
+        lines.append(f"backlog targets={n} " + " ".join(f"t={t}s:{b}" for t, _, b in d["samples"]))
+        lines.append(f"tries targets={n} " + (" ".join(f"{t}={c}" for t, c in r["tries"].items()) or "none"))
+        p = r["projection"]
+        lines.append(f"projection targets={n} cron={human(p['cron_s'])} worker={human(p['worker_s'])} "
+                     f"bot_api={human(p['api_s'])}")
+    lines.extend(fails)
+    lines.append(f"broadcast-bench complete exit={1 if fails else 0} sizes={len(reports)} "
+                 f"queued={sum(r['queued'] for r in reports)} delivered={sum(r['drain']['delivered'] for r in reports)}")
+    return lines
+
+
+def size_list(text: str) -> list[int]:
+    """``10k,100k,1M`` -> [10000, 100000, 1000000]."""
+    out = []
+    for part in filter(None, (p.strip().lower() for p in text.split(","))):
+        scale = {"k": 1_000, "m": 1_000_000}.get(part[-1], 1)
+        out.append(int(float(part.rstrip("km")) * scale))
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Broadcast enqueue/drain benchmark on a SQLite stand-in")
+    parser.add_argument("--targets", type=size_list, default=[10_000, 100_000, 1_000_000],
+                        help="approved users per run, e.g. 10k,100k,1M")
+    parser.add_argument("--platforms", choices=("both", "telegram", "bale"), default="both", help="bc_targets")
+    parser.add_argument("--bale-share", type=float, default=0.3, help="share of users that also have a Bale id")
+    parser.add_argument("--text", default=DEFAULT_TEXT, help="broadcast text (HTML)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="rows per INSERT (createAndEnqueue uses 200)")
+    parser.add_argument("--batch", type=int, default=DEFAULTS.batch, help="broadcast_batch_size")
+    parser.add_argument("--usleep-us", type=int, default=DEFAULTS.usleep_us, help="broadcast_usleep_us")
+    parser.add_argument("--maxtry", type=int, default=DEFAULTS.maxtry, help="broadcast_max_retries")
+    parser.add_argument("--workers", type=int, default=1, help="overlapping runBatch loops")
+    parser.add_argument("--drain-seconds", type=float, default=20.0)
+    parser.add_argument("--drain-limit", type=int, default=0, help="stop after this many finished rows (0 = no limit)")
+    parser.add_argument("--sample-every", type=float, default=5.0, help="backlog sample interval (s)")
+    parser.add_argument("--api", help="Bot API base URL (default: in-process botapi_standin)")
+    parser.add_argument("--bale-api", help="Bale base URL when it differs from --api")
+    parser.add_argument("--tg-token", default="100:tg-bench")
+    parser.add_argument("--bale-token", default="200:bale-bench")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="stand-in latency")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="send timeout (Http::timeout(30))")
+    parser.add_argument("--keep-db", type=Path, help="write broadcast-<targets>.sqlite here instead of a temp dir")
+    parser.add_argument("--max-amplification", type=float, default=0.0, help="FAIL above this attempts/finished")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--log", type=Path, help="also write the broadcast-bench log here")
+    parser.add_argument("--json", action="store_true")
+    add_limit_arguments(parser)
+    parser.set_defaults(blocked_share=0.02)
+    args = parser.parse_args(argv)
+    if not args.targets or min(args.targets) < 1:
+        parser.error("--targets needs at least one positive size")
+
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    reports, totals = asyncio.run(bench(args))
+    fails = failures(reports, args.max_amplification)
+    lines = log_lines(reports, args, started, fails)
+    if args.log:
+        args.log.parent.mkdir(parents=True, exist_ok=True)
+        args.log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps({"runs": reports, "bot_api": totals, "failures": fails}, indent=2, ensure_ascii=False))
+    else:
+        print("\n".join(lines))
+        if totals:
+            print(f"bot api: {totals}")
+    return 1 if fails else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
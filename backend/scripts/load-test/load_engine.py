@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""Asyncio load engine (no k6 / aiohttp dependency).
+
+Pooled keep-alive HTTP/1.1 connections, a fixed-concurrency (closed-loop)
+mode and a constant-arrival-rate (open-loop) mode, with streaming latency
+histograms reported per endpoint.
+
+Usage:
+  python3 scripts/load-test/load_engine.py --base=http://127.0.0.1:8080 --concurrency=32 --requests=2000
+  python3 scripts/load-test/load_engine.py --base=http://127.0.0.1:8080 --rate=200 --duration=30 \\
+      --webhook-secret=YOUR_TELEGRAM_WEBHOOK_SECRET
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import ssl
+import sys
+import time
+from typing import Callable, NamedTuple
+from urllib.parse import urlsplit
+
+USER_AGENT = "svp-load/1"
+
+
+class Response(NamedTuple):
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    set_cookies: tuple[str, ...] = ()
+
+
+class HttpConnection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+        self.used = 0
+
+    async def request(self, method: str, target: str, host: str, headers: dict[str, str], body: bytes) -> Response:
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        self.used += 1
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        status = int(status_line.split(b" ", 2)[1])
+        resp_headers: dict[str, str] = {}
+        set_cookies: list[str] = []
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = line.decode("latin-1").partition(":")
+            k = k.strip().lower()
+            if k == "set-cookie":
+                set_cookies.append(v.strip())
+            resp_headers[k] = v.strip()
+        if resp_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in resp_headers:
+            data = await self.reader.readexactly(int(resp_headers["content-length"]))
+        elif method == "HEAD" or status in (204, 304):
+            data = b""
+        else:
+            data = await self.reader.read()
+            self.reusable = False
+        if resp_headers.get("connection", "").lower() == "close":
+            self.reusable = False
+        return Response(status, resp_headers, data, tuple(set_cookies))
+
+    def close(self) -> None:
+        self.reusable = False
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Bounded pool of keep-alive connections to one origin."""
+
+    def __init__(self, base: str, size: int = 16, timeout: float = 15.0):
+        parts = urlsplit(base)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if self.scheme == "https" else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.host_header = parts.netloc or self.host
+        self.ssl = ssl.create_default_context() if self.scheme == "https" else None
+        self.size = size
+        self.timeout = timeout
+        self.idle: list[HttpConnection] = []
+        self.opened = 0
+        self.live = 0
+        self._slots = asyncio.Semaphore(size)
+
+    async def _connect(self) -> HttpConnection:
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl,
+                                                       server_hostname=self.host if self.ssl else None)
+        self.opened += 1
+        self.live += 1
+        return HttpConnection(reader, writer)
+
+    def _discard(self, conn: HttpConnection) -> None:
+        conn.close()
+        self.live -= 1
+
+    async def request(self, method: str, path: str, headers: dict[str, str] | None = None,
+                      body: bytes = b"") -> Response:
+        async with self._slots:
+            for attempt in (0, 1):
+                conn = self.idle.pop() if self.idle else await asyncio.wait_for(self._connect(), self.timeout)
+                reused = conn.used > 0
+                try:
+                    resp = await asyncio.wait_for(
+                        conn.request(method, self.prefix + path, self.host_header, headers or {}, body), self.timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                    self._discard(conn)
+                    # A keep-alive socket the server already closed: retry once on a fresh one.
+                    if reused and attempt == 0:
+                        continue
+                    raise exc
+                except BaseException:
+                    self._discard(conn)
+                    raise
+                if conn.reusable:
+                    self.idle.append(conn)
+                else:
+                    self._discard(conn)
+                return resp
+        raise AssertionError("unreachable")
+
+    async def close(self) -> None:
+        while self.idle:
+            self._discard(self.idle.pop())
+
+
+class Histogram:
+    """Streaming log-bucketed latency histogram (~1% relative precision)."""
+
+    GROWTH = 1.01
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._log = math.log(self.GROWTH)
+
+    def record(self, ms: float) -> None:
+        ms = max(ms, 0.001)
+        key = math.floor(math.log(ms) / self._log)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def merge(self, other: Histogram) -> None:
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                # Bucket midpoint, clamped to the exact extremes.
+                return min(max(self.GROWTH ** (key + 0.5), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Endpoint(NamedTuple):
+    label: str
+    method: str
+    path: str
+    body: Callable[[], bytes] | None = None
+    headers: dict[str, str] = {}
+
+
+class Stats:
+    def __init__(self, endpoint: Endpoint, mode: str):
+        self.endpoint = endpoint
+        self.mode = mode
+        self.hist = Histogram()
+        self.codes: dict[int, int] = {}
+        self.errors = 0
+        self.exceptions: dict[str, int] = {}
+        self.dropped = 0
+        self.elapsed = 0.0
+
+    def record(self, ms: float, status: int | None, error: str | None = None) -> None:
+        self.hist.record(ms)
+        if status is not None:
+            self.codes[status] = self.codes.get(status, 0) + 1
+        if error is not None:
+            self.exceptions[error] = self.exceptions.get(error, 0) + 1
+        if status is None or not 200 <= status < 300:
+            self.errors += 1
+
+    def report(self) -> dict:
+        h = self.hist
+        return {
+            "endpoint": self.endpoint.label,
+            "mode": self.mode,
+            "requests": h.count,
+            "errors": self.errors,
+            "error_rate": round(100 * self.errors / h.count, 2) if h.count else 0.0,
+            "dropped": self.dropped,
+            "codes": {str(k): v for k, v in sorted(self.codes.items())},
+            "exceptions": self.exceptions,
+            "elapsed_s": round(self.elapsed, 3),
+            "rps": round(h.count / self.elapsed, 1) if self.elapsed else 0.0,
+            "p50_ms": round(h.percentile(50), 1),
+            "p95_ms": round(h.percentile(95), 1),
+            "p99_ms": round(h.percentile(99), 1),
+            "max_ms": round(h.max, 1),
+            "mean_ms": round(h.mean, 1),
+        }
+
+
+async def _issue(pool: ConnectionPool, ep: Endpoint, stats: Stats, started: float) -> None:
+    status = error = None
+    try:
+        resp = await pool.request(ep.method, ep.path, dict(ep.headers), ep.body() if ep.body else b"")
+        status = resp.status
+    except Exception as exc:  # counted, never fatal to the run
+        error = type(exc).__name__
+    stats.record((time.perf_counter() - started) * 1000, status, error)
+
+
+async def run_closed(pool: ConnectionPool, ep: Endpoint, concurrency: int,
+                     requests: int | None = None, duration: float | None = None) -> Stats:
+    """Fixed concurrency: each worker issues its next request when the last completes."""
+    stats = Stats(ep, f"closed c={concurrency}")
+    remaining = [requests if requests is not None else math.inf]
+    deadline = time.perf_counter() + duration if duration else math.inf
+
+    async def worker() -> None:
+        while remaining[0] > 0 and time.perf_counter() < deadline:
+            remaining[0] -= 1
+            await _issue(pool, ep, stats, time.perf_counter())
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats.elapsed = time.perf_counter() - t0
+    return stats
+
+
+async def run_open(pool: ConnectionPool, ep: Endpoint, rate: float, duration: float,
+                   max_inflight: int = 1000) -> Stats:
+    """Constant arrival rate; latency is measured from each request's scheduled
+    start so a slow server cannot hide queueing (no coordinated omission)."""
+    stats = Stats(ep, f"open rate={rate:g}/s")
+    total = int(rate * duration)
+    inflight: set[asyncio.Task] = set()
+    t0 = time.perf_counter()
+    for i in range(total):
+        scheduled = t0 + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(inflight) >= max_inflight:
+            stats.dropped += 1
+            continue
+        task = asyncio.create_task(_issue(pool, ep, stats, scheduled))
+        inflight.add(task)
+        task.add_done_callback(inflight.discard)
+    if inflight:
+        await asyncio.gather(*inflight)
+    stats.elapsed = time.perf_counter() - t0
+    return stats
+
+
+def telegram_update() -> bytes:
+    uid = random.randint(1, 2**31 - 1)
+    return json.dumps({
+        "update_id": uid,
+        "message": {"message_id": uid % 100000, "from": {"id": 1}, "chat": {"id": 1, "type": "private"},
+                    "date": int(time.time()), "text": "ping"},
+    }).encode()
+
+
+def default_endpoints(secret: str = "", secret_header: str = "") -> list[Endpoint]:
+    endpoints = [Endpoint("GET /health/ready", "GET", "/health/ready")]
+    if secret:
+        headers = {"Content-Type": "application/json"}
+        if secret_header:
+            headers["X-Telegram-Bot-Api-Secret-Token"] = secret_header
+        endpoints.append(Endpoint("POST /api/v1/webhook/telegram/{secret}", "POST",
+                                  f"/api/v1/webhook/telegram/{secret}", telegram_update, headers))
+    return endpoints
+
+
+def print_report(r: dict) -> None:
+    print(r["endpoint"])
+    print(f"  mode:     {r['mode']}")
+    print(f"  requests: {r['requests']}  ({r['rps']} req/s over {r['elapsed_s']}s)")
+    print(f"  errors:   {r['errors']} ({r['error_rate']}%)  codes={r['codes']}"
+          + (f" exceptions={r['exceptions']}" if r["exceptions"] else "")
+          + (f" dropped={r['dropped']}" if r["dropped"] else ""))
+    print(f"  p50 ms:   {r['p50_ms']}")
+    print(f"  p95 ms:   {r['p95_ms']}")
+    print(f"  p99 ms:   {r['p99_ms']}  (max {r['max_ms']})\n")
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    reports = []
+    for ep in default_endpoints(args.webhook_secret, args.secret_header):
+        pool = ConnectionPool(args.base, size=args.connections or max(args.concurrency, 1), timeout=args.timeout)
+        try:
+            if args.rate:
+                stats = await run_open(pool, ep, args.rate, args.duration or 10, args.max_inflight)
+            else:
+                stats = await run_closed(pool, ep, args.concurrency, args.requests, args.duration)
+        finally:
+            await pool.close()
+        report = stats.report()
+        report["connections_opened"] = pool.opened
+        reports.append(report)
+    return reports
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SVP asyncio load engine")
+    parser.add_argument("--base", default="http://127.0.0.1:8080")
+    parser.add_argument("--concurrency", type=int, default=16, help="closed-loop workers")
+    parser.add_argument("--requests", type=int, help="closed-loop total per endpoint (default: run --duration)")
+    parser.add_argument("--duration", type=float, help="seconds per endpoint")
+    parser.add_argument("--rate", type=float, help="open-loop arrivals per second (enables open-loop mode)")
+    parser.add_argument("--max-inflight", type=int, default=1000, help="open-loop cap; excess arrivals are dropped")
+    parser.add_argument("--connections", type=int, help="pool size (default: --concurrency)")
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--webhook-secret", default="", help="Telegram webhook secret (optional)")
+    parser.add_argument("--secret-header", default="", help="X-Telegram-Bot-Api-Secret-Token value (optional)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    if args.requests is None and args.duration is None and not args.rate:
+        args.requests = 100
+
+    reports = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(f"SVP async load — {args.base}\n")
+        for r in reports:
+            print_report(r)
+        if not args.webhook_secret:
+            print("Skipping webhook bench (pass --webhook-secret=...)\n")
+    for r in reports:
+        ok = r["requests"] - r["errors"]
+        print(f"load: {r['endpoint']} {ok}/{r['requests']} OK p99={r['p99_ms']:.0f}ms rps={r['rps']}", file=sys.stderr)
+    return 0 if all(r["errors"] == 0 and r["dropped"] == 0 for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Authenticated ``POST /api/v1/admin/mutate`` load harness.
+
+Logs in once the way the dashboard does — Sanctum session (``/sanctum/csrf-cookie``
+then ``POST /api/v1/dashboard/login``, AuthController::login) or a bearer token
+(``POST /api/v1/auth/token``) — and replays a weighted mix of mutate ops with a
+concurrency cap, reporting a latency histogram per op. A 401/419 (expired
+session or CSRF token) triggers one re-login and a retry.
+
+Ops in the mix are checked against the handlers registered in MutationRegistry
+(the same ``app/Modules/*/Mutations/*.php`` scan as ``scripts/list_mutate_ops.php``).
+Mutations are real writes: point the mix at preview/read-style ops unless the
+target is a disposable staging copy.
+
+Mix file (see mutate-mix.example.json)::
+
+  {"ops": [{"op": "user_merge_preview", "weight": 5, "payload": {"keep_id": 1, "drop_id": 2}}, ...]}
+
+``payload`` may be a list; one entry is picked at random per request.
+
+Usage:
+  SVP_LOAD_USER=admin SVP_LOAD_PASSWORD=... python3 scripts/load-test/mutate_harness.py \\
+      --base=https://staging.example --mix=scripts/load-test/mutate-mix.example.json --concurrency=8 --duration=60
+  python3 scripts/load-test/mutate_harness.py --list-ops
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool, Endpoint, Response, Stats, print_report  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+MUTATION_GLOBS = ("app/Modules/*/Mutations/*.php", "app/Modules/*/*/Mutations/*.php")
+OP_RE = re.compile(r"'([a-z][a-z0-9_]+)'\s*=>\s*\[self::class")
+REAUTH_STATUS = (401, 419)
+
+
+class AuthError(RuntimeError):
+    pass
+
+
+def registry_ops(root: Path = ROOT) -> list[str]:
+    ops: set[str] = set()
+    for pattern in MUTATION_GLOBS:
+        for path in root.glob(pattern):
+            ops.update(OP_RE.findall(path.read_text()))
+    return sorted(ops)
+
+
+class MixEntry:
+    __slots__ = ("op", "weight", "payloads")
+
+    def __init__(self, op: str, weight: float, payloads: list[dict]):
+        self.op = op
+        self.weight = weight
+        self.payloads = payloads or [{}]
+
+
+def load_mix(path: Path, known: list[str] | None = None) -> list[MixEntry]:
+    data = json.loads(path.read_text())
+    entries = []
+    for item in data["ops"] if isinstance(data, dict) else data:
+        payload = item.get("payload", {})
+        entry = MixEntry(item["op"], float(item.get("weight", 1)), payload if isinstance(payload, list) else [payload])
+        if entry.weight > 0:
+            entries.append(entry)
+    if not entries:
+        raise ValueError(f"{path}: no ops with positive weight")
+    if known is not None:
+        unknown = sorted({e.op for e in entries} - set(known))
+        if unknown:
+            raise ValueError(f"{path}: ops not registered in MutationRegistry: {', '.join(unknown)}")
+    return entries
+
+
+class DashboardSession:
+    """One operator login shared by every worker, like a dashboard tab."""
+
+    def __init__(self, pool: ConnectionPool, base: str, user: str, password: str, mode: str = "session",
+                 admin_prefix: str = "admin"):
+        self.pool = pool
+        self.origin = base.rstrip("/")
+        self.user = user
+        self.password = password
+        self.mode = mode
+        self.mutate_path = f"/api/v1/{admin_prefix}/mutate"
+        self.cookies: dict[str, str] = {}
+        self.token = ""
+        self.generation = 0  # bumped on every successful login
+        self.logins = 0
+        self._lock = asyncio.Lock()
+
+    def _absorb(self, resp: Response) -> None:
+        for header in resp.set_cookies:
+            name, _, rest = header.partition("=")
+            self.cookies[name.strip()] = rest.split(";", 1)[0]
+
+    def headers(self) -> dict[str, str]:
+        headers = {"Accept": "application/json", "Content-Type": "application/json",
+                   "X-Requested-With": "XMLHttpRequest"}
+        if self.mode == "token":
+            headers["Authorization"] = f"Bearer {self.token}"
+            return headers
+        # Sanctum treats the request as stateful only with a first-party Origin/Referer.
+        headers["Origin"] = self.origin
+        headers["Referer"] = self.origin + "/dashboard/"
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        if "XSRF-TOKEN" in self.cookies:
+            headers["X-XSRF-TOKEN"] = unquote(self.cookies["XSRF-TOKEN"])
+        return headers
+
+    async def _post(self, path: str, body: dict) -> Response:
+        resp = await self.pool.request("POST", path, self.headers(), json.dumps(body).encode())
+        self._absorb(resp)
+        return resp
+
+    async def login(self) -> None:
+        creds = {"username": self.user, "password": self.password}
+        if self.mode == "token":
+            resp = await self._post("/api/v1/auth/token", creds)
+            data = json.loads(resp.body or b"{}") if resp.status == 200 else {}
+            self.token = data.get("token") or data.get("data", {}).get("token", "")
+        else:
+            self.cookies.clear()
+            self._absorb(await self.pool.request("GET", "/sanctum/csrf-cookie", self.headers()))
+            resp = await self._post("/api/v1/dashboard/login", creds)
+        if resp.status != 200 or (self.mode == "token" and not self.token):
+            raise AuthError(f"{self.mode} login failed: HTTP {resp.status} {resp.body[:200]!r}")
+        self.generation += 1
+        self.logins += 1
+
+    async def relogin(self, seen_generation: int) -> None:
+        async with self._lock:
+            if self.generation == seen_generation:  # another worker may have refreshed already
+                await self.login()
+
+    async def mutate(self, op: str, payload: dict) -> Response:
+        for attempt in (0, 1):
+            generation = self.generation
+            resp = await self._post(self.mutate_path, {"op": op, **payload})
+            if resp.status not in REAUTH_STATUS or attempt:
+                return resp
+            await self.relogin(generation)
+        raise AssertionError("unreachable")
+
+
+class OpStats(Stats):
+    def __init__(self, op: str, mode: str):
+        super().__init__(Endpoint(op, "POST", "mutate"), mode)
+        self.messages: dict[str, int] = {}
+
+    def report(self) -> dict:
+        return {**super().report(), "messages": self.messages}
+
+
+async def _issue(session: DashboardSession, entry: MixEntry, stats: OpStats, rng: random.Random,
+                 started: float) -> None:
+    status = error = None
+    try:
+        resp = await session.mutate(entry.op, rng.choice(entry.payloads))
+        status = resp.status
+        try:
+            body = json.loads(resp.body or b"{}")
+        except ValueError:
+            body = {}
+        if isinstance(body, dict) and body.get("ok") is False:
+            msg = str(body.get("message", "error"))
+            stats.messages[msg] = stats.messages.get(msg, 0) + 1
+    except Exception as exc:
+        error = type(exc).__name__
+    stats.record((time.perf_counter() - started) * 1000, status, error)
+
+
+async def run_mix(session: DashboardSession, mix: list[MixEntry], concurrency: int,
+                  requests: int | None = None, duration: float | None = None, rate: float | None = None,
+                  seed: int | None = None) -> dict[str, OpStats]:
+    """Closed loop with ``concurrency`` workers, or — with ``rate`` — constant
+    arrivals capped at ``concurrency`` in flight (excess counted as dropped)."""
+    rng = random.Random(seed)
+    mode = f"open rate={rate:g}/s max={concurrency}" if rate else f"closed c={concurrency}"
+    stats = {e.op: OpStats(e.op, mode) for e in mix}
+    cum = []
+    total_w = 0.0
+    for e in mix:
+        total_w += e.weight
+        cum.append(total_w)
+    pick = lambda: rng.choices(mix, cum_weights=cum)[0]  # noqa: E731
+    t0 = time.perf_counter()
+
+    if rate:
+        count = int(rate * (duration or 10)) if requests is None else requests
+        inflight: set[asyncio.Task] = set()
+        for i in range(count):
+            scheduled = t0 + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            entry = pick()
+            if len(inflight) >= concurrency:
+                stats[entry.op].dropped += 1
+                continue
+            task = asyncio.create_task(_issue(session, entry, stats[entry.op], rng, scheduled))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+        if inflight:
+            await asyncio.gather(*inflight)
+    else:
+        remaining = [requests if requests is not None else math.inf]
+        deadline = t0 + duration if duration else math.inf
+
+        async def worker() -> None:
+            while remaining[0] > 0 and time.perf_counter() < deadline:
+                remaining[0] -= 1
+                entry = pick()
+                await _issue(session, entry, stats[entry.op], rng, time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    elapsed = time.perf_counter() - t0
+    for s in stats.values():
+        s.elapsed = elapsed
+    return stats
+
+
+def combined(stats: dict[str, OpStats]) -> OpStats:
+    out = OpStats("all ops", next(iter(stats.values())).mode)
+    for s in stats.values():
+        out.hist.merge(s.hist)
+        out.errors += s.errors
+        out.dropped += s.dropped
+        out.elapsed = s.elapsed
+        for code, n in s.codes.items():
+            out.codes[code] = out.codes.get(code, 0) + n
+        for name, n in s.exceptions.items():
+            out.exceptions[name] = out.exceptions.get(name, 0) + n
+        for msg, n in s.messages.items():
+            out.messages[msg] = out.messages.get(msg, 0) + n
+    return out
+
+
+async def run(args: argparse.Namespace, mix: list[MixEntry]) -> tuple[list[dict], int]:
+    pool = ConnectionPool(args.base, size=args.concurrency, timeout=args.timeout)
+    session = DashboardSession(pool, args.base, args.user, args.password, args.auth, args.admin_prefix)
+    try:
+        await session.login()
+        stats = await run_mix(session, mix, args.concurrency, args.requests, args.duration, args.rate, args.seed)
+    finally:
+        await pool.close()
+    reports = [s.report() for s in stats.values() if s.hist.count or s.dropped]
+    reports.sort(key=lambda r: -r["requests"])
+    return [combined(stats).report()] + reports, session.logins
+
+
+def main(argv: list[str] | None = None) -> int:
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description="SVP admin/mutate load harness")
+    parser.add_argument("--base", default="http://127.0.0.1:8080")
+    parser.add_argument("--auth", choices=("session", "token"), default="session")
+    parser.add_argument("--user", default=env("SVP_LOAD_USER", ""))
+    parser.add_argument("--password", default=env("SVP_LOAD_PASSWORD", ""))
+    parser.add_argument("--admin-prefix", choices=("admin", "dashboard/admin"), default="admin")
+    parser.add_argument("--mix", type=Path, help="weighted op mix (JSON)")
+    parser.add_argument("--allow-unregistered", action="store_true",
+                        help="do not check mix ops against MutationRegistry handlers")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, help="total requests (default: run --duration)")
+    parser.add_argument("--duration", type=float, help="seconds")
+    parser.add_argument("--rate", type=float, help="open-loop arrivals per second, capped at --concurrency in flight")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--list-ops", action="store_true", help="print MutationRegistry ops and exit")
+    args = parser.parse_args(argv)
+
+    if args.list_ops:
+        print("\n".join(registry_ops()))
+        return 0
+    if not args.mix:
+        parser.error("--mix is required")
+    if not args.user or not args.password:
+        parser.error("--user/--password (or SVP_LOAD_USER/SVP_LOAD_PASSWORD) are required")
+    if args.requests is None and args.duration is None:
+        args.requests = 100
+    mix = load_mix(args.mix, None if args.allow_unregistered else registry_ops())
+
+    try:
+        reports, logins = asyncio.run(run(args, mix))
+    except AuthError as exc:
+        print(f"mutate-load: {exc}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps({"logins": logins, "ops": reports}, indent=2))
+    else:
+        print(f"SVP admin/mutate load — {args.base} ({args.auth} auth, {logins} login(s))\n")
+        for r in reports:
+            print_report(r)
+            if r["messages"]:
+                print(f"  ok:false  {r['messages']}\n")
+    total = reports[0]
+    print(f"mutate-load: {total['requests'] - total['errors']}/{total['requests']} OK "
+          f"p99={total['p99_ms']:.0f}ms rps={total['rps']}", file=sys.stderr)
+    return 0 if total["errors"] == 0 and total["dropped"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Latency-aware soak monitor — drop-in for ``scripts/ops/soak-24h.sh``.
+
+Probes ``/health`` and ``/health/ready`` over pooled keep-alive connections on
+a fixed schedule, writes the same log lines as the shell script (plus the
+probe latency) and the same ``soak complete FAIL count: N`` footer, so
+``log_ok()`` and ``docs/scripts/analyze-soak.py`` read its logs unchanged.
+
+Every probe is also appended to a fixed-size binary ring file (16 bytes per
+probe), an hourly percentile summary is logged, and latency SLOs
+(``/health/ready`` p95 < 200ms by default, see docs/LOAD-TEST-FA.md) are
+checked per summary window.
+
+Usage:
+  SVP_BASE_URL=https://staging.example python3 scripts/load-test/soak_monitor.py
+  python3 scripts/load-test/soak_monitor.py --interval=60 --slo=/health/ready=200 --slo=/health=100
+  python3 scripts/load-test/soak_monitor.py --read-ring=/tmp/svp-soak.ring
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool, Histogram  # noqa: E402
+
+PATHS = ("/health", "/health/ready")
+DEFAULT_SLO = {"/health/ready": 200.0}  # p95 ms, docs/LOAD-TEST-FA.md staging threshold
+SLO_PERCENTILE = 95
+
+
+class Probe(NamedTuple):
+    epoch: float
+    path: int  # index into the ring's path table
+    status: int  # 0 = connection error
+    ms: float
+
+
+class LatencyRing:
+    """Fixed-capacity binary ring of probes.
+
+    Header: magic, capacity, total written; then ``capacity`` records of
+    (epoch f64, latency f32, status u16, path u16). The oldest records are
+    overwritten once ``total > capacity``.
+    """
+
+    MAGIC = b"SVPRING1"
+    HEADER = struct.Struct("<8sQQ")
+    RECORD = struct.Struct("<dfHH")
+
+    def __init__(self, path: Path, capacity: int = 65536):
+        self.path = path
+        exists = path.exists() and path.stat().st_size >= self.HEADER.size
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if exists:
+            magic, self.capacity, self.total = self.HEADER.unpack(os.pread(self.fd, self.HEADER.size, 0))
+            if magic != self.MAGIC:
+                os.close(self.fd)
+                raise ValueError(f"{path}: not a soak latency ring")
+        else:
+            self.capacity, self.total = capacity, 0
+            os.ftruncate(self.fd, self.HEADER.size + capacity * self.RECORD.size)
+            self._write_header()
+
+    def _write_header(self) -> None:
+        os.pwrite(self.fd, self.HEADER.pack(self.MAGIC, self.capacity, self.total), 0)
+
+    def append(self, probe: Probe) -> None:
+        slot = self.total % self.capacity
+        os.pwrite(self.fd, self.RECORD.pack(probe.epoch, probe.ms, probe.status, probe.path),
+                  self.HEADER.size + slot * self.RECORD.size)
+        self.total += 1
+        self._write_header()
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+    @classmethod
+    def read(cls, path: Path) -> Iterator[Probe]:
+        """Probes oldest first."""
+        data = path.read_bytes()
+        magic, capacity, total = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path}: not a soak latency ring")
+        first = max(0, total - capacity)
+        for n in range(first, total):
+            epoch, ms, status, pid = cls.RECORD.unpack_from(data, cls.HEADER.size + (n % capacity) * cls.RECORD.size)
+            yield Probe(epoch, pid, status, ms)
+
+
+def _stamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+def _pcts(h: Histogram) -> str:
+    return (f"n={h.count} p50={h.percentile(50):.1f}ms p95={h.percentile(95):.1f}ms "
+            f"p99={h.percentile(99):.1f}ms max={h.max if h.count else 0:.1f}ms")
+
+
+class SoakMonitor:
+    def __init__(self, base: str, interval: float, duration: float, log_file: Path,
+                 ring: LatencyRing | None = None, slo: dict[str, float] | None = None,
+                 summary_every: float = 3600, paths: tuple[str, ...] = PATHS, timeout: float = 10.0):
+        self.base = base.rstrip("/")
+        self.interval = interval
+        self.duration = duration
+        self.log_file = log_file
+        self.ring = ring
+        self.slo = DEFAULT_SLO if slo is None else slo
+        self.summary_every = summary_every
+        self.paths = paths
+        self.timeout = timeout
+        self.fail_count = 0
+        self.window = {p: Histogram() for p in paths}
+        self.total = {p: Histogram() for p in paths}
+        self.slow = dict.fromkeys(paths, 0)  # probes over the path's SLO threshold
+        self.breaches = dict.fromkeys(paths, 0)  # summary windows whose p95 missed the SLO
+        self.windows = 0
+
+    def _log(self, line: str, echo: bool = False) -> None:
+        with self.log_file.open("a") as fh:
+            fh.write(line + "\n")
+        if echo:
+            print(line, flush=True)
+
+    def _summarize(self, epoch: float) -> None:
+        self.windows += 1
+        for path, h in self.window.items():
+            if not h.count:
+                continue
+            line = f"{_stamp(epoch)} summary {path} {_pcts(h)}"
+            limit = self.slo.get(path)
+            if limit is not None:
+                missed = h.percentile(SLO_PERCENTILE) >= limit
+                self.breaches[path] += missed
+                line += f" slo=p{SLO_PERCENTILE}<{limit:g}ms {'BREACH' if missed else 'met'}"
+            self._log(line, echo=True)
+            self.window[path] = Histogram()
+
+    async def _probe(self, pool: ConnectionPool, pid: int, path: str) -> None:
+        started = time.perf_counter()
+        epoch = time.time()
+        try:
+            status = (await pool.request("GET", path)).status
+        except Exception:
+            status = 0
+        ms = (time.perf_counter() - started) * 1000
+        for h in (self.window[path], self.total[path]):
+            h.record(ms)
+        if path in self.slo and ms >= self.slo[path]:
+            self.slow[path] += 1
+        if self.ring is not None:
+            self.ring.append(Probe(epoch, pid, status, ms))
+        if status == 200:
+            self._log(f"{_stamp(epoch)} OK {path} {ms:.1f}ms")
+        else:
+            self.fail_count += 1
+            self._log(f"{_stamp(epoch)} FAIL {path} http={status:03d} {ms:.1f}ms", echo=True)
+
+    async def run(self) -> int:
+        self._log(f"soak start base={self.base} interval={self.interval:g}s duration={self.duration:g}s", echo=True)
+        pool = ConnectionPool(self.base, size=1, timeout=self.timeout)
+        t0 = time.monotonic()
+        next_summary = t0 + self.summary_every
+        tick = 0
+        try:
+            # Fixed-rate schedule: probe time never drifts by the probes' own latency.
+            while (now := time.monotonic()) - t0 < self.duration:
+                if now >= next_summary:
+                    self._summarize(time.time())
+                    next_summary += self.summary_every
+                for pid, path in enumerate(self.paths):
+                    await self._probe(pool, pid, path)
+                tick += 1
+                await asyncio.sleep(max(0.0, t0 + tick * self.interval - time.monotonic()))
+        finally:
+            await pool.close()
+        if any(h.count for h in self.window.values()):
+            self._summarize(time.time())
+        for path in self.paths:
+            line = f"soak latency {path} {_pcts(self.total[path])}"
+            if path in self.slo:
+                line += (f" slo=p{SLO_PERCENTILE}<{self.slo[path]:g}ms slow_probes={self.slow[path]}"
+                         f" breached_windows={self.breaches[path]}/{self.windows}")
+            self._log(line, echo=True)
+        self._log(f"soak complete FAIL count: {self.fail_count}", echo=True)
+        return self.fail_count
+
+    @property
+    def slo_breached(self) -> bool:
+        return any(self.breaches.values())
+
+
+def summarize_ring(path: Path, paths: tuple[str, ...] = PATHS) -> None:
+    hists: dict[int, Histogram] = {}
+    errors: dict[int, int] = {}
+    first = last = None
+    for p in LatencyRing.read(path):
+        hists.setdefault(p.path, Histogram()).record(p.ms)
+        errors[p.path] = errors.get(p.path, 0) + (p.status != 200)
+        first = p.epoch if first is None else first
+        last = p.epoch
+    if first is None:
+        print(f"{path}: empty")
+        return
+    print(f"{path}: {_stamp(first)} .. {_stamp(last)}")
+    for pid, h in sorted(hists.items()):
+        name = paths[pid] if pid < len(paths) else f"path#{pid}"
+        print(f"  {name}: {_pcts(h)} errors={errors[pid]}")
+
+
+def _slo_arg(value: str) -> tuple[str, float]:
+    path, _, ms = value.rpartition("=")
+    if not path.startswith("/"):
+        raise argparse.ArgumentTypeError("expected PATH=MS, e.g. /health/ready=200")
+    return path, float(ms)
+
+
+def main(argv: list[str] | None = None) -> int:
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description="SVP latency-aware soak monitor")
+    parser.add_argument("--base", default=env("SVP_BASE_URL", "http://localhost"))
+    parser.add_argument("--interval", type=float, default=float(env("SVP_SOAK_INTERVAL_SEC", "300")))
+    parser.add_argument("--duration", type=float, default=float(env("SVP_SOAK_DURATION_SEC", "86400")))
+    parser.add_argument("--log", type=Path, default=Path(env("SVP_SOAK_LOG", "/tmp/svp-soak.log")))
+    parser.add_argument("--ring", type=Path, help="binary latency ring (default: <log>.ring)")
+    parser.add_argument("--ring-capacity", type=int, default=65536, help="probes kept in the ring")
+    parser.add_argument("--summary-every", type=float, default=3600, help="seconds between percentile summaries")
+    parser.add_argument("--slo", type=_slo_arg, action="append",
+                        help="PATH=MS p95 threshold (repeatable; default /health/ready=200)")
+    parser.add_argument("--strict-slo", action="store_true", help="exit non-zero when any SLO window is breached")
+    parser.add_argument("--read-ring", type=Path, help="print percentiles from a ring file and exit")
+    args = parser.parse_args(argv)
+
+    if args.read_ring:
+        summarize_ring(args.read_ring)
+        return 0
+
+    ring = LatencyRing(args.ring or args.log.with_name(args.log.name + ".ring"), args.ring_capacity)
+    monitor = SoakMonitor(args.base, args.interval, args.duration, args.log, ring,
+                          dict(args.slo) if args.slo else None, args.summary_every)
+    try:
+        fails = asyncio.run(monitor.run())
+    finally:
+        ring.close()
+    return 1 if fails or (args.strict_slo and monitor.slo_breached) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""Local stand-in for the SVP backend, for exercising the load tooling
+without Laravel/MySQL.
+
+Mirrors the response shapes of the routes the load scripts hit:
+``/health``, ``/health/ready`` (HealthController) and
+``POST /api/v1/webhook/{platform}/{secret}`` (WebhookController behind
+WebhookRateLimit: per-IP per-minute limit, 429 ``rate_limited``). Extra
+routes are registered with ``StandinServer.route()``; ``enable_admin()`` adds
+the Sanctum session/token login flow and ``POST /api/v1/admin/mutate``;
+``enable_inbound_drain()`` drains the webhook queue the way InboundQueueService
+does and serves its depth on ``GET /metrics``.
+
+Usage:
+  python3 scripts/load-test/standin_server.py --port=8080 --latency-ms=5 --webhook-secret=s3cret
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import secrets
+import time
+from typing import Awaitable, Callable, NamedTuple
+from urllib.parse import parse_qsl, quote, unquote
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+    peer: str
+    params: dict[str, str]
+    query: str = ""
+
+    def json(self) -> dict:
+        return json.loads(self.body or b"{}")
+
+    def cookies(self) -> dict[str, str]:
+        pairs = (c.strip().partition("=") for c in self.headers.get("cookie", "").split(";") if "=" in c)
+        return {k: unquote(v) for k, _, v in pairs}
+
+    def args(self) -> dict[str, str]:
+        return dict(parse_qsl(self.query))
+
+
+class Reply(NamedTuple):
+    status: int
+    body: dict | bytes
+    headers: dict[str, str] = {}
+    cookies: tuple[str, ...] = ()
+
+
+Handler = Callable[[Request], Awaitable[Reply]]
+
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 401: "Unauthorized",
+           403: "Forbidden", 404: "Not Found", 419: "Page Expired", 422: "Unprocessable Entity", 429: "Too Many Requests",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class StandinServer:
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, webhook_secret: str = "s3cret",
+                 secret_header: str = "", rate_limit_per_min: int = 120, ready: bool = True):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.webhook_secret = webhook_secret
+        self.secret_header = secret_header
+        self.rate_limit_per_min = rate_limit_per_min
+        self.trust_forwarded_for = False  # rate_limit_trust_forwarded_for
+        self.ready = ready
+        self.clock = time.time  # rate-limit windows; tests pin it
+        self.connections = 0
+        self.requests = 0
+        self.by_route: dict[str, int] = {}
+        self.webhook_queue: list[dict] = []
+        self.inbound_drained = 0
+        self.inbound_drain: dict[str, float] | None = None
+        self._kick_until = 0.0
+        self._drains: set[asyncio.Task] = set()
+        self._hits: dict[tuple[str, int], int] = {}
+        self.users: dict[str, str] = {}
+        self.mutate_ops: dict[str, Callable[[dict], Reply]] = {}
+        self.mutate_rate_limit_per_min = 300
+        self.sessions: dict[str, dict] = {}  # laravel_session id → {"xsrf", "user"}
+        self.tokens: dict[str, str] = {}
+        self.logins = 0
+        self.mutations: dict[str, int] = {}
+        self._routes: list[tuple[str, re.Pattern[str], str, Handler]] = []
+        self._server: asyncio.base_events.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self.port = 0
+        self.route("GET", "/health", self._health)
+        self.route("GET", "/health/ready", self._health_ready)
+        self.route("POST", "/api/v1/webhook/{platform}/{secret}", self._webhook)
+
+    def route(self, method: str, pattern: str, handler: Handler) -> None:
+        regex = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern) + "$")
+        self._routes.append((method, regex, pattern, handler))
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> StandinServer:
+        self._server = await asyncio.start_server(self._serve, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.inbound_drain and self.inbound_drain["cron_s"] > 0:
+            self._spawn(self._drain_cron())
+        return self
+
+    async def stop(self) -> None:
+        for task in list(self._drains):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            # Let the handlers see the closed sockets before the loop shuts down and cancels them.
+            await asyncio.sleep(0.01)
+
+    async def __aenter__(self) -> StandinServer:
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        peer = writer.get_extra_info("peername")[0]
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    k, _, v = line.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                path, _, query = target.partition("?")
+                reply = await self._dispatch(method, path, headers, body, peer, query)
+                payload = reply.body if isinstance(reply.body, bytes) else json.dumps(reply.body).encode()
+                keep = headers.get("connection", "").lower() != "close"
+                head = [f"HTTP/1.1 {reply.status} {REASONS.get(reply.status, 'OK')}",
+                        "Content-Type: application/json", f"Content-Length: {len(payload)}",
+                        f"Connection: {'keep-alive' if keep else 'close'}"]
+                head += [f"{k}: {v}" for k, v in reply.headers.items()]
+                head += [f"Set-Cookie: {c}" for c in reply.cookies]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+                await writer.drain()
+                if not keep:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, headers: dict[str, str], body: bytes, peer: str,
+                        query: str = "") -> Reply:
+        self.requests += 1
+        if self.latency_ms or self.jitter_ms:
+            await asyncio.sleep((self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000)
+        for route_method, regex, pattern, handler in self._routes:
+            m = regex.match(path)
+            if m and route_method == method:
+                self.by_route[pattern] = self.by_route.get(pattern, 0) + 1
+                return await handler(Request(method, path, headers, body, peer, m.groupdict(), query))
+        return Reply(404, {"ok": False, "message": "not_found"})
+
+    async def _health(self, req: Request) -> Reply:
+        return Reply(200, {"ok": True})
+
+    async def _health_ready(self, req: Request) -> Reply:
+        status = "ok" if self.ready else "fail"
+        return Reply(200 if self.ready else 503, {"ok": self.ready, "checks": {"database": status, "cache": status}})
+
+    def rate_limited(self, peer: str) -> bool:
+        """WebhookRateLimit: fixed one-minute window per client IP."""
+        if self.rate_limit_per_min <= 0:
+            return False
+        key = (peer, int(self.clock() // 60))
+        self._hits[key] = self._hits.get(key, 0) + 1
+        return self._hits[key] > self.rate_limit_per_min
+
+    def client_ip(self, req: Request) -> str:
+        if self.trust_forwarded_for:
+            for header in ("cf-connecting-ip", "x-real-ip", "x-forwarded-for"):
+                raw = req.headers.get(header, "").split(",")[0].strip()
+                if raw:
+                    return raw
+        return req.peer
+
+    async def _webhook(self, req: Request) -> Reply:
+        if self.rate_limited(self.client_ip(req)):
+            return Reply(429, {"ok": False, "message": "rate_limited"})
+        if req.params["secret"] != self.webhook_secret:
+            return Reply(403, {"ok": False, "message": "invalid_secret"})
+        if self.secret_header and req.headers.get("x-telegram-bot-api-secret-token") != self.secret_header:
+            return Reply(403, {"ok": False, "message": "invalid_secret_token"})
+        try:
+            update = req.json()
+        except ValueError:
+            return Reply(422, {"ok": False, "message": "invalid_payload"})
+        self.webhook_queue.append({"platform": req.params["platform"], "update": update})
+        if self.inbound_drain is not None:
+            self._kick_drain()
+        return Reply(200, {"ok": True})
+
+    def enable_inbound_drain(self, batch: int = 5, kick_lock_s: float = 5.0, cron_s: float = 60.0,
+                             process_ms: float = 0.0) -> StandinServer:
+        """InboundQueueService drain: each accepted update calls kickAsyncDrain(), which runs one
+        drainBatch() of ``batch`` rows after the response unless a kick ran in the last
+        ``kick_lock_s`` seconds; InboundQueueDrainJob adds one batch every ``cron_s``.
+        ``process_ms`` is the ProcessInboundUpdateJob time per row."""
+        self.inbound_drain = {"batch": batch, "kick_lock_s": kick_lock_s, "cron_s": cron_s, "process_ms": process_ms}
+        self.route("GET", "/metrics", self._metrics)
+        return self
+
+    @property
+    def inbound_pending(self) -> int:
+        return len(self.webhook_queue) - self.inbound_drained
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._drains.add(task)
+        task.add_done_callback(self._drains.discard)
+
+    def _kick_drain(self) -> None:
+        now = self.clock()
+        if now < self._kick_until:
+            return
+        self._kick_until = now + self.inbound_drain["kick_lock_s"]
+        self._spawn(self._drain_batch())
+
+    async def _drain_batch(self) -> None:
+        for _ in range(int(self.inbound_drain["batch"])):
+            if self.inbound_pending <= 0:
+                return
+            self.inbound_drained += 1
+            if self.inbound_drain["process_ms"]:
+                await asyncio.sleep(self.inbound_drain["process_ms"] / 1000)
+
+    async def _drain_cron(self) -> None:
+        while True:
+            await asyncio.sleep(self.inbound_drain["cron_s"])
+            await self._drain_batch()
+
+    async def _metrics(self, req: Request) -> Reply:
+        lines = ["svp_up 1", f"svp_inbound_queue_pending {self.inbound_pending}",
+                 f"webhook_received_total {len(self.webhook_queue)}"]
+        return Reply(200, ("\n".join(lines) + "\n").encode())
+
+    def enable_admin(self, users: dict[str, str], ops: dict[str, Callable[[dict], Reply]] | list[str],
+                     mutate_rate_limit_per_min: int = 300) -> StandinServer:
+        """Dashboard auth (AuthController / Sanctum) and the admin mutate endpoint.
+
+        ``ops`` maps op → handler(payload) → Reply; a plain list registers ops
+        that answer ``{"ok": true}``.
+        """
+        self.users = dict(users)
+        self.mutate_ops = ops if isinstance(ops, dict) else {op: lambda payload: Reply(200, {"ok": True}) for op in ops}
+        self.mutate_rate_limit_per_min = mutate_rate_limit_per_min
+        self.route("GET", "/sanctum/csrf-cookie", self._csrf_cookie)
+        for path in ("/api/v1/dashboard/login", "/api/v1/auth/login"):
+            self.route("POST", path, self._login)
+        self.route("POST", "/api/v1/auth/token", self._token)
+        self.route("POST", "/api/v1/auth/logout", self._logout)
+        for prefix in ("admin", "dashboard/admin"):
+            self.route("POST", f"/api/v1/{prefix}/mutate", self._mutate)
+        return self
+
+    def _session_cookies(self, sid: str) -> tuple[str, ...]:
+        return (f"XSRF-TOKEN={quote(self.sessions[sid]['xsrf'])}; Path=/; SameSite=Lax",
+                f"laravel_session={sid}; Path=/; HttpOnly; SameSite=Lax")
+
+    def _new_session(self, user: str | None = None) -> str:
+        sid = secrets.token_urlsafe(24)
+        # Laravel's XSRF-TOKEN cookie is an encrypted blob with URL-unsafe characters.
+        self.sessions[sid] = {"xsrf": secrets.token_urlsafe(24) + "+/=", "user": user}
+        return sid
+
+    def _csrf_ok(self, req: Request) -> str | None:
+        sid = req.cookies().get("laravel_session", "")
+        session = self.sessions.get(sid)
+        if session is None or req.headers.get("x-xsrf-token") != session["xsrf"]:
+            return None
+        return sid
+
+    @staticmethod
+    def _credentials(req: Request, *order: str) -> tuple[str, str]:
+        data = req.json()
+        user = next((str(data[k]) for k in order if data.get(k)), "")
+        pwd = next((str(data[k]) for k in ("pwd", "password") if data.get(k)), "")
+        return user, pwd
+
+    async def _csrf_cookie(self, req: Request) -> Reply:
+        sid = req.cookies().get("laravel_session", "")
+        if sid not in self.sessions:
+            sid = self._new_session()
+        return Reply(204, b"", cookies=self._session_cookies(sid))
+
+    async def _login(self, req: Request) -> Reply:
+        old = self._csrf_ok(req)
+        if old is None:
+            return Reply(419, {"message": "CSRF token mismatch."})
+        user, pwd = self._credentials(req, "log", "username")
+        if not user or self.users.get(user) != pwd:
+            return Reply(401, {"ok": False, "message": "invalid_credentials"})
+        del self.sessions[old]
+        sid = self._new_session(user)  # session()->regenerate()
+        self.logins += 1
+        return Reply(200, {"ok": True, "redirect": "/dashboard/"}, cookies=self._session_cookies(sid))
+
+    async def _token(self, req: Request) -> Reply:
+        user, pwd = self._credentials(req, "username", "log")
+        if not user or self.users.get(user) != pwd:
+            return Reply(401, {"ok": False, "message": "invalid_credentials"})
+        token = f"{len(self.tokens) + 1}|{secrets.token_urlsafe(30)}"
+        self.tokens[token] = user
+        self.logins += 1
+        return Reply(200, {"ok": True, "token": token, "token_type": "Bearer"})
+
+    async def _logout(self, req: Request) -> Reply:
+        sid = self._csrf_ok(req)
+        if sid is not None:
+            self.sessions.pop(sid, None)
+        return Reply(200, {"ok": True})
+
+    def _actor(self, req: Request) -> str | None | Reply:
+        auth = req.headers.get("authorization", "")
+        if auth.startswith("Bearer "):
+            return self.tokens.get(auth[7:])
+        sid = req.cookies().get("laravel_session", "")
+        if sid in self.sessions and self.sessions[sid]["user"] and self._csrf_ok(req) is None:
+            return Reply(419, {"message": "CSRF token mismatch."})
+        return self.sessions.get(sid, {}).get("user")
+
+    async def _mutate(self, req: Request) -> Reply:
+        actor = self._actor(req)
+        if isinstance(actor, Reply):
+            return actor
+        if actor is None:
+            return Reply(401, {"message": "Unauthenticated."})
+        # AdminDashboardRateLimit:mutate — per dashboard user, fixed minute window.
+        key = (f"dash_user:{actor}", int(self.clock() // 60))
+        self._hits[key] = self._hits.get(key, 0) + 1
+        if 0 < self.mutate_rate_limit_per_min < self._hits[key]:
+            return Reply(429, {"ok": False, "message": "rate_limited"})
+        payload = req.json()
+        op = payload.pop("op", None)
+        if not op:
+            return Reply(422, {"message": "The op field is required.", "errors": {"op": ["required"]}})
+        handler = self.mutate_ops.get(op)
+        if handler is None:
+            return Reply(422, {"ok": False, "message": "unknown_op", "code": op})
+        self.mutations[op] = self.mutations.get(op, 0) + 1
+        return handler(payload)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    server = StandinServer(args.latency_ms, args.jitter_ms, args.webhook_secret, args.secret_header,
+                           args.rate_limit)
+    server.trust_forwarded_for = args.trust_forwarded_for
+    if args.inbound_batch:
+        server.enable_inbound_drain(args.inbound_batch, args.kick_lock_s, args.cron_s, args.process_ms)
+    await server.start(args.host, args.port)
+    print(f"standin listening on {server.base}", flush=True)
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SVP backend stand-in for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--webhook-secret", default="s3cret")
+    parser.add_argument("--secret-header", default="")
+    parser.add_argument("--rate-limit", type=int, default=120, help="webhook requests per IP per minute (0 = off)")
+    parser.add_argument("--trust-forwarded-for", action="store_true", help="rate-limit by X-Forwarded-For")
+    parser.add_argument("--inbound-batch", type=int, default=0,
+                        help="drain the webhook queue in batches of N (svp.inbound_queue_batch_size; 0 = keep it)")
+    parser.add_argument("--kick-lock-s", type=float, default=5.0, help="kickAsyncDrain lock")
+    parser.add_argument("--cron-s", type=float, default=60.0, help="InboundQueueDrainJob interval")
+    parser.add_argument("--process-ms", type=float, default=0.0, help="update processing time per row")
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,67 @@
+"""Bot API stand-in: per-token flood limits, 429 retry_after and per-chat answers."""
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from botapi_standin import BotApiServer, BotLimits  # noqa: E402
+from load_engine import ConnectionPool  # noqa: E402
+
+JSON = {"Content-Type": "application/json"}
+
+
+class BotApiTest(unittest.IsolatedAsyncioTestCase):
+    async def server(self, limits):
+        server = await BotApiServer(limits).start()
+        self.addAsyncCleanup(server.stop)
+        self.now = 1000.0
+        server.clock = lambda: self.now
+        self.pool = ConnectionPool(server.base, size=2)
+        self.addAsyncCleanup(self.pool.close)
+        return server
+
+    async def send(self, chat_id, token="1:a", method="sendMessage", text="hi"):
+        resp = await self.pool.request("POST", f"/bot{token}/{method}", JSON,
+                                       json.dumps({"chat_id": chat_id, "text": text}).encode())
+        return resp.status, json.loads(resp.body)
+
+    async def test_bucket_and_flood_wait(self):
+        server = await self.server(BotLimits(rate=2, burst=3))
+        for chat in (1, 2, 3):
+            self.assertEqual((await self.send(chat))[0], 200)
+        status, body = await self.send(4)
+        self.assertEqual((status, body["error_code"], body["parameters"]), (429, 429, {"retry_after": 1}))
+        self.assertEqual(body["description"], "Too Many Requests: retry after 1")
+        # Another token has its own bucket; this one stays in the penalty window.
+        self.assertEqual((await self.send(4, token="2:b"))[0], 200)
+        self.now += 0.6
+        self.assertEqual((await self.send(4))[0], 429)
+        self.now += 0.5
+        self.assertEqual((await self.send(4))[0], 200)
+        self.assertEqual(server.totals()["limited"], 2)
+
+    async def test_per_chat_interval(self):
+        await self.server(BotLimits(per_chat_interval=1.0))
+        self.assertEqual((await self.send(5))[0], 200)
+        self.assertEqual((await self.send(5))[0], 429)
+        self.now += 1.0
+        self.assertEqual((await self.send(5))[0], 200)
+
+    async def test_blocked_bad_request_and_form_body(self):
+        server = await self.server(BotLimits(blocked_share=1.0))
+        status, body = await self.send(9)
+        self.assertEqual((status, body["description"]), (403, "Forbidden: bot was blocked by the user"))
+        self.assertEqual((await self.send(9, text=" "))[0], 400)
+        resp = await self.pool.request("POST", "/bot1:a/sendMessage",
+                                       {"Content-Type": "application/x-www-form-urlencoded"}, b"text=hi")
+        self.assertEqual(json.loads(resp.body)["description"], "Bad Request: chat_id is empty")
+        resp = await self.pool.request("POST", "/bot1:a/getMe")
+        self.assertTrue(json.loads(resp.body)["ok"])
+        self.assertEqual((await self.send(9, method="sendSticker"))[0], 404)
+        self.assertEqual(server.totals()["blocked"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Broadcast enqueue/drain replay against SQLite and the Bot API stand-in."""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from botapi_standin import BotApiServer, BotLimits  # noqa: E402
+from broadcast_bench import (Api, Settings, classify, connect, create_and_enqueue, drain_queue, human,  # noqa: E402
+                             main, php_json, pop_batch, seed_users, size_list)
+
+
+class QueueTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = connect(Path(tmp.name) / "q.sqlite")
+        self.addCleanup(self.db.close)
+
+    async def api(self, limits):
+        server = await BotApiServer(limits).start()
+        self.addAsyncCleanup(server.stop)
+        return server, {"tg": Api(server.base, "1:tg"), "bale": Api(server.base, "2:bale")}
+
+    def count(self, sql):
+        return self.db.execute(sql).fetchone()[0]
+
+    async def test_enqueue_rows_and_pop(self):
+        seed_users(self.db, 50, 0.5)
+        enq = create_and_enqueue(self.db, "<b>hi</b> a/b", "both", chunk=7)
+        self.assertEqual((enq.queued, enq.total_targets), (75, 50))
+        self.assertGreater(enq.grown_bytes, 0)
+        row = self.db.execute("SELECT * FROM svp_broadcast_queue WHERE bot = 'bale' ORDER BY id").fetchone()
+        self.assertEqual(row["payload_json"], php_json({"text": "<b>hi</b> a/b", "parse_mode": "HTML",
+                                                         "media_urls": [], "chat_id": row["chat_id"]}))
+        self.assertIn("a\\/b", row["payload_json"])
+        rows = pop_batch(self.db, 5, "c_t")
+        self.assertEqual([r["id"] for r in rows], [1, 2, 3, 4, 5])
+        self.assertEqual(self.count("SELECT COUNT(*) FROM svp_broadcast_queue WHERE status = 'sending'"), 5)
+
+    async def test_drain_to_done(self):
+        server, apis = await self.api(BotLimits(rate=1000, burst=1000, blocked_share=0.2))
+        seed_users(self.db, 30, 0)
+        enq = create_and_enqueue(self.db, "hello", "telegram")
+        drain, _ = await drain_queue(self.db, apis, Settings(batch=5, usleep_us=0), 2, enq.queued, 30)
+        self.assertEqual((drain.finished, drain.attempts, drain.batches), (30, 30, 6))
+        self.assertEqual(drain.delivered + drain.kinds["blocked"], 30)
+        b = self.db.execute("SELECT * FROM svp_broadcasts WHERE id = ?", (enq.broadcast_id,)).fetchone()
+        self.assertEqual((b["status"], b["sent_count"], b["blocked_count"]), ("done", drain.delivered, drain.failed))
+        self.assertEqual(server.totals()["sent"], drain.delivered)
+
+    async def test_rate_limit_is_retried_without_cap(self):
+        _, apis = await self.api(BotLimits(rate=10, burst=10))
+        seed_users(self.db, 20, 0)
+        enq = create_and_enqueue(self.db, "hello", "telegram")
+        drain, _ = await drain_queue(self.db, apis, Settings(batch=20, usleep_us=1000, maxtry=2), 1, enq.queued, 30)
+        self.assertEqual((drain.delivered, drain.failed), (20, 0))
+        self.assertGreater(drain.kinds["rate_limit"], 0)
+        self.assertGreater(drain.attempts, 20)
+        self.assertGreater(self.count("SELECT MAX(tries) FROM svp_broadcast_queue"), 2)
+
+    async def test_unreachable_api_fails_after_maxtry(self):
+        server, apis = await self.api(BotLimits())
+        await server.stop()
+        seed_users(self.db, 3, 0)
+        enq = create_and_enqueue(self.db, "hello", "telegram")
+        drain, _ = await drain_queue(self.db, apis, Settings(batch=5, usleep_us=0, maxtry=2), 1, enq.queued, 30)
+        self.assertEqual((drain.failed, drain.attempts, drain.kinds["unknown"]), (3, 6, 6))
+        self.assertEqual(sum(drain.exceptions.values()), 6)
+
+
+class HelpersTest(unittest.TestCase):
+    def test_helpers(self):
+        self.assertEqual(size_list("10k,2.5k,1M,7"), [10_000, 2_500, 1_000_000, 7])
+        self.assertEqual((human(59), human(3661), human(90000), human(None)), ("59s", "1h1m", "1d1h", "never"))
+        self.assertEqual(classify({"error_code": 403, "description": "Forbidden: user is deactivated"}), "blocked")
+        self.assertEqual(classify({"error_code": 403, "description": "not enough rights"}), "bad_request")
+        self.assertEqual(classify({"ok": False, "description": "no_response"}), "unknown")
+
+    def test_log(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "broadcast-bench.log"
+            rc = main(["--targets=40", "--platforms=telegram", "--usleep-us=0", "--latency-ms=0", "--jitter-ms=0",
+                       "--drain-seconds=10", "--blocked-share=0", "--log", str(log), "--json"])
+            lines = log.read_text().splitlines()
+        self.assertEqual(rc, 0)
+        self.assertTrue(lines[0].startswith("broadcast-bench start"))
+        self.assertIn("delivered=40 failed=0", next(x for x in lines if x.startswith("drain ")))
+        self.assertTrue(lines[-1].startswith("broadcast-bench complete exit=0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
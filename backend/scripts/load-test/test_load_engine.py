@@ -0,0 +1,107 @@
+"""Load engine against the bundled stand-in server.
+
+Run: python3 -m pytest backend/scripts/load-test   (or python3 -m unittest from this directory)
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool, Endpoint, Histogram, default_endpoints, run_closed, run_open  # noqa: E402
+from standin_server import StandinServer  # noqa: E402
+
+
+class HistogramTest(unittest.TestCase):
+    def test_percentiles_within_bucket_precision(self):
+        rng = random.Random(7)
+        samples = [rng.expovariate(1 / 40) for _ in range(20000)]
+        hist = Histogram()
+        for s in samples:
+            hist.record(s)
+        samples.sort()
+        for p in (50, 95, 99):
+            exact = samples[int(p / 100 * len(samples)) - 1]
+            self.assertAlmostEqual(hist.percentile(p), exact, delta=exact * 0.02)
+        self.assertEqual(hist.max, samples[-1])
+        self.assertEqual(hist.count, 20000)
+
+    def test_merge(self):
+        a, b = Histogram(), Histogram()
+        for x in range(1, 51):
+            a.record(x)
+            b.record(x + 50)
+        a.merge(b)
+        self.assertEqual(a.count, 100)
+        self.assertAlmostEqual(a.percentile(50), 50, delta=1)
+        self.assertEqual(a.max, 100)
+
+
+class LoadEngineTest(unittest.IsolatedAsyncioTestCase):
+    async def test_closed_loop_reuses_keepalive_connections(self):
+        async with StandinServer(latency_ms=1) as server:
+            pool = ConnectionPool(server.base, size=8)
+            stats = await run_closed(pool, Endpoint("ready", "GET", "/health/ready"), concurrency=8, requests=400)
+            await pool.close()
+        report = stats.report()
+        self.assertEqual(report["requests"], 400)
+        self.assertEqual(report["errors"], 0)
+        self.assertEqual(report["codes"], {"200": 400})
+        self.assertLessEqual(pool.opened, 8)
+        self.assertEqual(server.connections, pool.opened)
+        self.assertGreaterEqual(report["p99_ms"], report["p50_ms"])
+
+    async def test_open_loop_issues_scheduled_arrivals(self):
+        async with StandinServer(latency_ms=20) as server:
+            pool = ConnectionPool(server.base, size=64)
+            stats = await run_open(pool, Endpoint("ready", "GET", "/health/ready"), rate=200, duration=0.5)
+            await pool.close()
+        report = stats.report()
+        self.assertEqual(report["requests"], 100)
+        self.assertEqual(report["dropped"], 0)
+        self.assertEqual(server.requests, 100)
+        # Arrivals overlap the 20ms service time, so more than one connection is needed.
+        self.assertGreater(pool.opened, 1)
+
+    async def test_open_loop_drops_over_max_inflight(self):
+        async with StandinServer(latency_ms=200) as server:
+            pool = ConnectionPool(server.base, size=4)
+            stats = await run_open(pool, Endpoint("ready", "GET", "/health/ready"), rate=100, duration=0.2,
+                                   max_inflight=5)
+            await pool.close()
+        self.assertEqual(stats.hist.count + stats.dropped, 20)
+        self.assertGreater(stats.dropped, 0)
+
+    async def test_webhook_rate_limit_counts_429(self):
+        async with StandinServer(webhook_secret="s3cret", rate_limit_per_min=30) as server:
+            server.clock = lambda: 0.0
+            webhook = default_endpoints("s3cret")[1]
+            pool = ConnectionPool(server.base, size=4)
+            stats = await run_closed(pool, webhook, concurrency=4, requests=50)
+            await pool.close()
+        self.assertEqual(stats.codes, {200: 30, 429: 20})
+        self.assertEqual(stats.errors, 20)
+        self.assertEqual(len(server.webhook_queue), 30)
+        self.assertEqual(len({u["update"]["update_id"] for u in server.webhook_queue}), 30)
+
+    async def test_wrong_secret_and_unavailable_ready(self):
+        async with StandinServer(webhook_secret="right", ready=False) as server:
+            pool = ConnectionPool(server.base, size=2)
+            wrong = await run_closed(pool, default_endpoints("wrong")[1], concurrency=2, requests=4)
+            ready = await run_closed(pool, Endpoint("ready", "GET", "/health/ready"), concurrency=2, requests=4)
+            await pool.close()
+        self.assertEqual(wrong.codes, {403: 4})
+        self.assertEqual(ready.codes, {503: 4})
+
+    async def test_connection_refused_is_counted_not_raised(self):
+        async with StandinServer() as server:
+            base = server.base
+        pool = ConnectionPool(base, size=2, timeout=2)
+        stats = await run_closed(pool, Endpoint("ready", "GET", "/health/ready"), concurrency=2, requests=4)
+        self.assertEqual(stats.errors, 4)
+        self.assertEqual(sum(stats.exceptions.values()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
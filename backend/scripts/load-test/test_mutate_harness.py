@@ -0,0 +1,121 @@
+"""Mutate harness against the stand-in backend's Sanctum/mutate routes."""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mutate_harness import (  # noqa: E402
+    AuthError, DashboardSession, MixEntry, combined, load_mix, registry_ops, run_mix,
+)
+from load_engine import ConnectionPool  # noqa: E402
+from standin_server import Reply, StandinServer  # noqa: E402
+
+HERE = Path(__file__).resolve().parent
+USERS = {"admin": "pw"}
+MIX = [
+    MixEntry("user_merge_preview", 6, [{"keep_id": 1, "drop_id": 2}]),
+    MixEntry("discount_redemptions", 3, [{"code_id": 1}]),
+    MixEntry("vpn_server_overview", 1, []),
+]
+
+
+def standin(**kwargs):
+    ops = {
+        "user_merge_preview": lambda p: Reply(200, {"ok": True, "keep": p["keep_id"]}),
+        "discount_redemptions": lambda p: Reply(404, {"ok": False, "message": "not_found"}),
+        "vpn_server_overview": lambda p: Reply(200, {"ok": True}),
+    }
+    server = StandinServer(**kwargs).enable_admin(USERS, ops)
+    server.clock = lambda: 0.0
+    return server
+
+
+class MixTest(unittest.TestCase):
+    def test_example_mix_ops_are_registered(self):
+        ops = registry_ops()
+        self.assertIn("user_merge_preview", ops)
+        self.assertGreater(len(ops), 100)
+        mix = load_mix(HERE / "mutate-mix.example.json", ops)
+        self.assertEqual(len(mix[0].payloads), 2)
+
+    def test_unregistered_op_rejected(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as fh:
+            json.dump({"ops": [{"op": "no_such_op", "weight": 1}]}, fh)
+            fh.flush()
+            with self.assertRaisesRegex(ValueError, "no_such_op"):
+                load_mix(Path(fh.name), registry_ops())
+            self.assertEqual(load_mix(Path(fh.name))[0].payloads, [{}])
+
+
+class HarnessTest(unittest.IsolatedAsyncioTestCase):
+    async def session(self, server, mode="session", password="pw"):
+        pool = ConnectionPool(server.base, size=4)
+        self.addAsyncCleanup(pool.close)
+        session = DashboardSession(pool, server.base, "admin", password, mode)
+        await session.login()
+        return session
+
+    async def test_session_login_and_weighted_mix(self):
+        async with standin() as server:
+            session = await self.session(server)
+            stats = await run_mix(session, MIX, concurrency=4, requests=250, seed=1)
+            # AdminDashboardRateLimit:mutate defaults to 300/min per user.
+            more = await run_mix(session, MIX[2:], concurrency=4, requests=60)
+        self.assertEqual(more["vpn_server_overview"].codes, {200: 50, 429: 10})
+        self.assertEqual(server.logins, 1)
+        self.assertIn("X-XSRF-TOKEN", session.headers())
+        total = combined(stats)
+        self.assertEqual(total.hist.count, 250)
+        self.assertEqual(sum(server.mutations.values()), 300)
+        self.assertGreater(stats["user_merge_preview"].hist.count, stats["discount_redemptions"].hist.count)
+        self.assertGreater(stats["discount_redemptions"].hist.count, stats["vpn_server_overview"].hist.count)
+        self.assertEqual(stats["user_merge_preview"].errors, 0)
+        self.assertEqual(stats["discount_redemptions"].messages, {"not_found": stats["discount_redemptions"].errors})
+        self.assertLessEqual(server.connections, 4)
+
+    async def test_token_auth(self):
+        async with standin() as server:
+            session = await self.session(server, mode="token")
+            stats = await run_mix(session, MIX[:1], concurrency=2, requests=20)
+        self.assertTrue(session.token)
+        self.assertEqual(stats["user_merge_preview"].codes, {200: 20})
+
+    async def test_expired_session_relogs_once(self):
+        async with standin() as server:
+            session = await self.session(server)
+            first = await run_mix(session, MIX[:1], concurrency=4, requests=20)
+            server.sessions.clear()  # session expiry / server restart
+            second = await run_mix(session, MIX[:1], concurrency=4, requests=20)
+        self.assertEqual(first["user_merge_preview"].errors + second["user_merge_preview"].errors, 0)
+        self.assertEqual(session.logins, 2)
+
+    async def test_csrf_mismatch_relogs(self):
+        async with standin() as server:
+            session = await self.session(server)
+            session.cookies["XSRF-TOKEN"] = "stale"
+            stats = await run_mix(session, MIX[:1], concurrency=1, requests=3)
+        self.assertEqual(stats["user_merge_preview"].codes, {200: 3})
+        self.assertEqual(session.logins, 2)
+
+    async def test_bad_credentials(self):
+        async with standin() as server:
+            for mode in ("session", "token"):
+                with self.assertRaises(AuthError):
+                    await self.session(server, mode=mode, password="wrong")
+
+    async def test_rate_limit_and_open_loop_drops(self):
+        async with standin(latency_ms=100) as server:
+            server.mutate_rate_limit_per_min = 10
+            session = await self.session(server)
+            stats = await run_mix(session, MIX[:1], concurrency=4, duration=0.2, rate=100)
+        s = stats["user_merge_preview"]
+        self.assertEqual(s.hist.count + s.dropped, 20)
+        self.assertGreater(s.dropped, 0)
+        self.assertEqual(s.codes.get(429, 0), max(0, s.hist.count - 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Soak monitor against the bundled stand-in server."""
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from soak_monitor import PATHS, LatencyRing, Probe, SoakMonitor  # noqa: E402
+from standin_server import StandinServer  # noqa: E402
+
+POLL_RE = re.compile(r"^\S+Z (OK|FAIL) (\S+) ")
+
+
+class LatencyRingTest(unittest.TestCase):
+    def test_wraps_and_reopens(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "soak.ring"
+            ring = LatencyRing(path, capacity=4)
+            for i in range(6):
+                ring.append(Probe(1000.0 + i, i % 2, 200, float(i)))
+            ring.close()
+            self.assertEqual(path.stat().st_size, LatencyRing.HEADER.size + 4 * LatencyRing.RECORD.size)
+            self.assertEqual([p.ms for p in LatencyRing.read(path)], [2.0, 3.0, 4.0, 5.0])
+            ring = LatencyRing(path, capacity=99)  # existing capacity wins
+            ring.append(Probe(2000.0, 0, 503, 9.0))
+            ring.close()
+            probes = list(LatencyRing.read(path))
+            self.assertEqual([p.ms for p in probes], [3.0, 4.0, 5.0, 9.0])
+            self.assertEqual(probes[-1].status, 503)
+
+
+class SoakMonitorTest(unittest.IsolatedAsyncioTestCase):
+    async def run_monitor(self, server, **kwargs):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        log = Path(tmp.name) / "soak.log"
+        ring = LatencyRing(Path(tmp.name) / "soak.ring")
+        self.addCleanup(ring.close)
+        monitor = SoakMonitor(server.base, interval=0.05, duration=0.5, log_file=log, ring=ring,
+                              summary_every=0.2, **kwargs)
+        fails = await monitor.run()
+        return monitor, fails, log.read_text(), list(LatencyRing.read(ring.path))
+
+    async def test_log_format_stays_compatible(self):
+        async with StandinServer() as server:
+            monitor, fails, text, probes = await self.run_monitor(server)
+        lines = text.splitlines()
+        self.assertRegex(lines[0], r"^soak start base=\S+ interval=0.05s duration=0.5s$")
+        self.assertEqual(lines[-1], "soak complete FAIL count: 0")
+        polls = [m.groups() for line in lines if (m := POLL_RE.match(line))]
+        self.assertGreaterEqual(len(polls), 16)
+        self.assertEqual({status for status, _ in polls}, {"OK"})
+        self.assertEqual(len(probes), len(polls))
+        # One keep-alive connection serves the whole run.
+        self.assertEqual(server.connections, 1)
+        self.assertTrue(any(" summary /health/ready " in line and " met" in line for line in lines))
+        self.assertNotIn("FAIL:", text)
+        self.assertEqual(fails, 0)
+        self.assertFalse(monitor.slo_breached)
+
+    async def test_failures_and_slo_breaches_are_counted(self):
+        async with StandinServer(latency_ms=15, ready=False) as server:
+            monitor, fails, text, probes = await self.run_monitor(server, slo={"/health": 5.0})
+        ready_probes = [p for p in probes if PATHS[p.path] == "/health/ready"]
+        self.assertEqual(fails, len(ready_probes))
+        self.assertTrue(text.endswith(f"soak complete FAIL count: {fails}\n"))
+        self.assertIn("FAIL /health/ready http=503", text)
+        self.assertTrue(monitor.slo_breached)
+        self.assertEqual(monitor.slow["/health"], len(probes) - len(ready_probes))
+        self.assertRegex(text, r"soak latency /health n=\d+ .* slow_probes=\d+ breached_windows=(\d+)/\1")
+
+    async def test_unreachable_base_logs_http_000(self):
+        async with StandinServer() as server:
+            base = server.base
+        server.port = int(base.rsplit(":", 1)[1])
+        monitor, fails, text, probes = await self.run_monitor(server)
+        self.assertGreater(fails, 0)
+        self.assertIn("FAIL /health http=000", text)
+        self.assertEqual({p.status for p in probes}, {0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Webhook replay: update streams, the WebhookRateLimit effect and inbound queue drain against the stand-in."""
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool  # noqa: E402
+from standin_server import StandinServer  # noqa: E402
+from webhook_replay import (DepthProbe, Event, Recorder, Replay, Sample, UpdateFactory, drain_stats,  # noqa: E402
+                            failures, load_recorded, parse_mix, report, settle, synthesize)
+
+
+class StreamTest(unittest.TestCase):
+    def test_synthesized_mix_and_payment_pairs(self):
+        factory = UpdateFactory(users=10, seed=3)
+        events = list(synthesize(50, 2, parse_mix("message=1,callback=1,payment=1"), factory, "fixed"))
+        self.assertEqual(len(events), 99)
+        ids = [e.update["update_id"] for e in events]
+        self.assertEqual(ids, sorted(set(ids)))
+        kinds = {next(k for k in e.update if k != "update_id") for e in events}
+        self.assertEqual(kinds, {"message", "callback_query", "pre_checkout_query"})
+        pre = [e.update["pre_checkout_query"] for e in events if "pre_checkout_query" in e.update]
+        paid = [e.update["message"]["successful_payment"] for e in events
+                if "successful_payment" in e.update.get("message", {})]
+        self.assertTrue(paid)
+        self.assertEqual(paid[0]["invoice_payload"], pre[0]["invoice_payload"])
+        with self.assertRaises(ValueError):
+            parse_mix("sticker=1")
+
+    def test_recorded_formats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cap = Path(tmp) / "cap.jsonl"
+            cap.write_text("\n".join(json.dumps({"t": t, "update": {"update_id": i}})
+                                     for i, t in enumerate((10.5, 10.0, 12.0))) + "\n")
+            self.assertEqual([(e.at, e.update["update_id"]) for e in load_recorded(cap, 5)],
+                             [(0.0, 1), (0.5, 0), (2.0, 2)])
+            dump = Path(tmp) / "getupdates.json"
+            dump.write_text(json.dumps({"ok": True, "result": [{"update_id": 1}, {"update_id": 2}]}, indent=1))
+            self.assertEqual(load_recorded(dump, 4), [Event(0.0, {"update_id": 1}), Event(0.25, {"update_id": 2})])
+
+    def test_drain_stats(self):
+        samples = [Sample(0, 0, 0), Sample(10, 40, 50), Sample(20, 80, 100), Sample(30, 60, 100), Sample(40, 0, 100)]
+        d = drain_stats(samples, 20)
+        self.assertEqual((d["peak_pending"], d["drain_during_per_s"], d["drain_after_per_s"]), (80, 1.0, 4.0))
+        self.assertEqual((d["time_to_empty_s"], d["time_to_empty"]), (20, "measured"))
+        d = drain_stats(samples[:4], 20)
+        self.assertEqual((d["time_to_empty_s"], d["time_to_empty"]), (40.0, "projected"))
+        d = drain_stats([Sample(0, 0, 0), Sample(10, 30, 30), Sample(20, 30, 30)], 10)
+        self.assertIsNone(d["time_to_empty_s"])
+
+
+class ReplayTest(unittest.IsolatedAsyncioTestCase):
+    async def standin(self, drain=None, **kw):
+        server = StandinServer(**kw)
+        if drain:
+            server.enable_inbound_drain(**drain)
+        await server.start()
+        self.addAsyncCleanup(server.stop)
+        return server
+
+    def events(self, n, rate=200):
+        factory = UpdateFactory(seed=1)
+        return synthesize(rate, (n + 0.5) / rate, {"message": 1}, factory, "fixed")
+
+    async def test_rate_limit_per_ip_window(self):
+        server = await self.standin(rate_limit_per_min=20)
+        server.clock = lambda: 600.0
+        replay = Replay(server.base, redeliver=False)
+        sent_s = await replay.run(self.events(30))
+        r = report(replay, sent_s, [], "", 20)
+        self.assertEqual((r["accepted"], r["rate_limit"]["limited"], r["dropped"]), (20, 10, 10))
+        self.assertEqual(r["rate_limit"]["max_accepted_per_ip_minute"], 20)
+        self.assertEqual(len(server.webhook_queue), 20)
+
+        server.trust_forwarded_for = True
+        spread = Replay(server.base, source_ips=3, redeliver=False)
+        await spread.run(self.events(30))
+        self.assertEqual((spread.accepted, spread.codes.get(429, 0)), (30, 0))
+
+    async def test_redelivery_after_window(self):
+        server = await self.standin(rate_limit_per_min=5)
+        now = [600.0]
+        server.clock = lambda: now[0]
+        replay = Replay(server.base, max_attempts=3)
+        run = asyncio.create_task(replay.run(self.events(8)))
+        await asyncio.sleep(0.3)
+        now[0] = 660.0  # next WebhookRateLimit window before the 1 s redelivery
+        await run
+        self.assertEqual((replay.accepted, replay.dropped, replay.redelivered, replay.codes[429]), (8, 0, 3, 3))
+
+    async def test_inbound_drain_and_depth(self):
+        server = await self.standin(rate_limit_per_min=0, drain={"batch": 5, "kick_lock_s": 0.2, "cron_s": 0.1})
+        probe = DepthProbe(server.base + "/metrics")
+        self.addAsyncCleanup(probe.close)
+        replay = Replay(server.base)
+        sent_s = await replay.run(self.events(40))
+        samples = [Sample(0.0, 0, 0), Sample(round(replay.elapsed(), 2), await probe.read(), replay.accepted)]
+        self.assertGreater(samples[-1].pending, 0)
+        await settle(probe, replay, 0.05, 10, 0, samples)
+        r = report(replay, sent_s, samples, "", 0)
+        self.assertEqual((r["accepted"], samples[-1].pending, server.inbound_drained), (40, 0, 40))
+        self.assertEqual(r["drain"]["time_to_empty"], "measured")
+        self.assertGreater(r["drain"]["drain_per_s"], 0)
+        self.assertEqual(failures(r, 1000), [])
+        self.assertEqual(failures(r, 10), [f"FAIL: peak pending {r['drain']['peak_pending']} >= 10"])
+
+    async def test_capture_then_replay(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "cap.jsonl"
+            recorder = await Recorder(out, "s3cret").start()
+            pool = ConnectionPool(recorder.base)
+            for i in range(3):
+                resp = await pool.request("POST", "/api/v1/webhook/bale/s3cret", {"Content-Type": "application/json"},
+                                          json.dumps({"update_id": i}).encode())
+                self.assertEqual(resp.status, 200)
+            self.assertEqual((await pool.request("POST", "/api/v1/webhook/bale/nope", {}, b"{}")).status, 403)
+            await pool.close()
+            await recorder.stop()
+            events = load_recorded(out, 1)
+            self.assertEqual([e.update["update_id"] for e in events], [0, 1, 2])
+            self.assertEqual(events[0].at, 0.0)
+            self.assertEqual(json.loads(out.read_text().splitlines()[0])["platform"], "bale")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""XuiHttpTransport replay and the service scenarios against an in-process 3x-ui fleet."""
+import contextlib
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from xui_bench import Options, Shared, Target, Transport, main, parse_ports, run_scenario, scaling  # noqa: E402
+from xui_fleet import LEGACY, V3, Fleet, PanelSpec  # noqa: E402
+
+
+class BenchTest(unittest.IsolatedAsyncioTestCase):
+    async def fleet(self, count, spec=PanelSpec()):
+        fleet = await Fleet(count, spec, seed=1).start()
+        self.addAsyncCleanup(fleet.stop)
+        self.now = 1000.0
+        fleet.set_clock(lambda: self.now)
+        return fleet, [Target(p.panel_id, base) for p, base in zip(fleet.panels, fleet.bases)]
+
+    async def test_sync_request_sequence_and_flavor_cache(self):
+        fleet, targets = await self.fleet(2, lambda pid: PanelSpec(flavor=V3 if pid == 2 else LEGACY))
+        shared = Shared()
+        first = (await run_scenario(targets, "sync", 1, shared)).report()
+        # legacy: csrf-token + login, flavor probe (login + paged 404), onlines, 4 x inbounds/get = 9
+        # v3: the same plus one clients/list/paged page = 10
+        self.assertEqual((first["requests"], first["rows"], first["failed"]), (19, 400, 0))
+        self.assertEqual(shared.flavor, {1: LEGACY, 2: V3})
+        second = (await run_scenario(targets, "sync", 2, shared)).report()
+        # cached token and flavor: login, onlines, (v3 page), inbounds/get x 4
+        self.assertEqual(second["requests"], 6 + 7)
+        self.assertEqual(fleet.totals()["requests"], 19 + 13)
+
+    async def test_expired_session_costs_a_retry_sleep(self):
+        fleet, targets = await self.fleet(3, PanelSpec(session_ttl=60))
+        shared = Shared()
+        await run_scenario(targets, "keeper", 3, shared, sleep_scale=0)
+        self.now += 120
+        probe = (await run_scenario(targets, "probe", 3, shared, sleep_scale=0)).report()
+        # Dead probe, then the cached CSRF token is replayed against the expired session:
+        # modern and legacy login both 403 (JSON, then form) — one 350ms sleep per panel.
+        self.assertEqual((probe["logins"], probe["login_attempts"], probe["slept_s"]), (3, 6, 1.05))
+        self.assertEqual(probe["requests"], 3 * (1 + 4 + 2))
+        self.assertEqual(fleet.totals()["expired"], 3)
+
+    async def test_login_retries_and_reauth(self):
+        _, targets = await self.fleet(1, PanelSpec(csrf=False, login_fail_first=2, session_ttl=60))
+        shared = Shared()
+        t = Transport(targets[0], shared, sleep_scale=0)
+        self.assertTrue(await t.login_with_retries())
+        self.assertEqual((t.login_attempts, round(t.slept, 2), shared.no_csrf), (3, 0.8, {1}))
+        self.now += 61
+        r = await t.request("inbounds/list")
+        self.assertTrue(r.api_ok)
+        self.assertEqual((t.reauths, t.logins), (1, 2))
+        await t.close()
+        failing = await self.fleet(1, PanelSpec(csrf=False, login_fail_first=6))
+        run = (await run_scenario(failing[1], "usage", 1, Shared(), sleep_scale=0)).report()
+        self.assertEqual((run["failed"], run["login_attempts"], run["requests"]), (1, 6, 7))
+
+    async def test_usage_and_import(self):
+        fleet, targets = await self.fleet(2, PanelSpec(clients=10))
+        shared = Shared()
+        usage = (await run_scenario(targets, "usage", 2, shared, Options(clients=10, usage_items=60))).report()
+        # csrf-token + login, flavor probe, then 40 lookups (4 inbounds x 10 clients, under the cap of 50)
+        self.assertEqual((usage["rows"], usage["requests"]), (2 * 40, 2 * (2 + 2 + 40)))
+        imported = (await run_scenario(targets, "import", 1, shared, Options(db_bytes=4096))).report()
+        self.assertEqual((imported["ok"], fleet.totals()["imports"]), (2, 2))
+        self.assertGreater(fleet.panels[0].imported_bytes, 4096)
+
+    async def test_concurrency_overlaps_panel_io(self):
+        _, targets = await self.fleet(8, PanelSpec(latency_ms=50, inbounds=1))
+        serial = await run_scenario(targets, "keeper", 1, Shared())
+        parallel = await run_scenario(targets, "keeper", 8, Shared())
+        self.assertGreater(serial.wall, 8 * 2 * 0.05)
+        self.assertLess(parallel.wall, serial.wall / 2)
+
+    async def test_unreachable_panel_is_counted(self):
+        fleet, targets = await self.fleet(1)
+        await fleet.stop()
+        run = (await run_scenario(targets, "keeper", 1, Shared(), timeout=2)).report()
+        self.assertEqual((run["failed"], sum(run["exceptions"].values())), (1, 1))
+
+
+class HelpersTest(unittest.TestCase):
+    def test_ports_and_scaling(self):
+        self.assertEqual(parse_ports("19000-19002,19010"), [19000, 19001, 19002, 19010])
+        reports = [{"scenario": "sync", "concurrency": 1, "panels": n, "wall_s": w} for n, w in ((10, 1.0), (50, 5.0))]
+        self.assertEqual(scaling(reports), {"sync c=1": 100.0})
+
+    def test_every_concurrency_level_starts_warm(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["--fleet=3", "--scenario=sync", "--concurrency=1,3", "--sleep-scale=0",
+                                   "--clients=2", "--json"]), 0)
+        runs = json.loads(out.getvalue())["runs"]
+        # login, onlines, 4 x inbounds/get at both levels; no csrf-token or flavor probe left for c=1
+        self.assertEqual([(r["concurrency"], r["requests_per_panel"]) for r in runs], [(1, 6.0), (3, 6.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""3x-ui stand-in panels: login flows, sessions and the API flavors."""
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool  # noqa: E402
+from xui_fleet import V3, Fleet, PanelSpec, XuiPanel, client_email  # noqa: E402
+
+JSON = {"Content-Type": "application/json"}
+
+
+class PanelTest(unittest.IsolatedAsyncioTestCase):
+    async def panel(self, spec=PanelSpec()):
+        panel = await XuiPanel(7, spec).start()
+        self.addAsyncCleanup(panel.stop)
+        self.now = 1000.0
+        panel.clock = lambda: self.now
+        self.pool = ConnectionPool(panel.base, size=2)
+        self.addAsyncCleanup(self.pool.close)
+        return panel
+
+    async def call(self, method, path, headers=None, body=b""):
+        resp = await self.pool.request(method, path, headers or {}, body)
+        return resp, json.loads(resp.body) if resp.body.startswith(b"{") else None
+
+    async def login(self, user="admin"):
+        resp, token = await self.call("GET", "/csrf-token")
+        cookie = resp.set_cookies[0].split(";", 1)[0]
+        resp, data = await self.call("POST", "/login", {**JSON, "Cookie": cookie, "X-CSRF-Token": token["obj"]},
+                                     json.dumps({"username": user, "password": "admin"}).encode())
+        return resp, data, cookie
+
+    async def test_csrf_login_then_api(self):
+        panel = await self.panel()
+        resp, _ = await self.call("GET", "/panel/api/inbounds/list")
+        self.assertEqual(resp.status, 401)
+        resp, data = await self.call("POST", "/login", JSON, b'{"username": "admin", "password": "admin"}')
+        self.assertEqual(resp.status, 403)
+        resp, data, cookie = await self.login()
+        self.assertEqual((resp.status, data["success"]), (200, True))
+        resp, data = await self.call("GET", "/panel/api/inbounds/get/2", {"Cookie": cookie})
+        clients = json.loads(data["obj"]["settings"])["clients"]
+        self.assertEqual([c["email"] for c in clients[:2]], ["p7-i2-c1", "p7-i2-c2"])
+        resp, data = await self.call("GET", "/panel/api/inbounds/get/9", {"Cookie": cookie})
+        self.assertEqual(data, {"success": False, "msg": "record not found"})
+        self.assertEqual((panel.logins, panel.login_posts, panel.unauthorized), (1, 2, 1))
+
+    async def test_session_expiry_and_failed_login(self):
+        panel = await self.panel(PanelSpec(session_ttl=60, login_fail_first=1))
+        resp, data, _ = await self.login()
+        self.assertEqual((resp.status, data["success"], resp.set_cookies), (200, False, ()))
+        _, _, cookie = await self.login()
+        resp, _ = await self.call("POST", "/panel/api/inbounds/onlines", {"Cookie": cookie})
+        self.assertEqual(resp.status, 200)
+        self.now += 61
+        resp, _ = await self.call("POST", "/panel/api/inbounds/onlines", {"Cookie": cookie})
+        self.assertEqual(resp.status, 401)
+        self.assertEqual((panel.expired, panel.login_failures), (1, 1))
+
+    async def test_legacy_form_login_and_flavors(self):
+        await self.panel(PanelSpec(csrf=False, clients=3))
+        resp, _ = await self.call("GET", "/csrf-token")
+        self.assertEqual(resp.status, 404)
+        resp, data = await self.call("POST", "/login", {"Content-Type": "application/x-www-form-urlencoded"},
+                                     b"username=admin&password=admin")
+        cookie = resp.set_cookies[0].split(";", 1)[0]
+        resp, _ = await self.call("GET", "/panel/api/clients/list/paged?page=1&pageSize=1", {"Cookie": cookie})
+        self.assertEqual(resp.status, 404)
+        email = client_email(7, 1, 3)
+        _, data = await self.call("GET", f"/panel/api/inbounds/getClientTraffics/{email}", {"Cookie": cookie})
+        self.assertEqual(data["obj"]["email"], email)
+        _, data = await self.call("GET", "/panel/api/inbounds/getClientTraffics/p8-i1-c1", {"Cookie": cookie})
+        self.assertIsNone(data["obj"])
+
+    async def test_v3_paged_clients(self):
+        await self.panel(PanelSpec(flavor=V3, inbounds=3, clients=4))
+        _, _, cookie = await self.login()
+        _, data = await self.call("GET", "/panel/api/clients/list/paged?page=2&pageSize=5", {"Cookie": cookie})
+        page = data["obj"]
+        self.assertEqual(page["total"], 12)
+        self.assertEqual([(c["email"], c["inboundIds"]) for c in page["clients"][:2]],
+                         [("p7-i2-c2", [2]), ("p7-i2-c3", [2])])
+
+
+class FleetTest(unittest.IsolatedAsyncioTestCase):
+    async def test_mixed_fleet_ports_and_totals(self):
+        async with Fleet(3, lambda pid: PanelSpec(flavor=V3 if pid == 2 else "legacy_inbound")) as fleet:
+            self.assertEqual(len(set(fleet.bases)), 3)
+            self.assertEqual([p.spec.flavor for p in fleet.panels], ["legacy_inbound", V3, "legacy_inbound"])
+            pool = ConnectionPool(fleet.panels[1].base)
+            await pool.request("GET", "/csrf-token")
+            await pool.close()
+            self.assertEqual(fleet.totals()["requests"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
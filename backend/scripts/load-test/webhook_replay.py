@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""Replay Telegram/Bale updates into the webhook and measure how fast ``svp_inbound_queue`` drains.
+
+WebhookController accepts each update on ``POST /api/v1/webhook/{platform}/{secret}``.
+WebhookRateLimit sits in front of it: per client IP, per wall-clock minute,
+default 120, answering 429 ``rate_limited``. The controller inserts a pending
+row and calls kickAsyncDrain(). That runs one drainBatch() of
+``inbound_queue_batch_size`` rows (default 5) after the response, at most once
+per 5 s lock. InboundQueueDrainJob adds one batch a minute. The queue only
+empties as fast as those batches run, so the question is ingest vs drain.
+
+Update stream, one of:
+
+  synthesized   --rate=R updates/s for --duration s, Poisson arrivals (or --arrivals=fixed);
+                a --mix of messages, callback queries and payments
+                (pre_checkout_query + successful_payment) from --users distinct chats
+  recorded      --recorded=FILE: JSONL of {"t": seconds, "update": {...}} (what --capture writes)
+                replayed at the recorded inter-arrival times (scaled by --speed);
+                plain updates or a getUpdates JSON dump are paced at --rate
+  captured      --capture=FILE --port=P: listen on /api/v1/webhook/{platform}/{secret}
+                and append every update with its arrival time, for a later --recorded replay
+
+Requests go out on up to --connections keep-alive connections (Telegram's
+webhook max_connections defaults to 40). A 429/5xx or a connection error is
+redelivered with exponential backoff, as Telegram does, unless --no-redeliver.
+All updates come from one IP, as they do from Telegram's webhook pool. With
+rate_limit_trust_forwarded_for on, --source-ips spreads them over N
+X-Forwarded-For addresses.
+
+Queue depth is sampled every --sample-every s from the ``svp_inbound_queue_pending``
+gauge on ``/metrics`` (X-Health-Token from --health-token / SVP_HEALTH_DEEP_TOKEN),
+or from --depth-cmd, a shell command printing the pending count. After the
+replay, sampling goes on for up to --settle s to time the queue to empty.
+
+Report:
+- offered vs accepted ingest rate, and 429s per rate-limit window (the WebhookRateLimit effect);
+- the sustained drain rate, from the depth samples and the accepted count;
+- peak pending against --pending-threshold (LOAD-TEST-FA: pending < 1000);
+- time-to-empty, measured when the queue empties within --settle, else projected.
+
+--standin runs the replay against an in-process standin_server.py that drains
+like InboundQueueService.
+
+Usage:
+  python3 scripts/load-test/webhook_replay.py --standin --rate=5 --duration=120 --process-ms=80
+  SVP_HEALTH_DEEP_TOKEN=... python3 scripts/load-test/webhook_replay.py --base=https://staging.example \\
+    --secret=$TELEGRAM_WEBHOOK_SECRET --rate=3 --duration=300 --settle=600 --log ../docs/evidence/webhook-replay.log
+  python3 scripts/load-test/webhook_replay.py --capture=updates.jsonl --port=8443 --secret=s3cret
+  python3 scripts/load-test/webhook_replay.py --recorded=updates.jsonl --speed=2 --base=http://127.0.0.1:8080
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import socket
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool, Histogram  # noqa: E402
+from standin_server import Reply, Request, StandinServer  # noqa: E402
+
+PENDING_RE = re.compile(r"^svp_inbound_queue_pending\s+(\d+)", re.M)
+MESSAGE_TEXTS = ("/start", "🛒 خرید سرویس", "📦 سرویس‌های من", "💰 کیف پول", "🎁 تست رایگان", "پشتیبانی")
+CALLBACK_DATA = ("menu", "buy_plan:3", "buy_plan:7", "svc:12", "svc_renew:12", "wallet", "wallet_topup:200000")
+
+
+class Event(NamedTuple):
+    at: float  # seconds from the start of the replay
+    update: dict
+
+
+# --- update streams --------------------------------------------------------
+
+class UpdateFactory:
+    """Bot API update shapes UpdateRouter dispatches on."""
+
+    def __init__(self, users: int = 1000, seed: int | None = None, first_update_id: int = 900_000_000):
+        self.rng = random.Random(seed)
+        self.users = max(1, users)
+        self.update_id = first_update_id
+        self.message_id = 0
+        self.paid: list[dict] = []  # pre-checkouts waiting for their successful_payment
+
+    def _user(self, uid: int | None = None) -> dict:
+        uid = uid or 5_000_000_000 + self.rng.randrange(self.users)
+        return {"id": uid, "is_bot": False, "first_name": f"u{uid % 100000}", "language_code": "fa"}
+
+    def _next(self, **body) -> dict:
+        self.update_id += 1
+        return {"update_id": self.update_id, **body}
+
+    def _message(self, user: dict, **extra) -> dict:
+        self.message_id += 1
+        return {"message_id": self.message_id, "from": user, "chat": {"id": user["id"], "type": "private",
+                "first_name": user["first_name"]}, "date": int(time.time()), **extra}
+
+    def message(self) -> dict:
+        return self._next(message=self._message(self._user(), text=self.rng.choice(MESSAGE_TEXTS)))
+
+    def callback(self) -> dict:
+        user = self._user()
+        return self._next(callback_query={
+            "id": str(self.rng.getrandbits(63)), "from": user, "chat_instance": str(user["id"] * 7),
+            "message": {**self._message({"id": 100, "is_bot": True, "first_name": "svp"}, text="منو"),
+                        "chat": {"id": user["id"], "type": "private"}},
+            "data": self.rng.choice(CALLBACK_DATA)})
+
+    def payment(self) -> dict:
+        """A pre_checkout_query, then the matching successful_payment on the next payment slot."""
+        if self.paid:
+            q = self.paid.pop(0)
+            return self._next(message=self._message(q["from"], successful_payment={
+                "currency": q["currency"], "total_amount": q["total_amount"], "invoice_payload": q["invoice_payload"],
+                "telegram_payment_charge_id": f"tg_{q['id']}", "provider_payment_charge_id": f"pr_{q['id']}"}))
+        user = self._user()
+        amount = self.rng.choice((50, 100, 250, 500))
+        q = {"id": str(self.rng.getrandbits(63)), "from": user, "currency": "XTR", "total_amount": amount,
+             "invoice_payload": f"wallet_topup:{user['id']}:{amount}"}
+        self.paid.append(q)
+        return self._next(pre_checkout_query=q)
+
+    def make(self, kind: str) -> dict:
+        return {"message": self.message, "callback": self.callback, "payment": self.payment}[kind]()
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """``message=0.7,callback=0.25,payment=0.05`` -> weights."""
+    mix = {}
+    for part in filter(None, text.split(",")):
+        kind, _, weight = part.partition("=")
+        if kind not in ("message", "callback", "payment"):
+            raise ValueError(f"unknown update kind: {kind}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def synthesize(rate: float, duration: float, mix: dict[str, float], factory: UpdateFactory,
+               arrivals: str = "poisson") -> Iterator[Event]:
+    kinds, weights = zip(*mix.items())
+    t = 0.0
+    while True:
+        t += factory.rng.expovariate(rate) if arrivals == "poisson" else 1 / rate
+        if t >= duration:
+            return
+        yield Event(t, factory.make(factory.rng.choices(kinds, weights)[0]))
+
+
+def load_recorded(path: Path, rate: float) -> list[Event]:
+    """Capture JSONL keeps its timing; plain updates and getUpdates dumps are paced at ``rate``."""
+    text = path.read_text(encoding="utf-8")
+    try:
+        whole = json.loads(text)
+    except ValueError:
+        whole = None  # JSONL
+    if isinstance(whole, dict) and isinstance(whole.get("result"), list):
+        whole = whole["result"]
+    if isinstance(whole, list):
+        return [Event(i / rate, u) for i, u in enumerate(whole)]
+    events = []
+    for line in filter(None, (ln.strip() for ln in text.splitlines())):
+        record = json.loads(line)
+        if "update" in record and "t" in record:
+            events.append(Event(float(record["t"]), record["update"]))
+        else:
+            events.append(Event(len(events) / rate, record))
+    start = min((e.at for e in events), default=0.0)
+    return sorted((Event(e.at - start, e.update) for e in events), key=lambda e: e.at)
+
+
+class Recorder(StandinServer):
+    """Webhook endpoint that appends each update and its arrival time to a JSONL file."""
+
+    def __init__(self, out: Path, secret: str, secret_header: str = ""):
+        super().__init__(webhook_secret=secret, secret_header=secret_header, rate_limit_per_min=0)
+        self.out = out.open("a", encoding="utf-8")
+        self.started = time.monotonic()
+        self.captured = 0
+
+    async def _webhook(self, req: Request) -> Reply:
+        if req.params["secret"] != self.webhook_secret:
+            return Reply(403, {"ok": False, "message": "invalid_secret"})
+        try:
+            update = req.json()
+        except ValueError:
+            return Reply(200, {"ok": True})
+        self.out.write(json.dumps({"t": round(time.monotonic() - self.started, 4), "platform": req.params["platform"],
+                                   "update": update}, ensure_ascii=False) + "\n")
+        self.out.flush()
+        self.captured += 1
+        return Reply(200, {"ok": True})
+
+    async def stop(self) -> None:
+        await super().stop()
+        self.out.close()
+
+
+# --- replay ----------------------------------------------------------------
+
+class Replay:
+    def __init__(self, base: str, platform: str = "telegram", secret: str = "s3cret", secret_token: str = "",
+                 connections: int = 40, timeout: float = 15.0, source_ips: int = 0, redeliver: bool = True,
+                 max_attempts: int = 6):
+        self.pool = ConnectionPool(base, size=connections, timeout=timeout)
+        self.path = f"/api/v1/webhook/{platform}/{secret}"
+        self.headers = {"Content-Type": "application/json"}
+        if secret_token:
+            self.headers["X-Telegram-Bot-Api-Secret-Token"] = secret_token
+        self.ips = [f"149.154.167.{200 + i % 50}" if i < 50 else f"91.108.6.{i - 50}" for i in range(source_ips)]
+        self.redeliver = redeliver
+        self.max_attempts = max(1, max_attempts)
+        self.started = time.monotonic()
+        self.scheduled = 0
+        self.requests = 0
+        self.accepted = 0
+        self.redelivered = 0
+        self.dropped = 0
+        self.codes: Counter[int] = Counter()
+        self.exceptions: Counter[str] = Counter()
+        self.windows: dict[int, Counter[str]] = {}  # wall-clock minute -> sent/accepted/limited
+        self.per_ip_window: Counter[tuple[str, int]] = Counter()
+        self.hist = Histogram()
+        self.last_accept = 0.0
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    async def deliver(self, update: dict, n: int) -> None:
+        ip = self.ips[n % len(self.ips)] if self.ips else ""
+        headers = {**self.headers, "X-Forwarded-For": ip} if ip else self.headers
+        body = json.dumps(update, ensure_ascii=False).encode()
+        for attempt in range(1, self.max_attempts + 1):
+            window = self.windows.setdefault(int(time.time() // 60), Counter())
+            window["sent"] += 1
+            self.requests += 1
+            t = time.perf_counter()
+            try:
+                resp = await self.pool.request("POST", self.path, headers, body)
+                status = resp.status
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as exc:
+                self.exceptions[type(exc).__name__] += 1
+                status = 0
+            self.hist.record((time.perf_counter() - t) * 1000)
+            if status:
+                self.codes[status] += 1
+            if 200 <= status < 300:
+                self.accepted += 1
+                window["accepted"] += 1
+                self.per_ip_window[(ip, int(time.time() // 60))] += 1
+                self.last_accept = self.elapsed()
+                return
+            if status == 429:
+                window["limited"] += 1
+            if not self.redeliver or attempt == self.max_attempts or (status and status != 429 and status < 500):
+                break
+            self.redelivered += 1
+            await asyncio.sleep(min(60.0, 2.0 ** (attempt - 1)))
+        self.dropped += 1
+
+    async def run(self, events: Iterator[Event], speed: float = 1.0) -> float:
+        """Open loop: each update goes out at its own time, however slow the server is."""
+        self.started = time.monotonic()
+        tasks = []
+        for n, event in enumerate(events):
+            delay = event.at / speed - self.elapsed()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.scheduled += 1
+            tasks.append(asyncio.create_task(self.deliver(event.update, n)))
+        sent_s = self.elapsed()
+        await asyncio.gather(*tasks)
+        await self.pool.close()
+        return sent_s
+
+
+# --- queue depth -----------------------------------------------------------
+
+class DepthProbe:
+    """Pending rows in svp_inbound_queue, from /metrics or a shell command."""
+
+    def __init__(self, metrics_url: str = "", token: str = "", cmd: str = "", timeout: float = 10.0):
+        self.cmd = cmd
+        self.token = token
+        self.pool = ConnectionPool(metrics_url, size=1, timeout=timeout) if metrics_url and not cmd else None
+        self.error = ""
+
+    async def read(self) -> int | None:
+        try:
+            if self.cmd:
+                proc = await asyncio.create_subprocess_shell(self.cmd, stdout=asyncio.subprocess.PIPE)
+                out, _ = await proc.communicate()
+                return int(out.decode().split()[0])
+            if self.pool is None:
+                return None
+            resp = await self.pool.request("GET", "", {"X-Health-Token": self.token} if self.token else {})
+            m = PENDING_RE.search(resp.body.decode("utf-8", "replace"))
+            if resp.status != 200 or not m:
+                self.error = f"/metrics {resp.status}" + ("" if m else " without svp_inbound_queue_pending")
+                return None
+            return int(m.group(1))
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError) as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
+            return None
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            await self.pool.close()
+
+
+class Sample(NamedTuple):
+    t: float
+    pending: int
+    accepted: int
+
+
+async def sample_depth(probe: DepthProbe, replay: Replay, every: float, stop: asyncio.Event,
+                       samples: list[Sample]) -> None:
+    while True:
+        try:
+            await asyncio.wait_for(stop.wait(), every)
+            return
+        except asyncio.TimeoutError:
+            pass
+        pending = await probe.read()
+        if pending is not None:
+            samples.append(Sample(round(replay.elapsed(), 2), pending, replay.accepted))
+
+
+async def settle(probe: DepthProbe, replay: Replay, every: float, seconds: float, baseline: int,
+                 samples: list[Sample]) -> None:
+    """Keep sampling after the replay until the queue is back to ``baseline`` or ``seconds`` pass."""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pending = await probe.read()
+        if pending is None:
+            return
+        samples.append(Sample(round(replay.elapsed(), 2), pending, replay.accepted))
+        if pending <= baseline:
+            return
+        await asyncio.sleep(min(every, max(0.0, deadline - time.monotonic())))
+
+
+def drain_stats(samples: list[Sample], replay_end: float, baseline: int | None = None) -> dict:
+    """Drained rows = accepted - growth in pending, between samples."""
+    if len(samples) < 2:
+        return {"samples": len(samples)}
+    first, last = samples[0], samples[-1]
+    base = first.pending if baseline is None else baseline
+    drained = (last.accepted - first.accepted) - (last.pending - first.pending)
+    span = last.t - first.t
+    during = [s for s in samples if s.t <= replay_end]
+    after = [s for s in samples if s.t >= replay_end]
+    peak = max(samples, key=lambda s: s.pending)
+    out = {
+        "samples": len(samples),
+        "drain_per_s": round(drained / span, 3) if span > 0 else 0.0,
+        "peak_pending": peak.pending,
+        "peak_at_s": peak.t,
+        "pending_at_end": next((s.pending for s in reversed(during)), first.pending),
+        "final_pending": last.pending,
+    }
+    if len(during) >= 2 and during[-1].t > during[0].t:
+        d = (during[-1].accepted - during[0].accepted) - (during[-1].pending - during[0].pending)
+        out["drain_during_per_s"] = round(d / (during[-1].t - during[0].t), 3)
+    if len(after) >= 2 and after[-1].t > after[0].t:
+        d = (after[-1].accepted - after[0].accepted) - (after[-1].pending - after[0].pending)
+        out["drain_after_per_s"] = round(d / (after[-1].t - after[0].t), 3)
+    empty = next((s for s in samples if s.t >= replay_end and s.pending <= base), None)
+    if empty is not None:
+        out["time_to_empty_s"] = round(max(0.0, empty.t - replay_end), 1)
+        out["time_to_empty"] = "measured"
+    else:
+        rate = out.get("drain_after_per_s") or out["drain_per_s"]
+        backlog = last.pending - base
+        out["time_to_empty_s"] = round(last.t - replay_end + backlog / rate, 1) if rate > 0 else None
+        out["time_to_empty"] = "projected"
+    return out
+
+
+# --- report ----------------------------------------------------------------
+
+def report(replay: Replay, sent_s: float, samples: list[Sample], probe_error: str, limit: int) -> dict:
+    windows = sorted(replay.windows.items())
+    first = windows[0][0] if windows else 0
+    span = max(sent_s, replay.last_accept, 1e-9)
+    baseline = samples[0].pending if samples else None
+    return {
+        "scheduled": replay.scheduled,
+        "requests": replay.requests,
+        "accepted": replay.accepted,
+        "dropped": replay.dropped,
+        "redelivered": replay.redelivered,
+        "codes": dict(sorted(replay.codes.items())),
+        "exceptions": dict(replay.exceptions),
+        "offered_per_s": round(replay.scheduled / sent_s, 3) if sent_s else 0.0,
+        "ingest_per_s": round(replay.accepted / span, 3),
+        "send_s": round(sent_s, 2),
+        "p50_ms": round(replay.hist.percentile(50), 1),
+        "p99_ms": round(replay.hist.percentile(99), 1),
+        "rate_limit": {
+            "limit_per_min": limit,
+            "limited": replay.codes.get(429, 0),
+            "max_accepted_per_ip_minute": max(replay.per_ip_window.values(), default=0),
+            "windows": [{"minute": m - first, **{k: c.get(k, 0) for k in ("sent", "accepted", "limited")}}
+                        for m, c in windows],
+        },
+        "depth": [tuple(s) for s in samples],
+        "depth_error": probe_error,
+        "drain": drain_stats(samples, sent_s, baseline) if samples else {"samples": 0},
+    }
+
+
+def human(seconds: float | None) -> str:
+    if seconds is None:
+        return "never"
+    seconds = int(round(seconds))
+    h, rest = divmod(seconds, 3600)
+    m, s = divmod(rest, 60)
+    return f"{h}h{m:02d}m" if h else f"{m}m{s:02d}s" if m else f"{s}s"
+
+
+def failures(r: dict, threshold: int) -> list[str]:
+    lines = []
+    if r["scheduled"] and not r["accepted"]:
+        lines.append(f"FAIL: none of {r['scheduled']} updates accepted (codes {r['codes']})")
+    if r["exceptions"]:
+        lines.append(f"FAIL: connection errors {r['exceptions']}")
+    d = r["drain"]
+    if threshold and d.get("peak_pending", 0) >= threshold:
+        lines.append(f"FAIL: peak pending {d['peak_pending']} >= {threshold}")
+    if d.get("samples", 0) >= 2 and d.get("time_to_empty_s") is None:
+        lines.append("FAIL: queue does not drain (drain rate <= 0)")
+    return lines
+
+
+def log_lines(r: dict, args: argparse.Namespace, started: str, fails: list[str]) -> list[str]:
+    source = (f"recorded={args.recorded.name}" if args.recorded
+              else f"synth rate={args.rate:g}/s duration={args.duration:g}s arrivals={args.arrivals}")
+    lines = [f"webhook-replay start {started} host={socket.gethostname()} base={args.base or 'standin'} "
+             f"platform={args.platform} {source}",
+             f"ingest scheduled={r['scheduled']} accepted={r['accepted']} dropped={r['dropped']} "
+             f"redelivered={r['redelivered']} offered_per_s={r['offered_per_s']} ingest_per_s={r['ingest_per_s']} "
+             f"p50_ms={r['p50_ms']} p99_ms={r['p99_ms']} codes={r['codes']}"]
+    rl = r["rate_limit"]
+    lines.append(f"rate-limit limit_per_min={rl['limit_per_min'] or '-'} limited={rl['limited']} "
+                 f"max_accepted_per_ip_minute={rl['max_accepted_per_ip_minute']}")
+    for w in rl["windows"]:
+        lines.append(f"window minute={w['minute']} sent={w['sent']} accepted={w['accepted']} 429={w['limited']}")
+    if r["depth"]:
+        lines.append("depth " + " ".join(f"t={t}s:{p}" for t, p, _ in r["depth"])
+                     + (f" (stopped: {r['depth_error']})" if r["depth_error"] else ""))
+        d = r["drain"]
+        lines.append(f"drain drain_per_s={d.get('drain_per_s')} during={d.get('drain_during_per_s', '-')} "
+                     f"after={d.get('drain_after_per_s', '-')} peak_pending={d.get('peak_pending')} "
+                     f"at={d.get('peak_at_s')}s pending_at_end={d.get('pending_at_end')} "
+                     f"final_pending={d.get('final_pending')} time_to_empty={human(d.get('time_to_empty_s'))} "
+                     f"({d.get('time_to_empty')})")
+    else:
+        lines.append(f"depth unavailable ({r['depth_error'] or 'no probe'})")
+    lines.extend(fails)
+    lines.append(f"webhook-replay complete exit={1 if fails else 0} accepted={r['accepted']}/{r['scheduled']}")
+    return lines
+
+
+# --- main ------------------------------------------------------------------
+
+async def replay_main(args: argparse.Namespace) -> tuple[dict, dict | None]:
+    server = None
+    base = args.base
+    limit = args.rate_limit
+    if args.standin:
+        server = StandinServer(webhook_secret=args.secret, rate_limit_per_min=args.rate_limit)
+        server.trust_forwarded_for = args.trust_forwarded_for
+        server.enable_inbound_drain(args.inbound_batch, args.kick_lock_s, args.cron_s, args.process_ms)
+        await server.start()
+        base = server.base
+    if args.recorded:
+        events: Iterator[Event] = iter(load_recorded(args.recorded, args.rate))
+    else:
+        factory = UpdateFactory(args.users, args.seed)
+        events = synthesize(args.rate, args.duration, args.mix, factory, args.arrivals)
+    metrics_url = args.metrics_url or (base.rstrip("/") + "/metrics")
+    probe = DepthProbe(metrics_url, args.health_token, args.depth_cmd, args.timeout)
+    replay = Replay(base, args.platform, args.secret, args.secret_token, args.connections, args.timeout,
+                    args.source_ips, not args.no_redeliver, args.max_attempts)
+    samples: list[Sample] = []
+    stop = asyncio.Event()
+    try:
+        first = await probe.read()
+        if first is not None:
+            samples.append(Sample(0.0, first, 0))
+        sampler = asyncio.create_task(sample_depth(probe, replay, args.sample_every, stop, samples)) \
+            if first is not None else None
+        sent_s = await replay.run(events, args.speed)
+        stop.set()
+        if sampler is not None:
+            await sampler
+            await settle(probe, replay, args.sample_every, args.settle, samples[0].pending, samples)
+        r = report(replay, sent_s, samples, probe.error, limit)
+    finally:
+        await probe.close()
+        if server is not None:
+            await server.stop()
+    standin = None
+    if server is not None:
+        standin = {"received": len(server.webhook_queue), "drained": server.inbound_drained,
+                   "pending": server.inbound_pending}
+    return r, standin
+
+
+async def capture_main(args: argparse.Namespace) -> int:
+    recorder = await Recorder(args.capture, args.secret, args.secret_token).start(args.host, args.port)
+    print(f"capturing {recorder.base}/api/v1/webhook/{{platform}}/{args.secret} -> {args.capture}", flush=True)
+    try:
+        if args.duration:
+            await asyncio.sleep(args.duration)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await recorder.stop()
+        print(f"captured {recorder.captured} updates", flush=True)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Webhook ingress replay and inbound queue drain measurement")
+    parser.add_argument("--base", help="backend base URL, e.g. https://staging.example")
+    parser.add_argument("--standin", action="store_true", help="replay against an in-process stand-in backend")
+    parser.add_argument("--platform", choices=("telegram", "bale"), default="telegram")
+    parser.add_argument("--secret", default=os.environ.get("SVP_WEBHOOK_SECRET", "s3cret"), help="{platform}_webhook_secret")
+    parser.add_argument("--secret-token", default="", help="X-Telegram-Bot-Api-Secret-Token (telegram_secret_header)")
+    parser.add_argument("--rate", type=float, default=5.0, help="updates per second (synthesized / untimed recordings)")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds of synthesized traffic (capture: 0 = until ^C)")
+    parser.add_argument("--arrivals", choices=("poisson", "fixed"), default="poisson")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("message=0.6,callback=0.35,payment=0.05"))
+    parser.add_argument("--users", type=int, default=1000, help="distinct chats in synthesized updates")
+    parser.add_argument("--recorded", type=Path, help="replay a capture JSONL, JSONL of updates or getUpdates dump")
+    parser.add_argument("--speed", type=float, default=1.0, help="recorded timing multiplier (2 = twice as fast)")
+    parser.add_argument("--capture", type=Path, help="record incoming webhook updates to this JSONL instead")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--connections", type=int, default=40, help="concurrent webhook connections (max_connections)")
+    parser.add_argument("--source-ips", type=int, default=0, help="X-Forwarded-For addresses to rotate (0 = none)")
+    parser.add_argument("--no-redeliver", action="store_true", help="do not retry 429/5xx like Telegram does")
+    parser.add_argument("--max-attempts", type=int, default=6)
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--metrics-url", help="default: <base>/metrics")
+    parser.add_argument("--health-token", default=os.environ.get("SVP_HEALTH_DEEP_TOKEN", ""))
+    parser.add_argument("--depth-cmd", default="", help="shell command printing the pending count")
+    parser.add_argument("--sample-every", type=float, default=5.0)
+    parser.add_argument("--settle", type=float, default=120.0, help="seconds to keep sampling after the replay")
+    parser.add_argument("--pending-threshold", type=int, default=1000, help="FAIL at this peak pending (0 = off)")
+    parser.add_argument("--rate-limit", type=int, default=120,
+                        help="webhook_rate_limit_per_min (stand-in setting; annotates the report)")
+    parser.add_argument("--trust-forwarded-for", action="store_true", help="stand-in: rate-limit by X-Forwarded-For")
+    parser.add_argument("--inbound-batch", type=int, default=5, help="stand-in: inbound_queue_batch_size")
+    parser.add_argument("--kick-lock-s", type=float, default=5.0, help="stand-in: kickAsyncDrain lock")
+    parser.add_argument("--cron-s", type=float, default=60.0, help="stand-in: InboundQueueDrainJob interval")
+    parser.add_argument("--process-ms", type=float, default=50.0, help="stand-in: processing time per update")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--log", type=Path, help="also write the webhook-replay log here")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    if args.capture:
+        try:
+            return asyncio.run(capture_main(args))
+        except KeyboardInterrupt:
+            return 0
+    if not args.base and not args.standin:
+        parser.error("--base or --standin is required")
+    if args.rate <= 0 or args.speed <= 0:
+        parser.error("--rate and --speed must be positive")
+    if args.recorded and not args.recorded.is_file():
+        parser.error(f"recording not found: {args.recorded}")
+
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    r, standin = asyncio.run(replay_main(args))
+    fails = failures(r, args.pending_threshold)
+    lines = log_lines(r, args, started, fails)
+    if args.log:
+        args.log.parent.mkdir(parents=True, exist_ok=True)
+        args.log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps({**r, "standin": standin, "failures": fails}, indent=2, ensure_ascii=False))
+    else:
+        print("\n".join(lines))
+        if standin:
+            print(f"stand-in: {standin}")
+    return 1 if fails else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
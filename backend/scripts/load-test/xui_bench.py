@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""Benchmark the XuiPanel service I/O against a 3x-ui panel fleet (see xui_fleet.py).
+
+For each panel the driver replays the requests the PHP services send through
+XuiHttpTransport. That covers:
+
+- loginWithRetries: csrf-token, then the modern cookie login, then the legacy
+  login, sleeping 350 ms + 100 ms per retry between attempts;
+- request(), including the re-login after a 401/403;
+- ensureReady's status probe;
+- requestImportDb's multipart upload.
+
+Scenarios:
+
+  keeper  PanelSessionKeeperService::run        loginWithRetries(6, 300ms)
+  probe   XuiClient::ensureReady                 status probe; log in only when the cookie is dead
+  sync    ConfigsSyncService::syncPanelToDb      login, onlines, v3 client pages, inbounds/get per inbound
+  usage   UsageLiveService::refreshTrafficBatch  login, one traffic lookup per item (at most 50)
+  import  XuiClient::importDbFromPath            login, multipart server/importDB
+
+The PHP jobs (InboundClientsCacheJob, the session keeper) walk the panels one at
+a time, and each panel's requests are sequential, so ``--concurrency=1`` is
+today's behaviour. A higher value runs that many panels at once. The gap shows
+how much of the wall time is panel I/O waiting in line.
+
+Each request opens a new connection (``Connection: close``), as Laravel's Http
+client does. Session cookies, CSRF tokens and detected API flavors carry over
+between runs, the way the cache and ``svp_panels.panel_api_flavor`` do; an
+unreported warm-up pass per fleet size and scenario fills them first, so every
+concurrency level starts from the same warm state. Sleeps
+are real; ``--sleep-scale`` shrinks them for quick runs and the report still
+counts the unscaled time.
+
+Without ``--ports`` the fleet runs in this process. Start ``xui_fleet.py``
+separately and pass ``--ports`` to keep the stand-in off the driver's event loop.
+The two must use the same ``--inbounds``/``--clients``.
+
+Usage:
+  python3 scripts/load-test/xui_bench.py --fleet=10,50,100 --scenario=sync,usage --concurrency=1,8 --latency-ms=20
+  python3 scripts/load-test/xui_fleet.py --panels=200 --port=19000 --latency-ms=20 &
+  python3 scripts/load-test/xui_bench.py --ports=19000-19199 --fleet=50,200 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, NamedTuple
+from urllib.parse import quote, urlencode
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_engine import ConnectionPool, Histogram, Response  # noqa: E402
+from xui_fleet import LEGACY, V3, Fleet, add_spec_arguments, client_email, spec_from_args  # noqa: E402
+
+UNKNOWN = "unknown"  # XuiPanelContext::FLAVOR_UNKNOWN
+API_ROOT = "/panel/api/"
+BROWSER_HEADERS = {
+    "Accept": "application/json, text/html, */*",
+    "User-Agent": "SimpleVPBot-Laravel/1.0",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+COOKIE_RE = re.compile(r"^([^=;]+)=([^;]+)")
+USAGE_MAX_ITEMS = 50  # UsageLiveService::MAX_BATCH_ITEMS
+SYNC_MAX_CLIENTS = 500  # ConfigsSyncService $constMax
+V3_PAGE_SIZE = 500
+
+
+class Shared:
+    """State that outlives one runWithPanel(): XuiSessionStore and the stored API flavor."""
+
+    def __init__(self) -> None:
+        self.cookie: dict[int, str] = {}
+        self.csrf: dict[int, str] = {}
+        self.no_csrf: set[int] = set()
+        self.flavor: dict[int, str] = {}
+
+    def clear(self, panel_id: int) -> None:
+        self.cookie.pop(panel_id, None)
+        self.csrf.pop(panel_id, None)
+
+
+class Target(NamedTuple):
+    panel_id: int
+    base: str
+
+
+class ApiResult(NamedTuple):
+    code: int
+    json: dict | list | None
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.code < 300
+
+    @property
+    def api_ok(self) -> bool:
+        """XuiHttpTransport::apiHttpOk."""
+        if not self.ok:
+            return False
+        if isinstance(self.json, dict) and "success" in self.json:
+            return bool(self.json["success"])
+        return True
+
+
+def decode(resp: Response) -> dict | list | None:
+    try:
+        data = json.loads(resp.body)
+    except ValueError:
+        return None
+    return data if isinstance(data, (dict, list)) else None
+
+
+def cookie_from(resp: Response) -> str:
+    parts = []
+    for line in resp.set_cookies:
+        m = COOKIE_RE.match(line)
+        if m and (pair := f"{m[1].strip()}={m[2].strip()}") not in parts:
+            parts.append(pair)
+    return "; ".join(parts)
+
+
+def merge_cookies(existing: str, new: str) -> str:
+    jar: dict[str, str] = {}
+    for part in f"{existing};{new}".split(";"):
+        name, sep, value = part.strip().partition("=")
+        if sep:
+            jar[name.strip()] = value.strip()
+    return "; ".join(f"{k}={v}" for k, v in jar.items()) if jar else existing
+
+
+class Transport:
+    """XuiHttpTransport for one panel with cookie credentials, as built by runWithPanel()."""
+
+    def __init__(self, target: Target, shared: Shared, username: str = "admin", password: str = "admin",
+                 sleep_scale: float = 1.0, timeout: float = 90.0):
+        self.id = target.panel_id
+        self.pool = ConnectionPool(target.base, size=1, timeout=timeout)
+        self.shared = shared
+        self.username = username
+        self.password = password
+        self.sleep_scale = sleep_scale
+        self.requests = 0
+        self.logins = 0
+        self.login_attempts = 0
+        self.reauths = 0
+        self.probes = 0
+        self.slept = 0.0
+        self.rows = 0
+
+    async def _send(self, method: str, path: str, headers: dict[str, str], body: bytes = b"") -> Response:
+        self.requests += 1
+        return await self.pool.request(method, path, {**headers, "Connection": "close"}, body)
+
+    async def _sleep(self, us: int) -> None:
+        self.slept += us / 1e6
+        await asyncio.sleep(us / 1e6 * self.sleep_scale)
+
+    def _session_headers(self, headers: dict[str, str]) -> dict[str, str]:
+        if cookie := self.shared.cookie.get(self.id, ""):
+            headers["Cookie"] = cookie
+        if csrf := self.shared.csrf.get(self.id, ""):
+            headers["X-CSRF-Token"] = csrf
+        return headers
+
+    def clear_session(self) -> None:
+        self.shared.clear(self.id)
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    async def probe(self) -> bool:
+        self.probes += 1
+        if not self.shared.cookie.get(self.id):
+            return False
+        resp = await self._send("GET", API_ROOT + "server/status", self._session_headers({"Accept": "application/json"}))
+        return 200 <= resp.status < 300
+
+    async def ensure_ready(self, force_reauth: bool = False) -> bool:
+        if not force_reauth and self.shared.cookie.get(self.id) and await self.probe():
+            return True
+        return await self.login_with_cookie_session(6, 350000)
+
+    async def login_with_retries(self, max_attempts: int = 6, delay_us: int = 350000) -> bool:
+        return await self.login_with_cookie_session(max_attempts, delay_us)
+
+    async def login_with_cookie_session(self, max_attempts: int = 6, delay_us: int = 350000) -> bool:
+        for i in range(max(1, min(12, max_attempts))):
+            if i > 0:
+                self.clear_session()
+                await self._sleep(max(50000, delay_us + (i - 1) * 100000))
+            if await self.login_via_cookie_session():
+                self.logins += 1
+                return True
+        return False
+
+    async def login_via_cookie_session(self) -> bool:
+        self.login_attempts += 1
+        body = {"username": self.username, "password": self.password}
+        csrf = None if self.id in self.shared.no_csrf else await self._ensure_csrf_token()
+        if csrf is not None and await self._attempt_login_post(
+                {**body, "twoFactorCode": ""},
+                {"Cookie": csrf[1], "X-CSRF-Token": csrf[0], "X-Requested-With": "XMLHttpRequest"},
+                csrf[1], True):
+            return True
+        self.shared.csrf.pop(self.id, None)
+        return await self._attempt_login_post({**body, "loginSecret": ""}, {}, "", False)
+
+    async def _ensure_csrf_token(self) -> tuple[str, str] | None:
+        token, cookie = self.shared.csrf.get(self.id, ""), self.shared.cookie.get(self.id, "")
+        if token and cookie:
+            return token, cookie
+        headers = dict(BROWSER_HEADERS)
+        if cookie:
+            headers["Cookie"] = cookie
+        resp = await self._send("GET", "/csrf-token", headers)
+        if resp.status == 404:
+            self.shared.no_csrf.add(self.id)
+            return None
+        data = decode(resp)
+        if resp.status != 200 or not isinstance(data, dict) or not data.get("success") or not data.get("obj"):
+            return None
+        cookie = merge_cookies(cookie, new) if (new := cookie_from(resp)) else cookie
+        if not cookie:
+            return None
+        self.shared.cookie[self.id] = cookie
+        self.shared.csrf[self.id] = str(data["obj"])
+        return str(data["obj"]), cookie
+
+    async def _attempt_login_post(self, body: dict, extra: dict[str, str], fallback_cookie: str,
+                                  store_csrf: bool) -> bool:
+        # Mirrors attemptLoginPost, including the fallback to the csrf-token cookie
+        # when the login reply sets none.
+        headers = {**BROWSER_HEADERS, **extra}
+        resp = await self._send("POST", "/login", {**headers, "Content-Type": "application/json"},
+                                json.dumps(body).encode())
+        if not 200 <= resp.status < 300:
+            resp = await self._send("POST", "/login", {**headers, "Content-Type": "application/x-www-form-urlencoded"},
+                                    urlencode(body).encode())
+        data = decode(resp)
+        ok = isinstance(data, dict) and bool(data.get("success") or data.get("obj"))
+        if not ok and not 200 <= resp.status < 300:
+            return False
+        cookie = cookie_from(resp) or fallback_cookie
+        if not cookie:
+            return False
+        self.shared.cookie[self.id] = cookie
+        if store_csrf and "X-CSRF-Token" in extra:
+            self.shared.csrf[self.id] = extra["X-CSRF-Token"]
+        return True
+
+    async def request(self, path: str, method: str = "GET", body: dict | None = None, retry: int = 2) -> ApiResult:
+        headers = self._session_headers({"Accept": "application/json"})
+        payload = b""
+        if method == "POST" and body:
+            headers["Content-Type"] = "application/json"
+            payload = json.dumps(body).encode()
+        resp = await self._send(method, API_ROOT + path, headers, payload)
+        if resp.status in (401, 403) and retry > 0:
+            self.clear_session()
+            self.reauths += 1
+            if await self.login_with_cookie_session(4, 300000):
+                return await self.request(path, method, body, retry - 1)
+        return ApiResult(resp.status, decode(resp))
+
+    async def request_import_db(self, data: bytes, filename: str = "x-ui.db", retry: int = 2) -> bool:
+        boundary = f"----{os.urandom(8).hex()}"
+        body = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"db\"; filename=\"{filename}\"\r\n"
+                f"Content-Type: application/octet-stream\r\n\r\n").encode() + data + f"\r\n--{boundary}--\r\n".encode()
+        headers = self._session_headers({"Content-Type": f"multipart/form-data; boundary={boundary}",
+                                         "Accept": "application/json"})
+        resp = await self._send("POST", API_ROOT + "server/importDB", headers, body)
+        if resp.status in (401, 403) and retry > 0:
+            self.clear_session()
+            self.reauths += 1
+            if await self.login_with_cookie_session(4, 300000):
+                return await self.request_import_db(data, filename, retry - 1)
+        result = decode(resp)
+        return 200 <= resp.status < 300 and isinstance(result, dict) and bool(result.get("success") or result.get("obj"))
+
+    async def detect_api_flavor(self) -> str:
+        r = await self.request("clients/list/paged?page=1&pageSize=1")
+        if r.api_ok:
+            flavor = V3
+        elif r.code == 404:
+            flavor = LEGACY
+        else:
+            flavor = LEGACY if (await self.request("inbounds/list")).api_ok else UNKNOWN
+        self.shared.flavor[self.id] = flavor
+        return flavor
+
+    async def api_flavor(self) -> str:
+        flavor = self.shared.flavor.get(self.id, UNKNOWN)
+        if flavor == UNKNOWN and await self.login_via_cookie_session():
+            flavor = await self.detect_api_flavor()
+        return flavor
+
+    async def is_v3(self) -> bool:
+        return await self.api_flavor() == V3
+
+
+class Options(NamedTuple):
+    inbounds: int = 4
+    clients: int = 50
+    usage_items: int = USAGE_MAX_ITEMS
+    db_bytes: int = 256 * 1024
+
+
+async def keeper(t: Transport, opts: Options) -> bool:
+    return await t.login_with_retries(6, 300000)
+
+
+async def probe(t: Transport, opts: Options) -> bool:
+    return await t.ensure_ready()
+
+
+async def onlines(t: Transport) -> ApiResult:
+    """XuiClient::fetchOnlines."""
+    if await t.is_v3():
+        return await t.request("clients/onlines", "POST")
+    r = await t.request("inbounds/onlines", "POST")
+    if r.code == 404:
+        r3 = await t.request("clients/onlines", "POST")
+        if r3.api_ok:
+            await t.detect_api_flavor()
+            return r3
+    return r
+
+
+async def sync(t: Transport, opts: Options) -> bool:
+    if not await t.login_with_retries():
+        return False
+    await onlines(t)
+    by_inbound: dict[int, int] = {}
+    if await t.is_v3():
+        for page in range(1, 21):
+            r = await t.request(f"clients/list/paged?page={page}&pageSize={V3_PAGE_SIZE}")
+            obj = r.json.get("obj") if r.api_ok and isinstance(r.json, dict) else None
+            batch = obj.get("clients", []) if isinstance(obj, dict) else []
+            for c in batch:
+                for iid in c.get("inboundIds") or []:
+                    by_inbound[int(iid)] = by_inbound.get(int(iid), 0) + 1
+            if len(batch) < V3_PAGE_SIZE:
+                break
+    for iid in range(1, opts.inbounds + 1):  # the plans' inbound ids
+        r = await t.request(f"inbounds/get/{iid}")
+        inbound = r.json.get("obj") if r.api_ok and isinstance(r.json, dict) else None
+        if not isinstance(inbound, dict):
+            continue
+        if await t.is_v3() and iid in by_inbound:
+            t.rows += by_inbound[iid]
+        else:
+            clients = json.loads(inbound.get("settings") or "{}").get("clients", [])
+            t.rows += min(SYNC_MAX_CLIENTS, sum(1 for c in clients if c.get("email")))
+    return True
+
+
+async def usage(t: Transport, opts: Options) -> bool:
+    if not await t.login_with_retries(6, 300000):
+        return False
+    items = [(iid, n) for iid in range(1, opts.inbounds + 1) for n in range(1, opts.clients + 1)]
+    for iid, n in items[:min(opts.usage_items, USAGE_MAX_ITEMS)]:
+        email = quote(client_email(t.id, iid, n), safe="")
+        path = f"clients/traffic/{email}" if await t.is_v3() else f"inbounds/getClientTraffics/{email}"
+        r = await t.request(path)
+        if isinstance(r.json, dict) and isinstance(r.json.get("obj"), dict):
+            t.rows += 1
+    return True
+
+
+async def import_db(t: Transport, opts: Options) -> bool:
+    if not await t.login_with_retries():
+        return False
+    return await t.request_import_db(b"SQLite format 3\0" + bytes(max(0, opts.db_bytes - 16)))
+
+
+SCENARIOS: dict[str, Callable[[Transport, Options], Awaitable[bool]]] = {
+    "keeper": keeper, "probe": probe, "sync": sync, "usage": usage, "import": import_db,
+}
+
+
+class Run:
+    COUNTERS = ("requests", "logins", "login_attempts", "reauths", "probes", "slept", "rows")
+
+    def __init__(self, scenario: str, panels: int, concurrency: int):
+        self.scenario = scenario
+        self.panels = panels
+        self.concurrency = concurrency
+        self.hist = Histogram()
+        self.ok = 0
+        self.failed = 0
+        self.exceptions: dict[str, int] = {}
+        self.totals = dict.fromkeys(self.COUNTERS, 0)
+        self.wall = 0.0
+
+    def record(self, t: Transport, ms: float, ok: bool, error: str | None) -> None:
+        self.hist.record(ms)
+        self.ok += ok
+        self.failed += not ok
+        if error:
+            self.exceptions[error] = self.exceptions.get(error, 0) + 1
+        for key in self.COUNTERS:
+            self.totals[key] += getattr(t, key)
+
+    def report(self) -> dict:
+        h = self.hist
+        return {
+            "scenario": self.scenario,
+            "panels": self.panels,
+            "concurrency": self.concurrency,
+            "wall_s": round(self.wall, 3),
+            "panel_sum_s": round(h.total / 1000, 3),
+            "panel_p50_ms": round(h.percentile(50), 1),
+            "panel_p95_ms": round(h.percentile(95), 1),
+            "panel_max_ms": round(h.max, 1),
+            "ok": self.ok,
+            "failed": self.failed,
+            "exceptions": self.exceptions,
+            "requests": self.totals["requests"],
+            "requests_per_panel": round(self.totals["requests"] / self.panels, 1) if self.panels else 0.0,
+            "logins": self.totals["logins"],
+            "login_attempts": self.totals["login_attempts"],
+            "reauths": self.totals["reauths"],
+            "slept_s": round(self.totals["slept"], 2),
+            "rows": self.totals["rows"],
+        }
+
+
+async def run_scenario(targets: list[Target], scenario: str, concurrency: int, shared: Shared,
+                       opts: Options = Options(), sleep_scale: float = 1.0, timeout: float = 90.0) -> Run:
+    """One pass over ``targets`` with at most ``concurrency`` panels in flight (1 = the PHP loop)."""
+    run = Run(scenario, len(targets), concurrency)
+    step = SCENARIOS[scenario]
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(target: Target) -> None:
+        async with slots:
+            t = Transport(target, shared, sleep_scale=sleep_scale, timeout=timeout)
+            started = time.perf_counter()
+            ok, error = False, None
+            try:
+                ok = await step(t, opts)
+            except Exception as exc:  # an unreachable panel fails that panel, not the run
+                error = type(exc).__name__
+            finally:
+                await t.close()
+            run.record(t, (time.perf_counter() - started) * 1000, ok, error)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(target) for target in targets))
+    run.wall = time.perf_counter() - t0
+    return run
+
+
+def scaling(reports: list[dict]) -> dict[str, float]:
+    """Wall-time growth per added panel (ms), from the smallest to the largest fleet."""
+    out = {}
+    groups: dict[str, list[dict]] = {}
+    for r in reports:
+        groups.setdefault(f"{r['scenario']} c={r['concurrency']}", []).append(r)
+    for key, rows in groups.items():
+        lo, hi = min(rows, key=lambda r: r["panels"]), max(rows, key=lambda r: r["panels"])
+        if hi["panels"] > lo["panels"]:
+            out[key] = round(1000 * (hi["wall_s"] - lo["wall_s"]) / (hi["panels"] - lo["panels"]), 1)
+    return out
+
+
+def parse_ports(spec: str) -> list[int]:
+    ports: list[int] = []
+    for part in spec.split(","):
+        lo, _, hi = part.partition("-")
+        ports.extend(range(int(lo), int(hi or lo) + 1))
+    return ports
+
+
+def int_list(text: str) -> list[int]:
+    return [int(x) for x in text.split(",") if x.strip()]
+
+
+async def bench(args: argparse.Namespace) -> tuple[list[dict], dict | None]:
+    sizes = sorted(set(args.fleet))
+    fleet = None
+    if args.ports:
+        ports = parse_ports(args.ports)
+        if len(ports) < sizes[-1]:
+            raise SystemExit(f"xui-bench: --ports has {len(ports)} panels, --fleet needs {sizes[-1]}")
+        targets = [Target(i + 1, f"http://{args.host}:{port}/") for i, port in enumerate(ports)]
+    else:
+        fleet = await Fleet(sizes[-1], spec_from_args(args), seed=args.seed).start()
+        targets = [Target(p.panel_id, base) for p, base in zip(fleet.panels, fleet.bases)]
+    shared = Shared()
+    opts = Options(args.inbounds, args.clients, args.usage_items, args.db_kb * 1024)
+    reports = []
+    try:
+        for size in sizes:
+            for scenario in args.scenario:
+                # Otherwise the first concurrency level pays every login and flavor probe.
+                await run_scenario(targets[:size], scenario, max(args.concurrency), shared, opts, args.sleep_scale,
+                                   args.timeout)
+                for concurrency in args.concurrency:
+                    run = await run_scenario(targets[:size], scenario, concurrency, shared, opts, args.sleep_scale,
+                                             args.timeout)
+                    reports.append(run.report())
+                    if not args.json:
+                        print_row(reports[-1], reports)
+    finally:
+        if fleet is not None:
+            await fleet.stop()
+    return reports, fleet.totals() if fleet is not None else None
+
+
+HEADER = (f"{'scenario':<8} {'panels':>6} {'conc':>4} {'wall_s':>8} {'speedup':>7} {'p50_ms':>8} {'p95_ms':>8} "
+          f"{'req/panel':>9} {'logins':>6} {'reauth':>6} {'slept_s':>7} {'failed':>6}")
+
+
+def print_row(r: dict, reports: list[dict]) -> None:
+    serial = next((x for x in reports if x["scenario"] == r["scenario"] and x["panels"] == r["panels"]
+                   and x["concurrency"] == 1), None)
+    speedup = f"{serial['wall_s'] / r['wall_s']:.1f}x" if serial and r["wall_s"] else "-"
+    print(f"{r['scenario']:<8} {r['panels']:>6} {r['concurrency']:>4} {r['wall_s']:>8.3f} {speedup:>7} "
+          f"{r['panel_p50_ms']:>8.1f} {r['panel_p95_ms']:>8.1f} {r['requests_per_panel']:>9.1f} {r['logins']:>6} "
+          f"{r['reauths']:>6} {r['slept_s']:>7.2f} {r['failed']:>6}", flush=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="XuiPanel service I/O benchmark against a 3x-ui fleet")
+    parser.add_argument("--fleet", type=int_list, default=[10, 50, 100], help="fleet sizes, e.g. 10,50,100")
+    parser.add_argument("--scenario", type=lambda s: s.split(","), default=["keeper", "sync", "usage"],
+                        help=f"comma list of {', '.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", type=int_list, default=[1, 8], help="panels in flight; 1 = the PHP loop")
+    parser.add_argument("--ports", help="use a running xui_fleet.py, e.g. 19000-19199 (default: in-process fleet)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--usage-items", type=int, default=USAGE_MAX_ITEMS, help="traffic lookups per usage batch")
+    parser.add_argument("--db-kb", type=int, default=256, help="importDB upload size")
+    parser.add_argument("--sleep-scale", type=float, default=1.0, help="multiply login retry sleeps (report is unscaled)")
+    parser.add_argument("--timeout", type=float, default=90.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+    unknown = [s for s in args.scenario if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    if not args.fleet or not args.concurrency:
+        parser.error("--fleet and --concurrency need at least one value")
+
+    if not args.json:
+        where = f"ports {args.ports}" if args.ports else (
+            f"in-process fleet, latency {args.latency_ms:g}+{args.jitter_ms:g}ms, {args.flavor}, "
+            f"session ttl {args.session_ttl:g}s, login fail {args.login_fail_rate:g}")
+        print(f"XUI fleet bench — {where}; {args.inbounds} inbounds x {args.clients} clients per panel\n")
+        print(HEADER)
+    reports, totals = asyncio.run(bench(args))
+    growth = scaling(reports)
+    if args.json:
+        print(json.dumps({"runs": reports, "scaling_ms_per_panel": growth, "fleet": totals}, indent=2))
+    else:
+        if growth:
+            print("\nwall ms per added panel: " + ", ".join(f"{k} {v}" for k, v in growth.items()))
+        if totals:
+            print(f"fleet: {totals}")
+    failed = sum(r["failed"] for r in reports)
+    errors = sum(sum(r["exceptions"].values()) for r in reports)
+    print(f"xui-bench: {len(reports)} runs, {sum(r['panels'] for r in reports)} panel passes, "
+          f"{failed} failed, {errors} exceptions", file=sys.stderr)
+    return 0 if errors == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Stand-in 3x-ui panel fleet, for benchmarking the XuiPanel services without real panels.
+
+Every panel is a StandinServer on its own local port that answers the parts of
+the 3x-ui API XuiHttpTransport talks to:
+
+- ``GET /csrf-token`` and ``POST /login`` (JSON or form). With ``csrf=False``
+  the token endpoint is a 404, like panels before the CSRF login, and the
+  transport falls back to the legacy login.
+- Under ``/panel/api/``: ``server/status``, ``server/importDB``, ``inbounds/list``,
+  ``inbounds/get/{id}``, ``inbounds/onlines`` and ``inbounds/getClientTraffics/{email}``.
+- On ``v3_clients`` panels also ``clients/list/paged``, ``clients/onlines`` and
+  ``clients/traffic/{email}``. Legacy panels answer those with 404, which is
+  how detectApiFlavor() tells them apart.
+
+API calls without a live ``3x-ui`` session cookie get a 401. Sessions expire
+``session_ttl`` seconds after login. Logins fail with ``{"success": false}``
+for the first ``login_fail_first`` attempts and then at ``login_fail_rate``.
+Inbounds, clients and traffic numbers are derived from the panel id, so a
+driver can compute client emails with ``client_email()``.
+
+Usage:
+  python3 scripts/load-test/xui_fleet.py --panels=200 --port=19000 --latency-ms=20 --jitter-ms=10
+  python3 scripts/load-test/xui_fleet.py --panels=50 --flavor=mixed --session-ttl=30 --login-fail-rate=0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import sys
+import zlib
+from pathlib import Path
+from typing import Callable, NamedTuple
+from urllib.parse import parse_qsl, unquote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin_server import Handler, Reply, Request, StandinServer  # noqa: E402
+
+LEGACY = "legacy_inbound"  # XuiPanelContext::FLAVOR_LEGACY
+V3 = "v3_clients"  # XuiPanelContext::FLAVOR_V3
+COOKIE = "3x-ui"
+API = "/panel/api"
+NOT_FOUND = Reply(404, b"404 page not found")
+
+
+class PanelSpec(NamedTuple):
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    session_ttl: float = 3600.0
+    login_fail_rate: float = 0.0
+    login_fail_first: int = 0
+    inbounds: int = 4
+    clients: int = 50  # per inbound
+    flavor: str = LEGACY
+    csrf: bool = True
+    username: str = "admin"
+    password: str = "admin"
+
+
+def client_email(panel_id: int, inbound_id: int, n: int) -> str:
+    return f"p{panel_id}-i{inbound_id}-c{n}"
+
+
+def traffic(email: str) -> tuple[int, int]:
+    h = zlib.crc32(email.encode())
+    return (h & 0xFFFF) * 4096, (h >> 16) * 16384
+
+
+class XuiPanel(StandinServer):
+    def __init__(self, panel_id: int, spec: PanelSpec = PanelSpec(), seed: int | None = None):
+        super().__init__(spec.latency_ms, spec.jitter_ms, rate_limit_per_min=0)
+        self.panel_id = panel_id
+        self.spec = spec
+        self.rng = random.Random(seed)
+        self.panel_sessions: dict[str, dict] = {}  # 3x-ui cookie → {"expires", "authed", "csrf"}
+        self.login_posts = 0
+        self.login_failures = 0
+        self.expired = 0
+        self.unauthorized = 0
+        self.imports = 0
+        self.imported_bytes = 0
+        self._credential_checks = 0
+        self._inbounds: dict[int, dict] = {}
+        self.route("GET", "/csrf-token", self._csrf_token)
+        self.route("POST", "/login", self._panel_login)
+        routes: list[tuple[str, str, Handler]] = [
+            ("GET", "server/status", self._status),
+            ("POST", "server/importDB", self._import_db),
+            ("GET", "inbounds/list", self._inbounds_list),
+            ("GET", "inbounds/get/{id}", self._inbound_get),
+            ("POST", "inbounds/onlines", self._onlines),
+            ("GET", "inbounds/getClientTraffics/{email}", self._client_traffic),
+        ]
+        if spec.flavor == V3:
+            routes += [
+                ("GET", "clients/list/paged", self._clients_paged),
+                ("POST", "clients/onlines", self._onlines),
+                ("GET", "clients/traffic/{email}", self._client_traffic),
+            ]
+        for method, path, handler in routes:
+            self.route(method, f"{API}/{path}", self._authed(handler))
+
+    def _open_session(self, authed: bool) -> str:
+        sid = secrets.token_urlsafe(18)
+        self.panel_sessions[sid] = {"expires": self.clock() + self.spec.session_ttl, "authed": authed,
+                                    "csrf": secrets.token_hex(16)}
+        return sid
+
+    def _session(self, req: Request) -> str | None:
+        sid = req.cookies().get(COOKIE, "")
+        session = self.panel_sessions.get(sid)
+        if session is None:
+            return None
+        if session["expires"] <= self.clock():
+            del self.panel_sessions[sid]
+            self.expired += 1
+            return None
+        return sid
+
+    def _cookie(self, sid: str) -> tuple[str, ...]:
+        return (f"{COOKIE}={sid}; Path=/; Max-Age={int(self.spec.session_ttl)}; HttpOnly; SameSite=Lax",)
+
+    def _authed(self, handler: Handler) -> Handler:
+        async def guarded(req: Request) -> Reply:
+            sid = self._session(req)
+            if sid is None or not self.panel_sessions[sid]["authed"]:
+                self.unauthorized += 1
+                return Reply(401, {"success": False, "msg": "unauthorized"})
+            return await handler(req)
+        return guarded
+
+    async def _csrf_token(self, req: Request) -> Reply:
+        if not self.spec.csrf:
+            return NOT_FOUND
+        sid = self._session(req) or self._open_session(False)
+        return Reply(200, {"success": True, "msg": "", "obj": self.panel_sessions[sid]["csrf"]},
+                     cookies=self._cookie(sid))
+
+    def _login_fails(self) -> bool:
+        self._credential_checks += 1
+        if self._credential_checks <= self.spec.login_fail_first:
+            return True
+        return self.spec.login_fail_rate > 0 and self.rng.random() < self.spec.login_fail_rate
+
+    async def _panel_login(self, req: Request) -> Reply:
+        self.login_posts += 1
+        if req.headers.get("content-type", "").startswith("application/json"):
+            data = req.json()
+        else:
+            data = dict(parse_qsl(req.body.decode()))
+        sid = self._session(req)
+        if self.spec.csrf and (sid is None or req.headers.get("x-csrf-token") != self.panel_sessions[sid]["csrf"]):
+            return Reply(403, {"success": False, "msg": "invalid csrf token"})
+        if (data.get("username") != self.spec.username or data.get("password") != self.spec.password
+                or self._login_fails()):
+            self.login_failures += 1
+            return Reply(200, {"success": False, "msg": "Invalid username or password"})
+        if sid is None:
+            sid = self._open_session(True)
+        else:
+            self.panel_sessions[sid].update(authed=True, expires=self.clock() + self.spec.session_ttl)
+        self.logins += 1
+        return Reply(200, {"success": True, "msg": "Login Successfully", "obj": None}, cookies=self._cookie(sid))
+
+    def inbound(self, inbound_id: int) -> dict | None:
+        if not 1 <= inbound_id <= self.spec.inbounds:
+            return None
+        if inbound_id not in self._inbounds:
+            clients, stats = [], []
+            for n in range(1, self.spec.clients + 1):
+                email = client_email(self.panel_id, inbound_id, n)
+                up, down = traffic(email)
+                clients.append({"id": f"{self.panel_id:08x}-{inbound_id:04x}-4000-8000-{n:012x}", "email": email,
+                                "enable": True, "flow": "", "limitIp": 0, "totalGB": 0, "expiryTime": 0,
+                                "tgId": "", "subId": f"s{self.panel_id}x{inbound_id}x{n}", "reset": 0})
+                stats.append({"id": n, "inboundId": inbound_id, "enable": True, "email": email, "up": up,
+                              "down": down, "expiryTime": 0, "total": 0, "reset": 0})
+            port = 20000 + inbound_id
+            self._inbounds[inbound_id] = {
+                "id": inbound_id, "up": sum(s["up"] for s in stats), "down": sum(s["down"] for s in stats),
+                "total": 0, "remark": f"panel{self.panel_id}-in{inbound_id}", "enable": True, "expiryTime": 0,
+                "clientStats": stats, "listen": "", "port": port, "protocol": "vless",
+                "settings": json.dumps({"clients": clients, "decryption": "none", "fallbacks": []}),
+                "streamSettings": json.dumps({"network": "tcp", "security": "none"}),
+                "tag": f"inbound-{port}", "sniffing": json.dumps({"enabled": False}),
+            }
+        return self._inbounds[inbound_id]
+
+    def _client(self, email: str) -> dict | None:
+        parts = email.split("-")
+        try:
+            panel, inbound_id, n = int(parts[0][1:]), int(parts[1][1:]), int(parts[2][1:])
+        except (IndexError, ValueError):
+            return None
+        inbound = self.inbound(inbound_id) if panel == self.panel_id else None
+        return inbound["clientStats"][n - 1] if inbound and 1 <= n <= self.spec.clients else None
+
+    async def _status(self, req: Request) -> Reply:
+        return Reply(200, {"success": True, "obj": {"cpu": 3.5, "mem": {"current": 512 << 20, "total": 2048 << 20},
+                                                    "xray": {"state": "running", "version": "25.1.1"},
+                                                    "uptime": 86400}})
+
+    async def _import_db(self, req: Request) -> Reply:
+        self.imports += 1
+        self.imported_bytes += len(req.body)
+        if b'name="db"' not in req.body or b"SQLite format 3" not in req.body:
+            return Reply(200, {"success": False, "msg": "invalid db file"})
+        return Reply(200, {"success": True, "msg": "Import database successfully"})
+
+    async def _inbounds_list(self, req: Request) -> Reply:
+        return Reply(200, {"success": True, "obj": [self.inbound(i) for i in range(1, self.spec.inbounds + 1)]})
+
+    async def _inbound_get(self, req: Request) -> Reply:
+        inbound = self.inbound(int(req.params["id"])) if req.params["id"].isdigit() else None
+        if inbound is None:
+            return Reply(200, {"success": False, "msg": "record not found"})
+        return Reply(200, {"success": True, "obj": inbound})
+
+    async def _onlines(self, req: Request) -> Reply:
+        online = [client_email(self.panel_id, i, n) for i in range(1, self.spec.inbounds + 1)
+                  for n in range(1, self.spec.clients + 1, 10)]
+        return Reply(200, {"success": True, "obj": online})
+
+    async def _client_traffic(self, req: Request) -> Reply:
+        return Reply(200, {"success": True, "obj": self._client(unquote(req.params["email"]))})
+
+    async def _clients_paged(self, req: Request) -> Reply:
+        args = req.args()
+        page = max(1, int(args.get("page", 1)))
+        size = max(1, min(1000, int(args.get("pageSize", 500))))
+        total = self.spec.inbounds * self.spec.clients
+        clients = []
+        for k in range((page - 1) * size, min(page * size, total)):
+            inbound_id, n = divmod(k, self.spec.clients)
+            stat = self.inbound(inbound_id + 1)["clientStats"][n]
+            clients.append({"email": stat["email"], "enable": True, "inboundIds": [inbound_id + 1], "totalGB": 0,
+                            "expiryTime": 0, "up": stat["up"], "down": stat["down"]})
+        return Reply(200, {"success": True, "obj": {"clients": clients, "total": total}})
+
+
+class Fleet:
+    """``count`` panels, ids 1..count, on consecutive ports from ``port`` (ephemeral ports with 0).
+
+    ``spec`` may be a callable ``panel_id → PanelSpec`` for mixed fleets.
+    """
+
+    def __init__(self, count: int, spec: PanelSpec | Callable[[int], PanelSpec] = PanelSpec(), port: int = 0,
+                 host: str = "127.0.0.1", seed: int | None = None):
+        spec_for = spec if callable(spec) else (lambda panel_id: spec)
+        self.panels = [XuiPanel(i, spec_for(i), None if seed is None else seed + i) for i in range(1, count + 1)]
+        self.port = port
+        self.host = host
+
+    @property
+    def bases(self) -> list[str]:
+        return [f"{p.base}/" for p in self.panels]
+
+    def set_clock(self, clock: Callable[[], float]) -> None:
+        for panel in self.panels:
+            panel.clock = clock
+
+    def totals(self) -> dict[str, int]:
+        keys = ("requests", "connections", "login_posts", "logins", "login_failures", "expired", "unauthorized",
+                "imports")
+        return {k: sum(getattr(p, k) for p in self.panels) for k in keys}
+
+    async def start(self) -> Fleet:
+        for i, panel in enumerate(self.panels):
+            await panel.start(self.host, self.port + i if self.port else 0)
+        return self
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(p.stop() for p in self.panels))
+
+    async def __aenter__(self) -> Fleet:
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--session-ttl", type=float, default=3600.0, help="seconds a panel login stays valid")
+    parser.add_argument("--login-fail-rate", type=float, default=0.0, help="share of logins answered success=false")
+    parser.add_argument("--login-fail-first", type=int, default=0, help="fail the first N logins on every panel")
+    parser.add_argument("--inbounds", type=int, default=4, help="inbounds per panel")
+    parser.add_argument("--clients", type=int, default=50, help="clients per inbound")
+    parser.add_argument("--flavor", choices=("legacy", "v3", "mixed"), default="legacy",
+                        help="API flavor; mixed alternates legacy and v3 panels")
+    parser.add_argument("--no-csrf", action="store_true", help="panels without /csrf-token (legacy login only)")
+
+
+def spec_from_args(args: argparse.Namespace) -> Callable[[int], PanelSpec]:
+    base = PanelSpec(args.latency_ms, args.jitter_ms, args.session_ttl, args.login_fail_rate, args.login_fail_first,
+                     args.inbounds, args.clients, V3 if args.flavor == "v3" else LEGACY, not args.no_csrf)
+    if args.flavor != "mixed":
+        return lambda panel_id: base
+    return lambda panel_id: base._replace(flavor=V3 if panel_id % 2 == 0 else LEGACY)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    fleet = await Fleet(args.panels, spec_from_args(args), args.port, args.host, args.seed).start()
+    print(f"xui fleet: {args.panels} panels on http://{args.host}:{fleet.panels[0].port}"
+          f"-{fleet.panels[-1].port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await fleet.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Stand-in 3x-ui panel fleet")
+    parser.add_argument("--panels", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=19000, help="first port; panel N listens on port + N - 1")
+    parser.add_argument("--seed", type=int)
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
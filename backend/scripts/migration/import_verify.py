@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Offline import-verify: load the dump's svp_* tables into SQLite and check counts and checksums.
+
+``wp:import --verify-only`` needs the live MySQL behind ``SVP_MYSQL_DSN``, so
+evidence row 154 ends in ``SKIP`` on every rehearsal without one. This
+verifier streams the WordPress dump (or a ``wp_dump_shard.py`` shard
+directory), bulk-loads every ``{prefix}svp_*`` table into a local SQLite
+stand-in — batched ``executemany`` inside one transaction, tables named like
+the Laravel targets (``svp_users``), ``id`` as primary key so duplicate ids
+are dropped the way ``WpTableImporter`` skips them — and then re-reads each
+table in its own worker process.
+
+Each side gets a row count and an order-independent content checksum: the sum
+(mod 2^64) of a 64-bit BLAKE2b digest per row over its sorted non-NULL
+``column=value`` pairs. Numbers and numeric strings are normalised first
+(``'12'``, ``12`` and ``12.0`` hash alike), since the PHP parser casts quoted
+numbers and MySQL/SQLite column affinity may do the same.
+
+``--existing`` skips the load and verifies a database that is already there
+(e.g. a Laravel rehearsal on ``DB_CONNECTION=sqlite`` after ``wp:import``);
+only the columns both sides have are compared.
+
+The log follows ``import-verify-*.log``: one ``table … match=OK`` line per
+table and ``import-verify complete exit=0`` only when every table matches. The
+gap-matrix classifier accepts it as row 154 evidence only with ``--existing``;
+a load-mode log (``mode=sqlite-load``) just compares the dump with itself.
+
+Usage:
+  python3 scripts/migration/import_verify.py tests/fixtures/wp-minimal-dump.sql
+  python3 scripts/migration/import_verify.py dump.sql.gz --log ../docs/evidence/import-verify-v28.log
+  python3 scripts/migration/import_verify.py storage/app/wp-shards --db /tmp/rehearsal.sqlite
+  python3 scripts/migration/import_verify.py dump.sql --db database/database.sqlite --existing --json
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import socket
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import wp_dump_shard  # noqa: E402
+
+BATCH = 5000
+MASK = (1 << 64) - 1
+NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+NUM_START = frozenset("-+.0123456789")
+
+
+class Side(NamedTuple):
+    rows: int
+    checksum: int
+
+
+# --- checksums -------------------------------------------------------------
+
+def canon(value: object) -> str:
+    """Text a value hashes as; numbers and numeric strings share one form."""
+    kind = type(value)
+    if kind is str:
+        if not value or value[0] not in NUM_START or not NUMBER_RE.fullmatch(value):
+            return value
+        value = float(value) if "." in value or "e" in value or "E" in value else int(value)
+        kind = type(value)
+    if kind is int:
+        return str(value)
+    if kind is float:
+        return str(int(value)) if value.is_integer() and abs(value) < 2 ** 53 else repr(value)
+    if kind is bytes:
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def row_digest(row: dict) -> int:
+    text = "\x1f".join([f"{k}\x1e{canon(v)}" for k, v in sorted(row.items()) if v is not None])
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+class Tally:
+    """Count and checksum accumulated one row at a time; order does not matter."""
+
+    __slots__ = ("rows", "checksum")
+
+    def __init__(self):
+        self.rows = 0
+        self.checksum = 0
+
+    def add(self, row: dict) -> None:
+        self.rows += 1
+        self.checksum = (self.checksum + row_digest(row)) & MASK
+
+    def side(self) -> Side:
+        return Side(self.rows, self.checksum)
+
+
+# --- source ----------------------------------------------------------------
+
+def source_rows(path: Path, prefix: str, malformed: dict[str, int]) -> Iterator[tuple[str, dict]]:
+    """``(target table, row)`` for every svp_* row of a dump file or shard directory."""
+    if path.is_dir():
+        manifest = wp_dump_shard.load_manifest(path)
+        for table, meta in manifest["tables"].items():
+            if meta["role"] != "svp":
+                continue
+            if meta["malformed"]:
+                malformed[meta["target"]] = meta["malformed"]
+            for row in wp_dump_shard.read_shard(path, table):
+                yield meta["target"], row
+        return
+    targets: dict[str, str | None] = {}
+    with wp_dump_shard.open_dump(path) as stream:
+        for t in wp_dump_shard.iter_tuples(stream):
+            if (target := targets.get(t.table, "")) == "":
+                svp = wp_dump_shard.role(t.table, prefix) == "svp"
+                target = targets[t.table] = wp_dump_shard.target(t.table, prefix) if svp else None
+            if target is None:
+                continue
+            values = wp_dump_shard.parse_values(t.raw) if t.columns is not None else []
+            if t.columns is None or len(values) != len(t.columns):
+                malformed[target] = malformed.get(target, 0) + 1
+                continue
+            yield target, dict(zip(t.columns, values))
+
+
+# --- SQLite stand-in -------------------------------------------------------
+
+def _q(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class Loader:
+    """Bulk loads rows into SQLite: one transaction, ``executemany`` per (table, column list) batch."""
+
+    def __init__(self, conn: sqlite3.Connection, batch: int = BATCH):
+        self.conn = conn
+        self.batch = batch
+        self.columns: dict[str, list[str]] = {}
+        self.pending: dict[tuple[str, tuple[str, ...]], list[tuple]] = {}
+        self.inserted = 0
+
+    def add(self, table: str, row: dict) -> None:
+        cols = tuple(row)
+        known = self.columns.get(table)
+        if known is None:
+            pk = " PRIMARY KEY" if "id" in cols else ""
+            defs = ", ".join(_q(c) + (pk if c == "id" else "") for c in cols)
+            self.conn.execute(f"CREATE TABLE {_q(table)} ({defs})")
+            known = self.columns[table] = list(cols)
+        elif not set(cols) <= set(known):
+            for c in cols:
+                if c not in known:
+                    self.conn.execute(f"ALTER TABLE {_q(table)} ADD COLUMN {_q(c)}")
+                    known.append(c)
+        key = (table, cols)
+        rows = self.pending.setdefault(key, [])
+        rows.append(tuple(row.values()))
+        if len(rows) >= self.batch:
+            self._flush(key)
+
+    def _flush(self, key: tuple[str, tuple[str, ...]]) -> None:
+        table, cols = key
+        rows = self.pending.pop(key)
+        sql = (f"INSERT OR IGNORE INTO {_q(table)} ({', '.join(map(_q, cols))}) "
+               f"VALUES ({', '.join('?' * len(cols))})")
+        before = self.conn.total_changes
+        self.conn.executemany(sql, rows)
+        self.inserted += self.conn.total_changes - before
+
+    def close(self) -> None:
+        for key in list(self.pending):
+            self._flush(key)
+
+
+def load(path: Path, db: Path, prefix: str, batch: int = BATCH) -> tuple[dict[str, Side], dict[str, int], int]:
+    """Load svp_* rows into a new ``db``; returns (source side per table, malformed, rows inserted)."""
+    conn = sqlite3.connect(db, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    source: dict[str, Tally] = {}
+    malformed: dict[str, int] = {}
+    loader = Loader(conn, batch)
+    conn.execute("BEGIN")
+    for table, row in source_rows(path, prefix, malformed):
+        (source.get(table) or source.setdefault(table, Tally())).add(row)
+        loader.add(table, row)
+    loader.close()
+    conn.execute("COMMIT")
+    conn.close()
+    return {t: s.side() for t, s in sorted(source.items())}, malformed, loader.inserted
+
+
+def db_columns(db: Path) -> dict[str, list[str]]:
+    conn = sqlite3.connect(f"file:{db}?mode=ro", uri=True)
+    try:
+        tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        return {t: [r[1] for r in conn.execute(f"PRAGMA table_info({_q(t)})")] for t in tables}
+    finally:
+        conn.close()
+
+
+def source_sides(path: Path, prefix: str, only: dict[str, list[str]]) -> tuple[dict[str, Side], dict[str, int], dict[str, set[str]]]:
+    """Source side restricted to the columns each table has in the database (``--existing``).
+
+    Also returns the columns the dump gives each table, so the database side
+    hashes the same set.
+    """
+    source: dict[str, Tally] = {}
+    malformed: dict[str, int] = {}
+    seen: dict[str, set[str]] = {}
+    keep = {t: set(cols) for t, cols in only.items()}
+    for table, row in source_rows(path, prefix, malformed):
+        seen.setdefault(table, set()).update(row)
+        cols = keep.get(table)
+        row = {k: v for k, v in row.items() if k in cols} if cols is not None else row
+        (source.get(table) or source.setdefault(table, Tally())).add(row)
+    return {t: s.side() for t, s in sorted(source.items())}, malformed, seen
+
+
+def db_side(db: Path, table: str, columns: list[str] | None = None) -> Side | None:
+    """Worker: count and checksum one table (``columns`` limits the hashed columns)."""
+    conn = sqlite3.connect(f"file:{db}?mode=ro", uri=True)
+    try:
+        names = columns or [r[1] for r in conn.execute(f"PRAGMA table_info({_q(table)})")]
+        if not names:
+            return None
+        tally = Tally()
+        cur = conn.execute(f"SELECT {', '.join(map(_q, names))} FROM {_q(table)}")
+        while batch := cur.fetchmany(BATCH):
+            for values in batch:
+                tally.add(dict(zip(names, values)))
+        return tally.side()
+    finally:
+        conn.close()
+
+
+def db_sides(db: Path, tables: dict[str, list[str] | None], jobs: int) -> dict[str, Side | None]:
+    if jobs <= 1 or len(tables) <= 1:
+        return {t: db_side(db, t, cols) for t, cols in tables.items()}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tables))) as pool:
+        return dict(zip(tables, pool.map(db_side, [db] * len(tables), tables, tables.values())))
+
+
+# --- report ----------------------------------------------------------------
+
+def verify(path: Path, db: Path, prefix: str = "wp_", jobs: int = 1, existing: bool = False,
+           batch: int = BATCH) -> dict:
+    started = time.perf_counter()
+    if existing:
+        columns = db_columns(db)
+        source, malformed, seen = source_sides(path, prefix, columns)
+        loaded = None
+        wanted = {t: [c for c in columns[t] if c in seen[t]] if t in columns else None for t in source}
+    else:
+        source, malformed, loaded = load(path, db, prefix, batch)
+        wanted = {t: None for t in source}
+    load_s = time.perf_counter() - started
+    present = {t: cols for t, cols in wanted.items() if cols is not None or not existing}
+    sides = db_sides(db, present, jobs)
+    tables = []
+    for table, src in source.items():
+        got = sides.get(table)
+        tables.append({
+            "table": table,
+            "wp": src.rows,
+            "db": got.rows if got else 0,
+            "wp_checksum": f"{src.checksum:016x}",
+            "db_checksum": f"{got.checksum:016x}" if got else None,
+            "malformed": malformed.get(table, 0),
+            "match": got == src and not malformed.get(table),
+        })
+    return {
+        "ok": bool(tables) and all(t["match"] for t in tables),
+        "source": str(path),
+        "db": str(db),
+        "mode": "existing" if existing else "load",
+        "rows_loaded": loaded,
+        "tables": tables,
+        "load_s": round(load_s, 3),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def log_lines(report: dict, started: str) -> list[str]:
+    src = Path(report["source"])
+    size = sum(p.stat().st_size for p in src.iterdir()) if src.is_dir() else src.stat().st_size
+    lines = [
+        f"import-verify start {started} host={socket.gethostname()} mode=sqlite-{report['mode']}",
+        f"source {src.name} bytes={size} db={report['db']}",
+    ]
+    for t in report["tables"]:
+        extra = f" malformed={t['malformed']}" if t["malformed"] else ""
+        lines.append(f"table {t['table']} wp={t['wp']} sqlite={t['db']} "
+                     f"checksum={t['wp_checksum']}/{t['db_checksum'] or '-'}{extra} match={'OK' if t['match'] else 'DIFF'}")
+    for t in report["tables"]:
+        if not t["match"]:
+            lines.append(f"FAIL: {t['table']} dump and sqlite differ (rows {t['wp']} vs {t['db']})")
+    if not report["tables"]:
+        lines.append("FAIL: no svp_* tables in source")
+    rows = sum(t["wp"] for t in report["tables"])
+    lines.append(f"import-verify complete exit={0 if report['ok'] else 1} tables={len(report['tables'])} "
+                 f"rows={rows} load={report['load_s']}s elapsed={report['elapsed_s']}s")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="WordPress dump (.sql / .sql.gz) or wp_dump_shard.py output directory")
+    parser.add_argument("--db", type=Path, help="SQLite file (default: a temporary file, removed afterwards)")
+    parser.add_argument("--existing", action="store_true", help="verify --db as it is instead of loading it")
+    parser.add_argument("--prefix", default="wp_", help="table prefix in the dump (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="checksum worker processes (default: %(default)s)")
+    parser.add_argument("--batch", type=int, default=BATCH, help="rows per executemany (default: %(default)s)")
+    parser.add_argument("--log", type=Path, help="also write the import-verify log here")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON instead of the log")
+    args = parser.parse_args(argv)
+    if not args.source.exists():
+        parser.error(f"source not found: {args.source}")
+    if args.existing and (args.db is None or not args.db.is_file()):
+        parser.error("--existing needs --db pointing at a SQLite file")
+    if not args.existing and args.db is not None and args.db.exists():
+        parser.error(f"{args.db} exists: pass --existing to verify it, or remove it to load a fresh copy")
+
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    tmp = None
+    db = args.db
+    if db is None:
+        tmp = tempfile.TemporaryDirectory(prefix="import-verify-")
+        db = Path(tmp.name) / "svp.sqlite"
+    try:
+        report = verify(args.source, db, args.prefix, args.jobs, args.existing, args.batch)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+    if tmp is not None:
+        report["db"] = "(temporary)"
+    lines = log_lines(report, started)
+    if args.log:
+        args.log.parent.mkdir(parents=True, exist_ok=True)
+        args.log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("\n".join(lines))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Offline import-verify: SQLite load, checksums and the evidence log."""
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "docs" / "scripts"))
+
+from evidence_rules import classify_bytes  # noqa: E402
+from import_verify import canon, log_lines, row_digest, verify  # noqa: E402
+from wp_dump_shard import shard  # noqa: E402
+
+DUMP = """-- two column lists for one table, like tests/fixtures/wp-minimal-dump.sql
+INSERT INTO `wp_svp_users` (`id`, `username`, `tg_user_id`, `created_at`) VALUES
+(1, 'user1', 900001, '2024-01-01 00:00:00'),
+(2, 'it\\'s', 900002, '2024-01-02 00:00:00');
+
+INSERT INTO `wp_svp_users` (`id`, `username`, `created_at`) VALUES
+(100, 'reseller1', '2024-01-01 00:00:00');
+
+INSERT INTO `wp_svp_services` (`id`, `user_id`, `email`, `total_traffic`) VALUES
+(1, 1, 'u1@test.local', 10.5),(2, 2, 'u2@test.local', 0);
+
+INSERT INTO `wp_options` (`option_id`, `option_name`, `option_value`) VALUES (1, 'siteurl', 'x');
+"""
+
+
+class ChecksumTest(unittest.TestCase):
+    def test_numbers_and_numeric_strings_hash_alike(self):
+        self.assertEqual({canon(12), canon("12"), canon(12.0), canon("12.0")}, {"12"})
+        self.assertEqual(canon("10.50"), canon(10.5))
+        self.assertEqual(canon("user1"), "user1")
+        self.assertEqual(row_digest({"a": 1, "b": None}), row_digest({"a": "1"}))
+        self.assertNotEqual(row_digest({"a": 1}), row_digest({"b": 1}))
+
+
+class VerifyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.dump = self.dir / "dump.sql"
+        self.dump.write_text(DUMP, encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_matches_but_is_not_row_154_evidence(self):
+        report = verify(self.dump, self.dir / "a.sqlite", jobs=2)
+        self.assertTrue(report["ok"])
+        self.assertEqual([(t["table"], t["wp"], t["db"]) for t in report["tables"]],
+                         [("svp_services", 2, 2), ("svp_users", 3, 3)])
+        lines = log_lines(report, "2026-01-01T00:00:00Z")
+        self.assertTrue(lines[-1].startswith("import-verify complete exit=0"))
+        self.assertFalse(any(line.startswith(("FAIL:", "SKIP:")) for line in lines))
+        verdict = classify_bytes("import-verify-v28.log", "\n".join(lines).encode())
+        self.assertEqual((verdict.ok, verdict.stopped_on), (False, "mode=sqlite-load"))
+        conn = sqlite3.connect(self.dir / "a.sqlite")
+        self.assertEqual(conn.execute("SELECT username FROM svp_users WHERE id = 2").fetchone(), ("it's",))
+        self.assertEqual(conn.execute("SELECT tg_user_id FROM svp_users WHERE id = 100").fetchone(), (None,))
+
+    def test_shard_directory_gives_the_same_checksums(self):
+        shard(self.dump, self.dir / "shards", jobs=1)
+        from_dump = verify(self.dump, self.dir / "a.sqlite", jobs=1)["tables"]
+        from_shards = verify(self.dir / "shards", self.dir / "b.sqlite", jobs=1)["tables"]
+        self.assertEqual(from_dump, from_shards)
+
+    def test_duplicate_ids_fail_like_the_importer_skips_them(self):
+        self.dump.write_text(DUMP + "INSERT INTO `wp_svp_services` (`id`, `user_id`) VALUES (2, 9);\n", encoding="utf-8")
+        report = verify(self.dump, self.dir / "a.sqlite", jobs=1)
+        services = report["tables"][0]
+        self.assertEqual((services["wp"], services["db"], services["match"]), (3, 2, False))
+        lines = log_lines(report, "2026-01-01T00:00:00Z")
+        self.assertIn("FAIL: svp_services dump and sqlite differ (rows 3 vs 2)", lines)
+        self.assertTrue(lines[-1].startswith("import-verify complete exit=1"))
+
+    def test_existing_database_compares_shared_columns_and_catches_edits(self):
+        db = self.dir / "laravel.sqlite"
+        conn = sqlite3.connect(db)
+        conn.execute("CREATE TABLE svp_services (id INTEGER PRIMARY KEY, user_id INTEGER, email TEXT, "
+                     "total_traffic NUMERIC, updated_at TEXT)")
+        conn.executemany("INSERT INTO svp_services VALUES (?, ?, ?, ?, ?)",
+                         [(1, 1, "u1@test.local", "10.50", "2026-01-01"), (2, 2, "u2@test.local", 0, None)])
+        conn.execute("CREATE TABLE svp_users (id INTEGER PRIMARY KEY, username TEXT, created_at TEXT)")
+        conn.executemany("INSERT INTO svp_users VALUES (?, ?, ?)", [
+            (1, "user1", "2024-01-01 00:00:00"), (2, "it's", "2024-01-02 00:00:00"),
+            (100, "reseller1", "2024-01-01 00:00:00")])
+        conn.commit()
+        report = verify(self.dump, db, jobs=1, existing=True)
+        self.assertTrue(report["ok"], report["tables"])
+        lines = log_lines(report, "2026-01-01T00:00:00Z")
+        self.assertTrue(classify_bytes("import-verify-v28.log", "\n".join(lines).encode()).ok)
+        conn.execute("UPDATE svp_users SET username = 'edited' WHERE id = 100")
+        conn.commit()
+        conn.close()
+        report = verify(self.dump, db, jobs=1, existing=True)
+        self.assertEqual([t["match"] for t in report["tables"]], [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
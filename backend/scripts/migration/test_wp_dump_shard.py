@@ -0,0 +1,135 @@
+"""Dump streaming and sharding on small generated dumps.
+
+Run: python3 -m pytest backend/scripts/migration   (or python3 -m unittest from this directory)
+"""
+import gzip
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from wp_dump_shard import count, iter_tuples, load_manifest, parse_values, read_shard, role, shard, split_ranges  # noqa: E402
+
+HEADER = """-- MySQL dump 10.13
+/*!40101 SET NAMES utf8mb4 */;
+
+DROP TABLE IF EXISTS `wp_svp_users`;
+CREATE TABLE `wp_svp_users` (
+  `id` bigint(20) NOT NULL AUTO_INCREMENT,
+  `name` varchar(191) DEFAULT NULL,
+  `note` text,
+  `balance` decimal(12,2) DEFAULT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+LOCK TABLES `wp_svp_users` WRITE;
+"""
+NOTES = ["plain", "It\\'s (fine); ok", "two''quotes", "line\\nbreak, comma", "", "سلام"]
+
+
+def dump(statements: int = 40, per: int = 25) -> str:
+    out = [HEADER]
+    n = 0
+    for _ in range(statements):
+        rows = []
+        for _ in range(per):
+            n += 1
+            rows.append(f"({n},'user_{n}','{NOTES[n % len(NOTES)]}',{n / 4})")
+        out.append("INSERT INTO `wp_svp_users` VALUES " + ",".join(rows) + ";\n")
+        out.append("INSERT INTO `wp_posts` (`ID`, `post_content`) VALUES (1,'<p>a; b</p>'),(2,NULL);\n")
+    out.append("UNLOCK TABLES;\n")
+    out.append("INSERT INTO `wp_options` (`option_id`, `option_name`, `option_value`) VALUES\n"
+               "(1, 'siteurl', 'https://x.test'),\n(2, 'svp_settings', 'a:1:{s:1:\\\"k\\\";s:2:\\\"v;\\\";}');\n")
+    return "".join(out)
+
+
+class ParseValuesTest(unittest.TestCase):
+    def test_mysql_escapes_and_types(self):
+        raw = b"1,-2,3.5,NULL,'It\\'s','a''b','\\n\\t\\\\','100%\\_',_binary 'x',0x1F,''"
+        self.assertEqual(parse_values(raw), [1, -2, 3.5, None, "It's", "a'b", "\n\t\\", "100%\\_", "x", "0x1F", ""])
+
+
+class IterTuplesTest(unittest.TestCase):
+    def test_chunk_size_does_not_change_the_result(self):
+        data = dump(8, 5).encode()
+        whole = list(iter_tuples(io.BytesIO(data)))
+        for chunk in (7, 64, 1000):
+            self.assertEqual(list(iter_tuples(io.BytesIO(data), chunk=chunk)), whole)
+        self.assertEqual(len(whole), 8 * 5 + 8 * 2 + 2)
+        self.assertEqual(whole[0].columns, ("id", "name", "note", "balance"))
+        self.assertEqual(whole[-1].columns, ("option_id", "option_name", "option_value"))
+
+    def test_statements_are_split_by_start_offset(self):
+        data = dump(6, 3).encode()
+        cut = data.index(b"INSERT INTO `wp_svp_users`", data.index(b"INSERT INTO `wp_svp_users`") + 1)
+        schema = {"wp_svp_users": ("id", "name", "note", "balance")}
+        head = list(iter_tuples(io.BytesIO(data), 0, cut, dict(schema), chunk=32))
+        tail = list(iter_tuples(io.BytesIO(data), cut, None, dict(schema), chunk=32))
+        self.assertEqual(head + tail, list(iter_tuples(io.BytesIO(data))))
+        self.assertEqual(len(head), 3 + 2)
+
+
+class ShardTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.path = self.dir / "dump.sql"
+        self.path.write_text(dump(), encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shards_the_tables_wp_import_reads(self):
+        manifest = shard(self.path, self.dir / "out", jobs=1)
+        self.assertEqual(set(manifest["tables"]), {"wp_svp_users", "wp_options"})
+        users = manifest["tables"]["wp_svp_users"]
+        self.assertEqual((users["rows"], users["malformed"], users["target"], users["role"]), (1000, 0, "svp_users", "svp"))
+        self.assertEqual(manifest["skipped"], {"wp_posts": 80})
+        rows = list(read_shard(self.dir / "out", "wp_svp_users"))
+        self.assertEqual(rows[0], {"id": 1, "name": "user_1", "note": NOTES[1].replace("\\'", "'"), "balance": 0.25})
+        self.assertEqual([r["id"] for r in rows], list(range(1, 1001)))
+        options = list(read_shard(self.dir / "out", "wp_options"))
+        self.assertEqual(options[1]["option_value"], 'a:1:{s:1:"k";s:2:"v;";}')
+        self.assertEqual(load_manifest(self.dir / "out")["tables"], manifest["tables"])
+
+    def test_parallel_ranges_match_one_pass(self):
+        self.assertGreater(len(split_ranges(self.path, 4, chunk=2048)), 2)
+        one = shard(self.path, self.dir / "one", jobs=1, everything=True, chunk=2048)
+        four = shard(self.path, self.dir / "four", jobs=4, everything=True, chunk=2048)
+        self.assertEqual(four["jobs"], 4)
+        self.assertEqual(one["tables"], four["tables"])
+        for table in one["tables"]:
+            self.assertEqual((self.dir / "one" / f"{table}.jsonl").read_bytes(),
+                             (self.dir / "four" / f"{table}.jsonl").read_bytes())
+        self.assertFalse((self.dir / "four" / ".parts").exists())
+
+    def test_gzip_and_count(self):
+        gz = self.dir / "dump.sql.gz"
+        gz.write_bytes(gzip.compress(self.path.read_bytes()))
+        expected = {"wp_options": 2, "wp_posts": 80, "wp_svp_users": 1000}
+        self.assertEqual(count(gz, jobs=4), expected)
+        self.assertEqual(count(self.path, jobs=3, chunk=2048), expected)
+
+    def test_column_count_mismatch_is_malformed(self):
+        self.path.write_text(HEADER + "INSERT INTO `wp_svp_users` VALUES (1,'a','b',1.0),(2,'short');\n", encoding="utf-8")
+        manifest = shard(self.path, self.dir / "out", jobs=1)
+        self.assertEqual(manifest["tables"]["wp_svp_users"]["rows"], 1)
+        self.assertEqual(manifest["tables"]["wp_svp_users"]["malformed"], 1)
+        self.assertEqual(json.loads((self.dir / "out" / "manifest.json").read_text())["schema"], 1)
+
+
+class RoleTest(unittest.TestCase):
+    def test_matches_wp_dump_parser_buckets(self):
+        self.assertEqual(role("wp_options", "wp_"), "options")
+        self.assertEqual(role("wp_users", "wp_"), "users")
+        self.assertEqual(role("wp_usermeta", "wp_"), "usermeta")
+        self.assertEqual(role("wp_svp_users", "wp_"), "svp")
+        self.assertIsNone(role("wp_posts", "wp_"))
+
+
+if __name__ == "__main__":
+    unittest.main()
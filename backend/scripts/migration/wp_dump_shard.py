@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""Stream a WordPress SQL dump into per-table JSONL row shards in bounded memory.
+
+``WpDumpParser::parseFile`` reads the whole dump with ``File::get()`` and
+``SqlInsertParser`` rebuilds every tuple one character at a time, so a
+production dump runs out of memory before ``wp:import`` gets to the rows.
+This pre-processor reads the dump in fixed-size chunks (plain or ``.gz``),
+yields one ``INSERT`` tuple at a time from a generator, and writes the rows
+the importer reads — ``{prefix}svp_*``, options, users, usermeta (or every
+table with ``--all``) — to ``<out>/<table>.jsonl``, one JSON object per row.
+
+Plain dumps are split into byte ranges at statement starts (a line beginning
+with ``INSERT INTO``) and sharded by ``--jobs`` worker processes; each worker
+writes its own part files, which are concatenated in dump order. Memory per
+worker is one chunk plus the largest single tuple.
+
+Parsing follows MySQL: ``\\'`` / ``''`` escapes inside strings, ``NULL``,
+bare numbers as int/float, ``_binary '…'``. INSERTs without a column list
+take the columns of the dump's ``CREATE TABLE``. Tuples whose value count does
+not match the columns are counted as ``malformed`` and not written (the PHP
+parser drops them the same way).
+
+``<out>/manifest.json`` records per-table row counts, columns, role (svp /
+options / users / usermeta) and the import target name; tables not sharded
+are still counted under ``skipped``.
+
+Usage:
+  python3 scripts/migration/wp_dump_shard.py dump.sql --out storage/app/wp-shards
+  python3 scripts/migration/wp_dump_shard.py dump.sql.gz --out shards --all
+  python3 scripts/migration/wp_dump_shard.py dump.sql --count          # row counts only, nothing written
+  python3 scripts/migration/wp_dump_shard.py dump.sql --out shards --jobs 8 --prefix wp_ --json
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+
+CHUNK = 1 << 20
+SCHEMA = 1
+MANIFEST = "manifest.json"
+
+STATEMENT_RE = re.compile(rb"^[ \t]*(INSERT|CREATE[ \t]+TABLE)\b", re.M | re.I)
+INSERT_RE = re.compile(
+    rb"INSERT\s+(?:IGNORE\s+)?INTO\s+`?([\w$]+)`?\s*(?:\(([^)]*)\)\s*)?VALUES\s*", re.I)
+CREATE_RE = re.compile(rb"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?([\w$]+)`?\s*\((.*?)\n\)[^;]*;", re.I | re.S)
+COLUMN_RE = re.compile(rb"^\s*`([^`]+)`", re.M)
+# One "(…)" tuple and the "," or ";" after it. Possessive runs keep a partial
+# tuple at the end of the buffer from backtracking through the whole chunk.
+TUPLE_RE = re.compile(rb"\s*\(((?:'(?:[^'\\]++|\\.|'')*+'|[^'()]++)*+)\)\s*([,;]?)", re.S)
+VALUE_RE = re.compile(rb"\s*(?:(?:_binary\s*|[xXbB])?(')((?:[^'\\]++|\\.|'')*+)'|([^,']+?))\s*(?:,|$)", re.S)
+ESCAPE_RE = re.compile(rb"\\(.)|''", re.S)
+ESCAPES = {b"0": b"\0", b"b": b"\b", b"n": b"\n", b"r": b"\r", b"t": b"\t", b"Z": b"\x1a"}
+NUMERIC = frozenset(b"-+.0123456789")
+
+
+class Tuple(NamedTuple):
+    table: str
+    columns: tuple[str, ...] | None  # None when neither the INSERT nor a CREATE TABLE named them
+    raw: bytes  # between the tuple's parentheses
+
+
+# --- scanning --------------------------------------------------------------
+
+def open_dump(path: Path) -> BinaryIO:
+    return gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb", buffering=0)
+
+
+def _columns(block: bytes) -> tuple[str, ...]:
+    return tuple(c.decode() for c in COLUMN_RE.findall(block))
+
+
+def iter_tuples(stream: BinaryIO, start: int = 0, end: int | None = None,
+                schema: dict[str, tuple[str, ...]] | None = None, chunk: int = CHUNK) -> Iterator[Tuple]:
+    """Every INSERT tuple of statements that *start* in ``[start, end)`` — the last may run past ``end``.
+
+    ``schema`` maps table → columns for INSERTs without a column list; ``CREATE
+    TABLE`` statements met on the way are added to it.
+    """
+    schema = {} if schema is None else schema
+    if start:
+        stream.seek(start)
+    buf, pos, base, eof = b"", 0, start, False
+
+    def fill() -> bool:
+        nonlocal buf, pos, base, eof
+        if eof:
+            return False
+        data = stream.read(chunk)
+        eof = not data
+        buf, base, pos = buf[pos:] + data, base + pos, 0
+        return not eof
+
+    while True:
+        m = STATEMENT_RE.search(buf, pos)
+        if m is None:
+            pos = max(pos, len(buf) - 64)  # keep a keyword cut by the chunk edge
+            if not fill():
+                return
+            continue
+        pos = m.start(1)
+        if end is not None and base + pos >= end:
+            return
+        if m.group(1)[:1] in b"cC":
+            while (c := CREATE_RE.match(buf, pos)) is None and len(buf) - pos < 64 * chunk and fill():
+                pass
+            if c is None:
+                pos += 6
+                continue
+            schema[c.group(1).decode()] = _columns(c.group(2))
+            pos = c.end()
+            continue
+        while (h := INSERT_RE.match(buf, pos)) is None and len(buf) - pos < 4096 and fill():
+            pass
+        if h is None:
+            pos += 6  # INSERT … SELECT / SET: nothing to shard
+            continue
+        table = h.group(1).decode()
+        columns = (tuple(c.strip(b" `\t\r\n").decode() for c in h.group(2).split(b","))
+                   if h.group(2) else schema.get(table))
+        pos = h.end()
+        while True:
+            t = TUPLE_RE.match(buf, pos)
+            if (t is None or t.end() == len(buf)) and not eof:
+                fill()  # the tuple (or its separator) may continue in the next chunk
+                continue
+            if t is None:
+                return  # truncated dump
+            pos = t.end()
+            yield Tuple(table, columns, t.group(1))
+            if t.group(2) != b",":
+                break
+
+
+def _unescape(m: re.Match) -> bytes:
+    if m.group(0) == b"''":
+        return b"'"
+    ch = m.group(1)
+    if ch in (b"%", b"_"):
+        return m.group(0)  # MySQL keeps the backslash for LIKE wildcards
+    return ESCAPES.get(ch, ch)
+
+
+def parse_values(raw: bytes) -> list[object]:
+    """Values of one tuple: strings decoded, ``NULL`` → None, bare numbers → int/float."""
+    out: list[object] = []
+    for quote, text, bare in VALUE_RE.findall(raw):
+        if quote:
+            if b"\\" in text or b"''" in text:
+                text = ESCAPE_RE.sub(_unescape, text)
+            out.append(text.decode("utf-8", "replace"))
+        elif bare[0] in NUMERIC:
+            try:
+                out.append(int(bare))
+            except ValueError:
+                try:
+                    out.append(float(bare))
+                except ValueError:
+                    out.append(bare.decode("utf-8", "replace"))
+        elif bare.upper() == b"NULL":
+            out.append(None)
+        else:
+            out.append(bare.decode("utf-8", "replace"))  # 0x… literals, CURRENT_TIMESTAMP
+    return out
+
+
+def iter_rows(stream: BinaryIO, want: Callable[[str], bool] = lambda _t: True, **kwargs) -> Iterator[tuple[str, dict | None]]:
+    """``(table, row)`` per tuple; ``row`` is None for unwanted tables and malformed tuples."""
+    for t in iter_tuples(stream, **kwargs):
+        if not want(t.table) or t.columns is None:
+            yield t.table, None
+            continue
+        values = parse_values(t.raw)
+        yield t.table, dict(zip(t.columns, values)) if len(values) == len(t.columns) else None
+
+
+# --- tables ----------------------------------------------------------------
+
+def role(table: str, prefix: str) -> str | None:
+    """Which ``WpDumpParser`` bucket a table feeds, or None when the importer ignores it."""
+    if table.endswith("options"):
+        return "options"
+    if table.endswith("users") and "svp_users" not in table and "usermeta" not in table:
+        return "users"
+    if table.endswith("usermeta"):
+        return "usermeta"
+    if table.startswith(prefix + "svp_"):
+        return "svp"
+    return None
+
+
+def target(table: str, prefix: str) -> str:
+    """Import target: ``wp_svp_users`` → ``svp_users``; other tables keep their dump name."""
+    return table[len(prefix):] if role(table, prefix) == "svp" else table
+
+
+def schemas(path: Path, chunk: int = CHUNK) -> dict[str, tuple[str, ...]]:
+    """``CREATE TABLE`` columns for the whole dump — a ``bytes.find`` pass, no tuple parsing."""
+    out: dict[str, tuple[str, ...]] = {}
+    with open_dump(path) as stream:
+        buf = b""
+        while data := stream.read(chunk):
+            buf += data
+            pos = 0
+            while (i := buf.find(b"CREATE TABLE", pos)) >= 0:
+                if not (c := CREATE_RE.match(buf, i)):
+                    break
+                out[c.group(1).decode()] = _columns(c.group(2))
+                pos = c.end()
+            else:
+                pos = max(pos, len(buf) - 16)
+            buf = buf[pos:] if pos else buf
+            if len(buf) > 64 * chunk:  # no closing ");" in sight: not a CREATE TABLE we can read
+                buf = buf[-16:]
+    return out
+
+
+def split_ranges(path: Path, jobs: int, chunk: int = CHUNK) -> list[tuple[int, int | None]]:
+    """Byte ranges of roughly equal size, each starting at a line that begins an INSERT.
+
+    ``.gz`` dumps cannot seek and stay one open-ended range.
+    """
+    size = path.stat().st_size
+    if jobs <= 1 or path.suffix == ".gz" or size < 2 * chunk:
+        return [(0, None)]
+    cuts = [0]
+    with open(path, "rb") as f:
+        for i in range(1, jobs):
+            at = max(size * i // jobs, cuts[-1] + 1)
+            f.seek(at)
+            window = b""
+            while True:
+                data = f.read(chunk)
+                if not data:
+                    at = size
+                    break
+                window = window[-16:] + data
+                if (k := window.find(b"\nINSERT INTO ")) >= 0:
+                    at = f.tell() - len(window) + k + 1
+                    break
+            if at < size and at > cuts[-1]:
+                cuts.append(at)
+    return list(zip(cuts, cuts[1:] + [None]))
+
+
+class Stats(NamedTuple):
+    rows: dict[str, int]  # written rows per sharded table
+    malformed: dict[str, int]
+    skipped: dict[str, int]  # tuples per table not sharded
+    columns: dict[str, list[str]]  # union over the table's INSERT column lists
+
+
+def shard_range(path: Path, start: int, end: int | None, out: Path, prefix: str, everything: bool,
+                schema: dict[str, tuple[str, ...]], chunk: int = CHUNK) -> Stats:
+    """Worker: write ``out/<table>.jsonl`` for the statements starting in ``[start, end)``."""
+    wanted: dict[str, bool] = {}
+    rows: dict[str, int] = {}
+    malformed: dict[str, int] = {}
+    skipped: dict[str, int] = {}
+    columns: dict[str, list[str]] = {}
+    files: dict[str, BinaryIO] = {}
+    last: dict[str, tuple[str, ...]] = {}  # column list of the table's current INSERT
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    try:
+        with open_dump(path) as stream:
+            for t in iter_tuples(stream, start, end, dict(schema), chunk):
+                if (keep := wanted.get(t.table)) is None:
+                    keep = wanted[t.table] = everything or role(t.table, prefix) is not None
+                if not keep:
+                    skipped[t.table] = skipped.get(t.table, 0) + 1
+                    continue
+                values = parse_values(t.raw) if t.columns is not None else None
+                if values is None or len(values) != len(t.columns):
+                    malformed[t.table] = malformed.get(t.table, 0) + 1
+                    continue
+                if (f := files.get(t.table)) is None:
+                    out.mkdir(parents=True, exist_ok=True)
+                    f = files[t.table] = open(out / f"{t.table}.jsonl", "wb", buffering=CHUNK)
+                    columns[t.table] = []
+                if t.columns is not last.get(t.table):
+                    last[t.table] = t.columns
+                    columns[t.table] += [c for c in t.columns if c not in columns[t.table]]
+                f.write(dumps(dict(zip(t.columns, values))).encode() + b"\n")
+                rows[t.table] = rows.get(t.table, 0) + 1
+    finally:
+        for f in files.values():
+            f.close()
+    return Stats(rows, malformed, skipped, columns)
+
+
+def count_range(path: Path, start: int, end: int | None, chunk: int = CHUNK) -> dict[str, int]:
+    """Worker: tuples per table, values left unparsed."""
+    counts: dict[str, int] = {}
+    with open_dump(path) as stream:
+        for t in iter_tuples(stream, start, end, {}, chunk):
+            counts[t.table] = counts.get(t.table, 0) + 1
+    return counts
+
+
+def _merge(into: dict[str, int], more: dict[str, int]) -> None:
+    for k, v in more.items():
+        into[k] = into.get(k, 0) + v
+
+
+def shard(path: Path, out: Path, prefix: str = "wp_", jobs: int = 1, everything: bool = False,
+          chunk: int = CHUNK) -> dict:
+    """Shard ``path`` into ``out`` and write the manifest; returns it."""
+    started = time.perf_counter()
+    ranges = split_ranges(path, jobs, chunk)
+    schema = schemas(path, chunk) if len(ranges) > 1 else {}
+    parts = out / ".parts"
+    if parts.exists():
+        shutil.rmtree(parts)
+    args = [(path, s, e, parts / str(n), prefix, everything, schema, chunk) for n, (s, e) in enumerate(ranges)]
+    if len(args) == 1:
+        results = [shard_range(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(shard_range, *zip(*args)))
+
+    rows: dict[str, int] = {}
+    malformed: dict[str, int] = {}
+    skipped: dict[str, int] = {}
+    columns: dict[str, list[str]] = {}
+    for r in results:
+        _merge(rows, r.rows)
+        _merge(malformed, r.malformed)
+        _merge(skipped, r.skipped)
+        for table, cols in r.columns.items():
+            known = columns.setdefault(table, [])
+            known += [c for c in cols if c not in known]
+    tables = {}
+    for table in sorted(set(rows) | set(malformed)):
+        dest = out / f"{table}.jsonl"
+        with open(dest, "wb") as f:
+            for n in range(len(args)):
+                part = parts / str(n) / f"{table}.jsonl"
+                if part.exists():
+                    with open(part, "rb") as src:
+                        shutil.copyfileobj(src, f, CHUNK)
+        tables[table] = {
+            "role": role(table, prefix),
+            "target": target(table, prefix),
+            "file": dest.name,
+            "rows": rows.get(table, 0),
+            "malformed": malformed.get(table, 0),
+            "columns": columns.get(table, []),
+            "bytes": dest.stat().st_size,
+        }
+    shutil.rmtree(parts, ignore_errors=True)
+    manifest = {
+        "schema": SCHEMA,
+        "source": str(path),
+        "source_bytes": path.stat().st_size,
+        "prefix": prefix,
+        "jobs": len(ranges),
+        "tables": tables,
+        "skipped": dict(sorted(skipped.items())),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000),
+    }
+    tmp = out / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp, out / MANIFEST)
+    return manifest
+
+
+def count(path: Path, jobs: int = 1, chunk: int = CHUNK) -> dict[str, int]:
+    ranges = split_ranges(path, jobs, chunk)
+    counts: dict[str, int] = {}
+    if len(ranges) == 1:
+        return dict(sorted(count_range(path, *ranges[0], chunk).items()))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for r in pool.map(count_range, *zip(*[(path, s, e, chunk) for s, e in ranges])):
+            _merge(counts, r)
+    return dict(sorted(counts.items()))
+
+
+def load_manifest(out: Path) -> dict:
+    data = json.loads((out / MANIFEST).read_text(encoding="utf-8"))
+    if data.get("schema") != SCHEMA:
+        raise ValueError(f"{out / MANIFEST}: schema {data.get('schema')} (expected {SCHEMA})")
+    return data
+
+
+def read_shard(out: Path, table: str) -> Iterator[dict]:
+    """Rows of one sharded table, one at a time."""
+    with open(out / f"{table}.jsonl", "rb") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dump", type=Path, help="WordPress SQL dump (.sql or .sql.gz)")
+    parser.add_argument("--out", type=Path, help="shard directory (required unless --count)")
+    parser.add_argument("--prefix", default="wp_", help="table prefix in the dump (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (default: %(default)s)")
+    parser.add_argument("--all", action="store_true", help="shard every table, not just the ones wp:import reads")
+    parser.add_argument("--count", action="store_true", help="count rows per table without writing shards")
+    parser.add_argument("--json", action="store_true", help="print the manifest (or counts) as JSON")
+    args = parser.parse_args(argv)
+    if not args.dump.is_file():
+        parser.error(f"dump not found: {args.dump}")
+    if not args.count and args.out is None:
+        parser.error("--out is required unless --count")
+
+    started = time.perf_counter()
+    if args.count:
+        counts = count(args.dump, args.jobs)
+        elapsed = time.perf_counter() - started
+        if args.json:
+            print(json.dumps(counts, indent=2))
+        else:
+            for table, n in counts.items():
+                print(f"{table:<48} {n:>10}")
+        print(f"wp-dump-shard: {sum(counts.values())} rows in {len(counts)} tables "
+              f"({args.dump.stat().st_size / 1e6:.1f} MB, {elapsed:.2f}s)", file=sys.stderr)
+        return 0
+
+    manifest = shard(args.dump, args.out, args.prefix, args.jobs, args.all)
+    if args.json:
+        print(json.dumps(manifest, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'table':<40} {'role':<9} {'rows':>10} {'malformed':>9} {'MB':>8}")
+        for table, t in manifest["tables"].items():
+            print(f"{table:<40} {t['role'] or '-':<9} {t['rows']:>10} {t['malformed']:>9} {t['bytes'] / 1e6:>8.1f}")
+    rows = sum(t["rows"] for t in manifest["tables"].values())
+    print(f"wp-dump-shard: {rows} rows in {len(manifest['tables'])} tables → {args.out} "
+          f"({len(manifest['skipped'])} tables skipped, {manifest['jobs']} jobs, "
+          f"{manifest['source_bytes'] / 1e6:.1f} MB, {manifest['elapsed_ms'] / 1000:.2f}s)", file=sys.stderr)
+    return 1 if any(t["malformed"] for t in manifest["tables"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
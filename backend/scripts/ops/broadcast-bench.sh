@@ -0,0 +1,13 @@
+#!/usr/bin/env bash
+# Broadcast fan-out at 10k–1M targets (broadcast-load-smoke.sh stops at 1000 and never sends):
+# SQLite stand-in of svp_broadcast_queue + local Bot API stand-in with 429 retry_after limits.
+# Extra args pass through, e.g. --targets=100k --workers=8 --usleep-us=0.
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "$0")/../../.." && pwd)"
+LOG="${SVP_BROADCAST_BENCH_LOG:-$ROOT/docs/evidence/broadcast-bench-$(date +%F).log}"
+
+exec python3 "$ROOT/backend/scripts/load-test/broadcast_bench.py" \
+  --targets="${SVP_BROADCAST_TARGETS:-10k,100k,1M}" \
+  --drain-seconds="${SVP_BROADCAST_DRAIN_SEC:-20}" \
+  --log "$LOG" "$@"
@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 # v28 OPS evidence bundle — strict: truncate logs, exit 1 on any failure.
 # Local: SVP_BASE_URL=http://127.0.0.1:8080 SVP_WP_DUMP=backend/tests/fixtures/wp-minimal-dump.sql
+#        SVP_IMPORT_VERIFY_DB=backend/database/database.sqlite
 #        SVP_LARAVEL_ONLY=1 SVP_PHASE16_MANUAL_SIGNOFF='ops@host date'
 #        SVP_SECRET_ROTATION_SIGNED=1 SVP_SOAK_DURATION_SEC=120 SVP_SOAK_ACCEPT_SHORT=1
 set -euo pipefail
@@ -102,8 +103,15 @@ run_phpunit_filter "bot-parity-gate-v28" "Bot" "$EVID/staging-buy-flow-v28.log"
 if [[ "${SVP_LARAVEL_ONLY:-1}" == "1" ]]; then
   {
     log "import-run-v28 SKIP: wp:import removed; Laravel-only cutover" "$EVID/import-run-v28.log"
-    log "import-verify-v28 SKIP: use php artisan migrate --force && db:seed" "$EVID/import-verify-v28.log"
   }
+  # Row 154: dump vs the rehearsal SQLite database after migrate + import (counts + checksums), no MySQL needed.
+  # Loading the dump into a fresh stand-in only compares it with itself, so that mode is not evidence.
+  if [[ -n "${SVP_WP_DUMP:-}" && -e "${SVP_WP_DUMP}" && -n "${SVP_IMPORT_VERIFY_DB:-}" && -e "${SVP_IMPORT_VERIFY_DB}" ]]; then
+    SVP_MYSQL_DSN= bash "$ROOT/backend/scripts/ops/import-verify.sh" "$SVP_WP_DUMP" "$EVID/import-verify-v28.log" \
+      || mark_fail "import-verify dump/sqlite mismatch" "$EVID/import-verify-v28.log"
+  else
+    log "import-verify-v28 SKIP: set SVP_WP_DUMP and SVP_IMPORT_VERIFY_DB (rehearsal sqlite after migrate/import)" "$EVID/import-verify-v28.log"
+  fi
 else
   mark_fail "import-run requires SVP_LARAVEL_ONLY=1 (WordPress import decommissioned)" "$EVID/import-run-v28.log"
 fi
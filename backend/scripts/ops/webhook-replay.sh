@@ -0,0 +1,22 @@
+#!/usr/bin/env bash
+# Webhook ingress replay: synthesized updates into /api/v1/webhook/{platform}/{secret}, svp_inbound_queue
+# depth sampled from /metrics, ingest vs drain rate and time-to-empty. Without SVP_WEBHOOK_REPLAY_BASE it
+# runs against the in-process stand-in (kickAsyncDrain + InboundQueueDrainJob model).
+# Extra args pass through, e.g. --recorded=updates.jsonl --speed=2 or --source-ips=4.
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "$0")/../../.." && pwd)"
+LOG="${SVP_WEBHOOK_REPLAY_LOG:-$ROOT/docs/evidence/webhook-replay-$(date +%F).log}"
+
+if [[ -n "${SVP_WEBHOOK_REPLAY_BASE:-}" ]]; then
+  TARGET=(--base="$SVP_WEBHOOK_REPLAY_BASE")
+else
+  TARGET=(--standin)
+fi
+
+exec python3 "$ROOT/backend/scripts/load-test/webhook_replay.py" "${TARGET[@]}" \
+  --rate="${SVP_WEBHOOK_REPLAY_RATE:-3}" \
+  --duration="${SVP_WEBHOOK_REPLAY_DURATION_SEC:-180}" \
+  --settle="${SVP_WEBHOOK_REPLAY_SETTLE_SEC:-300}" \
+  --sample-every=10 \
+  --log "$LOG" "$@"
@@ -79,4 +79,20 @@ public function test_metrics_endpoint(): void
             ->assertOk()
             ->assertHeader('content-type', 'text/plain; version=0.0.4; charset=utf-8');
     }
+
+    public function test_metrics_inbound_queue_pending_gauge(): void
+    {
+        foreach (['pending', 'pending', 'done'] as $i => $status) {
+            DB::table('svp_inbound_queue')->insert([
+                'status' => $status,
+                'platform' => 'telegram',
+                'update_json' => json_encode(['update_id' => $i + 1]),
+                'created_at' => now(),
+            ]);
+        }
+
+        $this->get('/metrics')
+            ->assertOk()
+            ->assertSee("svp_inbound_queue_pending 2\n", false);
+    }
 }
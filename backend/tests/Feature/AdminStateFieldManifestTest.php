@@ -0,0 +1,63 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\DashboardUser;
+use App\Services\AdminState\FieldManifest;
+use Database\Seeders\SvpTestDataSeeder;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Tests\Concerns\CreatesSvpTestSchema;
+use Tests\TestCase;
+
+class AdminStateFieldManifestTest extends TestCase
+{
+    use CreatesSvpTestSchema;
+    use RefreshDatabase;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+        $this->createSvpTestSchema();
+        $this->seed(SvpTestDataSeeder::class);
+    }
+
+    public function test_manifest_narrows_payload_to_tab_fields(): void
+    {
+        $user = DashboardUser::query()->where('username', 'admin')->first();
+        $response = $this->actingAs($user)->getJson('/api/v1/admin/state?activeTab=audit&fields=manifest');
+        $response->assertOk();
+
+        $this->assertArrayHasKey('auditRows', $response->json());
+        $this->assertArrayHasKey('pagination', $response->json());
+        $this->assertArrayNotHasKey('usersList', $response->json());
+        $this->assertArrayNotHasKey('settings', $response->json());
+    }
+
+    public function test_without_fields_param_payload_is_unchanged(): void
+    {
+        $user = DashboardUser::query()->where('username', 'admin')->first();
+        $response = $this->actingAs($user)->getJson('/api/v1/admin/state?activeTab=audit');
+        $response->assertOk();
+
+        $this->assertArrayHasKey('usersList', $response->json());
+        $this->assertArrayHasKey('settings', $response->json());
+    }
+
+    public function test_tab_missing_from_manifest_keeps_full_payload(): void
+    {
+        $user = DashboardUser::query()->where('username', 'admin')->first();
+        $response = $this->actingAs($user)->getJson('/api/v1/admin/state?activeTab=tab_without_manifest_entry&fields=manifest');
+        $response->assertOk();
+
+        $this->assertNull(app(FieldManifest::class)->fieldsFor('tab_without_manifest_entry'));
+        $this->assertArrayHasKey('usersList', $response->json());
+        $this->assertArrayHasKey('settings', $response->json());
+    }
+
+    public function test_pattern_fields_match(): void
+    {
+        $this->assertTrue(FieldManifest::matches(['*Pagination'], 'auditPagination'));
+        $this->assertTrue(FieldManifest::matches(['panels'], 'panels'));
+        $this->assertFalse(FieldManifest::matches(['panels'], 'panelsPagination'));
+    }
+}
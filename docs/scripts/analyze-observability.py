@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Observability-48h trends — rolling error rate per target, rising windows flagged.
+
+Usage: python3 docs/scripts/analyze-observability.py [LOG ...] [--width 3] [--min-steps 3] [--json]
+Without arguments every docs/evidence/observability-48h-*.log is loaded.
+"""
+import argparse
+import json
+from pathlib import Path
+
+import observability_store
+from gap_matrix import EVID
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("logs", nargs="*", type=Path)
+parser.add_argument("--width", type=int, default=3, help="rolling mean window (scrape windows)")
+parser.add_argument("--min-steps", type=int, default=3, help="consecutive increases that count as a rising trend")
+parser.add_argument("--json", action="store_true")
+args = parser.parse_args()
+
+store = observability_store.ObservabilityStore()
+for path in args.logs or sorted(EVID.glob("observability-48h-*.log")):
+    store.load(path)
+report = observability_store.trends(store, args.width, args.min_steps)
+
+if args.json:
+    print(json.dumps(report, indent=2))
+else:
+    backend = "numpy" if observability_store.np is not None else "array"
+    print(f"{len(store)} windows, {len(store.files)} logs, {len(store.targets)} targets ({backend})")
+    for r in report:
+        flag = "RISING" if r["rising"] else "ok"
+        print(
+            f"{r['file']:<46} {r['target']:<14} windows={r['windows']:<4} "
+            f"err {r['first']}%→{r['last']}% max={r['max']}% rolling={r['rolling_last']}% "
+            f"Δ={r['rolling_delta']:+}  {flag}"
+        )
+        for span in r["rising"]:
+            print(f"    rising windows {span['from_window']}–{span['to_window']}: {span['from']}% → {span['to']}%")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Soak-log analytics — uptime, missing polls, longest outage and MTTR per run.
+
+Usage: python3 docs/scripts/analyze-soak.py [LOG ...] [--json]
+Without arguments every docs/evidence/soak-24h-*.log is compared.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import evidence_rules
+import soak_series
+from gap_matrix import EVID
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("logs", nargs="*", type=Path)
+parser.add_argument("--json", action="store_true", help="emit one JSON object per run")
+args = parser.parse_args()
+
+logs = args.logs or sorted(EVID.glob("soak-24h-*.log"))
+rows: list[dict] = []
+for path in logs:
+    for n, run in enumerate(soak_series.parse(path), 1):
+        rows.append({"file": path.name, "run": n, "version": evidence_rules.version_of(path.name),
+                     **soak_series.analyze(run)})
+rows.sort(key=lambda r: (r["version"] or 0, r["file"], r["run"]))
+
+if args.json:
+    for r in rows:
+        print(json.dumps(r))
+    sys.exit(0)
+
+print(f"{'file':<38} {'run':>3} {'interval':>8} {'duration':>8} {'polls':>9} {'missing':>7} "
+      f"{'uptime':>8} {'outages':>7} {'longest':>8} {'mttr':>7}  verdict")
+for r in rows:
+    print(
+        f"{r['file']:<38} {r['run']:>3} {r['interval']:>7}s {r['duration']:>7}s "
+        f"{r['polls']:>4}/{r['expected_polls']:<4} {r['missing_polls']:>7} {r['uptime']:>7.2%} "
+        f"{r['outages']:>7} {r['longest_outage_sec']:>7}s {r['mttr_sec']:>6.0f}s  "
+        f"{'OK' if r['healthy'] else 'DEGRADED'}"
+    )
+skipped = [p.name for p in logs if not any(r["file"] == p.name for r in rows)]
+if skipped:
+    print(f"\nno poll lines (summary/template logs): {', '.join(skipped)}")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Build docs/evidence/evidence-index.json + EVIDENCE-INDEX.md from every evidence file.
+
+Usage: python3 docs/scripts/build-evidence-index.py [--workers N]
+"""
+import argparse
+import time
+
+import evidence_index
+from gap_matrix import ROOT
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--workers", type=int, help="process pool size (default: all cores)")
+args = parser.parse_args()
+
+started = time.perf_counter()
+records, rebuilt = evidence_index.build(args.workers)
+written = evidence_index.write(records)
+elapsed = (time.perf_counter() - started) * 1000
+logs = [r for r in records if r["kind"] == "log"]
+failures = sum(1 for r in logs if r["status"] == "FAIL")
+unclassified = sum(1 for r in logs if r["status"] == "UNCLASSIFIED")
+print(
+    f"Indexed {len(records)} files ({len(logs)} logs, failures={failures}, unclassified={unclassified}); "
+    f"re-classified {len(rebuilt)}; wrote {', '.join(str(p.relative_to(ROOT)) for p in written) or 'nothing'}"
+    f" ({elapsed:.1f}ms)"
+)
@@ -0,0 +1,206 @@
+"""Evidence index — one classified record per docs/evidence file.
+
+Records carry the same PASS/FAIL verdict the gap-matrix engine uses
+(``evidence_rules.classify``), so the index, the matrix and the
+``run-v*-evidence`` bundles agree on which logs are green. A log that only the
+catch-all rule applies to and that holds none of its markers is
+UNCLASSIFIED rather than FAIL: no rule says what a green one looks like. Files are
+classified on a process pool; unchanged files (stat, then sha256) reuse the
+cached record.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import evidence_rules
+from gap_matrix import CACHE_DIR, EVID, OPS_ROW_LOG, file_digest
+
+CACHE = CACHE_DIR / "evidence-index.json"
+OUT_JSON = EVID / "evidence-index.json"
+OUT_MD = EVID / "EVIDENCE-INDEX.md"
+
+SCHEMA = 2
+ROW_BY_STEM = {stem: num for num, stem in OPS_ROW_LOG.items()}
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+ENV_RE = re.compile(r"(?:^|-)(prod|staging)(?:-|\.|$)")
+STEM_RE = re.compile(r"(?:-\d{4}-\d{2}-\d{2}(?:-[a-z]+)?)?(?:-v\d+)?$")
+CHECKBOX_RE = re.compile(rb"^\s*- \[([ xX])\]", re.MULTILINE)
+# Only the head of a log is searched for a date when the name has none.
+HEAD_BYTES = 4096
+
+
+def stem_of(name: str) -> str:
+    base = name.rsplit(".", 1)[0]
+    return STEM_RE.sub("", base) or base
+
+
+def status_of(verdict: evidence_rules.Verdict) -> str:
+    if verdict.ok:
+        return "PASS"
+    if verdict.stopped_on is None and verdict.rule == "*" and not verdict.seen:
+        return "UNCLASSIFIED"
+    return "FAIL"
+
+
+def classify_file(path: Path) -> dict:
+    """Build one index record; runs in a pool worker."""
+    name = path.name
+    version = evidence_rules.version_of(name)
+    env = ENV_RE.search(name.rsplit(".", 1)[0])
+    date = DATE_RE.search(name)
+    record = {
+        "file": name,
+        "stem": stem_of(name),
+        "kind": "log" if name.endswith(".log") else "doc",
+        "version": version,
+        "env": env.group(1) if env else None,
+        "date": date.group(1) if date else None,
+        "matrix_row": None,
+        "sha256": file_digest(path),
+        "markers": [],
+    }
+    if record["kind"] == "log":
+        if name == f"{record['stem']}-v{version}.log":
+            record["matrix_row"] = ROW_BY_STEM.get(record["stem"])
+        verdict = evidence_rules.classify(path, version)
+        failure = set(evidence_rules.FORBID) | set(evidence_rules.rule_for(name).forbid)
+        record["status"] = status_of(verdict)
+        record["markers"] = sorted(m for m in verdict.seen if m in failure)
+        if record["date"] is None:
+            with path.open("rb") as fh:
+                head = DATE_RE.search(fh.read(HEAD_BYTES).decode(errors="replace"))
+            record["date"] = head.group(1) if head else None
+    else:
+        boxes = CHECKBOX_RE.findall(path.read_bytes())
+        record["status"] = "OPEN" if b" " in boxes else ("DONE" if boxes else "DOC")
+        record["markers"] = [f"{boxes.count(b' ')} open checkbox(es)"] if b" " in boxes else []
+    return record
+
+
+def evidence_files() -> list[Path]:
+    skip = {OUT_JSON.name, OUT_MD.name}
+    return sorted(p for p in EVID.iterdir() if p.is_file() and p.name not in skip and not p.name.startswith("."))
+
+
+def load_cache() -> dict:
+    try:
+        data = json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("schema") != SCHEMA or data.get("rules") != evidence_rules.RULES_DIGEST:
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(files: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(
+        {"schema": SCHEMA, "rules": evidence_rules.RULES_DIGEST, "files": files},
+        ensure_ascii=False,
+    ))
+    os.replace(tmp, CACHE)
+
+
+def _index(job: tuple[Path, dict | None]) -> tuple[dict, bool]:
+    """Pool worker: reuse the cached record when only the stat changed."""
+    path, entry = job
+    if entry and entry["sha256"] == file_digest(path):
+        return entry, False
+    return classify_file(path), True
+
+
+def build(workers: int | None = None) -> tuple[list[dict], list[str]]:
+    """Return (records, names re-classified this run)."""
+    cached = load_cache()
+    fresh: dict[str, dict] = {}
+    stale: list[tuple[Path, dict | None]] = []
+    for path in evidence_files():
+        st = path.stat()
+        entry = cached.get(path.name)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            fresh[path.name] = entry
+        else:
+            stale.append((path, entry))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(stale) < 2:
+        results = list(map(_index, stale))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_index, stale, chunksize=max(1, len(stale) // (4 * workers))))
+
+    rebuilt: list[str] = []
+    for (path, _), (record, changed) in zip(stale, results):
+        st = path.stat()
+        fresh[path.name] = {**record, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if changed:
+            rebuilt.append(path.name)
+    if stale:
+        save_cache(fresh)
+    records = [{k: v for k, v in r.items() if k not in ("size", "mtime_ns")} for r in fresh.values()]
+    records.sort(key=lambda r: (-(r["version"] or 0), r["stem"], r["file"]))
+    return records, rebuilt
+
+
+def summarize(records: list[dict]) -> dict[str, dict[str, int]]:
+    summary: dict[str, dict[str, int]] = {}
+    for r in records:
+        if r["kind"] != "log":
+            continue
+        key = f"v{r['version']}" if r["version"] is not None else "unversioned"
+        bucket = summary.setdefault(key, {"logs": 0, "pass": 0, "failures": 0, "unclassified": 0})
+        bucket["logs"] += 1
+        bucket[{"PASS": "pass", "UNCLASSIFIED": "unclassified"}.get(r["status"], "failures")] += 1
+    return summary
+
+
+def render_md(records: list[dict], summary: dict[str, dict[str, int]]) -> str:
+    lines = [
+        "# Evidence index (generated)",
+        "",
+        "Generated by `docs/scripts/build-evidence-index.py` — do not edit by hand.",
+        "Status for `.log` files is the strict `log_ok()` verdict used by the gap matrix;",
+        "UNCLASSIFIED logs match no evidence rule (no pass or failure marker applies to them).",
+        "",
+        "| Version | Logs | PASS | FAIL | UNCLASSIFIED |",
+        "|---------|------|------|------|--------------|",
+    ]
+    lines += [f"| {k} | {v['logs']} | {v['pass']} | {v['failures']} | {v['unclassified']} |"
+              for k, v in summary.items()]
+    lines += [
+        "",
+        "| File | Kind | Version | Env | Date | Matrix row | Status | Failure markers |",
+        "|------|------|---------|-----|------|------------|--------|-----------------|",
+    ]
+    for r in records:
+        markers = ", ".join(f"`{m}`" for m in r["markers"]) or "—"
+        lines.append(
+            f"| [`{r['file']}`]({r['file']}) | {r['kind']} | {r['version'] if r['version'] is not None else '—'}"
+            f" | {r['env'] or '—'} | {r['date'] or '—'} | {r['matrix_row'] or '—'} | {r['status']} | {markers} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    if path.is_file() and path.read_text() == text:
+        return False
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+    return True
+
+
+def write(records: list[dict]) -> list[Path]:
+    summary = summarize(records)
+    payload = json.dumps({"summary": summary, "files": records}, ensure_ascii=False, indent=2) + "\n"
+    written = []
+    if write_if_changed(OUT_JSON, payload):
+        written.append(OUT_JSON)
+    if write_if_changed(OUT_MD, render_md(records, summary)):
+        written.append(OUT_MD)
+    return written
@@ -0,0 +1,163 @@
+"""Declarative OPS evidence classifier — the rule table behind ``log_ok()``.
+
+Each rule matches log names by glob and lists forbidden markers plus the
+marker sets that make a log pass. A log is scanned once, window by window over
+an mmap; markers drop out of the search as they are found and the scan stops
+at the first forbidden marker.
+"""
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import mmap
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Ci(str):
+    """Marker matched case-insensitively."""
+
+
+class Clause(NamedTuple):
+    all_of: tuple[str, ...]
+    none_of: tuple[str, ...] = ()
+
+
+class Rule(NamedTuple):
+    glob: str
+    pass_when: tuple[Clause, ...]
+    forbid: tuple[str, ...] = ()
+
+
+class Verdict(NamedTuple):
+    ok: bool
+    rule: str
+    stopped_on: str | None
+    seen: frozenset[str]
+
+
+# Forbidden in every log; any hit stops the scan.
+FORBID: tuple[str, ...] = ("FAIL:", "SKIP:", "requires SVP_MYSQL_DSN")
+
+# First matching glob wins; ``{v}`` is the evidence version.
+RULES: tuple[Rule, ...] = (
+    Rule(
+        "soak-24h-*",
+        pass_when=(Clause(("duration=86400", "FAIL count: 0")),),
+    ),
+    Rule(
+        "admin-alerts-*",
+        pass_when=(Clause(("complete exit=0", "[admin-alerts-fire-smoke] OK")),),
+        forbid=("Error",),
+    ),
+    Rule(
+        "*",
+        pass_when=(
+            Clause(("complete exit=0",)),
+            Clause(("health/ready: OK",)),
+            Clause(("Tests:", Ci("passed")), none_of=("FAIL",)),
+            Clause(("§7.1 path parity OK",)),
+            Clause(("docker-smoke-v{v}", "health/ready OK")),
+        ),
+        # import_verify.py without --existing loads the dump into a fresh stand-in: it only matches itself.
+        forbid=("mode=sqlite-load",),
+    ),
+)
+
+RULES_DIGEST = hashlib.sha256(
+    repr([(FORBID, r, [type(m).__name__ for c in r.pass_when for m in c.all_of]) for r in RULES]).encode()
+).hexdigest()[:16]
+
+VERSION_RE = re.compile(r"-v(\d+)(?:\.\w+)?$")
+
+
+def version_of(name: str) -> int | None:
+    m = VERSION_RE.search(name)
+    return int(m.group(1)) if m else None
+
+
+def rule_for(name: str) -> Rule:
+    return next(r for r in RULES if fnmatch.fnmatchcase(name, r.glob))
+
+
+# Scan window; consecutive windows overlap by the longest marker - 1 bytes.
+CHUNK = 1 << 20
+
+
+class _Compiled(NamedTuple):
+    markers: tuple[tuple[str, bytes, bool], ...]
+    stop: frozenset[str]
+    overlap: int
+
+
+@lru_cache(maxsize=None)
+def _compile(rule: Rule, version: int | None) -> _Compiled:
+    stop = list(dict.fromkeys((*FORBID, *rule.forbid)))
+    names: list[str] = []
+    for clause in rule.pass_when:
+        names += [*clause.all_of, *clause.none_of]
+    markers = []
+    # Forbidden markers first so a failing log stops at the earliest window.
+    for name in dict.fromkeys((*stop, *names)):
+        text = name.replace("{v}", str(version)) if version is not None else name
+        icase = isinstance(name, Ci)
+        needle = text.lower().encode() if icase else text.encode()
+        markers.append((name, needle, icase))
+    overlap = max(len(n) for _, n, _ in markers) - 1
+    return _Compiled(tuple(markers), frozenset(stop), overlap)
+
+
+def _scan(buf, compiled: _Compiled) -> tuple[set[str], str | None]:
+    seen: set[str] = set()
+    pending = list(compiled.markers)
+    size = len(buf)
+    start = 0
+    while pending and start < size:
+        window = buf[max(0, start - compiled.overlap):start + CHUNK]
+        lowered = None
+        for item in tuple(pending):
+            name, needle, icase = item
+            if icase:
+                if lowered is None:
+                    lowered = window.lower()
+                hit = needle in lowered
+            else:
+                hit = needle in window
+            if hit:
+                seen.add(name)
+                pending.remove(item)
+                if name in compiled.stop:
+                    return seen, name
+        start += CHUNK
+    return seen, None
+
+
+def classify_bytes(name: str, buf, version: int | None = None) -> Verdict:
+    if version is None:
+        version = version_of(name)
+    rule = rule_for(name)
+    seen, stopped_on = _scan(buf, _compile(rule, version))
+    if stopped_on is not None:
+        return Verdict(False, rule.glob, stopped_on, frozenset(seen))
+    ok = any(
+        all(m in seen for m in c.all_of) and not any(m in seen for m in c.none_of)
+        for c in rule.pass_when
+    )
+    return Verdict(ok, rule.glob, None, frozenset(seen))
+
+
+def classify(path: Path, version: int | None = None) -> Verdict:
+    """Classify one evidence file without loading it into memory."""
+    with path.open("rb") as fh:
+        try:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return classify_bytes(path.name, b"", version)
+        with buf:
+            return classify_bytes(path.name, buf, version)
+
+
+def log_ok(path: Path, version: int | None = None) -> bool:
+    return path.is_file() and classify(path, version).ok
@@ -0,0 +1,252 @@
+"""Versioned §14+§16 gap-matrix engine — shared by generate-matrix.py and the sync tools.
+
+Per-release differences live in the data tables below (``{v}`` is the target
+version); evidence status is cached on disk by content hash so a rebuild only
+re-evaluates OPS rows whose logs changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import evidence_rules
+
+ROOT = Path(__file__).resolve().parents[2]
+DOCS = ROOT / "docs"
+EVID = DOCS / "evidence"
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+CACHE = CACHE_DIR / "gap-matrix.json"
+
+# Cached verdicts are dropped whenever the rule table changes.
+RULES_VERSION = evidence_rules.RULES_DIGEST
+
+# Matrix row # → evidence log stem; the log is ``{stem}-v{v}.log``.
+OPS_ROW_LOG: dict[int, str] = {
+    120: "docker-smoke",
+    135: "staging-buy-flow",
+    143: "reseller-webhook",
+    144: "relay-forward",
+    145: "relay-webhook-set",
+    146: "relay-control-center",
+    150: "backup-restore-staging",
+    153: "import-run",
+    154: "import-verify",
+    155: "phase16-parallel",
+    156: "soak-24h",
+    157: "admin-alerts",
+    158: "wp-disable",
+}
+
+PHPUNIT_OPS_FIX: dict[int, str] = {
+    120: "ParityMigrationMysqlTest + docker-smoke-v{v}",
+    157: "admin-alerts-fire-smoke-v{v}",
+}
+
+CRIT_FIXES: dict[str, str] = {
+    "نمودار وضعیت پنل‌ها real-time refresh": "نمودار وضعیت پنل‌ها refresh (SPA polling 60s + manual refresh — v24 amendment; not WebSocket)",
+    "نمودار وضعیت پنل‌ها refresh (SPA polling 60s + manual refresh — v24 amendment)": "نمودار وضعیت پنل‌ها refresh (SPA polling 60s + manual refresh — v24 amendment; not WebSocket)",
+    "crypto settings فقط با MODULE_CRYPTO_ENABLED": "crypto settings فقط با `SVP_MODULE_CRYPTO=true`",
+    "crypto settings فقط با SVP_MODULE_CRYPTO=true": "crypto settings فقط با `SVP_MODULE_CRYPTO=true`",
+    "tab مخفی وقتی `MODULE_L2TP_ENABLED=false`": "tab مخفی وقتی `SVP_MODULE_L2TP=false`",
+    "tab مخفی وقتی SVP_MODULE_L2TP=false": "tab مخفی وقتی `SVP_MODULE_L2TP=false`",
+}
+
+STATUSES = ("DONE", "OPS", "PARTIAL", "OPEN")
+
+
+def matrix_path(version: int) -> Path:
+    return DOCS / f"SECTION14-GAP-MATRIX-V{version}-FA.md"
+
+
+def ops_row_log(version: int) -> dict[int, str]:
+    return {num: f"{stem}-v{version}.log" for num, stem in OPS_ROW_LOG.items()}
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def load_cache() -> dict:
+    try:
+        data = json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {"rules": RULES_VERSION, "files": {}}
+    if data.get("rules") != RULES_VERSION:
+        return {"rules": RULES_VERSION, "files": {}}
+    data.setdefault("files", {})
+    return data
+
+
+def save_cache(cache: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, ensure_ascii=False, sort_keys=True))
+    os.replace(tmp, CACHE)
+
+
+class EvidenceCache:
+    """Evidence verdicts keyed by content hash; stat() short-circuits the hash."""
+
+    def __init__(self, cache: dict):
+        self.cache = cache
+        self.files: dict[str, dict] = cache["files"]
+        self.evaluated: list[str] = []
+
+    def status(self, path: Path, evaluate) -> bool:
+        key = str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            self.files.pop(key, None)
+            return False
+        entry = self.files.get(key)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return entry["ok"]
+        digest = file_digest(path)
+        if entry and entry["sha256"] == digest:
+            ok = entry["ok"]
+        else:
+            ok = evaluate(path)
+            self.evaluated.append(path.name)
+        self.files[key] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "ok": ok,
+        }
+        return ok
+
+
+def split_row(line: str) -> list[str]:
+    return [p.strip() for p in line.strip().strip("|").split("|")]
+
+
+def parse_matrix(text: str) -> tuple[list[str], list[dict]]:
+    """Return (column headers, rows) of the numbered criterion table."""
+    columns: list[str] = []
+    rows: list[dict] = []
+    for line in text.splitlines():
+        if line.startswith("| # |"):
+            columns = split_row(line)
+            continue
+        if not line.startswith("| ") or " | L" not in line:
+            continue
+        cells = split_row(line)
+        if len(cells) < 5 or not cells[1].startswith("L"):
+            continue
+        try:
+            num = int(cells[0])
+        except ValueError:
+            continue
+        rows.append({
+            "num": num,
+            "line": cells[1],
+            "status": cells[2],
+            "crit": cells[3],
+            "cells": cells[4:],
+        })
+    return columns, rows
+
+
+def load_source(path: Path, cache: dict) -> tuple[list[str], list[dict]]:
+    """Parse the previous matrix once per content hash."""
+    st = path.stat()
+    key = str(path.relative_to(ROOT))
+    entry = cache.get("sources", {}).get(key)
+    if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+        return entry["columns"], entry["rows"]
+    digest = file_digest(path)
+    if entry and entry["sha256"] == digest:
+        columns, rows = entry["columns"], entry["rows"]
+    else:
+        columns, rows = parse_matrix(path.read_text())
+    cache.setdefault("sources", {})[key] = {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": digest,
+        "columns": columns,
+        "rows": rows,
+    }
+    return columns, rows
+
+
+def build_rows(columns: list[str], rows: list[dict], version: int, evidence: EvidenceCache) -> list[dict]:
+    logs = ops_row_log(version)
+    extra = columns[4:] if len(columns) > 4 else []
+    phpunit_idx = next((i for i, c in enumerate(extra) if c.startswith("PHPUnit")), None)
+
+    def evaluate(path: Path) -> bool:
+        return evidence_rules.classify(path, version).ok
+
+    out: list[dict] = []
+    for r in rows:
+        cells = list(r["cells"])
+        ops_log = logs.get(r["num"])
+        if ops_log:
+            status = "DONE" if evidence.status(EVID / ops_log, evaluate) else "OPS"
+            cells[-1] = f"evidence/{ops_log}"
+            if r["num"] in PHPUNIT_OPS_FIX and phpunit_idx is not None:
+                cells[phpunit_idx] = PHPUNIT_OPS_FIX[r["num"]].format(v=version)
+        else:
+            status = "DONE"
+        out.append({
+            "num": r["num"],
+            "line": r["line"],
+            "status": status,
+            "crit": CRIT_FIXES.get(r["crit"], r["crit"]),
+            "cells": cells,
+        })
+    return out
+
+
+def render(columns: list[str], rows: list[dict], version: int, operator_date: str) -> str:
+    done = sum(1 for r in rows if r["status"] == "DONE")
+    ops = len(rows) - done
+    header = f"""# §14 + §16 — ماتریس شکاف v{version} ({done}/{len(rows)} DONE)
+
+مبنا: [`LARAVEL-BACKEND-SPEC-FA.md`](LARAVEL-BACKEND-SPEC-FA.md)
+
+| وضعیت | تعداد |
+|--------|-------|
+| DONE | {done} |
+| OPS | {ops} |
+| PARTIAL | 0 |
+| OPEN | 0 |
+
+> **v{version}:** OPS rows flip to DONE when `docs/evidence/*-v{version}.log` passes strict `log_ok()` (no FAIL/SKIP).
+
+| {" | ".join(columns)} |
+|{"|".join("-" * (len(c) + 2) for c in columns)}|
+"""
+    body = "\n".join(
+        "| " + " | ".join([str(r["num"]), r["line"], r["status"], r["crit"], *r["cells"]]) + " |"
+        for r in rows
+    )
+    footer = f"\n\nOperator / date: {operator_date} (v{version} — {ops} OPS pending live verify)\n"
+    return header + body + footer
+
+
+def generate(version: int, operator_date: str, source: int | None = None) -> dict:
+    """Build matrix v{version} from v{source} (default version - 1); write only on change."""
+    src = matrix_path(source if source is not None else version - 1)
+    out = matrix_path(version)
+    cache = load_cache()
+    evidence = EvidenceCache(cache)
+    columns, rows = load_source(src, cache)
+    built = build_rows(columns, rows, version, evidence)
+    text = render(columns, built, version, operator_date)
+    changed = not out.is_file() or out.read_text() != text
+    if changed:
+        out.write_text(text)
+    save_cache(cache)
+    done = sum(1 for r in built if r["status"] == "DONE")
+    return {
+        "out": out,
+        "done": done,
+        "ops": len(built) - done,
+        "changed": changed,
+        "evaluated": evidence.evaluated,
+    }
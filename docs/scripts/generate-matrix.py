@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Generate SECTION14-GAP-MATRIX-V{N}-FA.md — DONE/OPS from v{N} evidence logs.
+
+Usage: python3 docs/scripts/generate-matrix.py 29 [--from 28] [--date 2026-07-20]
+"""
+import argparse
+import datetime
+import time
+
+import gap_matrix
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("version", type=int, help="target matrix version (e.g. 29)")
+parser.add_argument("--from", dest="source", type=int, help="source matrix version (default: version - 1)")
+parser.add_argument("--date", default=datetime.date.today().isoformat(), help="operator / date footer")
+args = parser.parse_args()
+
+started = time.perf_counter()
+result = gap_matrix.generate(args.version, args.date, args.source)
+elapsed = (time.perf_counter() - started) * 1000
+state = "Wrote" if result["changed"] else "Unchanged"
+print(
+    f"{state} {result['out'].relative_to(gap_matrix.ROOT)} — {result['done']} DONE / {result['ops']} OPS"
+    f" (re-evaluated {len(result['evaluated'])} logs, {elapsed:.1f}ms)"
+)
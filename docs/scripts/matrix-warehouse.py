@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""SQLite warehouse of every gap-matrix version + evidence file (docs/scripts/.cache/gap-matrix.sqlite).
+
+Usage:
+  python3 docs/scripts/matrix-warehouse.py ingest
+  python3 docs/scripts/matrix-warehouse.py history 156
+  python3 docs/scripts/matrix-warehouse.py search 'soak OR alerting' [--version 28]
+  python3 docs/scripts/matrix-warehouse.py audit 28
+"""
+import argparse
+import json
+import time
+
+import matrix_warehouse
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0], formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 epilog="\n".join(__doc__.splitlines()[2:]))
+sub = parser.add_subparsers(dest="cmd", required=True)
+sub.add_parser("ingest", help="load new/changed matrix versions and evidence metadata")
+p = sub.add_parser("history", help="status of one numbered row across versions")
+p.add_argument("num", type=int)
+p = sub.add_parser("search", help="FTS5 query over criterion text")
+p.add_argument("query")
+p.add_argument("--version", type=int)
+p = sub.add_parser("audit", help="rows whose status disagrees with their log's verdict")
+p.add_argument("version", type=int)
+args = parser.parse_args()
+
+conn = matrix_warehouse.connect()
+started = time.perf_counter()
+
+if args.cmd == "ingest":
+    versions, evidence = matrix_warehouse.ingest(conn)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"Ingested matrix versions {versions or 'none'}; {evidence} evidence change(s) ({elapsed:.1f}ms)")
+elif args.cmd == "history":
+    history = matrix_warehouse.row_history(conn, args.num)
+    elapsed = (time.perf_counter() - started) * 1000
+    for h in history:
+        markers = ", ".join(json.loads(h["log_markers"])) if h["log_markers"] else ""
+        print(f"v{h['version']:<3} L{h['line_ref']:<5} {h['status'] or '—':<7} {h['ops_log'] or '—':<36} "
+              f"{h['log_status'] or '—'} {markers}")
+    for version, before, after in matrix_warehouse.flips(history):
+        print(f"flip v{version}: {before} → {after}")
+    print(f"({len(history)} versions, {elapsed:.2f}ms)")
+elif args.cmd == "search":
+    hits = matrix_warehouse.search(conn, args.query, args.version)
+    elapsed = (time.perf_counter() - started) * 1000
+    for h in hits:
+        print(f"v{h['version']:<3} {h['row_key']:<8} {h['status'] or '—':<7} {h['criterion']}")
+    print(f"({len(hits)} hits, {elapsed:.2f}ms)")
+else:
+    rows = matrix_warehouse.audit(conn, args.version)
+    elapsed = (time.perf_counter() - started) * 1000
+    for r in rows:
+        print(f"row {r['num']}: matrix {r['status']} but {r['ops_log']} is {r['log_status'] or 'MISSING'}")
+    print(f"({len(rows)} mismatches, {elapsed:.2f}ms)")
@@ -0,0 +1,237 @@
+"""SQLite warehouse of every SECTION14-GAP-MATRIX-V*-FA.md version plus the
+evidence index, so row history and audits are indexed queries instead of
+grepping markdown.
+
+Ingest is incremental: a matrix version is re-parsed only when its sha256
+changes (and dropped when its file is gone), and evidence rows come from
+``evidence_index.build()`` (itself cached) and are upserted only when the
+record differs — a new file hash, or a new verdict after the rule table or
+index schema changed.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from pathlib import Path
+
+import evidence_index
+from gap_matrix import CACHE_DIR, DOCS, STATUSES, file_digest, split_row
+
+DB = CACHE_DIR / "gap-matrix.sqlite"
+MATRIX_RE = re.compile(r"SECTION14-GAP-MATRIX-V(\d+)-FA\.md$")
+LINE_RE = re.compile(r"^L(\d+)$")
+LOG_RE = re.compile(r"([\w.-]+\.log)")
+CRITERION_HEADERS = ("Spec criterion", "Checkbox", "Spec", "اقدام")
+EVIDENCE_COLUMNS = ("file", "stem", "kind", "version", "env", "date", "matrix_row", "status", "markers", "sha256")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matrix_versions (
+    version INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    done INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matrix_rows (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL REFERENCES matrix_versions(version) ON DELETE CASCADE,
+    row_key TEXT NOT NULL,
+    num INTEGER,
+    line_ref INTEGER,
+    status TEXT,
+    criterion TEXT NOT NULL,
+    ops_log TEXT,
+    cells TEXT NOT NULL,
+    UNIQUE (version, row_key)
+);
+CREATE INDEX IF NOT EXISTS matrix_rows_num ON matrix_rows (num, version);
+CREATE INDEX IF NOT EXISTS matrix_rows_status ON matrix_rows (status, version);
+CREATE INDEX IF NOT EXISTS matrix_rows_version ON matrix_rows (version, status);
+CREATE VIRTUAL TABLE IF NOT EXISTS criteria_fts USING fts5 (
+    criterion, content='matrix_rows', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS matrix_rows_ai AFTER INSERT ON matrix_rows BEGIN
+    INSERT INTO criteria_fts (rowid, criterion) VALUES (new.id, new.criterion);
+END;
+CREATE TRIGGER IF NOT EXISTS matrix_rows_ad AFTER DELETE ON matrix_rows BEGIN
+    INSERT INTO criteria_fts (criteria_fts, rowid, criterion) VALUES ('delete', old.id, old.criterion);
+END;
+CREATE TABLE IF NOT EXISTS evidence_files (
+    file TEXT PRIMARY KEY,
+    stem TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version INTEGER,
+    env TEXT,
+    date TEXT,
+    matrix_row INTEGER,
+    status TEXT NOT NULL,
+    markers TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_files_version ON evidence_files (version, stem);
+CREATE INDEX IF NOT EXISTS evidence_files_row ON evidence_files (matrix_row, version);
+CREATE INDEX IF NOT EXISTS evidence_files_status ON evidence_files (status, version);
+"""
+
+
+def connect(path: Path = DB) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def parse_rows(text: str) -> list[dict]:
+    """Rows of every table in one matrix file, old (ID/v18) and new (#/Line) layouts."""
+    rows: list[dict] = []
+    columns: list[str] = []
+    for line in text.splitlines():
+        if not line.startswith("|"):
+            columns = []
+            continue
+        cells = split_row(line)
+        if not columns:
+            columns = cells
+            continue
+        if all(set(c) <= set("-: ") for c in cells) or not cells[0]:
+            continue
+        status = next((c for c in cells if c in STATUSES), None)
+        crit_idx = next((columns.index(h) for h in CRITERION_HEADERS if h in columns), 1)
+        crit_idx = min(crit_idx, len(cells) - 1)
+        line_ref = next((int(m.group(1)) for c in cells[:3] if (m := LINE_RE.match(c))), None)
+        ops = next((m.group(1) for c in reversed(cells) if (m := LOG_RE.search(c))), None)
+        rows.append({
+            "row_key": cells[0],
+            "num": int(cells[0]) if cells[0].isdigit() else None,
+            "line_ref": line_ref,
+            "status": status,
+            "criterion": cells[crit_idx],
+            "ops_log": ops,
+            "cells": cells,
+        })
+    if any(r["num"] is not None and r["line_ref"] is not None for r in rows):
+        # v22+: only the numbered criterion table is the matrix; the rest is summary.
+        rows = [r for r in rows if r["num"] is not None and r["line_ref"] is not None]
+    deduped: dict[str, dict] = {}
+    for r in rows:
+        deduped.setdefault(r["row_key"], r)
+    return list(deduped.values())
+
+
+def ingest_matrices(conn: sqlite3.Connection) -> list[int]:
+    known = {r["version"]: r["sha256"] for r in conn.execute("SELECT version, sha256 FROM matrix_versions")}
+    changed: list[int] = []
+    present: set[int] = set()
+    for path in sorted(DOCS.glob("SECTION14-GAP-MATRIX-V*-FA.md")):
+        m = MATRIX_RE.search(path.name)
+        if not m:
+            continue
+        version = int(m.group(1))
+        present.add(version)
+        digest = file_digest(path)
+        if known.get(version) == digest:
+            continue
+        rows = parse_rows(path.read_text())
+        conn.execute("DELETE FROM matrix_versions WHERE version = ?", (version,))
+        conn.execute(
+            "INSERT INTO matrix_versions (version, file, sha256, rows, done) VALUES (?, ?, ?, ?, ?)",
+            (version, path.name, digest, len(rows), sum(1 for r in rows if r["status"] == "DONE")),
+        )
+        conn.executemany(
+            "INSERT INTO matrix_rows (version, row_key, num, line_ref, status, criterion, ops_log, cells)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (version, r["row_key"], r["num"], r["line_ref"], r["status"], r["criterion"], r["ops_log"],
+                 json.dumps(r["cells"], ensure_ascii=False))
+                for r in rows
+            ],
+        )
+        changed.append(version)
+    gone = sorted(set(known) - present)
+    if gone:
+        conn.executemany("DELETE FROM matrix_versions WHERE version = ?", [(v,) for v in gone])
+    return changed
+
+
+def ingest_evidence(conn: sqlite3.Connection) -> int:
+    records, _ = evidence_index.build()
+    columns = ", ".join(EVIDENCE_COLUMNS)
+    known = {r["file"]: tuple(r) for r in conn.execute(f"SELECT {columns} FROM evidence_files")}
+    rows = [{**r, "markers": json.dumps(r["markers"], ensure_ascii=False)} for r in records]
+    current = {r["file"] for r in rows}
+    stale = [(f,) for f in known if f not in current]
+    if stale:
+        conn.executemany("DELETE FROM evidence_files WHERE file = ?", stale)
+    # Whole-record compare: a rule or schema change re-classifies a log without touching its hash.
+    upserts = [r for r in rows if known.get(r["file"]) != tuple(r[c] for c in EVIDENCE_COLUMNS)]
+    conn.executemany(
+        f"INSERT OR REPLACE INTO evidence_files ({columns})"
+        f" VALUES ({', '.join(':' + c for c in EVIDENCE_COLUMNS)})",
+        upserts,
+    )
+    return len(upserts) + len(stale)
+
+
+def ingest(conn: sqlite3.Connection) -> tuple[list[int], int]:
+    with conn:
+        versions = ingest_matrices(conn)
+        evidence = ingest_evidence(conn)
+    return versions, evidence
+
+
+def row_history(conn: sqlite3.Connection, num: int) -> list[sqlite3.Row]:
+    """Per-version status of one numbered row, with the log's evidence verdict."""
+    return conn.execute(
+        """
+        SELECT m.version, m.line_ref, m.status, m.criterion, m.ops_log,
+               e.status AS log_status, e.markers AS log_markers
+        FROM matrix_rows m
+        LEFT JOIN evidence_files e ON e.file = m.ops_log
+        WHERE m.num = ?
+        ORDER BY m.version
+        """,
+        (num,),
+    ).fetchall()
+
+
+def flips(history: list[sqlite3.Row]) -> list[tuple[int, str | None, str | None]]:
+    """(version, from, to) for every status change along a row's history."""
+    out = []
+    prev = None
+    for h in history:
+        if prev is not None and h["status"] != prev:
+            out.append((h["version"], prev, h["status"]))
+        prev = h["status"]
+    return out
+
+
+def search(conn: sqlite3.Connection, query: str, version: int | None = None) -> list[sqlite3.Row]:
+    sql = """
+        SELECT m.version, m.row_key, m.status, m.criterion, m.ops_log
+        FROM criteria_fts f JOIN matrix_rows m ON m.id = f.rowid
+        WHERE criteria_fts MATCH ?
+    """
+    params: list = [query]
+    if version is not None:
+        sql += " AND m.version = ?"
+        params.append(version)
+    return conn.execute(sql + " ORDER BY m.version DESC, m.num", params).fetchall()
+
+
+def audit(conn: sqlite3.Connection, version: int) -> list[sqlite3.Row]:
+    """Rows whose matrix status disagrees with their log's current verdict."""
+    return conn.execute(
+        """
+        SELECT m.num, m.status, m.ops_log, e.status AS log_status
+        FROM matrix_rows m
+        LEFT JOIN evidence_files e ON e.file = m.ops_log
+        WHERE m.version = ? AND m.ops_log IS NOT NULL
+          AND ((m.status = 'DONE') != (coalesce(e.status, 'MISSING') = 'PASS'))
+        ORDER BY m.num
+        """,
+        (version,),
+    ).fetchall()
@@ -0,0 +1,160 @@
+"""Columnar store for ``observability-48h-*.log`` scrapes.
+
+Each scrape window becomes one row across typed arrays (file, target,
+window index, up flag, error rate %, samples); file and target names are
+interned once. Rolling means and rising-run detection work on whole columns —
+with NumPy when it is installed, otherwise over the same ``array`` buffers.
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional; the array fallback gives identical results
+    np = None
+
+TARGET_RE = re.compile(
+    rb"target=(\S+) status=(\S+) error_rate=([\d.]+)%(?: samples=(\d+))?"
+)
+# Pre-v23 logs carry a single aggregate figure instead of per-window lines.
+LEGACY_RES: tuple[tuple[str, re.Pattern[bytes], float], ...] = (
+    ("admin-mutate", re.compile(rb"Error rate /api/v1/admin/mutate: ([\d.]+)%"), 1.0),
+    ("admin-mutate", re.compile(rb"/api/v1/admin/mutate error_rate: ([\d.]+)%"), 1.0),
+    ("aggregate", re.compile(rb"error_rate_5m=([\d.]+)"), 100.0),
+)
+
+
+class ObservabilityStore:
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self.targets: list[str] = []
+        self._target_ids: dict[str, int] = {}
+        self.file_id = array("H")
+        self.target_id = array("H")
+        self.window = array("I")
+        self.up = array("B")
+        self.error_rate = array("f")
+        self.samples = array("I")
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    def _target(self, name: str) -> int:
+        tid = self._target_ids.get(name)
+        if tid is None:
+            tid = self._target_ids[name] = len(self.targets)
+            self.targets.append(name)
+        return tid
+
+    def _append(self, fid: int, target: str, window: int, up: bool, rate: float, samples: int) -> None:
+        self.file_id.append(fid)
+        self.target_id.append(self._target(target))
+        self.window.append(window)
+        self.up.append(up)
+        self.error_rate.append(rate)
+        self.samples.append(samples)
+
+    def load(self, path: Path) -> int:
+        """Append one log's windows; returns the number of rows added."""
+        fid = len(self.files)
+        self.files.append(path.name)
+        windows: dict[bytes, int] = {}
+        added = 0
+        with path.open("rb") as fh:
+            for line in fh:
+                m = TARGET_RE.search(line)
+                if m:
+                    n = windows.get(m.group(1), 0)
+                    windows[m.group(1)] = n + 1
+                    self._append(fid, m.group(1).decode(), n, m.group(2) == b"up",
+                                 float(m.group(3)), int(m.group(4) or 0))
+                    added += 1
+                    continue
+                for target, pattern, scale in LEGACY_RES:
+                    m = pattern.search(line)
+                    if m:
+                        self._append(fid, target, 0, True, float(m.group(1)) * scale, 0)
+                        added += 1
+                        break
+        return added
+
+    def series(self) -> dict[tuple[int, int], array]:
+        """Row indices per (file, target), in window order."""
+        out: dict[tuple[int, int], array] = {}
+        for i, key in enumerate(zip(self.file_id, self.target_id)):
+            out.setdefault(key, array("I")).append(i)
+        return out
+
+    def column(self, name: str, rows: array) -> array:
+        col = getattr(self, name)
+        return array(col.typecode, (col[i] for i in rows))
+
+
+def rolling_mean(values: array, width: int) -> list[float]:
+    """Trailing mean; the first width-1 points average what is available."""
+    if not values:
+        return []
+    if np is not None:
+        v = np.frombuffer(values, dtype=np.float32).astype(np.float64)
+        c = np.concatenate(([0.0], np.cumsum(v)))
+        idx = np.arange(1, len(v) + 1)
+        lo = np.maximum(idx - width, 0)
+        return ((c[idx] - c[lo]) / (idx - lo)).tolist()
+    out: list[float] = []
+    total = 0.0
+    for i, x in enumerate(values):
+        total += x
+        if i >= width:
+            total -= values[i - width]
+        out.append(total / min(i + 1, width))
+    return out
+
+
+def rising_runs(values: array, min_steps: int) -> list[tuple[int, int]]:
+    """(start, end) window spans where the rate rose strictly at every step."""
+    if len(values) < 2:
+        return []
+    if np is not None:
+        up = np.diff(np.frombuffer(values, dtype=np.float32)) > 0
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], up.astype(np.int8), [0]))))
+        spans = zip(edges[::2].tolist(), edges[1::2].tolist())
+    else:
+        spans = []
+        start = None
+        for i in range(1, len(values)):
+            rising = values[i] > values[i - 1]
+            if rising and start is None:
+                start = i - 1
+            elif not rising and start is not None:
+                spans.append((start, i - 1))
+                start = None
+        if start is not None:
+            spans.append((start, len(values) - 1))
+    return [(s, e) for s, e in spans if e - s >= min_steps]
+
+
+def trends(store: ObservabilityStore, width: int = 3, min_steps: int = 3) -> list[dict]:
+    report: list[dict] = []
+    for (fid, tid), rows in store.series().items():
+        rates = store.column("error_rate", rows)
+        mean = rolling_mean(rates, width)
+        runs = rising_runs(rates, min_steps)
+        report.append({
+            "file": store.files[fid],
+            "target": store.targets[tid],
+            "windows": len(rows),
+            "down_windows": len(rows) - sum(store.column("up", rows)),
+            "first": round(rates[0], 4),
+            "last": round(rates[-1], 4),
+            "max": round(max(rates), 4),
+            "rolling_last": round(mean[-1], 4),
+            "rolling_delta": round(mean[-1] - mean[0], 4),
+            "rising": [
+                {"from_window": s, "to_window": e, "from": round(rates[s], 4), "to": round(rates[e], 4)}
+                for s, e in runs
+            ],
+        })
+    return report
@@ -0,0 +1,125 @@
+"""Soak-log time series — parse ``soak-24h.sh`` output and measure what the
+``duration=86400`` / ``FAIL count: 0`` check cannot see: missing polls,
+uptime, outages and MTTR.
+
+A log may hold several runs (each ``soak start`` line opens one). Each run is
+stored as two parallel arrays, one slot per poll: epoch seconds and a
+0/1 "every probed path was OK" flag.
+"""
+from __future__ import annotations
+
+import calendar
+import re
+from array import array
+from pathlib import Path
+
+START_RE = re.compile(rb"soak start base=(\S+) interval=(\d+)s duration=(\d+)s")
+POLL_RE = re.compile(rb"^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ) (OK|FAIL) (\S+)")
+FOOTER_RE = re.compile(rb"FAIL count: (\d+)")
+# A gap counts as missed polls once it exceeds this many intervals.
+GAP_TOLERANCE = 1.5
+
+
+class SoakRun:
+    __slots__ = ("base", "interval", "duration", "ts", "ok", "probes", "failed_probes", "footer_fails")
+
+    def __init__(self, base: str, interval: int, duration: int):
+        self.base = base
+        self.interval = interval
+        self.duration = duration
+        self.ts = array("q")
+        self.ok = array("B")
+        self.probes = 0
+        self.failed_probes = 0
+        self.footer_fails: int | None = None
+
+    def add(self, epoch: int, ok: bool) -> None:
+        self.probes += 1
+        self.failed_probes += not ok
+        if self.ts and self.ts[-1] == epoch:
+            self.ok[-1] &= ok
+        else:
+            self.ts.append(epoch)
+            self.ok.append(ok)
+
+
+def _epoch(s: bytes) -> int:
+    return calendar.timegm((int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19])))
+
+
+def parse(path: Path) -> list[SoakRun]:
+    runs: list[SoakRun] = []
+    seen: set[tuple[bytes, bytes]] = set()
+    run: SoakRun | None = None
+    with path.open("rb") as fh:
+        for line in fh:
+            m = POLL_RE.match(line)
+            if m:
+                if run is None:
+                    continue
+                key = (m.group(1), m.group(3))
+                if key in seen:  # `tee -a` into the same file doubles every line
+                    continue
+                seen.add(key)
+                run.add(_epoch(m.group(1)), m.group(2) == b"OK")
+                continue
+            m = START_RE.search(line)
+            if m:
+                run = SoakRun(m.group(1).decode(), int(m.group(2)), int(m.group(3)))
+                runs.append(run)
+                seen.clear()
+                continue
+            m = FOOTER_RE.search(line)
+            if m and run is not None:
+                run.footer_fails = int(m.group(1))
+    return [r for r in runs if r.ts or r.footer_fails is not None]
+
+
+def analyze(run: SoakRun) -> dict:
+    interval = run.interval
+    expected = -(-run.duration // interval) if interval else 0
+    polls = len(run.ts)
+    missing = 0
+    longest_gap = 0
+    outages: list[int] = []
+    down_since: int | None = None
+    prev: int | None = None
+    for epoch, ok in zip(run.ts, run.ok):
+        if prev is not None:
+            gap = epoch - prev
+            if gap > interval * GAP_TOLERANCE:
+                missing += round(gap / interval) - 1
+                longest_gap = max(longest_gap, gap)
+        if not ok and down_since is None:
+            down_since = epoch
+        elif ok and down_since is not None:
+            outages.append(epoch - down_since)
+            down_since = None
+        prev = epoch
+    if down_since is not None and prev is not None:
+        outages.append(prev + interval - down_since)
+    missing = max(missing, expected - polls)
+    ok_polls = sum(run.ok)
+    span = run.ts[-1] - run.ts[0] + interval if polls else 0
+    return {
+        "base": run.base,
+        "interval": interval,
+        "duration": run.duration,
+        "expected_polls": expected,
+        "polls": polls,
+        "missing_polls": missing,
+        "covered_sec": span,
+        "uptime": ok_polls / max(expected, polls) if polls else 0.0,
+        "failed_probes": run.failed_probes,
+        "footer_fails": run.footer_fails,
+        "outages": len(outages),
+        "longest_outage_sec": max(outages, default=0),
+        "mttr_sec": sum(outages) / len(outages) if outages else 0.0,
+        "longest_gap_sec": longest_gap,
+        "healthy": (
+            run.duration >= 86400
+            and missing == 0
+            and not outages
+            and run.footer_fails == 0
+        ),
+    }
@@ -1,33 +1,123 @@
 #!/usr/bin/env python3
-"""Sync LARAVEL-BACKEND-SPEC-FA.md checkboxes from SECTION14-GAP-MATRIX-V28-FA.md (v28)."""
+"""Sync LARAVEL-BACKEND-SPEC-FA.md checkboxes from SECTION14-GAP-MATRIX-V{N}-FA.md.
+
+Usage: python3 docs/scripts/sync-spec-from-matrix.py [--version N] [--check]
+
+Matrix rows are matched to spec checkboxes by line reference first (the
+``L123`` column, corrected for the drift learned from neighbouring matches),
+then by normalized criterion text (CRIT_FIXES aliases fold to one key). Only
+checkbox ticks that differ are patched, and the spec is rewritten atomically
+only when its content changes — cheap enough to run after every matrix build.
+"""
+import argparse
+import os
 import re
-from pathlib import Path
+import sys
+import unicodedata
 
-ROOT = Path(__file__).resolve().parents[1]
-SPEC = ROOT / "docs/LARAVEL-BACKEND-SPEC-FA.md"
-MATRIX = ROOT / "docs/SECTION14-GAP-MATRIX-V28-FA.md"
+import gap_matrix
 
-status_by_text: dict[str, str] = {}
-for line in MATRIX.read_text().splitlines():
-    m = re.match(r"\| \d+ \| L\d+ \| (DONE|OPS|PARTIAL|OPEN) \| (.+?) \|", line)
-    if m:
-        status_by_text[m.group(2).strip()] = m.group(1)
+SPEC = gap_matrix.DOCS / "LARAVEL-BACKEND-SPEC-FA.md"
+CHECKBOX_RE = re.compile(r"^- \[([ x])\] (.+)$")
+WS_RE = re.compile(r"\s+")
+
+
+def latest_version() -> int:
+    found = [int(m.group(1)) for p in gap_matrix.DOCS.glob("SECTION14-GAP-MATRIX-V*-FA.md")
+             if (m := re.search(r"-V(\d+)-FA", p.name))]
+    return max(found)
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKC", gap_matrix.CRIT_FIXES.get(text, text))
+    return WS_RE.sub(" ", text.replace("`", "")).strip().casefold()
+
+
+def line_ref(row: dict) -> int:
+    return int(row["line"].lstrip("L"))
 
-lines = SPEC.read_text().splitlines()
-out: list[str] = []
-synced = 0
-for line in lines:
-    m = re.match(r"^- \[([ x])\] (.+)$", line)
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--version", type=int, help="matrix version (default: newest on disk)")
+parser.add_argument("--check", action="store_true", help="report drift, exit 1 if the spec would change")
+args = parser.parse_args()
+
+version = args.version or latest_version()
+matrix = gap_matrix.matrix_path(version)
+_, rows = gap_matrix.load_source(matrix, cache := gap_matrix.load_cache())
+gap_matrix.save_cache(cache)
+
+lines = SPEC.read_text().splitlines(keepends=True)
+boxes: dict[int, tuple[str, str]] = {}  # 1-based line → (tick, normalized text)
+by_text: dict[str, list[int]] = {}
+for n, line in enumerate(lines, 1):
+    m = CHECKBOX_RE.match(line.rstrip("\n"))
     if m:
-        crit = m.group(2).strip()
-        st = status_by_text.get(crit)
-        if st:
-            tick = "x" if st == "DONE" else " "
-            out.append(f"- [{tick}] {crit}")
-            synced += 1
-            continue
-    out.append(line)
-
-SPEC.write_text("\n".join(out) + "\n")
-done = sum(1 for s in status_by_text.values() if s == "DONE")
-print(f"Synced {synced} checkboxes: {done} DONE")
+        key = normalize(m.group(2).strip())
+        boxes[n] = (m.group(1), key)
+        by_text.setdefault(key, []).append(n)
+matrix_keys = {normalize(r["crit"]) for r in rows}
+
+claimed: dict[int, dict] = {}
+row_line: dict[int, int] = {}  # row index → matched spec line
+how = {"line": 0, "text": 0, "line-edited": 0}
+deferred: list[int] = []
+drift = 0
+for i, r in enumerate(rows):
+    ref = line_ref(r)
+    key = normalize(r["crit"])
+    target = ref + drift
+    if target in boxes and target not in claimed and boxes[target][1] == key:
+        how["line"] += 1
+    elif free := [n for n in by_text.get(key, ()) if n not in claimed]:
+        target = free[0]
+        drift = target - ref
+        how["text"] += 1
+    else:
+        deferred.append(i)
+        continue
+    claimed[target] = r
+    row_line[i] = target
+
+# Criterion text edited on one side only: take the checkbox nearest the
+# drift-corrected line ref, between the neighbouring matches, whose text
+# belongs to no other matrix row.
+unmatched: list[dict] = []
+for i in deferred:
+    r = rows[i]
+    prev = max((j for j in row_line if j < i), default=None)
+    nxt = min((j for j in row_line if j > i), default=None)
+    lo = row_line[prev] if prev is not None else 0
+    hi = row_line[nxt] if nxt is not None else len(lines) + 1
+    expected = line_ref(r) + (row_line[prev] - line_ref(rows[prev]) if prev is not None else 0)
+    candidates = [n for n in range(lo + 1, hi) if n in boxes and n not in claimed and boxes[n][1] not in matrix_keys]
+    if candidates:
+        target = min(candidates, key=lambda n: abs(n - expected))
+        claimed[target] = r
+        row_line[i] = target
+        how["line-edited"] += 1
+    else:
+        unmatched.append(r)
+
+patched = 0
+for n, r in claimed.items():
+    tick = "x" if r["status"] == "DONE" else " "
+    if boxes[n][0] != tick:
+        lines[n - 1] = lines[n - 1].replace(f"- [{boxes[n][0]}]", f"- [{tick}]", 1)
+        patched += 1
+
+done = sum(1 for r in rows if r["status"] == "DONE")
+print(
+    f"Matrix v{version}: {len(rows)} rows ({done} DONE) → {len(claimed)} checkboxes "
+    f"(line {how['line']}, text {how['text']}, edited text {how['line-edited']}); "
+    f"{patched} tick(s) {'to patch' if args.check else 'patched'}"
+)
+for r in unmatched:
+    print(f"  unmatched row {r['num']} {r['line']}: {r['crit']}", file=sys.stderr)
+
+if args.check:
+    sys.exit(1 if patched else 0)
+if patched:
+    tmp = SPEC.with_name(f".{SPEC.name}.tmp")
+    tmp.write_text("".join(lines))
+    os.replace(tmp, SPEC)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Generate the per-tab admin/state field manifest the backend uses to skip unread loaders.
+
+Usage:
+  python3 frontend/scripts/admin-state-fields.py            # write backend/database/data/admin_state_fields.php
+  python3 frontend/scripts/admin-state-fields.py --check    # exit 1 if the committed manifest is stale
+  python3 frontend/scripts/admin-state-fields.py --tab audit --tab plans   # fields and readers, nothing written
+  python3 frontend/scripts/admin-state-fields.py --json > fields.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+import admin_state_fields
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--check", action="store_true", help="compare with the committed manifest; write nothing")
+parser.add_argument("--tab", action="append", default=[], help="show one tab (repeatable); write nothing")
+parser.add_argument("--json", action="store_true", help="print the manifest with readers and escapes as JSON")
+args = parser.parse_args()
+
+manifest = admin_state_fields.build()
+target = admin_state_fields.BACKEND_MANIFEST
+content = admin_state_fields.php(manifest)
+
+if args.json:
+    print(json.dumps(manifest, indent=2))
+    sys.exit(0)
+
+if args.tab:
+    for tab in args.tab:
+        entry = manifest.get(tab)
+        if entry is None:
+            print(f"{tab}: no reader found (full payload)")
+            continue
+        fields = "full payload" if entry["fields"] is None else ", ".join(entry["fields"])
+        print(f"{tab}: {fields}")
+        for rel in entry["readers"]:
+            print(f"  read in {rel}")
+        for where in entry["escapes"]:
+            print(f"  escapes at {where}")
+    sys.exit(0)
+
+if args.check:
+    current = target.read_text(encoding="utf-8") if target.exists() else ""
+    if current != content:
+        print(f"admin-state-fields: {target} is stale; run scripts/admin-state-fields.py", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(0)
+
+tmp = target.with_suffix(".tmp")
+tmp.write_text(content, encoding="utf-8")
+os.replace(tmp, target)
+
+narrowed = sum(1 for entry in manifest.values() if entry["fields"] is not None)
+print(f"admin-state-fields: {narrowed}/{len(manifest)} tabs narrowed, wrote {target}", file=sys.stderr)
+for tab, entry in manifest.items():
+    if entry["fields"] is None:
+        print(f"  {tab}: full payload ({', '.join(entry['escapes'][:3])})", file=sys.stderr)
@@ -0,0 +1,508 @@
+"""Codemod pipeline for porting vite-legacy admin components to Next.js + next-intl.
+
+Each file is read once, run through the ordered, precompiled ``RULES`` and
+written back only when the result differs from what is on disk. Files are
+independent, so they are processed on a worker pool. Ports are recorded in
+``admin-port-manifest.json``: up-to-date ones are skipped without running any
+rule and hand-edited ones are left alone. Rules that rewrite code
+(imports, tl/tp/tr helpers and calls, ``asChild``) work on ``tsx_tokens``
+tokens, so strings, comments and template text are never touched.
+
+Stages, in order (each formerly a separate full-tree script):
+
+``port``      legacy component → admin component (port-legacy-admin.py)
+``i18n``      next-intl key paths, helper removal (fix-ported-admin-i18n.py)
+``i18n-fix``  repair of the first i18n pass, cross namespaces (fix-ported-admin-i18n2.py)
+``ts``        TS fixes: duplicate imports, helper signatures, asChild (fix-ported-admin-ts.py)
+``wrappers``  *View rename + self-loading *Client wrappers (append-admin-wrappers.py)
+"""
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
+
+from admin_ports import IMPORTS, PORTS, VIEW_RENAMES, WRAPPERS
+from tsx_tokens import as_child_to_render, call_edits, helper_edits, import_edits, rename_calls, rewrite
+
+ROOT = Path(__file__).resolve().parents[2]
+LEGACY = ROOT / "frontend-vite-legacy" / "src" / "components"
+OUT = ROOT / "frontend" / "src" / "components" / "admin"
+RICH_EDITOR = ROOT / "frontend" / "src" / "components" / "broadcast-rich-editor.tsx"
+
+MANIFEST = Path(__file__).resolve().with_name("admin-port-manifest.json")
+
+STAGES = ("port", "i18n", "i18n-fix", "ts", "wrappers")
+# Bump when a rule change alters output, so recorded ports are redone.
+RULES_VERSION = 4
+PORT_DESTS = frozenset(spec["dest"] for spec in PORTS)
+HELPER_CALLS = {"tp": "t", "tl": "t", "tr": "t"}
+RE_HELPER_CALL = re.compile(r"\bt[lpr]\s*\(")
+
+
+class Job(NamedTuple):
+    src: Path
+    dest: Path
+    rel: str  # dest relative to OUT ("" outside the admin tree)
+    spec: dict | None  # PORTS entry when src is a legacy component
+
+
+class Rule(NamedTuple):
+    stage: str
+    name: str
+    scope: Callable[[Job], bool]
+    apply: Callable[[str, Job], str]
+
+
+# --- scopes ----------------------------------------------------------------
+
+def is_port(job: Job) -> bool:
+    return job.spec is not None
+
+
+def is_admin(job: Job) -> bool:
+    return job.rel != ""
+
+
+def is_port_dest(job: Job) -> bool:
+    return job.rel in PORT_DESTS
+
+
+def has_wrapper(job: Job) -> bool:
+    return job.rel in WRAPPERS
+
+
+def is_rich_editor(job: Job) -> bool:
+    return job.rel == "" and job.dest.name == RICH_EDITOR.name
+
+
+# --- port ------------------------------------------------------------------
+
+RE_USE_TRANSLATION = re.compile(r"const \{ t(?:, i18n)? \} = useTranslation\(\)")
+
+
+def port_tokens(text: str, job: Job) -> str:
+    """i18next imports and key-prefix helpers, from one tokenization."""
+    return rewrite(
+        text,
+        partial(import_edits, module="react-i18next", names=["useTranslation"]),
+        partial(import_edits, module="i18next", names=["TFunction"]),
+        partial(helper_edits, names=("tl", "tp")),
+    )
+
+
+def port_imports(text: str, job: Job) -> str:
+    if "useTranslations" not in text:
+        text = text.replace('"use client"\n\n', '"use client"\n\nimport { useTranslations } from "next-intl"\n', 1)
+    return text
+
+
+def port_hook(text: str, job: Job) -> str:
+    namespace = job.spec["namespace"]
+    text = RE_USE_TRANSLATION.sub(f'const t = useTranslations("{namespace}")', text)
+    for cross_ns in job.spec.get("extra_namespaces", {}):
+        if f't("{cross_ns}.' in text or f"t('{cross_ns}." in text:
+            marker = f'const t = useTranslations("{namespace}")'
+            if marker in text and "tInbound" not in text and cross_ns == "inboundLinkAdmin":
+                # Unindented, exactly as the original port emitted it; prettier fixes it up.
+                text = text.replace(marker, marker + f'\nconst tInbound = useTranslations("{cross_ns}")')
+    return text.replace('t("inboundLinkAdmin.clearPick")', 'tInbound("clearPick")')
+
+
+def port_calls(text: str, job: Job) -> str:
+    return rename_calls(text, {"tl": "t", "tp": "t"})
+
+
+def port_export(text: str, job: Job) -> str:
+    src, dest = job.spec["export_from"], job.spec["export_to"]
+    text = text.replace(f"export function {src}", f"export function {dest}")
+    return text.replace(f"export const {src}", f"export const {dest}")
+
+
+# --- i18n ------------------------------------------------------------------
+
+RE_NAMESPACE = re.compile(r'const t = useTranslations\("([a-zA-Z0-9_]+)"\)')
+RE_INBOUND_KEY = re.compile(r't\("inboundLinkAdmin\.([^"]+)"\)')
+
+
+def helpers_and_calls(text: str, job: Job) -> str:
+    """Drop tl/tp/tr key-prefix helpers (plain, useCallback or broken "\\${k}" form)
+    and point their call sites at ``t``."""
+    if "${k}" not in text and not RE_HELPER_CALL.search(text):
+        return text
+    return rewrite(text, helper_edits, partial(call_edits, mapping=HELPER_CALLS))
+
+
+def i18n_namespace_prefix(text: str, job: Job) -> str:
+    """t(`fooAdmin.bar`) when t = useTranslations("fooAdmin")."""
+    m = RE_NAMESPACE.search(text)
+    if m:
+        ns = re.escape(m.group(1))
+        text = re.sub(rf"t\(`{ns}\.([^`]+)`", r't("\1"', text)
+        text = re.sub(rf't\("{ns}\.', 't("', text)
+    return text
+
+
+def i18n_inbound(text: str, job: Job) -> str:
+    if "configs-admin-core" not in str(job.dest):
+        return text
+    if "tInbound" not in text:
+        text = text.replace(
+            'const t = useTranslations("configsAdmin")',
+            'const t = useTranslations("configsAdmin")\n  const tInbound = useTranslations("inboundLinkAdmin")',
+            1,
+        )
+    return RE_INBOUND_KEY.sub(r'tInbound("\1")', text)
+
+
+def i18n_user_imports(text: str, job: Job) -> str:
+    text = text.replace('@/components/dashboard-user-merge-admin"', '@/components/admin/users/user-merge-admin"')
+    text = text.replace("DashboardUserMergeAdmin", "UserMergeAdmin")
+    text = text.replace('@/components/dashboard-user-detail-admin"', '@/components/admin/users/user-detail-admin"')
+    return text.replace("DashboardUserDetailAdmin", "UserDetailAdmin")
+
+
+# --- i18n-fix --------------------------------------------------------------
+
+RE_QUOTED_TEMPLATE_KEY = re.compile(r't\("([^"]*\$\{[^"]+\})"')
+USERS_KEYS = ("status_pending", "status_approved", "status_rejected", "status_blocked", "colPhone")
+
+
+def fix_template_keys(text: str, job: Job) -> str:
+    return RE_QUOTED_TEMPLATE_KEY.sub(r"t(`\1`", text)
+
+
+def fix_users_namespace(text: str, job: Job) -> str:
+    path = str(job.dest)
+    if "resellers-admin-client" in path or "reseller-reports-admin-client" in path:
+        ns = "resellersAdmin" if "resellers-admin" in path else "resellerReportsAdmin"
+        if 'useTranslations("usersAdmin")' not in text:
+            text = text.replace(
+                f'const t = useTranslations("{ns}")',
+                f'const t = useTranslations("{ns}")\n  const tUsers = useTranslations("usersAdmin")',
+                1,
+            )
+        text = text.replace("t(`usersAdmin.status_${st}`)", "tUsers(`status_${st}`)")
+        for key in USERS_KEYS:
+            text = text.replace(f't("usersAdmin.{key}")', f'tUsers("{key}")')
+    if "user-detail-admin" in path:
+        if 'useTranslations("usersAdmin")' not in text:
+            text = text.replace(
+                'const t = useTranslations("userDetailAdmin")',
+                'const t = useTranslations("userDetailAdmin")\n  const tUsers = useTranslations("usersAdmin")',
+                1,
+            )
+        text = text.replace("t(`usersAdmin.status_${st}`", "tUsers(`status_${st}`")
+    return text
+
+
+# --- ts --------------------------------------------------------------------
+
+NEXT_INTL_IMPORT = 'import { useTranslations } from "next-intl"'
+RE_TARGETS_LABEL = re.compile(
+    r"function targetsLabel\(raw: string, tp: \(k: string\) => string\): string \{\n  if \(raw === \"both\"\) return t\("
+)
+RE_BROADCAST_STATUS_LABEL = re.compile(
+    r"function broadcastStatusLabel\(st: string, tp: \(k: string\) => string\): string \{\n  const key = `broadcastStatus_\$\{st\}`\n  const tr = t\(key\)"
+)
+
+
+def ts_dedupe_imports(text: str, job: Job) -> str:
+    out = []
+    seen = False
+    for line in text.splitlines():
+        if line.strip() == NEXT_INTL_IMPORT:
+            if seen:
+                continue
+            seen = True
+        out.append(line)
+    return "\n".join(out) + ("\n" if text.endswith("\n") else "")
+
+
+def ts_helpers(text: str, job: Job) -> str:
+    text = RE_TARGETS_LABEL.sub(
+        'function targetsLabel(raw: string, tp: (k: string) => string): string {\n  if (raw === "both") return tp("', text
+    )
+    text = text.replace('if (raw === "telegram") return t("targetsTelegram")', 'if (raw === "telegram") return tp("targetsTelegram")')
+    text = text.replace('if (raw === "bale") return t("targetsBale")', 'if (raw === "bale") return tp("targetsBale")')
+    text = RE_BROADCAST_STATUS_LABEL.sub(
+        "function broadcastStatusLabel(st: string, tp: (k: string) => string): string {\n"
+        "  const key = `broadcastStatus_${st}`\n  const tr = tp(key)",
+        text,
+    )
+    text = text.replace("t: TFunction", "t: (k: string, opts?: Record<string, string>) => string")
+    return text.replace('return t("configLineN", { n: idx + 1 })', 'return tl("configLineN", { n: idx + 1 })')
+
+
+def ts_as_child(text: str, job: Job) -> str:
+    return as_child_to_render(text, ("TooltipTrigger", "CollapsibleTrigger"))
+
+
+def ts_inbound(text: str, job: Job) -> str:
+    # Matches on file content, as the original script did.
+    if "configs-admin-core" not in text and "configs/configs-admin-core" not in text:
+        return text
+    if "tInbound" in text and 'useTranslations("inboundLinkAdmin")' in text:
+        return text
+    return text.replace(
+        'const t = useTranslations("configsAdmin")',
+        'const t = useTranslations("configsAdmin")\n  const tInbound = useTranslations("inboundLinkAdmin")',
+        1,
+    )
+
+
+def ts_discounts_export(text: str, job: Job) -> str:
+    if job.dest.name != "discounts-admin-client.tsx" or "export type UsageSummary" in text:
+        return text
+    return text.replace("type UsageSummary =", "export type UsageSummary =")
+
+
+def ts_rich_editor(text: str, job: Job) -> str:
+    text = text.replace('import { useTranslation } from "react-i18next"', NEXT_INTL_IMPORT)
+    text = text.replace("const { t } = useTranslation()", 'const t = useTranslations("broadcastAdmin")')
+    return text.replace('t("broadcastAdmin.', 't("')
+
+
+# --- wrappers --------------------------------------------------------------
+
+def wrap_client(text: str, job: Job) -> str:
+    view_name = VIEW_RENAMES[job.rel]
+    text = text.replace(f"export function {view_name}(", f"export function {view_name.replace('Client', 'View')}(")
+    if "useAdminTabState" not in text:
+        text = text.replace('"use client"\n\n', '"use client"\n' + IMPORTS + "\n", 1)
+    if f"export function {view_name}(" not in text:
+        text = text.rstrip() + "\n" + WRAPPERS[job.rel]
+    return text
+
+
+RULES: tuple[Rule, ...] = (
+    Rule("port", "tokens", is_port, port_tokens),
+    Rule("port", "imports", is_port, port_imports),
+    Rule("port", "hook", is_port, port_hook),
+    Rule("port", "calls", is_port, port_calls),
+    Rule("port", "export", is_port, port_export),
+    Rule("i18n", "helpers-calls", is_admin, helpers_and_calls),
+    Rule("i18n", "namespace-prefix", is_admin, i18n_namespace_prefix),
+    Rule("i18n", "inbound", is_admin, i18n_inbound),
+    Rule("i18n", "user-imports", is_admin, i18n_user_imports),
+    Rule("i18n-fix", "helpers-calls", is_port_dest, helpers_and_calls),
+    Rule("i18n-fix", "template-keys", is_port_dest, fix_template_keys),
+    Rule("i18n-fix", "users-namespace", is_port_dest, fix_users_namespace),
+    Rule("ts", "dedupe-imports", is_admin, ts_dedupe_imports),
+    Rule("ts", "helpers", is_admin, ts_helpers),
+    Rule("ts", "as-child", is_admin, ts_as_child),
+    Rule("ts", "inbound", is_admin, ts_inbound),
+    Rule("ts", "discounts-export", is_admin, ts_discounts_export),
+    Rule("ts", "rich-editor", is_rich_editor, ts_rich_editor),
+    Rule("wrappers", "client", has_wrapper, wrap_client),
+)
+
+
+# --- pipeline --------------------------------------------------------------
+
+def plan(stages: tuple[str, ...] = STAGES, names: set[str] | None = None,
+         legacy: Path = LEGACY, out: Path = OUT, rich_editor: Path = RICH_EDITOR) -> list[Job]:
+    """Jobs with at least one rule in ``stages``. Port destinations are rebuilt
+    from legacy only when the ``port`` stage runs; otherwise fixed in place."""
+    specs = [s for s in PORTS if not names or s["export_to"] in names or s["src"] in names]
+    jobs: list[Job] = []
+    ported: set[str] = set()
+    if "port" in stages:
+        for spec in specs:
+            jobs.append(Job(legacy / spec["src"], out / spec["dest"], spec["dest"], spec))
+            ported.add(spec["dest"])
+    if not names:
+        for path in sorted(out.rglob("*.tsx")):
+            rel = path.relative_to(out).as_posix()
+            if rel not in ported:
+                jobs.append(Job(path, path, rel, None))
+        if rich_editor.exists():
+            jobs.append(Job(rich_editor, rich_editor, "", None))
+    return [j for j in jobs if any(r.stage in stages and r.scope(j) for r in RULES)]
+
+
+def transform(text: str, job: Job, stages: tuple[str, ...] = STAGES) -> str:
+    for rule in RULES:
+        if rule.stage in stages and rule.scope(job):
+            text = rule.apply(text, job)
+    return text
+
+
+def write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# --- port manifest ---------------------------------------------------------
+#
+# One entry per port destination: source hash, rule-set version, the stages
+# applied and the hash of the dest as last written. A port whose source and
+# rules are unchanged is skipped from two hashes, without running any rule; a
+# dest whose hash no longer matches was edited by hand and is not overwritten
+# unless --force is given. --adopt records a dest the pipeline did not write
+# with ``out_sha256: null``, so it counts as edited until a forced re-port.
+
+def sha256_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest(path: Path = MANIFEST) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["ports"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(ports: dict[str, dict], path: Path = MANIFEST) -> None:
+    write_atomic(path, json.dumps({"ports": dict(sorted(ports.items()))}, indent=2) + "\n")
+
+
+def port_status(job: Job, entry: dict | None, stages: tuple[str, ...]) -> str:
+    """``new`` (no record or dest), ``fresh`` (skip), ``stale`` (re-port) or
+    ``edited`` (stale, but the dest changed since it was written)."""
+    if entry is None or not job.dest.exists():
+        return "new"
+    if (entry["rules_version"] == RULES_VERSION and set(stages) <= set(entry["stages"])
+            and entry["src_sha256"] == sha256_file(job.src)):
+        return "fresh"
+    out_sha256 = entry["out_sha256"]
+    return "stale" if out_sha256 is not None and out_sha256 == sha256_file(job.dest) else "edited"
+
+
+def port_entry(job: Job, stages: tuple[str, ...], src_sha256: str, out_sha256: str | None) -> dict:
+    return {
+        "src": job.spec["src"],
+        "src_sha256": src_sha256,
+        "rules_version": RULES_VERSION,
+        "stages": list(stages),
+        "out_sha256": out_sha256,
+    }
+
+
+# --- pipeline --------------------------------------------------------------
+
+class Result(NamedTuple):
+    job: Job
+    changed: bool
+    src_sha256: str
+    out_sha256: str
+    diff: str = ""
+
+
+def run_job(job: Job, stages: tuple[str, ...], mode: str = "write") -> Result:
+    """Transform one file. ``mode``: ``write`` (only when the output differs from
+    dest), ``check`` (write nothing) or ``diff`` (also return a unified diff)."""
+    raw = job.src.read_bytes()
+    source = raw.decode("utf-8")
+    text = transform(source, job, stages)
+    if job.src == job.dest:
+        current = source
+    else:
+        current = job.dest.read_text(encoding="utf-8") if job.dest.exists() else None
+    changed = text != current
+    diff = ""
+    if changed and mode == "diff":
+        rel = job.dest.relative_to(ROOT).as_posix()
+        diff = "".join(difflib.unified_diff(
+            (current or "").splitlines(True), text.splitlines(True),
+            f"a/{rel}" if current is not None else "/dev/null", f"b/{rel}",
+        ))
+    elif changed and mode == "write":
+        write_atomic(job.dest, text)
+    return Result(job, changed, hashlib.sha256(raw).hexdigest(), hashlib.sha256(text.encode("utf-8")).hexdigest(), diff)
+
+
+def run(jobs: list[Job], stages: tuple[str, ...] = STAGES, workers: int | None = None,
+        mode: str = "write") -> Iterator[Result]:
+    """Results in job order, yielded as they complete."""
+    if workers == 1 or len(jobs) < 2:
+        yield from (run_job(j, stages, mode) for j in jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_job, jobs, repeat(stages), repeat(mode), chunksize=4)
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Port and fix admin components in one pass")
+    parser.add_argument("names", nargs="*", help="PORTS src file or export_to name (default: all)")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"comma-separated subset of {','.join(STAGES)}")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (1 = inline)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="report files that would change, write nothing")
+    mode.add_argument("--dry-run", action="store_true", help="print unified diffs of would-be changes, write nothing")
+    mode.add_argument("--adopt", action="store_true",
+                      help="record the current legacy sources and dests in the manifest without porting")
+    parser.add_argument("--force", action="store_true", help="re-port even if up to date or edited by hand")
+    args = parser.parse_args(argv)
+    stages = tuple(s for s in STAGES if s in args.stages.split(","))
+    unknown = set(args.stages.split(",")) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+    run_mode = "check" if args.check else "diff" if args.dry_run else "write"
+    # With --dry-run stdout is a patch; progress goes to stderr.
+    log = sys.stderr if args.dry_run else sys.stdout
+
+    started = time.perf_counter()
+    manifest = load_manifest(MANIFEST)
+    jobs = plan(stages, set(args.names) or None, LEGACY, OUT, RICH_EDITOR)
+    if args.adopt:
+        ports = [j for j in jobs if j.spec and j.dest.exists()]
+        for job in ports:
+            manifest[job.rel] = port_entry(job, stages, sha256_file(job.src), None)
+        save_manifest(manifest, MANIFEST)
+        print(f"adopted {len(ports)} port(s) into {MANIFEST.relative_to(ROOT)}")
+        return 0
+
+    todo: list[Job] = []
+    fresh = 0
+    for job in jobs:
+        status = "new" if args.force or not job.spec else port_status(job, manifest.get(job.rel), stages)
+        if status == "fresh":
+            fresh += 1
+        elif status == "edited":
+            print(f"kept {job.dest.relative_to(ROOT)}: edited since last port (--force to overwrite)", file=log)
+        else:
+            todo.append(job)
+
+    changed = 0
+    dirty = False
+    for result in run(todo, stages, args.workers, run_mode):
+        job = result.job
+        if result.changed:
+            changed += 1
+            sys.stdout.write(result.diff)
+            verb = "would write" if run_mode != "write" else ("ported" if job.spec else "fixed")
+            origin = f"{job.spec['src']} -> " if job.spec else ""
+            print(f"{verb} {origin}{job.dest.relative_to(ROOT)}", file=log)
+        if run_mode != "write":
+            continue
+        if job.spec:
+            manifest[job.rel] = port_entry(job, stages, result.src_sha256, result.out_sha256)
+            dirty = True
+        elif job.rel in manifest and result.changed:
+            entry = manifest[job.rel]
+            entry["stages"] = [s for s in STAGES if s in entry["stages"] or s in stages]
+            if entry["out_sha256"] is not None:
+                entry["out_sha256"] = result.out_sha256
+            dirty = True
+    if dirty:
+        save_manifest(manifest, MANIFEST)
+    print(f"done ({changed} changed, {len(todo) - changed} unchanged, {fresh} up to date, "
+          f"stages={','.join(stages)}) in {time.perf_counter() - started:.2f}s", file=log)
+    return 1 if run_mode != "write" and changed else 0
@@ -0,0 +1,507 @@
+"""Per-tab manifest of the admin/state fields the dashboard actually reads.
+
+A state variable is anything bound to an ``admin/state`` response:
+
+- ``const { data } = useAdminTabState("tab")`` (or ``{ data: alias }``)
+- ``const x = await getAdminState("tab", ...)``
+- ``setX(await getAdminState("tab"))`` / ``setX(x)`` → the ``x`` of
+  ``const [x, setX] = useState(...)``; ``const y = x`` and
+  ``const y = { ...x }`` alias it
+- the parameter of a function in the same file that ``x`` is passed to
+  (``pickPagination(data, "panels")``, ``applyState(data)``)
+
+Reads through it (``x.field``, ``x?.field``, ``x["field"]``) are collected
+per tab; ``x[`${key}Pagination`]`` becomes the pattern ``*Pagination``. Any
+other use (a JSX prop, a call into another module) *escapes*: the tab is then
+marked ``None`` and the backend keeps its full payload.
+
+``useAdminTabState(tab)`` with a non-literal tab is attributed to the
+dashboard tabs whose ``case`` renders that file; fields read inside the hook
+itself (``enabledPlatforms``, ``pagination``, …) are added to every tab that
+goes through the hook.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from pathlib import Path
+
+from i18n_chunks import TAB_PAGE, _named_imports, _rel, resolve_import, tab_cases
+from i18n_index import ROOT, SRC, _string_value, source_files
+from tsx_tokens import Token, _statement_end, next_sig, prev_sig, tokenize
+
+BACKEND_MANIFEST = ROOT / "backend" / "database" / "data" / "admin_state_fields.php"
+HOOK = SRC / "hooks" / "use-admin-tab-state.ts"
+HOOK_TAB = "\0hook"
+TAB_HOOK = "useAdminTabState"
+STATE_CALL = "getAdminState"
+# Uses of a state variable that only test it, never hand it on.
+NEUTRAL_PREV = frozenset(("typeof", "!", "if"))
+NEUTRAL_NEXT = frozenset(("&&", "||", "??", "?", "===", "!==", "==", "!="))
+NEUTRAL_CALLS = frozenset(("Object.keys", "Array.isArray"))
+HOOK_DEPS = frozenset(("useMemo", "useEffect", "useCallback", "useLayoutEffect"))
+# A bare state variable between these is the value of the surrounding declaration.
+FLOW_PREV = frozenset(("=", "?", ":", "??", "||", "("))
+FLOW_NEXT = frozenset((")", ":", "??", "||", "as", ";"))
+TEMPLATE_KEY_RE = re.compile(r"`([^`$]*)\$\{[^`]*?\}([^`$]*)`")
+
+
+class Binding:
+    def __init__(self, *tabs: str | None):
+        self.tabs: set[str | None] = set(tabs)
+        self.sources: list[Binding] = []
+        self.fields: set[str] = set()
+        self.escapes: list[int] = []
+
+    def all_tabs(self, seen: set[int] | None = None) -> set[str | None]:
+        seen = set() if seen is None else seen
+        if id(self) in seen:
+            return set()
+        seen.add(id(self))
+        tabs = set(self.tabs)
+        for src in self.sources:
+            tabs |= src.all_tabs(seen)
+        return tabs
+
+
+class Function:
+    def __init__(self, params: list[str], body: tuple[int, int]):
+        self.params = params
+        self.body = body  # token range of the block, braces included
+        self.bindings: dict[int, Binding] = {}
+
+
+def _closing(tokens: tuple[Token, ...], i: int) -> int:
+    depth = 0
+    for k in range(i, len(tokens)):
+        tok = tokens[k]
+        if tok.kind != "punct":
+            continue
+        if tok.text in "([{":
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+            if depth == 0:
+                return k
+    return len(tokens) - 1
+
+
+def _params(tokens: tuple[Token, ...], open_paren: int, close: int) -> list[str]:
+    """Parameter names of ``(a: T<x, y>, b = 1)`` — idents after ``(`` or a top-level ``,``."""
+    names: list[str] = []
+    depth = 0
+    expect = True
+    for k in range(open_paren + 1, close):
+        tok = tokens[k]
+        if tok.kind == "punct":
+            if tok.text in "([{<":
+                depth += 1
+            elif tok.text in ")]}>":
+                depth -= 1
+            elif tok.text == "," and depth == 0:
+                expect = True
+            continue
+        if tok.kind == "ident" and expect and depth == 0:
+            names.append(tok.text)
+            expect = False
+        elif tok.kind not in ("ws", "comment"):
+            expect = False
+    return names
+
+
+def _functions(tokens: tuple[Token, ...]) -> dict[str, Function]:
+    """``function f(...) {}`` and ``const f = [useCallback(][async] (...) => {}`` in a file."""
+    out: dict[str, Function] = {}
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text not in ("function", "const"):
+            continue
+        name = next_sig(tokens, i)
+        if name is None or tokens[name].kind != "ident":
+            continue
+        k = next_sig(tokens, name)
+        if tok.text == "const":
+            if k is None or tokens[k].text != "=":
+                continue
+            k = next_sig(tokens, k)
+            if k is not None and tokens[k].text == "useCallback":
+                k = next_sig(tokens, next_sig(tokens, k))
+            if k is not None and tokens[k].text == "async":
+                k = next_sig(tokens, k)
+        if k is None or tokens[k].text != "(":
+            continue
+        close = _closing(tokens, k)
+        body = next_sig(tokens, close)
+        if tok.text == "const":
+            # (params): T => { ... }
+            while body is not None and tokens[body].text != "=>" and tokens[body].text not in (";", "{"):
+                body = next_sig(tokens, body)
+            if body is None or tokens[body].text != "=>":
+                continue
+            body = next_sig(tokens, body)
+        else:
+            while body is not None and tokens[body].text != "{":
+                body = next_sig(tokens, body)
+        if body is None or tokens[body].text != "{":
+            continue
+        out[tokens[name].text] = Function(_params(tokens, k, close), (body, _closing(tokens, body)))
+    return out
+
+
+def _call_tab(tokens: tuple[Token, ...], k: int | None, callee: str) -> tuple[bool, str | None]:
+    """``[await] callee("tab"`` at ``k`` → (matched, literal tab or None)."""
+    if k is not None and tokens[k].text == "await":
+        k = next_sig(tokens, k)
+    if k is None or tokens[k].text != callee:
+        return False, None
+    k = next_sig(tokens, k)
+    if k is None or tokens[k].text != "(":
+        return False, None
+    arg = next_sig(tokens, k)
+    return True, _string_value(tokens[arg]) if arg is not None else None
+
+
+class _Scanner:
+    def __init__(self, text: str):
+        self.tokens = tokenize(text)
+        self.functions = _functions(self.tokens)
+        newlines = [m.start() for m in re.finditer("\n", text)]
+        self.line = lambda pos: bisect_right(newlines, pos) + 1
+        self.bindings: list[Binding] = []
+
+    def _opener(self, i: int) -> tuple[int, int] | None:
+        """Unmatched ``(``/``[``/``{`` before ``i`` and the top-level commas between them."""
+        depth = 0
+        commas = 0
+        for k in range(i - 1, -1, -1):
+            tok = self.tokens[k]
+            if tok.kind != "punct":
+                continue
+            if tok.text in ")]}":
+                depth += 1
+            elif tok.text in "([{":
+                if depth == 0:
+                    return k, commas
+                depth -= 1
+            elif tok.text == "," and depth == 0:
+                commas += 1
+        return None
+
+    def _enclosing_call(self, i: int) -> tuple[Function, int] | None:
+        """``f(a, x, b)`` with ``x`` at ``i`` and ``f`` local → (f, argument index)."""
+        found = self._opener(i)
+        if found is None or self.tokens[found[0]].text != "(":
+            return None
+        fn = self.functions.get(self._callee(found[0]))
+        return (fn, found[1]) if fn is not None and found[1] < len(fn.params) else None
+
+    def _in_deps(self, i: int) -> bool:
+        """``x`` inside the dependency array of ``useMemo``/``useEffect``/``useCallback``."""
+        found = self._opener(i)
+        if found is None or self.tokens[found[0]].text != "[":
+            return False
+        call = self._opener(found[0])
+        return call is not None and self.tokens[call[0]].text == "(" and self._callee(call[0]) in HOOK_DEPS
+
+    def _callee(self, open_paren: int) -> str:
+        """Dotted name before ``(``: ``Object.keys``."""
+        parts: list[str] = []
+        k = prev_sig(self.tokens, open_paren)
+        while k is not None and self.tokens[k].kind == "ident":
+            parts.append(self.tokens[k].text)
+            k = prev_sig(self.tokens, k)
+            if k is None or self.tokens[k].text != ".":
+                break
+            k = prev_sig(self.tokens, k)
+        return ".".join(reversed(parts))
+
+    def _param(self, fn: Function, index: int, source: Binding) -> None:
+        binding = fn.bindings.get(index)
+        if binding is None:
+            binding = fn.bindings[index] = Binding()
+            self.bindings.append(binding)
+            start, end = fn.body
+            binding.sources.append(source)
+            self.walk(start, end, [{fn.params[index]: binding}])
+        elif source not in binding.sources:
+            binding.sources.append(source)
+
+    def walk(self, start: int, end: int, scopes: list[dict[str, Binding]],
+             seed: frozenset[str] = frozenset()) -> None:
+        tokens = self.tokens
+        setters: list[dict[str, Binding]] = [{} for _ in scopes]
+        skip: set[int] = set()
+
+        def resolve(name: str, table: list[dict[str, Binding]]) -> Binding | None:
+            for scope in reversed(table):
+                if name in scope:
+                    return scope[name]
+            return None
+
+        def bind(name: str, binding: Binding) -> None:
+            scopes[-1][name] = binding
+            self.bindings.append(binding)
+
+        for i in range(start, end + 1):
+            tok = tokens[i]
+            if i in skip:
+                continue
+            if tok.kind == "punct":
+                if tok.text == "{":
+                    scopes.append({})
+                    setters.append({})
+                elif tok.text == "}" and len(scopes) > 1:
+                    scopes.pop()
+                    setters.pop()
+                continue
+            if tok.kind != "ident":
+                continue
+
+            if tok.text in ("const", "let", "var"):
+                self._declaration(i, scopes, setters, skip, bind, resolve, seed)
+                continue
+
+            prev = prev_sig(tokens, i)
+            if prev is not None and tokens[prev].text in (".", "?."):
+                continue
+            nxt = next_sig(tokens, i)
+
+            target = resolve(tok.text, setters)
+            if target is not None and nxt is not None and tokens[nxt].text == "(":
+                arg = next_sig(tokens, nxt)
+                matched, tab = _call_tab(tokens, arg, STATE_CALL)
+                if matched:
+                    target.tabs.add(tab)
+                    continue
+                source = resolve(tokens[arg].text, scopes) if arg is not None and tokens[arg].kind == "ident" else None
+                close = next_sig(tokens, arg) if source else None
+                if source and close is not None and tokens[close].text == ")":
+                    target.sources.append(source)
+                    skip.add(arg)
+                continue
+
+            binding = resolve(tok.text, scopes)
+            if binding is None:
+                continue
+            if nxt is not None and tokens[nxt].text == ":" and prev is not None and tokens[prev].text in ("{", ","):
+                continue  # object key that happens to share the name
+            if nxt is not None and tokens[nxt].text in (".", "?."):
+                field = next_sig(tokens, nxt)
+                if field is not None and tokens[field].kind == "ident":
+                    binding.fields.add(tokens[field].text)
+                    continue
+                if field is not None and tokens[field].text == "[":
+                    nxt = field
+            if nxt is not None and tokens[nxt].text == "[":
+                if (field := self._subscript(nxt)) is not None:
+                    binding.fields.add(field)
+                    skip.update(range(nxt, _closing(tokens, nxt) + 1))
+                else:
+                    binding.escapes.append(self.line(tok.start))
+                continue
+            if (prev is not None and tokens[prev].text in NEUTRAL_PREV) or (nxt is not None and tokens[nxt].text in NEUTRAL_NEXT):
+                continue
+            if prev is not None and tokens[prev].text == "(" and self._callee(prev) in NEUTRAL_CALLS:
+                continue
+            if prev is not None and tokens[prev].text in ("(", ",", "[") and nxt is not None and tokens[nxt].text in (")", ",", "]"):
+                if self._in_deps(i):
+                    continue
+                call = self._enclosing_call(i)
+                if call is not None:
+                    self._param(*call, binding)
+                    continue
+            binding.escapes.append(self.line(tok.start))
+
+    def _subscript(self, open_bracket: int) -> str | None:
+        """Field name or ``prefix*suffix`` pattern of ``x[...]``; None when computed."""
+        tokens = self.tokens
+        close = _closing(tokens, open_bracket)
+        inner = [t for t in tokens[open_bracket + 1:close] if t.kind not in ("ws", "comment")]
+        if len(inner) == 1 and (value := _string_value(inner[0])) is not None:
+            return value
+        m = TEMPLATE_KEY_RE.fullmatch("".join(t.text for t in tokens[open_bracket + 1:close]).strip())
+        if m and (m.group(1) or m.group(2)):
+            return f"{m.group(1)}*{m.group(2)}"
+        return None
+
+    def _declaration(self, i, scopes, setters, skip, bind, resolve, seed) -> None:
+        tokens = self.tokens
+        j = next_sig(tokens, i)
+        if j is None:
+            return
+        if tokens[j].text == "{":
+            # const { data, ... } = useAdminTabState(...)
+            end = _closing(tokens, j)
+            eq = next_sig(tokens, end)
+            if eq is None or tokens[eq].text != "=":
+                return
+            matched, tab = _call_tab(tokens, next_sig(tokens, eq), TAB_HOOK)
+            if not matched:
+                return
+            skip.update(range(j, end + 1))
+            k = j
+            while (k := next_sig(tokens, k)) is not None and k < end:
+                if tokens[k].text == "data" and tokens[prev_sig(tokens, k)].text in ("{", ","):
+                    alias = k
+                    colon = next_sig(tokens, k)
+                    if colon is not None and tokens[colon].text == ":":
+                        alias = next_sig(tokens, colon)
+                    bind(tokens[alias].text, Binding(tab))
+        elif tokens[j].text == "[":
+            # const [x, setX] = useState(...)
+            end = _closing(tokens, j)
+            names = [k for k in range(j + 1, end) if tokens[k].kind == "ident"]
+            eq = next_sig(tokens, end)
+            call = next_sig(tokens, eq) if eq is not None else None
+            if len(names) == 2 and call is not None and tokens[call].text == "useState":
+                skip.update(range(j, end + 1))
+                value, setter = (tokens[n].text for n in names)
+                binding = Binding(HOOK_TAB) if value in seed else Binding()
+                bind(value, binding)
+                setters[-1][setter] = binding
+        elif tokens[j].kind == "ident":
+            eq = next_sig(tokens, j)
+            if eq is None or tokens[eq].text != "=":
+                return
+            rhs = next_sig(tokens, eq)
+            matched, tab = _call_tab(tokens, rhs, STATE_CALL)
+            if matched:
+                skip.add(j)
+                bind(tokens[j].text, Binding(tab))
+                return
+            if rhs is None:
+                return
+            if tokens[rhs].text == "{":
+                # const y = { ...x, ... }
+                close = _closing(tokens, rhs)
+                spreads = [resolve(tokens[k + 1].text, scopes) for k in range(rhs, close)
+                           if tokens[k].text == "..." and tokens[k + 1].kind == "ident"]
+                sources = [s for s in spreads if s is not None]
+                if sources:
+                    alias = Binding()
+                    alias.sources += sources
+                    skip.update(k + 1 for k in range(rhs, close) if tokens[k].text == "...")
+                    skip.add(j)
+                    bind(tokens[j].text, alias)
+                return
+            # const y = x / x as T / cond ? a : x / a ?? x: y holds the payload too
+            end = _statement_end(tokens, rhs)
+            flows = []
+            for k in range(rhs, end + 1):
+                if tokens[k].kind != "ident" or (source := resolve(tokens[k].text, scopes)) is None:
+                    continue
+                before, after = prev_sig(tokens, k), next_sig(tokens, k)
+                if tokens[before].text == "(" and self._callee(before):
+                    continue  # f(x): the result is not x
+                if tokens[before].text in FLOW_PREV and (after is None or after > end or tokens[after].text in FLOW_NEXT):
+                    flows.append((k, source))
+            if flows:
+                alias = Binding()
+                alias.sources += [source for _, source in flows]
+                skip.update(k for k, _ in flows)
+                skip.add(j)
+                bind(tokens[j].text, alias)
+
+
+def scan_state_reads(text: str, seed: frozenset[str] = frozenset()) -> list[Binding]:
+    """Every state binding in ``text`` that carries a tab, with the fields read through it.
+
+    ``seed`` names ``useState`` variables that hold a state payload although
+    no ``getAdminState`` result is visibly assigned to them (the hook's own
+    ``data``).
+    """
+    scanner = _Scanner(text)
+    scanner.walk(0, len(scanner.tokens) - 1, [{}], seed)
+    return _merge(scanner.bindings)
+
+
+def _merge(bindings: list[Binding]) -> list[Binding]:
+    """Fold aliases into the bindings that carry tabs (fields and escapes flow back)."""
+    for b in bindings:
+        for src in b.sources:
+            src.fields |= b.fields
+            src.escapes += b.escapes
+    # Sources can chain (setX(y) where y aliases z); repeat until stable.
+    changed = True
+    while changed:
+        changed = False
+        for b in bindings:
+            for src in b.sources:
+                if not b.fields <= src.fields or not set(b.escapes) <= set(src.escapes):
+                    src.fields |= b.fields
+                    src.escapes += [e for e in b.escapes if e not in src.escapes]
+                    changed = True
+    return [b for b in bindings if b.tabs]
+
+
+# --- manifest --------------------------------------------------------------
+
+def _tab_files() -> dict[str, list[str]]:
+    """Dashboard component file → tabs whose ``case`` renders it."""
+    text = TAB_PAGE.read_text(encoding="utf-8")
+    imports = _named_imports(text)
+    known = {_rel(p) for p in source_files()}
+    out: dict[str, list[str]] = {}
+    for tab, name in tab_cases(text).items():
+        target = resolve_import(_rel(TAB_PAGE), imports.get(name, ""), known)
+        if target:
+            out.setdefault(target, []).append(tab)
+    return out
+
+
+def build(src: Path = SRC) -> dict[str, dict]:
+    """``{tab: {"fields": [...] | None, "readers": [...], "escapes": [...]}}``."""
+    hook_fields: set[str] = set()
+    per_tab: dict[str, dict] = {}
+    dynamic = _tab_files()
+    for path in source_files(src):
+        rel = _rel(path)
+        text = path.read_text(encoding="utf-8")
+        if path == HOOK:
+            for b in scan_state_reads(text, seed=frozenset(("data",))):
+                hook_fields |= b.fields
+            continue
+        if TAB_HOOK not in text and STATE_CALL not in text:
+            continue
+        for b in scan_state_reads(text):
+            tabs = b.tabs
+            if None in tabs:
+                tabs = (tabs - {None}) | set(dynamic.get(rel, ()))
+            for tab in tabs:
+                entry = per_tab.setdefault(tab, {"fields": set(), "readers": set(), "escapes": [], "hook": False})
+                entry["fields"] |= b.fields
+                entry["readers"].add(rel)
+                entry["escapes"] += [f"{rel}:{line}" for line in b.escapes]
+                entry["hook"] |= TAB_HOOK in text
+    out = {}
+    for tab, entry in sorted(per_tab.items()):
+        fields = entry["fields"] | (hook_fields if entry["hook"] else set())
+        out[tab] = {
+            "fields": None if entry["escapes"] else sorted(fields),
+            "readers": sorted(entry["readers"]),
+            "escapes": sorted(set(entry["escapes"])),
+        }
+    return out
+
+
+def _php_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def php(manifest: dict[str, dict]) -> str:
+    """``database/data/admin_state_fields.php``: ``[tab => [field, ...] | null]``."""
+    lines = [
+        "<?php",
+        "",
+        "/** Auto-generated by frontend/scripts/admin-state-fields.py — do not edit. null = full payload. */",
+        "",
+        "return [",
+    ]
+    for tab, entry in manifest.items():
+        if entry["fields"] is None:
+            lines.append(f"    {_php_string(tab)} => null,")
+            continue
+        lines.append(f"    {_php_string(tab)} => [")
+        lines += [f"        {_php_string(field)}," for field in entry["fields"]]
+        lines.append("    ],")
+    lines.append("];")
+    return "\n".join(lines) + "\n"
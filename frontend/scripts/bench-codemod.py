@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark the token-level codemod rules against the regex passes they replaced.
+
+Every pass pair runs on each component of the legacy set, starting from the
+unmodified source. Reports best-of-N time per pass and the files whose output
+differs (the regex passes also rewrite strings, comments and ``attr(``).
+
+Usage:
+  python3 frontend/scripts/bench-codemod.py
+  python3 frontend/scripts/bench-codemod.py --repeat 10 --json
+  python3 frontend/scripts/bench-codemod.py --diff calls   # unified diffs for one pass
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import re
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+from admin_codemod import HELPER_CALLS, LEGACY, ROOT
+from tsx_tokens import (as_child_to_render, call_edits, drop_key_helpers, helper_edits, import_edits,
+                        remove_imports, rename_calls, rewrite, tokenize)
+
+# --- regex passes, as shipped in the porting scripts ------------------------
+
+OPTS = r"opts\?: Record<string, string \| number>"
+# Verbatim, including the stray backtick: `ns.`${k}` never matches a real `ns.${k}` helper.
+KEY = r"`[^`]+`\$\{k\}`"
+BROKEN_KEY = r"\"\\$\{k\}\""
+RE_HELPERS = tuple(re.compile(p) for p in (
+    rf"\n\s*const tl = useCallback\(\s*\n\s*\(k: string, {OPTS}\) => t\({KEY}, opts\),\s*\n\s*\[t\]\s*\n\s*\)",
+    rf"\n\s*const tp = useCallback\(\s*\n\s*\(k: string\) => t\({KEY}\),\s*\n\s*\[t\]\s*\n\s*\)",
+    rf"\n\s*const tp = \(k: string(?:, {OPTS})?\) => t\({KEY}(?:, opts)?\)",
+    rf"\n\s*const tr = \(k: string, {OPTS}\) => t\({KEY}, opts\)",
+    rf"\n\s*const tp = \(k: string, {OPTS}\) =>\s*\n\s*t\({KEY}, opts\)",
+    rf"\n\s*const tl = useCallback\(\s*\n\s*\(k: string, {OPTS}\) => t\({BROKEN_KEY}, opts\),\s*\n\s*\[t\]\s*\n\s*\)",
+    rf"\n\s*const tp = \(k: string(?:, {OPTS})?\) => t\({BROKEN_KEY}(?:, opts)?\)",
+    rf"\n\s*const tr = \(k: string, {OPTS}\) => t\({BROKEN_KEY}, opts\)",
+    rf"\n\s*const tp = \(k: string, {OPTS}\) =>\s*\n\s*t\({BROKEN_KEY}, opts\)",
+))
+RE_IMPORTS = (
+    re.compile(r'import \{ useTranslation \} from "react-i18next"\n'),
+    re.compile(r'import type \{ TFunction \} from "i18next"\n'),
+)
+RE_AS_CHILD = (
+    (re.compile(r"<TooltipTrigger asChild>\s*\n\s*<Button"), "<TooltipTrigger\n              render={\n                <Button"),
+    (re.compile(r"</Button>\s*\n\s*</TooltipTrigger>"), "</Button>\n              }\n            />"),
+    (re.compile(r"<CollapsibleTrigger asChild>\s*\n\s*<Button"),
+     "<CollapsibleTrigger\n                    render={\n                      <Button"),
+    (re.compile(r"</Button>\s*\n\s*</CollapsibleTrigger>"), "</Button>\n                    }\n                  />"),
+)
+
+
+def regex_helpers(text: str) -> str:
+    for pattern in RE_HELPERS:
+        text = pattern.sub("", text)
+    return text
+
+
+def regex_calls(text: str) -> str:
+    return text.replace("tp(", "t(").replace("tl(", "t(").replace("tr(", "t(")
+
+
+def regex_imports(text: str) -> str:
+    for pattern in RE_IMPORTS:
+        text = pattern.sub("", text)
+    return text
+
+
+def regex_as_child(text: str) -> str:
+    for pattern, repl in RE_AS_CHILD:
+        text = pattern.sub(repl, text)
+    return text.replace(" asChild", "")
+
+
+def token_imports(text: str) -> str:
+    text = remove_imports(text, "react-i18next", ["useTranslation"])
+    return remove_imports(text, "i18next", ["TFunction"])
+
+
+def regex_combined(text: str) -> str:
+    return regex_calls(regex_helpers(regex_imports(text)))
+
+
+def token_combined(text: str) -> str:
+    return rewrite(
+        text,
+        partial(import_edits, module="react-i18next", names=["useTranslation"]),
+        partial(import_edits, module="i18next", names=["TFunction"]),
+        helper_edits,
+        partial(call_edits, mapping=HELPER_CALLS),
+    )
+
+
+PASSES = {
+    "helpers": (regex_helpers, drop_key_helpers),
+    "calls": (regex_calls, lambda text: rename_calls(text, HELPER_CALLS)),
+    "imports": (regex_imports, token_imports),
+    "as-child": (regex_as_child, as_child_to_render),
+    # imports + helpers + calls: three regex passes vs one shared tokenization
+    "combined": (regex_combined, token_combined),
+}
+
+
+def best_of(fn, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        tokenize.cache_clear()
+        started = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Regex vs token codemod passes on the legacy components")
+    parser.add_argument("--legacy", type=Path, default=LEGACY)
+    parser.add_argument("--repeat", type=int, default=5, help="best of N timed runs per pass")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--diff", choices=sorted(PASSES), help="print regex→token output diffs for one pass")
+    args = parser.parse_args(argv)
+
+    files = sorted(args.legacy.rglob("*.tsx"))
+    texts = [f.read_text(encoding="utf-8") for f in files]
+    total_bytes = sum(len(t.encode("utf-8")) for t in texts)
+
+    lossy = [f for f, text in zip(files, texts) if "".join(tok.text for tok in tokenize(text)) != text]
+    tokenize_s = best_of(tokenize, texts, args.repeat)
+
+    rows = []
+    for name, (regex_fn, token_fn) in PASSES.items():
+        differing = []
+        for f, text in zip(files, texts):
+            old, new = regex_fn(text), token_fn(text)
+            if old == new:
+                continue
+            differing.append(f.relative_to(args.legacy).as_posix())
+            if args.diff == name:
+                rel = f.relative_to(ROOT).as_posix()
+                sys.stdout.writelines(difflib.unified_diff(
+                    old.splitlines(True), new.splitlines(True), f"regex/{rel}", f"token/{rel}", n=1))
+        if args.diff:
+            continue
+        rows.append({
+            "pass": name,
+            "regex_ms": round(best_of(regex_fn, texts, args.repeat) * 1000, 2),
+            "token_ms": round(best_of(token_fn, texts, args.repeat) * 1000, 2),
+            "files_differing": differing,
+        })
+    if args.diff:
+        return 0
+
+    report = {
+        "files": len(files),
+        "bytes": total_bytes,
+        "tokenize_ms": round(tokenize_s * 1000, 2),
+        "tokenize_mb_s": round(total_bytes / tokenize_s / 1e6, 2),
+        "lossless": not lossy,
+        "passes": rows,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{len(files)} files, {total_bytes / 1024:.0f} KiB; tokenize {report['tokenize_ms']} ms "
+              f"({report['tokenize_mb_s']} MB/s), lossless={report['lossless']}")
+        print(f"{'pass':<10} {'regex ms':>10} {'token ms':>10} {'differ':>7}")
+        for row in rows:
+            print(f"{row['pass']:<10} {row['regex_ms']:>10} {row['token_ms']:>10} {len(row['files_differing']):>7}")
+    return 1 if lossy else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Port legacy admin components and apply every fix stage in one pass.
+
+Usage:
+  python3 frontend/scripts/codemod-admin.py                      # all PORTS + in-place fixes
+  python3 frontend/scripts/codemod-admin.py UsersAdminCore        # one port
+  python3 frontend/scripts/codemod-admin.py --stages i18n,ts --check
+  python3 frontend/scripts/codemod-admin.py --dry-run > ports.patch
+  python3 frontend/scripts/codemod-admin.py --adopt               # record current ports as up to date
+"""
+
+from __future__ import annotations
+
+import admin_codemod
+
+if __name__ == "__main__":
+    raise SystemExit(admin_codemod.main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Compile messages/{en,fa}.json into minified catalogs with a size and repeated-value report.
+
+Usage:
+  python3 frontend/scripts/compile-messages.py                 # messages/compiled/<locale>.min.json + report
+  python3 frontend/scripts/compile-messages.py --dry-run --ns   # per-namespace table, nothing written
+  python3 frontend/scripts/compile-messages.py --dups 20        # most repeated values and their keys
+  python3 frontend/scripts/compile-messages.py --json > sizes.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import i18n_compile
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--out", type=Path, default=i18n_compile.COMPILED, help="output directory")
+parser.add_argument("--dry-run", action="store_true", help="report only; write nothing")
+parser.add_argument("--ns", action="store_true", help="report every namespace, not just locale totals")
+parser.add_argument("--dups", type=int, metavar="N", help="list the N most repeated values per locale")
+parser.add_argument("--json", action="store_true", help="full report as JSON")
+args = parser.parse_args()
+
+sources = i18n_compile.load()
+report = i18n_compile.report(sources)
+
+if not args.dry_run:
+    args.out.mkdir(parents=True, exist_ok=True)
+    for name, data in i18n_compile.outputs(sources).items():
+        tmp = args.out / f"{name}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, args.out / name)
+
+
+def row(label: str, r: dict) -> str:
+    def pct(after: int, before: int) -> str:
+        return f"{(after - before) / before * 100:+.1f}%" if before else ""
+
+    src, mn = r["source"], r["min"]
+    return (f"{label:<32} {src['bytes']:>8} {mn['bytes']:>8} {pct(mn['bytes'], src['bytes']):>7}"
+            f"   {src['gzip']:>7} {mn['gzip']:>7} {pct(mn['gzip'], src['gzip']):>7}")
+
+
+if args.json:
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+else:
+    header = f"{'':<32} {'source':>8} {'min':>8} {'':>7}   {'gz src':>7} {'gz min':>7}"
+    for loc, r in report.items():
+        print(f"[{loc}] {r['keys']} keys, {r['duplicate_values']} values repeated ({r['duplicate_uses']} extra uses)")
+        print(header)
+        if args.ns:
+            for ns, nr in r["namespaces"].items():
+                print(row(ns, nr))
+        print(row(f"{loc} total", r))
+        if args.dups:
+            for value, keys in list(i18n_compile.duplicates(sources[loc].catalog).items())[:args.dups]:
+                print(f"  {len(keys):>3}x {value!r}: {', '.join(keys[:4])}{' …' if len(keys) > 4 else ''}")
+        print()
+
+for loc, r in report.items():
+    if r["shadowed_keys"]:
+        print(f"{loc}: keys defined twice (last one wins): {', '.join(r['shadowed_keys'])}", file=sys.stderr)
+if not args.dry_run:
+    print(f"compile-messages: wrote {args.out}", file=sys.stderr)
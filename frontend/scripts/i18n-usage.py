@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Report used, unused, missing and dynamic i18n keys per namespace.
+
+Usage:
+  python3 frontend/scripts/i18n-usage.py                    # summary table
+  python3 frontend/scripts/i18n-usage.py --ns usersAdmin    # key lists for one namespace
+  python3 frontend/scripts/i18n-usage.py --json > usage.json
+  python3 frontend/scripts/i18n-usage.py --strict           # exit 1 on missing keys
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import i18n_index
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--ns", action="append", default=[], help="list keys for this namespace (repeatable)")
+parser.add_argument("--json", action="store_true", help="full report as JSON")
+parser.add_argument("--strict", action="store_true", help="exit 1 when a used key is missing from a catalog")
+parser.add_argument("--workers", type=int, help="process pool size for re-scanned files (default: all cores)")
+args = parser.parse_args()
+
+started = time.perf_counter()
+files, rescanned = i18n_index.build(args.workers)
+report = i18n_index.analyze(files, i18n_index.load_catalogs())
+elapsed = (time.perf_counter() - started) * 1000
+missing = sum(len(r["missing"]) for r in report.values())
+
+if args.json:
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+else:
+    print(f"{'namespace':<32} {'keys':>6} {'used':>6} {'dynamic':>8} {'unused':>7} {'missing':>8}")
+    for ns, r in report.items():
+        print(f"{ns:<32} {r['keys']:>6} {r['used']:>6} {r['covered']:>8} {len(r['unused']):>7} {len(r['missing']):>8}")
+    for ns in args.ns:
+        r = report.get(ns)
+        if r is None:
+            print(f"\n{ns}: no such namespace")
+            continue
+        for title, items in (("unused", r["unused"]), ("missing", list(r["missing"])), ("dynamic", r["dynamic"])):
+            print(f"\n{ns} {title} ({len(items)}):")
+            for item in items:
+                print(f"  {item}")
+    totals = {k: sum(r[k] if isinstance(r[k], int) else len(r[k]) for r in report.values())
+              for k in ("keys", "used", "covered", "unused")}
+    print(
+        f"\n{len(files)} files (re-scanned {len(rescanned)}), {totals['keys']} keys: {totals['used']} used, "
+        f"{totals['covered']} dynamic/indirect, {totals['unused']} unused, {missing} missing ({elapsed:.0f}ms)"
+    )
+raise SystemExit(1 if args.strict and missing else 0)
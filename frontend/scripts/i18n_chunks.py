@@ -0,0 +1,242 @@
+"""Per-namespace message chunks and the route → namespace manifest.
+
+Each top-level namespace of ``messages/{en,fa}.json`` is written to
+``messages/chunks/<locale>/<ns>.json`` as ``{"<ns>": {...}}``, so merging any
+set of chunks yields a valid (partial) message tree.
+
+The manifest maps every page route and component under ``components/admin``
+to the namespaces it needs: the namespaces of its own translator calls
+(``i18n_index``) plus those of every local module it imports, transitively.
+Routes also take the namespaces of their layouts. ``dashboard/[tab]`` is
+expanded per ``case "<tab>":`` into ``/dashboard/<tab>`` with only the
+component that case renders. A root translator called with a computed key
+(``t(item.labelKey)``) is narrowed to the namespaces of the full key literals
+in its file and direct imports (``config/admin-nav.ts``); when there are none
+the file is listed under ``unresolved`` and routes reaching it get every
+namespace.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+from i18n_index import FRONTEND, LOCALES, MESSAGES, ROOT, SRC, load_catalogs
+
+CHUNKS = MESSAGES / "chunks"
+MANIFEST = CHUNKS / "manifest.json"
+APP = SRC / "app"
+ADMIN = SRC / "components" / "admin"
+ALL = "*"
+
+SCHEMA = 1
+RESOLVE_SUFFIXES = (".tsx", ".ts", "/index.tsx", "/index.ts")
+TAB_PAGE = APP / "[locale]" / "dashboard" / "[tab]" / "page.tsx"
+TAB_CASE_RE = re.compile(r'case "([\w-]+)":|return\b[^<\n]*<([A-Z]\w*)')
+NAMED_IMPORT_RE = re.compile(r'import\s*\{([^}]*)\}\s*from\s*"([^"]+)"')
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def dump(obj: object) -> str:
+    return json.dumps(obj, ensure_ascii=False, indent=2) + "\n"
+
+
+# --- catalogs --------------------------------------------------------------
+
+def split(messages: Path = MESSAGES) -> dict[str, str]:
+    """``{chunk path: content}`` for every locale and top-level namespace."""
+    out: dict[str, str] = {}
+    for loc in LOCALES:
+        catalog = json.loads((messages / f"{loc}.json").read_text(encoding="utf-8"))
+        for ns, tree in catalog.items():
+            out[_rel(CHUNKS / loc / f"{ns}.json")] = dump({ns: tree})
+    return out
+
+
+# --- component graph -------------------------------------------------------
+
+def file_namespaces(scan: dict) -> set[str]:
+    """Top-level namespaces named by a file's own translator calls."""
+    found: set[str] = set()
+    for ns, kind, key, _line in scan["usages"]:
+        if kind == "unscoped":
+            # Translator handed in by the caller; its namespace is counted there.
+            continue
+        if ns:
+            found.add(ns.split(".", 1)[0])
+        elif kind == "key" or (kind == "prefix" and "." in key):
+            found.add(key.split(".", 1)[0])
+        else:
+            found.add(ALL)
+    return found
+
+
+def resolve_import(importer: str, spec: str, known: set[str]) -> str | None:
+    if spec.startswith("@/"):
+        base = _rel(SRC) + "/" + spec[2:]
+    else:
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), spec)).replace(os.sep, "/")
+    for suffix in ("", *RESOLVE_SUFFIXES):
+        if base + suffix in known:
+            return base + suffix
+    return None
+
+
+class Graph:
+    def __init__(self, files: dict[str, dict], keys: set[str]):
+        known = set(files)
+        self.own = {rel: file_namespaces(scan) for rel, scan in files.items()}
+        self.deps = {
+            rel: sorted({d for spec in scan["imports"] if (d := resolve_import(rel, spec, known))})
+            for rel, scan in files.items()
+        }
+        for rel, own in self.own.items():
+            if ALL not in own:
+                continue
+            named = {lit.split(".", 1)[0] for d in (rel, *self.deps[rel]) for lit in files[d]["literals"] if lit in keys}
+            if named:
+                own.discard(ALL)
+                own |= named
+        self._closure: dict[str, frozenset[str]] = {}
+
+    def reach(self, roots: list[str]) -> set[str]:
+        seen: set[str] = set()
+        stack = [r for r in roots if r in self.own]
+        while stack:
+            rel = stack.pop()
+            if rel not in seen:
+                seen.add(rel)
+                stack.extend(self.deps[rel])
+        return seen
+
+    def namespaces(self, *roots: str) -> set[str]:
+        key = "\0".join(sorted(roots))
+        if key not in self._closure:
+            found: set[str] = set()
+            for rel in self.reach(list(roots)):
+                found |= self.own[rel]
+            self._closure[key] = frozenset(found)
+        return set(self._closure[key])
+
+
+# --- routes ----------------------------------------------------------------
+
+def _route(page: Path) -> str:
+    parts = page.parent.relative_to(APP).parts
+    return "/" + "/".join(p for p in parts if p != "[locale]")
+
+
+def _layouts(page: Path) -> list[str]:
+    out = []
+    for d in [page.parent, *page.parent.parents]:
+        if (d / "layout.tsx").is_file():
+            out.append(_rel(d / "layout.tsx"))
+        if d == APP:
+            break
+    return out
+
+
+def tab_cases(text: str) -> dict[str, str]:
+    """``case "<tab>":`` → the component name its ``return`` renders."""
+    pending: list[str] = []
+    out: dict[str, str] = {}
+    for m in TAB_CASE_RE.finditer(text):
+        if m.group(1):
+            pending.append(m.group(1))
+        elif pending:
+            out.update(dict.fromkeys(pending, m.group(2)))
+            pending = []
+    return out
+
+
+def _named_imports(text: str) -> dict[str, str]:
+    out = {}
+    for m in NAMED_IMPORT_RE.finditer(text):
+        for name in m.group(1).split(","):
+            name = name.strip().split(" as ")[-1].strip()
+            if name:
+                out[name] = m.group(2)
+    return out
+
+
+def _finish(found: set[str], catalog_ns: list[str]) -> list[str]:
+    return list(catalog_ns) if ALL in found else sorted(found & set(catalog_ns))
+
+
+def routes(graph: Graph, catalog_ns: list[str]) -> dict[str, list[str]]:
+    out: dict[str, list[str]] = {}
+    for page in sorted(APP.rglob("page.tsx")):
+        rel = _rel(page)
+        base = graph.namespaces(*_layouts(page))
+        if page != TAB_PAGE:
+            out[_route(page)] = _finish(base | graph.namespaces(rel), catalog_ns)
+            continue
+        text = page.read_text(encoding="utf-8")
+        imports = _named_imports(text)
+        known = set(graph.own)
+        cases = {tab: resolve_import(rel, imports.get(name, ""), known) for tab, name in tab_cases(text).items()}
+        # Everything but the per-tab clients (tab guard, fallback title) renders on every tab.
+        shared = base | graph.own[rel] | graph.namespaces(*(d for d in graph.deps[rel] if d not in cases.values()))
+        prefix = _route(page).removesuffix("[tab]")
+        for tab, target in cases.items():
+            out[prefix + tab] = _finish(shared | (graph.namespaces(target) if target else set()), catalog_ns)
+        out[_route(page)] = _finish(shared, catalog_ns)
+    return dict(sorted(out.items()))
+
+
+def manifest(files: dict[str, dict], catalog_ns: list[str], keys: set[str]) -> dict:
+    graph = Graph(files, keys)
+    admin = _rel(ADMIN) + "/"
+    src = _rel(SRC) + "/"
+    components = {
+        rel.removeprefix(src): _finish(graph.namespaces(rel), catalog_ns) for rel in sorted(files) if rel.startswith(admin)
+    }
+    return {
+        "schema": SCHEMA,
+        "locales": list(LOCALES),
+        "chunks": _rel(CHUNKS).removeprefix(_rel(FRONTEND) + "/") + "/{locale}/{namespace}.json",
+        "namespaces": catalog_ns,
+        "routes": routes(graph, catalog_ns),
+        "components": components,
+        "unresolved": sorted(rel for rel, own in graph.own.items() if ALL in own),
+    }
+
+
+# --- output ----------------------------------------------------------------
+
+def outputs(files: dict[str, dict], messages: Path = MESSAGES) -> dict[str, str]:
+    """Every generated file, keyed by repo-relative path."""
+    chunks = split(messages)
+    catalog_ns = sorted({Path(p).stem for p in chunks})
+    keys = set().union(*load_catalogs(messages).values())
+    return {**chunks, _rel(MANIFEST): dump(manifest(files, catalog_ns, keys))}
+
+
+def stale(expected: dict[str, str]) -> tuple[list[str], list[str]]:
+    """(files to write, generated files no longer produced)."""
+    changed = []
+    for rel, content in expected.items():
+        path = ROOT / rel
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                continue
+        except OSError:
+            pass
+        changed.append(rel)
+    orphans = sorted(_rel(p) for p in CHUNKS.rglob("*.json") if _rel(p) not in expected) if CHUNKS.is_dir() else []
+    return changed, orphans
+
+
+def write(expected: dict[str, str], changed: list[str], orphans: list[str]) -> None:
+    for rel in changed:
+        path = ROOT / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(expected[rel], encoding="utf-8")
+        os.replace(tmp, path)
+    for rel in orphans:
+        (ROOT / rel).unlink()
@@ -0,0 +1,98 @@
+"""Minified builds of messages/{en,fa}.json and a report of repeated values.
+
+``<locale>.min.json`` is the catalog without whitespace; next-intl loads it as
+is. Values that repeat across keys ("Save", "Loading…", column names) are
+listed with their keys so they can be merged into a common namespace by hand:
+next-intl has no string references, and gzip already removes most of the
+repetition on the wire.
+
+Sizes are measured per namespace as ``{"<ns>": {...}}`` documents, the shape
+of the ``i18n_chunks`` chunk files, so the report applies to split loading.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from i18n_index import LOCALES, MESSAGES, flatten
+
+COMPILED = MESSAGES / "compiled"
+
+
+def pretty(obj: object) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode()
+
+
+def minify(obj: object) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def gz(data: bytes) -> int:
+    return len(gzip.compress(data, 9, mtime=0))
+
+
+def duplicates(catalog: dict) -> dict[str, list[str]]:
+    """Values used by more than one key → those keys, most repeated first."""
+    keys: dict[str, list[str]] = {}
+    for key, value in flatten(catalog).items():
+        keys.setdefault(value, []).append(key)
+    return dict(sorted(((v, k) for v, k in keys.items() if len(k) > 1), key=lambda item: -len(item[1])))
+
+
+class Source(NamedTuple):
+    catalog: dict
+    raw: bytes
+    shadowed: list[str]  # keys defined twice in one object; JSON keeps the last
+
+
+def load(messages: Path = MESSAGES) -> dict[str, Source]:
+    out: dict[str, Source] = {}
+    for loc in LOCALES:
+        shadowed: list[str] = []
+
+        def pairs(items: list[tuple[str, object]], shadowed=shadowed) -> dict:
+            obj: dict = {}
+            for k, v in items:
+                if k in obj:
+                    shadowed.append(k)
+                obj[k] = v
+            return obj
+
+        raw = (messages / f"{loc}.json").read_bytes()
+        out[loc] = Source(json.loads(raw, object_pairs_hook=pairs), raw, shadowed)
+    return out
+
+
+def _sizes(data: bytes) -> dict[str, int]:
+    return {"bytes": len(data), "gzip": gz(data)}
+
+
+def report(sources: dict[str, Source]) -> dict[str, dict]:
+    """Per locale: totals for source / minified, and the same per namespace."""
+    out: dict[str, dict] = {}
+    for loc, (catalog, raw, shadowed) in sources.items():
+        namespaces = {
+            ns: {
+                "source": _sizes(pretty({ns: tree})),
+                "min": _sizes(minify({ns: tree})),
+            }
+            for ns, tree in catalog.items()
+        }
+        dups = duplicates(catalog)
+        out[loc] = {
+            "keys": len(flatten(catalog)),
+            "duplicate_values": len(dups),
+            "duplicate_uses": sum(len(k) - 1 for k in dups.values()),
+            "shadowed_keys": shadowed,
+            "source": _sizes(raw),
+            "min": _sizes(minify(catalog)),
+            "namespaces": namespaces,
+        }
+    return out
+
+
+def outputs(sources: dict[str, Source]) -> dict[str, bytes]:
+    """``{file name: content}``."""
+    return {f"{loc}.min.json": minify(catalog) for loc, (catalog, _raw, _shadowed) in sources.items()}
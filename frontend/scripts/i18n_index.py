@@ -0,0 +1,354 @@
+"""i18n key usage index for frontend/src against messages/{en,fa}.json.
+
+Each translator variable (``const t = useTranslations("ns")``, ``await
+getTranslations(...)``) is resolved to its namespace within the block that
+declares it, and every call through it (``t("k")``, ``tInbound(...)``,
+``t.rich/raw/has(...)``) becomes a usage:
+
+``key``      literal key — counts as used, or missing when not in a catalog
+``prefix``   template key (`status_${st}`) — covers every key with that prefix
+``opaque``   computed key (``t(item.labelKey)``) — string literals in the same
+             file that name a key of that namespace count as used
+``unscoped`` call through a translator parameter (``t: (k) => string``) —
+             covers keys with that leaf path in any namespace
+
+Local imports (``@/…`` and relative specifiers) are recorded alongside, so
+``i18n_chunks`` can follow the component graph from the same cache.
+
+Files are tokenized with ``tsx_tokens``; per-file results are cached by
+(mtime, size), so re-indexing after an edit only re-reads what changed.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from tsx_tokens import TRIVIA, Token, next_sig, tokenize
+
+ROOT = Path(__file__).resolve().parents[2]
+FRONTEND = ROOT / "frontend"
+SRC = FRONTEND / "src"
+MESSAGES = FRONTEND / "messages"
+LOCALES = ("en", "fa")
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+CACHE = CACHE_DIR / "i18n-index.json"
+
+SCHEMA = 2
+TRANSLATOR_FACTORIES = frozenset(("useTranslations", "getTranslations"))
+TRANSLATOR_METHODS = frozenset(("rich", "raw", "has", "markup"))
+# Unbound callees that are translators by convention (parameters, props).
+TRANSLATOR_NAME_RE = re.compile(r"t[lpr]?(?:[A-Z]\w*)?$")
+KEY_RE = re.compile(r"[A-Za-z0-9_][\w.-]*$")
+
+
+class Usage(NamedTuple):
+    ns: str | None  # "" for the root translator, None when unscoped
+    kind: str  # key | prefix | opaque | unscoped
+    key: str  # key, static prefix, or source text of an opaque argument
+    line: int
+
+
+# --- per-file scan ---------------------------------------------------------
+
+def _string_value(tok: Token) -> str | None:
+    """Text of a string literal or a template without holes."""
+    if tok.kind == "string" and len(tok.text) >= 2:
+        return tok.text[1:-1]
+    if tok.kind == "template" and tok.text.startswith("`") and tok.text.endswith("`") and len(tok.text) >= 2:
+        return tok.text[1:-1]
+    return None
+
+
+def _binding(tokens: tuple[Token, ...], i: int) -> tuple[str, str] | None:
+    """``const NAME = [await] useTranslations|getTranslations(<ns>)`` at ``i``."""
+    j = next_sig(tokens, i)
+    if j is None or tokens[j].kind != "ident":
+        return None
+    name = tokens[j].text
+    k = next_sig(tokens, j)
+    if k is None or tokens[k].text != "=":
+        return None
+    k = next_sig(tokens, k)
+    if k is not None and tokens[k].text == "await":
+        k = next_sig(tokens, k)
+    if k is None or tokens[k].text not in TRANSLATOR_FACTORIES:
+        return None
+    k = next_sig(tokens, k)
+    if k is None or tokens[k].text != "(":
+        return None
+    k = next_sig(tokens, k)
+    if k is None or tokens[k].text == ")":
+        return name, ""
+    if (ns := _string_value(tokens[k])) is not None:
+        return name, ns
+    if tokens[k].text == "{":
+        # getTranslations({ locale, namespace: "ns" })
+        while (k := next_sig(tokens, k)) is not None and tokens[k].text != "}":
+            if tokens[k].text == "namespace":
+                v = next_sig(tokens, next_sig(tokens, k))
+                if v is not None and (ns := _string_value(tokens[v])) is not None:
+                    return name, ns
+        return name, ""
+    return None
+
+
+def _first_arg(tokens: tuple[Token, ...], open_paren: int) -> list[Token]:
+    depth = 0
+    out: list[Token] = []
+    k = open_paren + 1
+    while k < len(tokens):
+        tok = tokens[k]
+        if tok.kind == "punct":
+            if tok.text in "([{":
+                depth += 1
+            elif tok.text in ")]}":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif tok.text == "," and depth == 0:
+                break
+        if tok.kind not in TRIVIA:
+            out.append(tok)
+        k += 1
+    return out
+
+
+def _local_spec(tokens: tuple[Token, ...], k: int | None) -> str | None:
+    if k is not None and tokens[k].text == "(":
+        k = next_sig(tokens, k)
+    spec = _string_value(tokens[k]) if k is not None else None
+    return spec if spec and spec.startswith(("@/", ".")) else None
+
+
+def scan_source(text: str) -> dict:
+    """Usages, local imports and candidate key literals.
+
+    Files with opaque calls keep every key-like literal; other files keep only
+    dotted ones (full key paths that an importer may pass to a translator).
+    """
+    tokens = tokenize(text)
+    newlines = [m.start() for m in re.finditer("\n", text)]
+    scopes: list[dict[str, str]] = [{}]
+    usages: list[Usage] = []
+    literals: set[str] = set()
+    imports: set[str] = set()
+
+    def resolve(name: str) -> str | None:
+        for scope in reversed(scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    for i, tok in enumerate(tokens):
+        kind = tok.kind
+        if kind == "punct":
+            if tok.text == "{":
+                scopes.append({})
+            elif tok.text == "}" and len(scopes) > 1:
+                scopes.pop()
+            continue
+        if kind in ("string", "template"):
+            value = _string_value(tok)
+            if value and KEY_RE.match(value):
+                literals.add(value)
+            continue
+        if kind != "ident":
+            continue
+        if tok.text in ("import", "from"):
+            if spec := _local_spec(tokens, next_sig(tokens, i)):
+                imports.add(spec)
+            continue
+        if tok.text in ("const", "let", "var"):
+            bound = _binding(tokens, i)
+            if bound:
+                scopes[-1][bound[0]] = bound[1]
+            continue
+
+        k = next_sig(tokens, i)
+        if k is None:
+            continue
+        if tokens[k].text == ".":
+            m = next_sig(tokens, k)
+            if m is None or tokens[m].text not in TRANSLATOR_METHODS:
+                continue
+            k = next_sig(tokens, m)
+            if k is None:
+                continue
+        if tokens[k].text != "(":
+            continue
+        prev = i - 1
+        while prev >= 0 and tokens[prev].kind in TRIVIA:
+            prev -= 1
+        if prev >= 0 and tokens[prev].text in (".", "?.", "function"):
+            continue
+        ns = resolve(tok.text)
+        if ns is None and not TRANSLATOR_NAME_RE.match(tok.text):
+            continue
+        line = bisect_right(newlines, tok.start) + 1
+        arg = _first_arg(tokens, k)
+        if not arg:
+            continue
+        value = _string_value(arg[0]) if len(arg) == 1 else None
+        if ns is None:
+            if value is not None and "${" not in value:
+                usages.append(Usage(None, "unscoped", value, line))
+        elif value is not None:
+            usages.append(Usage(ns, "key", value, line))
+        elif arg[0].kind == "template":
+            usages.append(Usage(ns, "prefix", arg[0].text[1:].removesuffix("${"), line))
+        else:
+            usages.append(Usage(ns, "opaque", "".join(t.text for t in arg), line))
+
+    opaque = any(u.kind == "opaque" for u in usages)
+    return {
+        "usages": [list(u) for u in usages],
+        "imports": sorted(imports),
+        "literals": sorted(literals if opaque else (lit for lit in literals if "." in lit)),
+    }
+
+
+# --- cache -----------------------------------------------------------------
+
+def source_files(src: Path = SRC) -> list[Path]:
+    return sorted(p for p in src.rglob("*") if p.suffix in (".ts", ".tsx") and p.is_file())
+
+
+def load_cache() -> dict:
+    try:
+        data = json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("schema") == SCHEMA else {}
+
+
+def save_cache(files: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"schema": SCHEMA, "files": files}, ensure_ascii=False))
+    os.replace(tmp, CACHE)
+
+
+def _scan(path: Path) -> dict:
+    return scan_source(path.read_text(encoding="utf-8"))
+
+
+def build(workers: int | None = None, src: Path = SRC) -> tuple[dict[str, dict], list[str]]:
+    """Return ({file: scan}, files re-scanned this run)."""
+    cached = load_cache()
+    fresh: dict[str, dict] = {}
+    stale: list[Path] = []
+    for path in source_files(src):
+        rel = path.relative_to(ROOT).as_posix()
+        st = path.stat()
+        entry = cached.get(rel)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            fresh[rel] = entry
+        else:
+            stale.append(path)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(stale) < 2:
+        results = list(map(_scan, stale))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_scan, stale, chunksize=max(1, len(stale) // (4 * workers))))
+
+    rescanned = []
+    for path, scan in zip(stale, results):
+        st = path.stat()
+        rel = path.relative_to(ROOT).as_posix()
+        fresh[rel] = {**scan, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        rescanned.append(rel)
+    if stale or len(fresh) != len(cached):
+        save_cache(fresh)
+    return fresh, rescanned
+
+
+# --- report ----------------------------------------------------------------
+
+def flatten(obj: dict, prefix: str = "", out: dict[str, object] | None = None) -> dict[str, object]:
+    """Leaf key paths → values, as check-i18n.mjs flattens the message trees."""
+    out = {} if out is None else out
+    for k, v in obj.items():
+        path = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            flatten(v, path, out)
+        else:
+            out[path] = v
+    return out
+
+
+def load_catalogs(messages: Path = MESSAGES) -> dict[str, dict[str, object]]:
+    return {loc: flatten(json.loads((messages / f"{loc}.json").read_text(encoding="utf-8"))) for loc in LOCALES}
+
+
+def _full(ns: str, key: str) -> str:
+    return f"{ns}.{key}" if ns else key
+
+
+def _covered(keys: list[str], path: str) -> list[str]:
+    """Catalog keys equal to ``path`` or under it (``t.raw("group")``)."""
+    return [k for k in keys if k == path or k.startswith(path + ".")]
+
+
+def analyze(files: dict[str, dict], catalogs: dict[str, dict[str, object]]) -> dict[str, dict]:
+    """Per top-level namespace: keys, used, covered (dynamic/indirect), unused, missing."""
+    all_keys = sorted(set().union(*catalogs.values()))
+    by_ns: dict[str, list[str]] = {}
+    for key in all_keys:
+        by_ns.setdefault(key.split(".", 1)[0], []).append(key)
+    leaves: dict[str, list[str]] = {}
+    for key in all_keys:
+        leaves.setdefault(key.rsplit(".", 1)[-1], []).append(key)
+
+    used: set[str] = set()
+    covered: set[str] = set()
+    missing: dict[str, dict[str, list[str]]] = {}
+    dynamic: dict[str, list[str]] = {}
+    for rel, scan in files.items():
+        opaque_ns: set[str] = set()
+        for ns, kind, key, line in scan["usages"]:
+            where = f"{rel}:{line}"
+            if kind == "unscoped":
+                covered.update(leaves.get(key.rsplit(".", 1)[-1], ()))
+                continue
+            top = _full(ns, key).split(".", 1)[0] if kind != "opaque" else (ns.split(".", 1)[0] or "(root)")
+            if kind == "key":
+                path = _full(ns, key)
+                hits = _covered(by_ns.get(top, []), path)
+                used.update(hits)
+                for loc, catalog in catalogs.items():
+                    if path not in catalog and not any(k.startswith(path + ".") for k in by_ns.get(top, [])):
+                        missing.setdefault(top, {}).setdefault(path, []).append(f"{loc} {where}")
+            elif kind == "prefix":
+                path = _full(ns, key)
+                covered.update(k for k in all_keys if k.startswith(path))
+                dynamic.setdefault(top, []).append(f"{where} {path}${{…}}")
+            else:
+                opaque_ns.add(ns)
+                dynamic.setdefault(top, []).append(f"{where} {ns or '(root)'}[{key}]")
+        for ns in opaque_ns:
+            for literal in scan["literals"]:
+                path = _full(ns, literal)
+                if path in catalogs["en"] or path in catalogs[LOCALES[-1]]:
+                    covered.add(path)
+
+    report: dict[str, dict] = {}
+    for ns in sorted(set(by_ns) | set(missing) | set(dynamic)):
+        keys = by_ns.get(ns, [])
+        ns_used = [k for k in keys if k in used]
+        ns_unused = [k for k in keys if k not in used and k not in covered]
+        report[ns] = {
+            "keys": len(keys),
+            "used": len(ns_used),
+            "covered": len(keys) - len(ns_used) - len(ns_unused),
+            "unused": ns_unused,
+            "missing": {k: sorted(v) for k, v in sorted(missing.get(ns, {}).items())},
+            "dynamic": sorted(dynamic.get(ns, [])),
+        }
+    return report
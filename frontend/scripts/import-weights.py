@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Report what each admin client bundles: transitive byte weight and lazy-loading candidates.
+
+Usage:
+  python3 frontend/scripts/import-weights.py                       # one line per admin client, heaviest first
+  python3 frontend/scripts/import-weights.py --root src/components/admin/users-admin-client.tsx
+  python3 frontend/scripts/import-weights.py --candidates --min-kb 8
+  python3 frontend/scripts/import-weights.py --json > weights.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import import_graph
+from i18n_index import FRONTEND, ROOT
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--root", action="append", default=[], help="analyze this file instead of the admin clients (repeatable)")
+parser.add_argument("--candidates", action="store_true", help="list lazy-loading candidates under each root")
+parser.add_argument("--min-kb", type=float, default=import_graph.LAZY_MIN_BYTES / 1024,
+                    help="smallest exclusive weight worth splitting (default: %(default)s)")
+parser.add_argument("--json", action="store_true", help="full report as JSON")
+args = parser.parse_args()
+
+
+def root_rel(arg: str) -> str:
+    for base in (ROOT, FRONTEND):
+        path = (base / arg).resolve()
+        if path.is_file():
+            return path.relative_to(ROOT).as_posix()
+    sys.exit(f"import-weights: no such file: {arg}")
+
+
+started = time.perf_counter()
+files, rescanned = import_graph.scan_files()
+graph = import_graph.ImportGraph(files)
+roots = [root_rel(r) for r in args.root] or import_graph.clients()
+report = {root: graph.report(root, int(args.min_kb * 1024)) for root in roots}
+elapsed = (time.perf_counter() - started) * 1000
+
+if args.json:
+    print(json.dumps(report, indent=2))
+    raise SystemExit(0)
+
+
+def short(rel: str) -> str:
+    return rel.removeprefix("frontend/src/")
+
+
+def kb(n: int) -> str:
+    return f"{n / 1024:.1f}"
+
+
+print(f"{'root':<56} {'KiB':>7} {'own':>6} {'files':>6} {'lazy?':>6}  heaviest import")
+for root, r in sorted(report.items(), key=lambda item: -item[1]["bytes"]):
+    heaviest = short(r["heaviest"][0]) if r["heaviest"] else ""
+    print(f"{short(root):<56} {kb(r['bytes']):>7} {kb(r['own']):>6} {r['files']:>6} {len(r['candidates']):>6}  {heaviest}")
+    if args.candidates or args.root:
+        for c in r["candidates"]:
+            print(f"    -{kb(c['bytes']):>6} KiB  {short(c['from'])}:{c['line']} → {short(c['to'])}")
+        if args.root:
+            print(f"    packages: {', '.join(r['packages']) or '-'}")
+            if r["lazy"]:
+                print(f"    already lazy: {', '.join(map(short, r['lazy']))}")
+print(f"\n{len(files)} files (re-scanned {len(rescanned)}), {len(report)} roots ({elapsed:.0f}ms)", file=sys.stderr)
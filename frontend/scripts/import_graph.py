@@ -0,0 +1,262 @@
+"""Import graph of frontend/src with per-file byte weights.
+
+Every ``import``/``export … from`` statement and ``import("…")`` call is an
+edge of one kind:
+
+``static``   bundled with the importer
+``type``     ``import type`` (or only ``type`` names) — erased, weight 0
+``dynamic``  ``import("…")`` / ``next/dynamic`` — already split out
+
+``@/`` and relative specifiers resolve to files under ``src`` (``.json`` and
+other assets become leaf nodes); bare specifiers are packages, listed but not
+weighed. A file's weight is its source size in bytes; a root's weight is the
+sum over its static closure.
+
+A static edge ``A → B`` is a lazy-loading candidate when every name ``A``
+imports from ``B`` is only rendered as a JSX tag (so ``next/dynamic`` can wrap
+it) and removing the edge drops bytes from the root's closure — the edge's
+*exclusive* weight, i.e. what nothing else in that closure pulls in.
+``components/ui`` primitives and edges carrying most of the root (the page
+body behind a thin wrapper) are never candidates.
+
+Per-file edges are cached by (mtime, size) like ``i18n_index``; a re-run only
+re-tokenizes files that changed.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import NamedTuple
+
+from i18n_chunks import ADMIN, _rel, resolve_import
+from i18n_index import CACHE_DIR, ROOT, SRC, _string_value, source_files
+from tsx_tokens import Token, next_sig, prev_sig, tokenize
+
+CACHE = CACHE_DIR / "import-graph.json"
+SCHEMA = 1
+STATIC, TYPE, DYNAMIC = "static", "type", "dynamic"
+CLIENT_GLOB = "**/*-client.tsx"
+LAZY_MIN_BYTES = 4096
+# Primitives (buttons, selects, dialogs) render on first paint; splitting them only adds requests.
+PRIMITIVES = "frontend/src/components/ui/"
+# An edge carrying more than this share of the root is the page body itself, not a side branch.
+BODY_SHARE = 0.5
+
+
+# --- per-file scan ---------------------------------------------------------
+
+def _statement(tokens: tuple[Token, ...], i: int) -> tuple[str | None, bool, dict[str, bool], int]:
+    """``import …``/``export … from`` at ``i`` → (specifier, type only, {local: is type}, spec index)."""
+    j = next_sig(tokens, i)
+    type_only = j is not None and tokens[j].text == "type"
+    names: dict[str, bool] = {}
+    braces = False
+    pending_type = False
+    while j is not None:
+        tok = tokens[j]
+        if tok.kind == "string":
+            return _string_value(tok), type_only, names, j
+        if tok.text in (";", "=", "("):
+            break
+        if tok.text == "{":
+            braces = True
+        elif tok.text == "}":
+            braces = False
+        elif tok.kind == "ident" and tok.text not in ("import", "export", "from", "as", "type", "default"):
+            k = next_sig(tokens, j)
+            if k is not None and tokens[k].text == "as":
+                j = k
+                continue
+            names[tok.text] = type_only or pending_type
+        if tok.kind == "ident":
+            pending_type = braces and tok.text == "type"
+        j = next_sig(tokens, j)
+    return None, type_only, names, i
+
+
+def _name_uses(tokens: tuple[Token, ...], names: set[str], skip: set[int]) -> dict[str, set[str]]:
+    """``{name: {"jsx", "value"}}`` — how each imported name is used in the file."""
+    uses: dict[str, set[str]] = {n: set() for n in names}
+    for i, tok in enumerate(tokens):
+        if i in skip:
+            continue
+        if tok.kind == "jsxident":
+            base = tok.text.split(".", 1)[0]
+            if base in uses:
+                uses[base].add("jsx")
+        elif tok.kind == "ident" and tok.text in uses:
+            prv = prev_sig(tokens, i)
+            if prv is not None and tokens[prv].text in (".", "?."):
+                continue
+            uses[tok.text].add("value")
+    return uses
+
+
+def scan_source(text: str) -> list[dict]:
+    """``[{"spec", "kind", "line", "jsx_only"}]`` for every import in a file."""
+    tokens = tokenize(text)
+    newlines = [m.start() for m in re.finditer("\n", text)]
+    found: list[tuple[str, str, int, dict[str, bool]]] = []
+    skip: set[int] = set()
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text not in ("import", "export"):
+            continue
+        prv = prev_sig(tokens, i)
+        if prv is not None and tokens[prv].text in (".", "?."):
+            continue
+        line = bisect_right(newlines, tok.start) + 1
+        nxt = next_sig(tokens, i)
+        if tok.text == "import" and nxt is not None and tokens[nxt].text == "(":
+            spec_at = next_sig(tokens, nxt)
+            spec = _string_value(tokens[spec_at]) if spec_at is not None else None
+            close = next_sig(tokens, spec_at) if spec else None
+            after = next_sig(tokens, close) if close is not None else None
+            if spec:
+                # `import("x").T` is a type reference, not a chunk.
+                typed = after is not None and tokens[after].text == "."
+                found.append((spec, TYPE if typed else DYNAMIC, line, {}))
+            continue
+        spec, type_only, names, end = _statement(tokens, i)
+        if spec is None or (tok.text == "export" and tokens[prev_sig(tokens, end)].text != "from"):
+            continue
+        skip.update(range(i, end + 1))
+        kind = TYPE if type_only or (names and all(names.values())) else STATIC
+        found.append((spec, kind, line, names))
+
+    value_names = {n for _s, kind, _l, names in found if kind == STATIC for n, is_type in names.items() if not is_type}
+    uses = _name_uses(tokens, value_names, skip)
+    out = []
+    for spec, kind, line, names in found:
+        local = [n for n, is_type in names.items() if not is_type]
+        jsx_only = kind == STATIC and bool(local) and all(uses[n] == {"jsx"} for n in local)
+        out.append({"spec": spec, "kind": kind, "line": line, "jsx_only": jsx_only})
+    return out
+
+
+# --- cache -----------------------------------------------------------------
+
+def load_cache() -> dict:
+    try:
+        data = json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("schema") == SCHEMA else {}
+
+
+def save_cache(files: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"schema": SCHEMA, "files": files}))
+    os.replace(tmp, CACHE)
+
+
+def scan_files(src: Path = SRC) -> tuple[dict[str, dict], list[str]]:
+    """Return ({file: {"size", "mtime_ns", "imports"}}, files re-scanned this run)."""
+    cached = load_cache()
+    files: dict[str, dict] = {}
+    rescanned: list[str] = []
+    for path in source_files(src):
+        rel = _rel(path)
+        st = path.stat()
+        entry = cached.get(rel)
+        if not entry or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                     "imports": scan_source(path.read_text(encoding="utf-8"))}
+            rescanned.append(rel)
+        files[rel] = entry
+    if rescanned or len(files) != len(cached):
+        save_cache(files)
+    return files, rescanned
+
+
+# --- graph -----------------------------------------------------------------
+
+class Edge(NamedTuple):
+    src: str
+    dst: str
+    kind: str  # static | type | dynamic
+    line: int
+    jsx_only: bool
+
+
+class ImportGraph:
+    def __init__(self, files: dict[str, dict]):
+        known = set(files)
+        self.weight: dict[str, int] = {rel: entry["size"] for rel, entry in files.items()}
+        self.edges: dict[str, list[Edge]] = {rel: [] for rel in files}
+        self.packages: dict[str, set[str]] = {rel: set() for rel in files}
+        for rel, entry in files.items():
+            for imp in entry["imports"]:
+                spec = imp["spec"]
+                if not spec.startswith(("@/", ".")):
+                    if imp["kind"] == STATIC:
+                        self.packages[rel].add(_package(spec))
+                    continue
+                dst = resolve_import(rel, spec, known) or self._asset(rel, spec)
+                if dst is not None:
+                    self.edges[rel].append(Edge(rel, dst, imp["kind"], imp["line"], imp["jsx_only"]))
+
+    def _asset(self, importer: str, spec: str) -> str | None:
+        """Non-TS local import (``.json``, ``.css``) — a leaf weighed by its size."""
+        if spec.startswith("@/"):
+            base = _rel(SRC) + "/" + spec[2:]
+        else:
+            base = os.path.normpath(os.path.join(os.path.dirname(importer), spec)).replace(os.sep, "/")
+        path = ROOT / base
+        if not path.is_file():
+            return None
+        self.weight.setdefault(base, path.stat().st_size)
+        self.edges.setdefault(base, [])
+        self.packages.setdefault(base, set())
+        return base
+
+    def closure(self, root: str, without: Edge | None = None) -> set[str]:
+        """Files bundled with ``root``: its static imports, transitively."""
+        seen: set[str] = set()
+        stack = [root]
+        while stack:
+            rel = stack.pop()
+            if rel in seen:
+                continue
+            seen.add(rel)
+            stack.extend(e.dst for e in self.edges.get(rel, ()) if e.kind == STATIC and e is not without)
+        return seen
+
+    def size(self, files: set[str]) -> int:
+        return sum(self.weight[rel] for rel in files)
+
+    def report(self, root: str, min_bytes: int = LAZY_MIN_BYTES) -> dict:
+        files = self.closure(root)
+        total = self.size(files)
+        candidates = []
+        for rel in sorted(files):
+            for edge in self.edges[rel]:
+                if edge.kind != STATIC or not edge.jsx_only or edge.dst.startswith(PRIMITIVES):
+                    continue
+                exclusive = total - self.size(self.closure(root, without=edge))
+                if min_bytes <= exclusive <= total * BODY_SHARE:
+                    candidates.append({"from": edge.src, "line": edge.line, "to": edge.dst, "bytes": exclusive})
+        candidates.sort(key=lambda c: -c["bytes"])
+        lazy = sorted({e.dst for rel in files for e in self.edges[rel] if e.kind == DYNAMIC})
+        return {
+            "bytes": total,
+            "files": len(files),
+            "own": self.weight[root],
+            "packages": sorted(set().union(*(self.packages[rel] for rel in files))),
+            "lazy": lazy,
+            "candidates": candidates,
+            "heaviest": sorted((rel for rel in files if rel != root), key=lambda r: -self.weight[r])[:5],
+        }
+
+
+def _package(spec: str) -> str:
+    parts = spec.split("/")
+    return "/".join(parts[:2]) if spec.startswith("@") else parts[0]
+
+
+def clients() -> list[str]:
+    """Admin client roots: ``components/admin/**/*-client.tsx``."""
+    return sorted(_rel(p) for p in ADMIN.glob(CLIENT_GLOB))
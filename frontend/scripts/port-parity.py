@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Compare legacy admin components with their ports by structural fingerprint and report drift.
+
+Usage:
+  python3 frontend/scripts/port-parity.py                          # one line per PORTS pair
+  python3 frontend/scripts/port-parity.py dashboard-users-admin.tsx   # facet details for some pairs
+  python3 frontend/scripts/port-parity.py --check                  # exit 1 if a legacy fingerprint left its baseline
+  python3 frontend/scripts/port-parity.py --accept                 # record current legacy fingerprints as reviewed
+  python3 frontend/scripts/port-parity.py --json > parity.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import port_parity
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("names", nargs="*", help="PORTS src, dest or export_to name (default: all)")
+parser.add_argument("--check", action="store_true", help="exit 1 when a legacy component changed since its baseline")
+parser.add_argument("--accept", action="store_true", help="write the current legacy fingerprints to port-parity.json")
+parser.add_argument("--json", action="store_true", help="full report as JSON")
+args = parser.parse_args()
+
+started = time.perf_counter()
+fps = port_parity.Fingerprints()
+report = port_parity.report(fps, args.names)
+fps.save()
+elapsed = (time.perf_counter() - started) * 1000
+
+if args.json:
+    print(json.dumps({dest: {k: v for k, v in r.items() if k != "fingerprint"} for dest, r in report.items()}, indent=2))
+else:
+    def counts(diff: dict) -> str:
+        return " ".join(f"{f}-{len(diff[f]['removed'])}+{len(diff[f]['added'])}"
+                        for f in ("exports", "keys", "ops") if diff[f]["removed"] or diff[f]["added"])
+
+    print(f"{'port':<40} {'legacy':<9} {'archive':<8} {'jsx':>6}  ported vs legacy")
+    for dest, r in report.items():
+        if "missing" in r:
+            print(f"{dest:<40} missing {r['missing']} file")
+            continue
+        legacy = r["baseline"] or "new"
+        if r["since_port"]:
+            legacy += "*"
+        print(f"{dest:<40} {legacy:<9} {r['archive'] or '-':<8} {r['ported']['jsx']:>6.3f}  {counts(r['ported']) or 'in sync'}")
+        if not args.names:
+            continue
+        for title, diff in (("legacy since baseline", r["since_baseline"]), ("ported vs legacy", r["ported"])):
+            if diff is None or not port_parity.differs(diff):
+                continue
+            print(f"  {title}: jsx similarity {diff['jsx']:.3f}")
+            for facet in ("exports", "keys", "ops"):
+                for sign, names in (("-", diff[facet]["removed"]), ("+", diff[facet]["added"])):
+                    for name in names:
+                        print(f"    {sign} {facet[:-1]} {name}")
+    print(f"\n{len(report)} pairs (re-fingerprinted {len(fps.rescanned)} files, {elapsed:.0f}ms); "
+          "legacy: same/changed vs baseline, * = source edited since the codemod ran", file=sys.stderr)
+
+if args.accept:
+    port_parity.save_baseline(port_parity.accept(report))
+    print(f"port-parity: recorded {len(report)} baseline(s) in {port_parity.BASELINE.name}", file=sys.stderr)
+
+changed = [dest for dest, r in report.items() if r.get("baseline") != "same"]
+if args.check and not args.accept and changed:
+    print(f"port-parity: legacy changed since review: {', '.join(changed)}", file=sys.stderr)
+    raise SystemExit(1)
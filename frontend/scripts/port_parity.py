@@ -0,0 +1,304 @@
+"""Structural fingerprints of legacy and ported admin components, and their drift.
+
+A fingerprint keeps what a port has to preserve and drops formatting,
+comments and renamed locals:
+
+``exports``  exported symbol names
+``keys``     translation keys as full paths (``discountsAdmin.save``); calls
+             through a key-prefix helper (``tp("x")``) get the helper's prefix,
+             template keys become ``prefix*``; calls through a translator
+             parameter are ``?.key`` and match any namespace
+``ops``      ``postAdminMutate("op", …)`` operation names
+``jsx``      JSX element names in source order
+
+Pairs come from ``admin_ports.PORTS``: the legacy component, its copy under
+``_vite_legacy_archive`` (when there is one) and the ported file. Ported
+fingerprints are normalized before comparing: the ``*View`` rename is undone
+and what the generated ``*Client`` wrapper adds is left out.
+
+``port-parity.json`` records each pair's legacy fingerprint when its drift
+was last reviewed (``--accept``); a legacy edit that changes the fingerprint
+shows up against that baseline, a reformat does not. Fingerprints are cached
+by (mtime, size), so repeated runs only re-read files that changed.
+"""
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from admin_codemod import LEGACY, OUT, ROOT, load_manifest, sha256_file, write_atomic
+from admin_ports import PORTS, VIEW_RENAMES, WRAPPERS
+from i18n_index import CACHE_DIR, TRANSLATOR_NAME_RE, _binding, _first_arg, _string_value
+from tsx_tokens import Token, jsx_elements, next_sig, prev_sig, tokenize
+
+ARCHIVE = ROOT / "frontend" / "src" / "_vite_legacy_archive" / "components"
+BASELINE = Path(__file__).resolve().with_name("port-parity.json")
+CACHE = CACHE_DIR / "port-parity.json"
+SCHEMA = 1
+FACETS = ("exports", "keys", "ops", "jsx")
+MUTATE_CALL = "postAdminMutate"
+# Prefix of keys called through a translator parameter, whose namespace is the caller's.
+UNBOUND = "?."
+DECLARATIONS = frozenset(("function", "const", "let", "var", "class", "type", "interface", "enum"))
+
+
+# --- fingerprint -----------------------------------------------------------
+
+def _helper_prefix(tokens: tuple[Token, ...], i: int, translators: dict[str, str]) -> tuple[str, str] | None:
+    """``const tp = [useCallback(](k, …) => t(`<prefix>${k}`…)`` at ``i`` → (name, prefix)."""
+    j = next_sig(tokens, i)
+    k = next_sig(tokens, j) if j is not None else None
+    if j is None or tokens[j].kind != "ident" or k is None or tokens[k].text != "=":
+        return None
+    k = next_sig(tokens, k)
+    if k is not None and tokens[k].text == "useCallback":
+        k = next_sig(tokens, next_sig(tokens, k))
+    if k is None or tokens[k].text != "(":
+        return None
+    depth = 0
+    while k is not None:
+        text = tokens[k].text
+        depth += text == "("
+        depth -= text == ")"
+        if depth == 0:
+            break
+        k = next_sig(tokens, k)
+    arrow = next_sig(tokens, k) if k is not None else None
+    call = next_sig(tokens, arrow) if arrow is not None and tokens[arrow].text == "=>" else None
+    if call is None or tokens[call].text not in translators:
+        return None
+    paren = next_sig(tokens, call)
+    arg = next_sig(tokens, paren) if paren is not None and tokens[paren].text == "(" else None
+    if arg is None or tokens[arg].kind != "template" or not tokens[arg].text.endswith("${"):
+        return None
+    return tokens[j].text, translators[tokens[call].text] + tokens[arg].text[1:-2]
+
+
+def _exports(tokens: tuple[Token, ...], i: int) -> list[str]:
+    j = next_sig(tokens, i)
+    while j is not None and tokens[j].text in ("default", "async", "declare"):
+        j = next_sig(tokens, j)
+    if j is None:
+        return []
+    if tokens[j].text in DECLARATIONS:
+        name = next_sig(tokens, j)
+        return [tokens[name].text] if name is not None and tokens[name].kind == "ident" else []
+    if tokens[j].text != "{":
+        return []
+    names: list[str] = []
+    while (j := next_sig(tokens, j)) is not None and tokens[j].text != "}":
+        if tokens[j].kind == "ident" and tokens[j].text not in ("as", "type"):
+            k = next_sig(tokens, j)
+            if k is None or tokens[k].text != "as":
+                names.append(tokens[j].text)
+    end = next_sig(tokens, j) if j is not None else None
+    # `export { … } from "x"` re-exports another module; not this file's symbols.
+    return [] if end is not None and tokens[end].text == "from" else names
+
+
+def fingerprint(text: str) -> dict[str, list[str]]:
+    tokens = tokenize(text)
+    # i18next's `const { t } = useTranslation()` is the root translator in legacy files.
+    translators: dict[str, str] = {"t": ""} if "useTranslation(" in text else {}
+    exports: list[str] = []
+    keys: set[str] = set()
+    unbound: set[str] = set()  # through a translator parameter (`t: (k) => string`)
+    ops: set[str] = set()
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident":
+            continue
+        if tok.text == "export":
+            exports += _exports(tokens, i)
+            continue
+        if tok.text in ("const", "let"):
+            if bound := _binding(tokens, i):
+                translators[bound[0]] = f"{bound[1]}." if bound[1] else ""
+            elif helper := _helper_prefix(tokens, i, translators):
+                translators[helper[0]] = helper[1]
+            continue
+        if tok.text not in translators and tok.text != MUTATE_CALL and not TRANSLATOR_NAME_RE.match(tok.text):
+            continue
+        paren = next_sig(tokens, i)
+        prv = prev_sig(tokens, i)
+        if paren is None or tokens[paren].text != "(" or (prv is not None and tokens[prv].text in (".", "?.", "function")):
+            continue
+        arg = _first_arg(tokens, paren)
+        if not arg:
+            continue
+        value = _string_value(arg[0]) if len(arg) == 1 else None
+        if tok.text == MUTATE_CALL:
+            if value:
+                ops.add(value)
+            continue
+        if value is not None and "${" not in value:
+            key = value
+        elif arg[0].kind == "template" and arg[0].text.endswith("${"):
+            key = arg[0].text[1:-2] + "*"
+        else:
+            continue
+        if tok.text in translators:
+            keys.add(translators[tok.text] + key)
+        else:
+            unbound.add(key)
+    keys |= {UNBOUND + key for key in unbound}
+    return {
+        "exports": sorted(set(exports)),
+        "keys": sorted(keys),
+        "ops": sorted(ops),
+        "jsx": [el.name for el in jsx_elements(tokens) if el.name],
+    }
+
+
+def digest(fp: dict[str, list[str]]) -> str:
+    return hashlib.sha256(json.dumps(fp, sort_keys=True).encode()).hexdigest()[:16]
+
+
+# --- cache -----------------------------------------------------------------
+
+def load_cache() -> dict:
+    try:
+        data = json.loads(CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("schema") == SCHEMA else {}
+
+
+def save_cache(files: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"schema": SCHEMA, "files": files}))
+    os.replace(tmp, CACHE)
+
+
+class Fingerprints:
+    """Path → fingerprint, re-reading only files whose (mtime, size) changed."""
+
+    def __init__(self) -> None:
+        self._cached = load_cache()
+        self._files: dict[str, dict] = {}
+        self.rescanned: list[str] = []
+
+    def __call__(self, path: Path) -> dict[str, list[str]] | None:
+        if not path.is_file():
+            return None
+        rel = path.relative_to(ROOT).as_posix()
+        st = path.stat()
+        entry = self._cached.get(rel)
+        if not entry or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "fp": fingerprint(path.read_text(encoding="utf-8"))}
+            self.rescanned.append(rel)
+        self._files[rel] = entry
+        return entry["fp"]
+
+    def save(self) -> None:
+        if self.rescanned or set(self._files) != set(self._cached):
+            save_cache({**self._cached, **self._files})
+
+
+# --- comparison ------------------------------------------------------------
+
+def normalize_ported(fp: dict[str, list[str]], spec: dict) -> dict[str, list[str]]:
+    """Undo the View rename and drop what the generated wrapper adds."""
+    wrapper = WRAPPERS.get(spec["dest"])
+    if wrapper is None:
+        return fp
+    view = VIEW_RENAMES.get(spec["dest"], spec["export_to"]).removesuffix("Client") + "View"
+    added = fingerprint(wrapper)
+    jsx = fp["jsx"]
+    if added["jsx"] and jsx[-len(added["jsx"]):] == added["jsx"]:
+        jsx = jsx[:-len(added["jsx"])]
+    return {
+        "exports": sorted({spec["export_to"] if name == view else name for name in fp["exports"]}),
+        "keys": sorted(set(fp["keys"]) - set(added["keys"])),
+        "ops": fp["ops"],
+        "jsx": jsx,
+    }
+
+
+def normalize_legacy(fp: dict[str, list[str]], spec: dict) -> dict[str, list[str]]:
+    renamed = [spec["export_to"] if name == spec["export_from"] else name for name in fp["exports"]]
+    return {**fp, "exports": sorted(renamed)}
+
+
+def _covered(key: str, pool: set[str], unbound: set[str]) -> bool:
+    """``key`` is in ``pool``, or a ``?.`` key of the pool names one of its dotted suffixes (or vice versa)."""
+    if key in pool:
+        return True
+    if key.startswith(UNBOUND):
+        tail = key[len(UNBOUND):]
+        return tail in pool or any(k.endswith("." + tail) for k in pool)
+    parts = key.split(".")
+    return any(".".join(parts[n:]) in unbound for n in range(len(parts)))
+
+
+def compare(a: dict[str, list[str]], b: dict[str, list[str]]) -> dict:
+    """Per set facet: names only in ``a`` / only in ``b``; ``jsx``: sequence similarity."""
+    out: dict = {}
+    for facet in ("exports", "ops"):
+        left, right = set(a[facet]), set(b[facet])
+        out[facet] = {"removed": sorted(left - right), "added": sorted(right - left)}
+    left, right = set(a["keys"]), set(b["keys"])
+    free = {side: {k[len(UNBOUND):] for k in keys if k.startswith(UNBOUND)} for side, keys in (("a", left), ("b", right))}
+    out["keys"] = {
+        "removed": sorted(k for k in left if not _covered(k, right, free["b"])),
+        "added": sorted(k for k in right if not _covered(k, left, free["a"])),
+    }
+    out["jsx"] = round(difflib.SequenceMatcher(None, a["jsx"], b["jsx"], autojunk=False).ratio(), 3)
+    return out
+
+
+def differs(diff: dict) -> bool:
+    return diff["jsx"] < 1 or any(diff[f]["removed"] or diff[f]["added"] for f in ("exports", "ops", "keys"))
+
+
+def load_baseline(path: Path = BASELINE) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["pairs"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(pairs: dict[str, dict], path: Path = BASELINE) -> None:
+    write_atomic(path, json.dumps({"pairs": dict(sorted(pairs.items()))}, indent=2) + "\n")
+
+
+def report(fps: Fingerprints, names: list[str] | None = None) -> dict[str, dict]:
+    """Per ported dest: legacy vs baseline, legacy vs ported, archive vs legacy."""
+    baseline = load_baseline()
+    manifest = load_manifest()
+    out: dict[str, dict] = {}
+    for spec in PORTS:
+        dest = spec["dest"]
+        if names and dest not in names and spec["src"] not in names and spec["export_to"] not in names:
+            continue
+        legacy_path = LEGACY / spec["src"]
+        legacy, ported, archive = fps(legacy_path), fps(OUT / dest), fps(ARCHIVE / spec["src"])
+        if legacy is None or ported is None:
+            out[dest] = {"src": spec["src"], "missing": "legacy" if legacy is None else "ported"}
+            continue
+        legacy_n = normalize_legacy(legacy, spec)
+        base = baseline.get(dest)
+        recorded = manifest.get(dest)
+        out[dest] = {
+            "src": spec["src"],
+            "digest": digest(legacy),
+            "fingerprint": legacy,
+            "since_port": recorded is not None and recorded["src_sha256"] != sha256_file(legacy_path),
+            "baseline": None if base is None else ("same" if base["digest"] == digest(legacy) else "changed"),
+            "since_baseline": None if base is None else compare(base["fingerprint"], legacy),
+            "ported": compare(legacy_n, normalize_ported(ported, spec)),
+            "archive": None if archive is None else ("same" if digest(archive) == digest(legacy) else "differs"),
+        }
+    return out
+
+
+def accept(result: dict[str, dict]) -> dict[str, dict]:
+    """Baseline entries for every reported pair (others are kept)."""
+    pairs = load_baseline()
+    for dest, r in result.items():
+        if "digest" in r:
+            pairs[dest] = {"src": r["src"], "digest": r["digest"], "fingerprint": r["fingerprint"]}
+    return pairs
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Split messages/{en,fa}.json into per-namespace chunks and write the route manifest.
+
+Usage:
+  python3 frontend/scripts/split-messages.py            # write messages/chunks/
+  python3 frontend/scripts/split-messages.py --check    # exit 1 when chunks are stale (CI)
+  python3 frontend/scripts/split-messages.py --route /dashboard/plan_cats
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import i18n_chunks
+import i18n_index
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--check", action="store_true", help="write nothing; exit 1 when any chunk or the manifest is stale")
+parser.add_argument("--route", action="append", default=[], help="print the namespaces and chunk bytes for a route")
+parser.add_argument("--workers", type=int, help="process pool size for re-scanned files (default: all cores)")
+args = parser.parse_args()
+
+started = time.perf_counter()
+files, _rescanned = i18n_index.build(args.workers)
+expected = i18n_chunks.outputs(files)
+changed, orphans = i18n_chunks.stale(expected)
+elapsed = (time.perf_counter() - started) * 1000
+
+if args.check:
+    for rel in changed:
+        print(f"stale: {rel}", file=sys.stderr)
+    for rel in orphans:
+        print(f"orphan: {rel}", file=sys.stderr)
+else:
+    i18n_chunks.write(expected, changed, orphans)
+
+manifest = json.loads(expected[i18n_chunks._rel(i18n_chunks.MANIFEST)])
+for route in args.route:
+    namespaces = manifest["routes"].get(route)
+    if namespaces is None:
+        print(f"{route}: not in manifest", file=sys.stderr)
+        continue
+    for loc in manifest["locales"]:
+        size = sum(len(expected[i18n_chunks._rel(i18n_chunks.CHUNKS / loc / f"{ns}.json")].encode()) for ns in namespaces)
+        full = len((i18n_index.MESSAGES / f"{loc}.json").read_bytes())
+        print(f"{route} [{loc}] {size / 1024:.1f} KiB of {full / 1024:.1f} KiB: {', '.join(namespaces)}")
+
+print(
+    f"split-messages: {len(manifest['namespaces'])} namespaces, {len(manifest['routes'])} routes, "
+    f"{len(changed)} {'stale' if args.check else 'written'}, {len(orphans)} orphaned ({elapsed:.0f} ms)",
+    file=sys.stderr,
+)
+if manifest["unresolved"]:
+    print(f"unresolved (all namespaces): {', '.join(manifest['unresolved'])}", file=sys.stderr)
+raise SystemExit(1 if args.check and (changed or orphans) else 0)
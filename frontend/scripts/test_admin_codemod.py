@@ -0,0 +1,110 @@
+"""Admin codemod pipeline: a second run over its own output makes no edits."""
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import admin_codemod  # noqa: E402
+from admin_codemod import STAGES, load_manifest, main, plan, run  # noqa: E402
+
+FIXTURES = {
+    "backup-admin-client.tsx": '''"use client"
+
+import { useTranslations } from "next-intl"
+
+function formatPanelDbStep(
+  step: string,
+  tp: (k: string, o?: Record<string, string | number>) => string
+): string {
+  const key = `panelDbStep_${step}`
+  const tr = tp(key)
+  return tr !== key ? tr : tp("panelDbStep_unknown", { step })
+}
+
+export function BackupAdminView() {
+  const t = useTranslations("backupAdmin")
+  const tp = (k: string) => t(`backupAdmin.${k}`)
+  return (
+    <TooltipTrigger asChild>
+      <Button title={tp("title")}>{formatPanelDbStep("dump", t)}</Button>
+    </TooltipTrigger>
+  )
+}
+''',
+    "plans/plan-card.tsx": '''"use client"
+
+import { useTranslations } from "next-intl"
+import { useTranslations } from "next-intl"
+
+export function PlanCard({ tl }: { tl: (k: string) => string }) {
+  const t = useTranslations("plansAdmin")
+  return <span aria-label={t("plansAdmin.card")}>{tl("price")}</span>
+}
+''',
+}
+
+
+class IdempotenceTest(unittest.TestCase):
+    def test_second_run_makes_no_edits(self):
+        stages = tuple(s for s in STAGES if s != "port")
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "admin"
+            for rel, text in FIXTURES.items():
+                (out / rel).parent.mkdir(parents=True, exist_ok=True)
+                (out / rel).write_text(text, encoding="utf-8")
+            jobs = plan(stages, out=out, rich_editor=Path(tmp) / "none.tsx")
+            self.assertEqual(len(jobs), len(FIXTURES))
+
+            first = list(run(jobs, stages, workers=1))
+            self.assertTrue(all(r.changed for r in first))
+            written = {rel: (out / rel).read_text(encoding="utf-8") for rel in FIXTURES}
+            self.assertIn('const tr = tp(key)', written["backup-admin-client.tsx"])
+            self.assertIn('title={t("title")}', written["backup-admin-client.tsx"])
+            self.assertIn('{tl("price")}', written["plans/plan-card.tsx"])
+
+            second = list(run(jobs, stages, workers=1))
+            self.assertEqual([r.job.rel for r in second if r.changed], [])
+            self.assertEqual({rel: (out / rel).read_text(encoding="utf-8") for rel in FIXTURES}, written)
+
+
+class AdoptTest(unittest.TestCase):
+    SRC = "dashboard-plan-cats-admin.tsx"
+    DEST = "plan-cats-admin-client.tsx"
+
+    def codemod(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(main([*argv, self.SRC, "--workers=1"]), 0)
+        return out.getvalue()
+
+    def test_adopted_port_is_kept_when_the_legacy_source_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            legacy, out = root / "legacy", root / "admin"
+            legacy.mkdir()
+            out.mkdir()
+            src, dest = legacy / self.SRC, out / self.DEST
+            src.write_text('export function PlanCatsAdmin() {\n  return null\n}\n', encoding="utf-8")
+            hand = '"use client"\n\nexport function PlanCatsAdminView() {\n  return <Switch />  // added by hand\n}\n'
+            dest.write_text(hand, encoding="utf-8")
+            with mock.patch.multiple(admin_codemod, ROOT=root, LEGACY=legacy, OUT=out,
+                                     RICH_EDITOR=root / "none.tsx", MANIFEST=root / "manifest.json"):
+                self.codemod("--adopt")
+                self.assertIsNone(load_manifest(root / "manifest.json")[self.DEST]["out_sha256"])
+                self.assertIn("0 changed", self.codemod())
+
+                src.write_text(src.read_text(encoding="utf-8") + "// trivial\n", encoding="utf-8")
+                self.assertIn(f"kept admin/{self.DEST}: edited since last port", self.codemod())
+                self.assertEqual(dest.read_text(encoding="utf-8"), hand)
+
+                self.codemod("--force")
+                self.assertNotEqual(dest.read_text(encoding="utf-8"), hand)
+
+
+if __name__ == "__main__":
+    unittest.main()
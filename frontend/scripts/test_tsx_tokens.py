@@ -0,0 +1,63 @@
+"""Token-level codemod rules: the tl/tp/tr call rename."""
+import sys
+import unittest
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from tsx_tokens import call_edits, helper_edits, rename_calls, rewrite, tokenize  # noqa: E402
+
+HELPER_CALLS = {"tp": "t", "tl": "t", "tr": "t"}
+
+SRC = '''function formatStep(
+  step: string,
+  tp: (k: string, o?: Record<string, string>) => string
+): { text: string; ok: boolean } {
+  return { text: tp("step_" + step), ok: true }
+}
+
+const label = (tp: (k: string) => string) => tp("label")
+const upper = tp => tp("upper")
+
+function Row({ tp, n }: { tp: (k: string) => string; n: number }) {
+  return <span>{tp("row")}</span>
+}
+
+export function View(props: Props) {
+  const t = useTranslations("plansAdmin")
+  const tp = (k: string) => t(`plansAdmin.${k}`)
+  if (props.on) {
+    const { tl } = props
+    tl("inner")
+  }
+  tl("outer")
+  return <p title={tp("title")}>{formatStep("s", tp)} {"tp(" + `tp(${n})`}</p>
+}
+'''
+
+
+class CallRenameTest(unittest.TestCase):
+    def test_locally_bound_names_are_not_renamed(self):
+        out = rename_calls(SRC, HELPER_CALLS)
+        self.assertIn('return { text: tp("step_" + step), ok: true }', out)
+        self.assertIn('=> tp("label")', out)
+        self.assertIn('tp => tp("upper")', out)
+        self.assertIn('<span>{tp("row")}</span>', out)
+        self.assertIn('    tl("inner")', out)
+        self.assertIn('  t("outer")', out)
+        self.assertIn('<p title={t("title")}>{formatStep("s", tp)}', out)
+        self.assertIn('{"tp(" + `tp(${n})`}', out)
+
+    def test_helper_removal_and_rename_share_a_tokenization(self):
+        out = rewrite(SRC, partial(helper_edits, names=("tl",)), partial(call_edits, mapping=HELPER_CALLS))
+        self.assertIn('return { text: tp("step_" + step), ok: true }', out)
+        self.assertIn('title={t("title")}', out)
+        self.assertEqual(rename_calls(out, HELPER_CALLS), out)
+
+    def test_tokenizer_is_lossless(self):
+        self.assertEqual("".join(t.text for t in tokenize(SRC)), SRC)
+
+
+if __name__ == "__main__":
+    unittest.main()
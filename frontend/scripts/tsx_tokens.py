@@ -0,0 +1,583 @@
+"""Lightweight TSX tokenizer and token-level rewrite rules for the admin codemod.
+
+The tokenizer is lossless (``"".join(t.text for t in tokens) == source``) and
+knows enough TSX to keep rewrites out of places they must not touch: string
+literals, template literal text (``${...}`` holes are code again), comments,
+regex literals and JSX text. Identifiers inside JSX tags are ``jsxident``.
+
+Rules compute ``(start, end, replacement)`` edits from one token stream;
+``rewrite`` applies several rules against a single tokenization. None of
+them use multi-line regexes, so cost is linear in the file size.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache, partial
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+
+class Token(NamedTuple):
+    kind: str  # ws comment string template regex number ident punct jsxident jsxtext tag
+    text: str
+    start: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+Edit = tuple[int, int, str]  # (start, end, replacement) offsets into the source
+
+
+class Element(NamedTuple):
+    name: str
+    open_lt: int  # token index of "<"
+    open_gt: int  # token index of ">" or "/>"
+    close_lt: int | None  # token index of "</" (None when self-closing)
+    close_gt: int | None
+
+    @property
+    def last(self) -> int:
+        return self.open_gt if self.close_gt is None else self.close_gt
+
+
+IDENT = r"[A-Za-z_$\u0080-￿][\w$\u0080-￿]*"
+IDENT_RE = re.compile(IDENT)
+COMMENT = r"//[^\n]*|/\*.*?(?:\*/|\Z)"
+# ">>" is deliberately absent so nested generics close one ">" at a time.
+PUNCTS = ("...", "===", "!==", "**=", "<<=", "&&=", "||=", "??=",
+          "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--",
+          "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "**", "<<")
+PUNCT = "|".join(map(re.escape, PUNCTS)) + "|."
+# One alternation per mode; "special" tokens need the mode stack or the previous token.
+JS_RE = re.compile(
+    rf"(?P<ws>\s+)|(?P<comment>{COMMENT})"
+    r"""|(?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)"""
+    rf"|(?P<ident>{IDENT})|(?P<number>\d[\w.]*|\.\d\w*)|(?P<special>[{{}}`<]|/(?![/*]))|(?P<punct>{PUNCT})",
+    re.S,
+)
+TAG_RE = re.compile(
+    rf"""(?P<ws>\s+)|(?P<comment>{COMMENT})|(?P<string>'[^']*'?|"[^"]*"?)"""
+    r"|(?P<jsxident>[A-Za-z_$][\w$.:-]*)|(?P<special>[{>]|/>)|(?P<punct>.)",
+    re.S,
+)
+CHILDREN_RE = re.compile(r"(?P<jsxtext>[^<{]+)|(?P<special></?|\{)")
+TEMPLATE_CHUNK_RE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*(?:`|\$\{)?", re.S)
+REGEX_RE = re.compile(r"/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+PUNCT_RE = re.compile(PUNCT, re.S)
+INDENT_RE = re.compile(r"[ \t]*")
+NONBLANK_LINE_RE = re.compile(r"\n(?=[^\n])")
+# First argument of a key-prefix helper: `ns.${k}` (or the "\${k}" left by a broken pass).
+KEY_ARG_RE = re.compile(r'`[^`]*\$\{k\}`|"[^"]*\$\{k\}"')
+EXPR_KEYWORDS = frozenset(("return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+                           "void", "throw", "yield", "await", "instanceof", "default"))
+TRIVIA = frozenset(("ws", "comment"))
+# Tokens after which a "{" in a return type opens an object type, not the function body.
+TYPE_CONTINUES = frozenset((":", "|", "&", "=>", ",", "<", "(", "["))
+
+
+def _expr_start(prev: Token | None) -> bool:
+    """Can a JSX element or regex literal start after ``prev``?"""
+    if prev is None:
+        return True
+    if prev.kind == "punct":
+        return prev.text not in (")", "]")
+    if prev.kind == "ident":
+        return prev.text in EXPR_KEYWORDS
+    if prev.kind == "template":
+        return prev.text.endswith("${")
+    return prev.kind == "tag"
+
+
+@lru_cache(maxsize=8)
+def tokenize(src: str) -> tuple[Token, ...]:
+    """Cached: consecutive rules that leave the text unchanged share one pass."""
+    tokens: list[Token] = []
+    append = tokens.append
+    # Frames: ["js", brace_depth] | ["template"] | ["tag", closing] | ["children"]
+    stack: list[list] = [["js", 0]]
+    frame = stack[0]
+    patterns = {"js": JS_RE, "tag": TAG_RE, "children": CHILDREN_RE}
+    pattern = JS_RE
+    prev: Token | None = None
+    i, n = 0, len(src)
+
+    while i < n:
+        m = pattern.match(src, i)
+        kind = m.lastgroup
+        if kind != "special":
+            tok = Token(kind, m.group(), i)
+            append(tok)
+            if kind not in TRIVIA:
+                prev = tok
+            i = m.end()
+            continue
+
+        text = m.group()
+        mode = frame[0]
+        if text == "{":
+            if mode == "js":
+                frame[1] += 1
+            else:
+                stack.append(["js", 0])
+            kind = "punct"
+        elif text == "}":
+            kind = "punct"
+            if frame[1] == 0 and len(stack) > 1:
+                stack.pop()
+                if stack[-1][0] == "template":
+                    stack.pop()
+                    kind = "template"
+                    text = TEMPLATE_CHUNK_RE.match(src, i + 1).group()
+                    text = "}" + text
+            else:
+                frame[1] = max(0, frame[1] - 1)
+        elif text == "`":
+            kind = "template"
+            text = "`" + TEMPLATE_CHUNK_RE.match(src, i + 1).group()
+        elif text in ("<", "</"):
+            if mode == "children":
+                stack.append(["tag", text == "</"])
+                kind = "tag"
+            elif _expr_start(prev) and (src.startswith(">", i + 1) or IDENT_RE.match(src, i + 1)):
+                stack.append(["tag", False])
+                kind = "tag"
+            else:
+                kind = "punct"
+                text = PUNCT_RE.match(src, i).group()
+        elif text == "/":
+            r = REGEX_RE.match(src, i) if _expr_start(prev) else None
+            if r:
+                kind, text = "regex", r.group()
+            else:
+                kind, text = "punct", PUNCT_RE.match(src, i).group()
+        elif text == "/>":
+            kind = "tag"
+            stack.pop()
+        elif text == ">":
+            kind = "tag"
+            if stack.pop()[1]:
+                if stack[-1][0] == "children":
+                    stack.pop()
+            else:
+                stack.append(["children"])
+
+        tok = Token(kind, text, i)
+        append(tok)
+        prev = tok
+        i += len(text)
+        if kind == "template" and text.endswith("${") and len(text) > 1:
+            stack.append(["template"])
+            stack.append(["js", 0])
+        frame = stack[-1]
+        pattern = patterns[frame[0]]
+    return tuple(tokens)
+
+
+# --- helpers ---------------------------------------------------------------
+
+def apply_edits(src: str, edits: Iterable[Edit]) -> str:
+    """Apply (start, end, replacement) edits; overlapping later edits are dropped."""
+    out: list[str] = []
+    pos = 0
+    for start, end, repl in sorted(edits):
+        if start < pos:
+            continue
+        out.append(src[pos:start])
+        out.append(repl)
+        pos = end
+    out.append(src[pos:])
+    return "".join(out)
+
+
+def next_sig(tokens: Sequence[Token], i: int) -> int | None:
+    i += 1
+    while i < len(tokens) and tokens[i].kind in TRIVIA:
+        i += 1
+    return i if i < len(tokens) else None
+
+
+def prev_sig(tokens: Sequence[Token], i: int) -> int | None:
+    i -= 1
+    while i >= 0 and tokens[i].kind in TRIVIA:
+        i -= 1
+    return i if i >= 0 else None
+
+
+def jsx_elements(tokens: Sequence[Token]) -> list[Element]:
+    """Every JSX element, outermost before nested, from the tag tokens."""
+    elements: list[Element] = []
+    headers: list[tuple[bool, int]] = []  # (closing, index of "<" / "</")
+    open_elems: list[tuple[str, int, int]] = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "tag":
+            continue
+        if tok.text in ("<", "</"):
+            headers.append((tok.text == "</", i))
+        elif headers:
+            closing, lt = headers.pop()
+            j = next_sig(tokens, lt)
+            name = tokens[j].text if j is not None and tokens[j].kind == "jsxident" and j < i else ""
+            if tok.text == "/>":
+                elements.append(Element(name, lt, i, None, None))
+            elif not closing:
+                open_elems.append((name, lt, i))
+            elif open_elems:
+                o_name, o_lt, o_gt = open_elems.pop()
+                elements.append(Element(o_name, o_lt, o_gt, lt, i))
+    elements.sort(key=lambda e: e.open_lt)
+    return elements
+
+
+def _statement_end(tokens: Sequence[Token], i: int) -> int:
+    """Index of the last token of the expression starting at ``i``."""
+    depth = 0
+    last = i
+    continues = ("=>", ",", "(", "[", "{", "=", "?", ":", "&&", "||", "??", "+", "-", "*", "/", ".", "?.")
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.kind == "punct":
+            if tok.text in "([{":
+                depth += 1
+            elif tok.text in ")]}":
+                if depth == 0:
+                    return last
+                depth -= 1
+            elif depth == 0 and tok.text == ";":
+                return i
+        elif tok.kind == "ws" and depth == 0 and "\n" in tok.text:
+            nxt = next_sig(tokens, i)
+            if tokens[last].text not in continues and (nxt is None or tokens[nxt].text not in continues[4:]):
+                return last
+        if tok.kind not in TRIVIA:
+            last = i
+        i += 1
+    return last
+
+
+# --- rules -----------------------------------------------------------------
+
+def rewrite(src: str, *rules: Callable[[str, Sequence[Token]], list[Edit]]) -> str:
+    """Apply the edits of several rules computed against one tokenization."""
+    tokens = tokenize(src)
+    return apply_edits(src, [edit for rule in rules for edit in rule(src, tokens)])
+
+
+def _brackets(tokens: Sequence[Token]) -> tuple[dict[int, int], list[int | None]]:
+    """Matching ``( [ {`` pairs (both ways) and each token's innermost open bracket."""
+    match: dict[int, int] = {}
+    parent: list[int | None] = []
+    stack: list[int] = []
+    for i, tok in enumerate(tokens):
+        parent.append(stack[-1] if stack else None)
+        if tok.kind != "punct":
+            continue
+        if tok.text in ("(", "[", "{"):
+            stack.append(i)
+        elif tok.text in (")", "]", "}") and stack:
+            j = stack.pop()
+            match[i], match[j] = j, i
+    return match, parent
+
+
+def _function_body(tokens: Sequence[Token], match: dict[int, int], close: int) -> int | None:
+    """Last token of the function whose parameter list ends at ``close``, skipping
+    a return type annotation; None when ``close`` does not end a parameter list."""
+    j = next_sig(tokens, close)
+    if j is not None and tokens[j].text == ":":
+        depth = 0
+        while (j := next_sig(tokens, j)) is not None:
+            text = tokens[j].text
+            if text == "{" and tokens[prev_sig(tokens, j)].text in TYPE_CONTINUES and j in match:
+                j = match[j]  # object type literal, not the body
+                continue
+            if depth == 0 and text in ("=>", "{"):
+                break
+            if text in ("(", "[", "<"):
+                depth += 1
+            elif text in (")", "]", ">"):
+                depth -= 1
+    if j is None:
+        return None
+    if tokens[j].text == "=>":
+        body = next_sig(tokens, j)
+        if body is None:
+            return None
+        return match.get(body, body) if tokens[body].text == "{" else _statement_end(tokens, body)
+    if tokens[j].text == "{" and j in match:
+        opener = match[close]
+        before = prev_sig(tokens, opener)
+        if before is not None and tokens[before].text in ("if", "while", "for", "switch", "with"):
+            return None
+        return match[j]
+    return None
+
+
+def _block_end(tokens: Sequence[Token], match: dict[int, int], parent: list[int | None], i: int) -> int:
+    """Last token of the innermost ``{ }`` block around ``i`` (the file when top level)."""
+    block = parent[i]
+    while block is not None and tokens[block].text != "{":
+        block = parent[block]
+    return len(tokens) - 1 if block is None else match.get(block, len(tokens) - 1)
+
+
+def _declares(tokens: Sequence[Token], i: int) -> bool:
+    prv = prev_sig(tokens, i)
+    return prv is not None and tokens[prv].text in ("const", "let", "var")
+
+
+def bound_ranges(tokens: Sequence[Token], names: Iterable[str]) -> dict[str, list[tuple[int, int]]]:
+    """Token index ranges where a name is bound locally: function parameters
+    (destructured too) and ``const``/``let``/``var``/``function`` declarations.
+    Key-prefix helper declarations (``const tl = (k) => t(`ns.${k}`)``) are not
+    bindings here: they are the helpers the call rename replaces."""
+    names = frozenset(names)
+    if not any(t.kind == "ident" and t.text in names for t in tokens):
+        return {}
+    match, parent = _brackets(tokens)
+    ranges: dict[str, list[tuple[int, int]]] = {}
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text not in names:
+            continue
+        prv, nxt = prev_sig(tokens, i), next_sig(tokens, i)
+        before = tokens[prv].text if prv is not None else ""
+        after = tokens[nxt].text if nxt is not None else ""
+        scope = None
+        if before in ("const", "let", "var", "function"):
+            init = next_sig(tokens, nxt) if after == "=" else None
+            if init is not None and _is_key_helper(tokens, init, _statement_end(tokens, init)):
+                continue
+            scope = (prv, _block_end(tokens, match, parent, prv))
+        elif after == "=>" and before not in (".", "?."):
+            body = next_sig(tokens, nxt)
+            if body is not None:
+                scope = (i, match.get(body, body) if tokens[body].text == "{" else _statement_end(tokens, body))
+        elif parent[i] is not None:
+            p = parent[i]
+            if tokens[p].text == "(":
+                is_param = before in ("(", ",", "...") and after in (":", ",", ")", "=", "?")
+            else:
+                # Inside a destructuring pattern: walk out to the "(" or the declaration.
+                is_param = before in ("{", "[", ",", ":", "...") and after in (",", "}", "]", "=")
+                while p is not None and tokens[p].text in ("{", "[") and not _declares(tokens, p):
+                    p = parent[p]
+                if is_param and p is not None and tokens[p].text in ("{", "["):
+                    decl = prev_sig(tokens, p)
+                    scope = (decl, _block_end(tokens, match, parent, decl))
+                    is_param = False
+            if is_param and p is not None and tokens[p].text == "(" and p in match:
+                end = _function_body(tokens, match, match[p])
+                if end is not None:
+                    scope = (p, end)
+        if scope is not None:
+            ranges.setdefault(tok.text, []).append(scope)
+    return ranges
+
+
+def call_edits(src: str, tokens: Sequence[Token], mapping: dict[str, str]) -> list[Edit]:
+    """``tl(`` → ``t(`` for bare identifier calls only — not ``attr(``, ``obj.tl(``,
+    ``function tl(``, text inside strings, templates and comments, or calls
+    where the name is bound locally (a ``tp`` parameter, a ``const tl = ...``)."""
+    bound = bound_ranges(tokens, mapping)
+    edits = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text not in mapping:
+            continue
+        if any(start <= i <= end for start, end in bound.get(tok.text, ())):
+            continue
+        nxt = next_sig(tokens, i)
+        if nxt is None or tokens[nxt].text != "(":
+            continue
+        prv = prev_sig(tokens, i)
+        if prv is not None and tokens[prv].text in (".", "?.", "function"):
+            continue
+        edits.append((tok.start, tok.end, mapping[tok.text]))
+    return edits
+
+
+def import_edits(src: str, tokens: Sequence[Token], module: str, names: Iterable[str] | None = None) -> list[Edit]:
+    """Drop ``import ... from "<module>"`` statements (with their line break)
+    whose imported names are exactly ``names`` (any, when None)."""
+    want = None if names is None else set(names)
+    edits = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text != "import":
+            continue
+        prv = prev_sig(tokens, i)
+        if prv is not None and tokens[prv].text not in (";", "}") and tokens[prv].kind != "comment" \
+                and "\n" not in tokens[i - 1].text:
+            continue
+        j, imported, source = i, set(), None
+        while (j := next_sig(tokens, j)) is not None:
+            t = tokens[j]
+            if t.kind == "string":
+                source = t.text[1:-1]
+                break
+            if t.kind == "ident" and t.text not in ("type", "from", "as"):
+                imported.add(t.text)
+        if source != module or (want is not None and imported != want):
+            continue
+        end = tokens[j].end
+        k = next_sig(tokens, j)
+        if k is not None and tokens[k].text == ";" and "\n" not in src[end:tokens[k].start]:
+            end = tokens[k].end
+        if src.startswith("\n", end):
+            end += 1
+        edits.append((tok.start, end, ""))
+    return edits
+
+
+def _is_key_helper(tokens: Sequence[Token], start: int, end: int) -> bool:
+    """``(k: string, ...) => t(`ns.${k}`[, opts])``, optionally in ``useCallback(..., [t])``."""
+    sig = [t for t in tokens[start:end + 1] if t.kind not in TRIVIA]
+    try:
+        arrow = next(n for n, t in enumerate(sig) if t.text == "=>")
+    except StopIteration:
+        return False
+    body = [t.text for t in sig[arrow + 1:]]
+    if body[:2] != ["t", "("]:
+        return False
+    k = 2
+    while k < len(body) and body[k] not in (",", ")"):
+        k += 1
+    if not KEY_ARG_RE.fullmatch("".join(body[2:k])):
+        return False
+    if body[k:k + 3] == [",", "opts", ")"]:
+        k += 3
+    elif body[k:k + 1] == [")"]:
+        k += 1
+    else:
+        return False
+    return body[k:] in ([], [",", "[", "t", "]", ")"], [",", "[", "t", "]", ",", ")"])
+
+
+def _value_uses(tokens: Sequence[Token], names: frozenset[str]) -> set[str]:
+    """Names referenced other than as a callee, declaration, parameter or key."""
+    used = set()
+    for i, tok in enumerate(tokens):
+        if tok.kind == "ident" and tok.text in names:
+            nxt, prv = next_sig(tokens, i), prev_sig(tokens, i)
+            if nxt is not None and tokens[nxt].text in ("(", ":", "=", "?"):
+                continue
+            if prv is not None and tokens[prv].text in (".", "?."):
+                continue
+            used.add(tok.text)
+    return used
+
+
+def helper_edits(src: str, tokens: Sequence[Token], names: Iterable[str] = ("tl", "tp", "tr")) -> list[Edit]:
+    """Remove ``const tl = (k) => t(`ns.${k}`)`` style key-prefix helpers.
+
+    Helpers still passed around as values (``targetsLabel(x, tp)``, hook deps)
+    are kept. The leading line break and indentation go with the declaration,
+    as the regex passes did, so the surrounding layout is unchanged.
+    """
+    names = frozenset(names) - _value_uses(tokens, frozenset(names))
+    edits = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident" or tok.text != "const":
+            continue
+        j = next_sig(tokens, i)
+        if j is None or tokens[j].text not in names:
+            continue
+        eq = next_sig(tokens, j)
+        if eq is None or tokens[eq].text != "=":
+            continue
+        init = next_sig(tokens, eq)
+        end = _statement_end(tokens, init)
+        if not _is_key_helper(tokens, init, end):
+            continue
+        start = tok.start
+        if i > 0 and tokens[i - 1].kind == "ws" and "\n" in tokens[i - 1].text:
+            start = tokens[i - 1].start + tokens[i - 1].text.index("\n")
+        edits.append((start, tokens[end].end, ""))
+    return edits
+
+
+def _attr(tokens: Sequence[Token], el: Element, name: str) -> int | None:
+    for k in range(el.open_lt + 1, el.open_gt):
+        if tokens[k].kind == "jsxident" and tokens[k].text == name:
+            nxt = next_sig(tokens, k)
+            if nxt is None or tokens[nxt].text != "=":
+                return k
+    return None
+
+
+def _line_indent(src: str, pos: int) -> str:
+    return INDENT_RE.match(src, src.rfind("\n", 0, pos) + 1).group(0)
+
+
+def as_child_edits(src: str, tokens: Sequence[Token],
+                   triggers: Iterable[str] = ("TooltipTrigger", "CollapsibleTrigger")) -> list[Edit]:
+    """``<Trigger asChild><Button …/></Trigger>`` → ``<Trigger render={<Button …/>} />``
+    (Radix ``asChild`` → Base UI ``render``), then drop any other ``asChild`` attribute."""
+    triggers = frozenset(triggers)
+    elements = jsx_elements(tokens)
+    by_lt = {e.open_lt: e for e in elements}
+    edits = []
+    done_until = -1
+    for el in elements:
+        if el.open_lt <= done_until or el.name not in triggers or el.close_lt is None:
+            continue
+        flag = _attr(tokens, el, "asChild")
+        if flag is None:
+            continue
+        first = next_sig(tokens, el.open_gt)
+        while first is not None and tokens[first].kind == "jsxtext" and not tokens[first].text.strip():
+            first = next_sig(tokens, first)
+        child = by_lt.get(first)
+        if child is None:
+            continue
+        after = child.last + 1
+        while after < el.close_lt and tokens[after].kind in ("ws", "jsxtext") and not tokens[after].text.strip():
+            after += 1
+        if after != el.close_lt:
+            continue
+        ind = _line_indent(src, tokens[el.open_lt].start)
+        head = "".join(t.text for k, t in enumerate(tokens[el.open_lt:el.open_gt], el.open_lt)
+                       if not (k == flag or (k == flag - 1 and t.kind == "ws"))).rstrip()
+        body = src[tokens[child.open_lt].start:tokens[child.last].end]
+        multiline_literal = any(t.kind in ("string", "template") and "\n" in t.text
+                                for t in tokens[child.open_lt:child.last + 1])
+        if not multiline_literal:
+            body = NONBLANK_LINE_RE.sub("\n  ", body)
+        if "\n" in src[tokens[el.open_lt].start:tokens[el.close_gt].end]:
+            repl = f"{head}\n{ind}  render={{\n{ind}    {body}\n{ind}  }}\n{ind}/>"
+        else:
+            repl = f"{head} render={{{body}}} />"
+        edits.append((tokens[el.open_lt].start, tokens[el.close_gt].end, repl))
+        done_until = el.close_gt
+    for k, tok in enumerate(tokens):
+        if tok.kind == "jsxident" and tok.text == "asChild" and not any(s <= tok.start < e for s, e, _ in edits):
+            nxt = next_sig(tokens, k)
+            if nxt is not None and tokens[nxt].text == "=":
+                continue
+            start = tokens[k - 1].start if tokens[k - 1].kind == "ws" else tok.start
+            edits.append((start, tok.end, ""))
+    return edits
+
+
+# --- single-rule entry points (skip tokenizing when the needle is absent) ---
+
+def rename_calls(src: str, mapping: dict[str, str]) -> str:
+    if not any(name + "(" in src or name + " (" in src for name in mapping):
+        return src
+    return rewrite(src, partial(call_edits, mapping=mapping))
+
+
+def remove_imports(src: str, module: str, names: Iterable[str] | None = None) -> str:
+    if f'"{module}"' not in src and f"'{module}'" not in src:
+        return src
+    return rewrite(src, partial(import_edits, module=module, names=names))
+
+
+def drop_key_helpers(src: str, names: Iterable[str] = ("tl", "tp", "tr")) -> str:
+    if "${k}" not in src:
+        return src
+    return rewrite(src, partial(helper_edits, names=names))
+
+
+def as_child_to_render(src: str, triggers: Iterable[str] = ("TooltipTrigger", "CollapsibleTrigger")) -> str:
+    if "asChild" not in src:
+        return src
+    return rewrite(src, partial(as_child_edits, triggers=triggers))
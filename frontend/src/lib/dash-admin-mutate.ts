@@ -46,12 +46,18 @@ export async function postAdminMutate(
   }
 }
 
+/**
+ * Sends `fields=manifest` by default: the backend drops loaders and keys the tab
+ * never reads, per backend/database/data/admin_state_fields.php. Regenerate it with
+ * `npm run admin-state:fields` after reading a new state field (CI runs `--check`);
+ * tabs missing from it get the full payload. Pass `{ fields: "all" }` to opt out.
+ */
 export async function getAdminState(
   activeTab: string,
   query: Record<string, string | number> = {}
 ): Promise<Record<string, unknown>> {
   await ensureCsrfCookie()
-  const qs = new URLSearchParams({ activeTab })
+  const qs = new URLSearchParams({ activeTab, fields: "manifest" })
   for (const [k, v] of Object.entries(query)) {
     if (v !== "" && v != null) qs.set(k, String(v))
   }